@@ -0,0 +1,182 @@
+"""Partition alerts and messages by month and add archive tables
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19 09:00:00
+
+"""
+from datetime import datetime
+from alembic import op
+import sqlalchemy as sa
+from app.core.partitioning import (
+    month_start,
+    add_months,
+    create_month_partition,
+    create_default_partition,
+)
+from app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+# Indexes recreated on the partitioned parents (names match the models)
+INDEXES = {
+    "alerts": ["id", "type", "severity", "is_dismissed", "created_at"],
+    "messages": ["id", "contact_id", "staff_id", "channel", "direction", "status", "created_at"],
+}
+
+FOREIGN_KEYS = {
+    "alerts": [],
+    "messages": [
+        ("contact_id", "contacts", "CASCADE"),
+        ("staff_id", "users", "SET NULL"),
+    ],
+}
+
+ARCHIVE_INDEXES = {
+    "alerts_archive": ["created_at"],
+    "messages_archive": ["contact_id", "created_at"],
+}
+
+
+def _add_constraints(table: str, primary_key: str) -> None:
+    """Recreate primary key, foreign keys and indexes after a table swap."""
+    op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({primary_key})")
+
+    for column, target, on_delete in FOREIGN_KEYS[table]:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {table}_{column}_fkey "
+            f"FOREIGN KEY ({column}) REFERENCES {target}(id) ON DELETE {on_delete}"
+        )
+
+    for column in INDEXES[table]:
+        op.execute(f"CREATE INDEX ix_{table}_{column} ON {table} ({column})")
+
+
+def _swap_table(table: str, partitioned: bool) -> None:
+    """
+    Rebuild `table` as a partitioned (or plain) table, preserving rows and id sequence.
+
+    The old table is renamed, a new one is created from it with LIKE,
+    rows are copied, and the sequence is handed over before the old table is dropped.
+    """
+    bind = op.get_bind()
+    legacy = f"{table}_legacy"
+
+    op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+
+    if partitioned:
+        op.execute(f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)")
+
+        # One partition per month from the oldest row up to the premake horizon
+        oldest = bind.execute(sa.text(f"SELECT min(created_at) FROM {legacy}")).scalar()
+        current = month_start(datetime.utcnow())
+        month = month_start(oldest) if oldest else current
+        horizon = add_months(current, settings.PARTITION_PREMAKE_MONTHS)
+
+        while month <= horizon:
+            create_month_partition(bind, table, month)
+            month = add_months(month, 1)
+
+        create_default_partition(bind, table)
+    else:
+        op.execute(f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS)")
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+    op.execute(f"DROP TABLE {legacy}")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+
+    # Partition key must be part of the primary key
+    _add_constraints(table, "id, created_at" if partitioned else "id")
+
+
+def _create_archive(table: str) -> None:
+    """Create the archive table with the hot table's columns and a lean index set."""
+    archive = f"{table}_archive"
+
+    op.execute(f"CREATE TABLE {archive} (LIKE {table})")
+    op.execute(f"ALTER TABLE {archive} ADD CONSTRAINT {archive}_pkey PRIMARY KEY (id)")
+
+    for column, target, on_delete in FOREIGN_KEYS[table]:
+        op.execute(
+            f"ALTER TABLE {archive} ADD CONSTRAINT {archive}_{column}_fkey "
+            f"FOREIGN KEY ({column}) REFERENCES {target}(id) ON DELETE {on_delete}"
+        )
+
+    for column in ARCHIVE_INDEXES[archive]:
+        op.execute(f"CREATE INDEX ix_{archive}_{column} ON {archive} ({column})")
+
+    # Append-only: pack pages fully and compress/TOAST rows early
+    op.execute(f"ALTER TABLE {archive} SET (fillfactor = 100, toast_tuple_target = 128)")
+
+
+def _create_plain_archives() -> None:
+    """Archive tables outside PostgreSQL, with the hot tables' columns as of this revision."""
+    op.create_table(
+        'alerts_archive',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column('type', sa.Enum('INVENTORY', 'INTEGRATION', 'BOOKING', 'SYSTEM', name='alerttype'), nullable=False),
+        sa.Column('severity', sa.Enum('INFO', 'WARNING', 'CRITICAL', name='alertseverity'), nullable=False),
+        sa.Column('message', sa.String(1000), nullable=False),
+        sa.Column('details', sa.String(2000), nullable=True),
+        sa.Column('is_dismissed', sa.Boolean(), nullable=False),
+        sa.Column('dismissed_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('reference_type', sa.String(50), nullable=True),
+        sa.Column('reference_id', sa.Integer(), nullable=True),
+    )
+    op.create_table(
+        'messages_archive',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column('contact_id', sa.Integer(), sa.ForeignKey('contacts.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('staff_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
+        sa.Column('channel', sa.Enum('EMAIL', 'SMS', 'SYSTEM', name='messagechannel'), nullable=False),
+        sa.Column('direction', sa.Enum('INCOMING', 'OUTGOING', name='messagedirection'), nullable=False),
+        sa.Column('status', sa.Enum('PENDING', 'SENT', 'DELIVERED', 'FAILED', name='messagestatus'), nullable=False),
+        sa.Column('content', sa.String(5000), nullable=False),
+        sa.Column('subject', sa.String(500), nullable=True),
+        sa.Column('error_message', sa.String(1000), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('sent_at', sa.DateTime(), nullable=True),
+    )
+    for archive, columns in ARCHIVE_INDEXES.items():
+        for column in columns:
+            op.create_index(f"ix_{archive}_{column}", archive, [column])
+
+
+def upgrade() -> None:
+    """
+    Convert alerts and messages to monthly range partitions on created_at
+    and create their archive tables.
+
+    PostgreSQL only. On other databases only the archive tables are created.
+    """
+    bind = op.get_bind()
+
+    if bind.dialect.name != "postgresql":
+        _create_plain_archives()
+        return
+
+    for table in ("alerts", "messages"):
+        _swap_table(table, partitioned=True)
+        _create_archive(table)
+
+
+def downgrade() -> None:
+    """
+    Move archived rows back, drop archive tables and return to plain tables.
+    """
+    bind = op.get_bind()
+
+    for table in ("alerts", "messages"):
+        op.execute(f"INSERT INTO {table} SELECT * FROM {table}_archive")
+        op.execute(f"DROP TABLE {table}_archive")
+
+        if bind.dialect.name == "postgresql":
+            _swap_table(table, partitioned=False)
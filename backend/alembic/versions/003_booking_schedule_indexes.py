@@ -0,0 +1,33 @@
+"""Add booking schedule indexes
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19 10:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add composite (staff_id, start_time) index for staff schedule range scans
+    and an index on service_type for resolving staff by service.
+    """
+    op.create_index('ix_bookings_staff_id_start_time', 'bookings', ['staff_id', 'start_time'])
+    op.create_index('ix_bookings_service_type', 'bookings', ['service_type'])
+
+
+def downgrade() -> None:
+    """
+    Drop booking schedule indexes.
+    """
+    op.drop_index('ix_bookings_service_type', table_name='bookings')
+    op.drop_index('ix_bookings_staff_id_start_time', table_name='bookings')
@@ -0,0 +1,41 @@
+"""Prevent staff double-booking with an exclusion constraint
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19 11:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.models.booking import STAFF_OVERLAP_CONSTRAINT, STAFF_OVERLAP_DDL
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add EXCLUDE USING gist over (staff_id, tsrange(start_time, end_time, '[)'))
+    for non-cancelled bookings. Requires the btree_gist extension.
+    
+    PostgreSQL only. Existing overlapping bookings must be resolved first.
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for statement in STAFF_OVERLAP_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """
+    Drop the exclusion constraint (the extension is left installed).
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(f"ALTER TABLE bookings DROP CONSTRAINT IF EXISTS {STAFF_OVERLAP_CONSTRAINT}")
@@ -0,0 +1,35 @@
+"""Add updated_at to bookings
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19 12:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add bookings.updated_at, used to version staff calendar feeds (ETag).
+    
+    Existing rows are backfilled with their created_at.
+    """
+    op.add_column('bookings', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE bookings SET updated_at = created_at")
+    with op.batch_alter_table('bookings') as batch:
+        batch.alter_column('updated_at', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade() -> None:
+    """
+    Drop bookings.updated_at.
+    """
+    op.drop_column('bookings', 'updated_at')
@@ -0,0 +1,82 @@
+"""Add recurring booking series and sparse exceptions
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19 13:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def _booking_status():
+    """Reuse the existing bookingstatus enum type."""
+    values = ('PENDING', 'CONFIRMED', 'COMPLETED', 'NO_SHOW', 'CANCELLED')
+    if op.get_bind().dialect.name == "postgresql":
+        return postgresql.ENUM(*values, name='bookingstatus', create_type=False)
+    return sa.Enum(*values, name='bookingstatus')
+
+
+def upgrade() -> None:
+    """
+    Create booking_series (one row per recurring rule) and
+    booking_series_exceptions (sparse per-occurrence overrides).
+    """
+    op.create_table(
+        'booking_series',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('contact_id', sa.Integer(), sa.ForeignKey('contacts.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('staff_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
+        sa.Column('status', _booking_status(), nullable=False),
+        sa.Column('service_type', sa.String(255), nullable=True),
+        sa.Column('notes', sa.String(1000), nullable=True),
+        sa.Column('start_time', sa.DateTime(), nullable=False),
+        sa.Column('duration_minutes', sa.Integer(), nullable=False),
+        sa.Column('frequency', sa.Enum('DAILY', 'WEEKLY', 'MONTHLY', name='recurrencefrequency'), nullable=False),
+        sa.Column('interval', sa.Integer(), nullable=False),
+        sa.Column('by_weekday', sa.String(20), nullable=True),
+        sa.Column('until', sa.DateTime(), nullable=True),
+        sa.Column('count', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_booking_series_id', 'booking_series', ['id'])
+    op.create_index('ix_booking_series_contact_id', 'booking_series', ['contact_id'])
+    op.create_index('ix_booking_series_staff_id', 'booking_series', ['staff_id'])
+    op.create_index('ix_booking_series_status', 'booking_series', ['status'])
+    op.create_index('ix_booking_series_start_time', 'booking_series', ['start_time'])
+    op.create_index('ix_booking_series_until', 'booking_series', ['until'])
+    op.create_index('ix_booking_series_staff_id_start_time', 'booking_series', ['staff_id', 'start_time'])
+
+    op.create_table(
+        'booking_series_exceptions',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('series_id', sa.Integer(), sa.ForeignKey('booking_series.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('occurrence_start', sa.DateTime(), nullable=False),
+        sa.Column('start_time', sa.DateTime(), nullable=True),
+        sa.Column('end_time', sa.DateTime(), nullable=True),
+        sa.Column('status', _booking_status(), nullable=True),
+        sa.Column('notes', sa.String(1000), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.UniqueConstraint('series_id', 'occurrence_start', name='uq_booking_series_exceptions_occurrence'),
+    )
+    op.create_index('ix_booking_series_exceptions_id', 'booking_series_exceptions', ['id'])
+    op.create_index('ix_booking_series_exceptions_start_time', 'booking_series_exceptions', ['start_time'])
+
+
+def downgrade() -> None:
+    """
+    Drop recurring booking tables.
+    """
+    op.drop_table('booking_series_exceptions')
+    op.drop_table('booking_series')
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP TYPE IF EXISTS recurrencefrequency")
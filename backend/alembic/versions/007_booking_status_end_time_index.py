@@ -0,0 +1,30 @@
+"""Add (status, end_time) index on bookings
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19 14:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Index for the past-booking status job: open statuses ending before a cutoff.
+    """
+    op.create_index('ix_bookings_status_end_time', 'bookings', ['status', 'end_time'])
+
+
+def downgrade() -> None:
+    """
+    Drop the (status, end_time) index.
+    """
+    op.drop_index('ix_bookings_status_end_time', table_name='bookings')
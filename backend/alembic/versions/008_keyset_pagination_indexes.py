@@ -0,0 +1,42 @@
+"""Add (sort_key, id) indexes for keyset pagination
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19 15:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_bookings_start_time_id', 'bookings', ['start_time', 'id']),
+    ('ix_alerts_created_at_id', 'alerts', ['created_at', 'id']),
+    ('ix_messages_created_at_id', 'messages', ['created_at', 'id']),
+    ('ix_messages_contact_id_created_at_id', 'messages', ['contact_id', 'created_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    """
+    Composite indexes matching each list endpoint's keyset sort key.
+    
+    Contacts (id) and inventory (unique item_name) are already covered.
+    """
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """
+    Drop keyset pagination indexes.
+    """
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
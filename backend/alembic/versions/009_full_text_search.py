@@ -0,0 +1,64 @@
+"""Full-text search over messages and contacts
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19 16:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.models.contact import CONTACT_SEARCH_VECTOR
+from app.models.message import MESSAGE_SEARCH_VECTOR
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+# DDL as of this revision (the models' lists have since gained workspace_id, see 014)
+MESSAGE_SEARCH_DDL = [
+    f"ALTER TABLE messages ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({MESSAGE_SEARCH_VECTOR}) STORED",
+    "CREATE INDEX ix_messages_search_vector ON messages USING gin (search_vector)",
+]
+CONTACT_SEARCH_DDL = [
+    f"ALTER TABLE contacts ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({CONTACT_SEARCH_VECTOR}) STORED",
+    "CREATE INDEX ix_contacts_search_vector ON contacts USING gin (search_vector)",
+]
+
+
+def upgrade() -> None:
+    """
+    PostgreSQL: generated tsvector columns with GIN indexes on messages
+    (partitioned parent, propagates to partitions) and contacts.
+    
+    Other databases: the search_index fallback table, backfilled.
+    """
+    bind = op.get_bind()
+
+    if bind.dialect.name != "postgresql":
+        from app.models.search_index import SearchIndexEntry
+        from app.services.search_service import rebuild_fallback_index
+        SearchIndexEntry.__table__.create(bind, checkfirst=True)
+        rebuild_fallback_index(bind)
+        return
+
+    for statement in MESSAGE_SEARCH_DDL + CONTACT_SEARCH_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """
+    Drop search columns/indexes or the fallback table.
+    """
+    bind = op.get_bind()
+
+    if bind.dialect.name != "postgresql":
+        op.drop_table("search_index")
+        return
+
+    for table in ("messages", "contacts"):
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_vector")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,59 @@
+"""Prefix and trigram indexes for contact typeahead
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19 17:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.models.contact import PHONE_DIGITS_SQL
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+# DDL as of this revision (the model's list has since gained workspace_id, see 014)
+CONTACT_LOOKUP_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX ix_contacts_name_prefix ON contacts (lower(name) text_pattern_ops)",
+    "CREATE INDEX ix_contacts_name_trgm ON contacts USING gin (lower(name) gin_trgm_ops)",
+    "CREATE INDEX ix_contacts_email_prefix ON contacts (lower(email) text_pattern_ops)",
+    f"CREATE INDEX ix_contacts_phone_digits_prefix ON contacts (({PHONE_DIGITS_SQL}) text_pattern_ops)",
+]
+
+INDEXES = [
+    "ix_contacts_name_prefix",
+    "ix_contacts_name_trgm",
+    "ix_contacts_email_prefix",
+    "ix_contacts_phone_digits_prefix",
+]
+
+
+def upgrade() -> None:
+    """
+    text_pattern_ops prefix indexes on lower(name), lower(email) and phone
+    digits, and a pg_trgm GIN index on lower(name) for word-prefix matches.
+    
+    PostgreSQL only (requires the pg_trgm extension).
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for statement in CONTACT_LOOKUP_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """
+    Drop lookup indexes (the extension is left installed).
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for name in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
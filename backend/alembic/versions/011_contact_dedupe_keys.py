@@ -0,0 +1,42 @@
+"""Normalized email/phone blocking keys for contact deduplication
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19 18:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add indexed email_key (normalized email) and phone_key (E.164) columns
+    and backfill them in batches.
+    """
+    from app.services.dedupe_service import backfill_blocking_keys
+
+    op.add_column('contacts', sa.Column('email_key', sa.String(255), nullable=True))
+    op.add_column('contacts', sa.Column('phone_key', sa.String(16), nullable=True))
+
+    backfill_blocking_keys(op.get_bind())
+
+    op.create_index('ix_contacts_email_key', 'contacts', ['email_key'])
+    op.create_index('ix_contacts_phone_key', 'contacts', ['phone_key'])
+
+
+def downgrade() -> None:
+    """
+    Drop blocking keys.
+    """
+    op.drop_index('ix_contacts_phone_key', table_name='contacts')
+    op.drop_index('ix_contacts_email_key', table_name='contacts')
+    op.drop_column('contacts', 'phone_key')
+    op.drop_column('contacts', 'email_key')
@@ -0,0 +1,45 @@
+"""Purge requests for chunked contact erasure
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19 19:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Create purge_requests, processed by the purge job.
+    
+    Contact children already cascade in the database (ON DELETE CASCADE);
+    the ORM relationships now rely on it (passive_deletes), so no foreign
+    key changes are needed.
+    """
+    op.create_table(
+        'purge_requests',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('contact_id', sa.Integer(), nullable=False),
+        sa.Column('requested_by', sa.Integer(), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
+        sa.Column('requested_at', sa.DateTime(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.Column('rows_deleted', sa.Integer(), nullable=True),
+    )
+    op.create_index('ix_purge_requests_id', 'purge_requests', ['id'])
+    op.create_index('ix_purge_requests_contact_id', 'purge_requests', ['contact_id'])
+    op.create_index('ix_purge_requests_completed_at_id', 'purge_requests', ['completed_at', 'id'])
+
+
+def downgrade() -> None:
+    """
+    Drop purge_requests.
+    """
+    op.drop_table('purge_requests')
@@ -0,0 +1,40 @@
+"""Indexes for the contact activity timeline
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-19 20:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_bookings_contact_id_start_time_id', 'bookings', ['contact_id', 'start_time', 'id']),
+    ('ix_alerts_reference_created_at_id', 'alerts', ['reference_type', 'reference_id', 'created_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    """
+    Time-ordered per-contact seeks for each timeline source.
+    
+    Messages are already covered by ix_messages_contact_id_created_at_id.
+    """
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """
+    Drop timeline indexes.
+    """
+    for name, table, _ in INDEXES:
+        op.drop_index(name, table_name=table)
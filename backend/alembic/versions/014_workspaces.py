@@ -0,0 +1,276 @@
+"""Workspaces (multi-tenancy): workspace_id on every business table
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-19 22:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.core.config import settings
+from app.models.contact import PHONE_DIGITS_SQL
+
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+TENANT_TABLES = [
+    'users',
+    'contacts',
+    'bookings',
+    'booking_series',
+    'booking_series_exceptions',
+    'inventory',
+    'alerts',
+    'alerts_archive',
+    'messages',
+    'messages_archive',
+    'purge_requests',
+]
+
+# Range-partitioned parents (002): foreign keys can't be added NOT VALID
+PARTITIONED_TABLES = {'alerts', 'messages'}
+
+# Tables whose contact_id becomes a (workspace_id, contact_id) foreign key
+CONTACT_CHILD_TABLES = ['bookings', 'booking_series', 'messages', 'messages_archive']
+
+INDEXES = [
+    ('ix_users_workspace_id', 'users', ['workspace_id']),
+    ('ix_contacts_workspace_id_email_key', 'contacts', ['workspace_id', 'email_key']),
+    ('ix_contacts_workspace_id_phone_key', 'contacts', ['workspace_id', 'phone_key']),
+    ('ix_bookings_workspace_id_start_time_id', 'bookings', ['workspace_id', 'start_time', 'id']),
+    ('ix_bookings_workspace_id_service_type', 'bookings', ['workspace_id', 'service_type']),
+    ('ix_bookings_workspace_id_status_end_time', 'bookings', ['workspace_id', 'status', 'end_time']),
+    ('ix_booking_series_workspace_id_start_time', 'booking_series', ['workspace_id', 'start_time']),
+    ('ix_alerts_workspace_id_created_at_id', 'alerts', ['workspace_id', 'created_at', 'id']),
+    ('ix_alerts_workspace_id_is_dismissed', 'alerts', ['workspace_id', 'is_dismissed']),
+    ('ix_alerts_archive_workspace_id_created_at', 'alerts_archive', ['workspace_id', 'created_at']),
+    ('ix_messages_workspace_id_created_at_id', 'messages', ['workspace_id', 'created_at', 'id']),
+    ('ix_messages_archive_workspace_id_created_at', 'messages_archive', ['workspace_id', 'created_at']),
+]
+
+# Superseded by the tenant-leading indexes above
+SUPERSEDED_INDEXES = [
+    ('ix_contacts_email_key', 'contacts', ['email_key']),
+    ('ix_contacts_phone_key', 'contacts', ['phone_key']),
+    ('ix_bookings_start_time_id', 'bookings', ['start_time', 'id']),
+    ('ix_bookings_service_type', 'bookings', ['service_type']),
+    ('ix_bookings_status_end_time', 'bookings', ['status', 'end_time']),
+    ('ix_alerts_created_at_id', 'alerts', ['created_at', 'id']),
+    ('ix_alerts_is_dismissed', 'alerts', ['is_dismissed']),
+    ('ix_messages_created_at_id', 'messages', ['created_at', 'id']),
+]
+
+# Unique constraints (unique indexes outside PostgreSQL)
+UNIQUE_CONSTRAINTS = [
+    ('uq_contacts_workspace_id_id', 'contacts', ['workspace_id', 'id']),
+    ('uq_inventory_workspace_id_item_name', 'inventory', ['workspace_id', 'item_name']),
+]
+
+# PostgreSQL GIN/expression indexes before (009/010) and after this revision
+GIN_INDEXES = {
+    'ix_contacts_name_prefix': ('contacts', "(lower(name) text_pattern_ops)"),
+    'ix_contacts_name_trgm': ('contacts', "USING gin (lower(name) gin_trgm_ops)"),
+    'ix_contacts_email_prefix': ('contacts', "(lower(email) text_pattern_ops)"),
+    'ix_contacts_phone_digits_prefix': ('contacts', f"(({PHONE_DIGITS_SQL}) text_pattern_ops)"),
+    'ix_contacts_search_vector': ('contacts', "USING gin (search_vector)"),
+    'ix_messages_search_vector': ('messages', "USING gin (search_vector)"),
+}
+TENANT_GIN_INDEXES = {
+    'ix_contacts_name_prefix': ('contacts', "(workspace_id, lower(name) text_pattern_ops)"),
+    'ix_contacts_name_trgm': ('contacts', "USING gin (workspace_id, lower(name) gin_trgm_ops)"),
+    'ix_contacts_email_prefix': ('contacts', "(workspace_id, lower(email) text_pattern_ops)"),
+    'ix_contacts_phone_digits_prefix': ('contacts', f"(workspace_id, ({PHONE_DIGITS_SQL}) text_pattern_ops)"),
+    'ix_contacts_search_vector': ('contacts', "USING gin (workspace_id, search_vector)"),
+    'ix_messages_search_vector': ('messages', "USING gin (workspace_id, search_vector)"),
+}
+
+# Plain indexes of the contacts table (recreated when it is rebuilt)
+CONTACT_COLUMN_INDEXES = ['id', 'email', 'phone', 'created_at']
+
+
+def _recreate_gin_indexes(indexes: dict) -> None:
+    """Replace the typeahead and search indexes (GIN on a scalar column needs btree_gin)."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    for name, (table, definition) in indexes.items():
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+        op.execute(f"CREATE INDEX {name} ON {table} {definition}")
+
+
+def _swap_contacts(partitions: int) -> None:
+    """
+    Rebuild contacts hash-partitioned on workspace_id (or plain with 0),
+    preserving rows and the id sequence.
+
+    Foreign keys referencing contacts must be dropped first. The partition
+    key must be part of the primary key, so partitioned contacts use
+    (workspace_id, id).
+    """
+    bind = op.get_bind()
+
+    op.execute("ALTER TABLE contacts RENAME TO contacts_legacy")
+    op.execute("ALTER SEQUENCE contacts_id_seq OWNED BY NONE")
+
+    if partitions:
+        op.execute(
+            "CREATE TABLE contacts (LIKE contacts_legacy INCLUDING DEFAULTS INCLUDING GENERATED) "
+            "PARTITION BY HASH (workspace_id)"
+        )
+        for remainder in range(partitions):
+            op.execute(
+                f"CREATE TABLE contacts_p{remainder} PARTITION OF contacts "
+                f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+            )
+    else:
+        op.execute("CREATE TABLE contacts (LIKE contacts_legacy INCLUDING DEFAULTS INCLUDING GENERATED)")
+
+    # search_vector is generated: copy every other column
+    columns = ", ".join(bind.execute(sa.text(
+        "SELECT column_name FROM information_schema.columns "
+        "WHERE table_name = 'contacts_legacy' AND is_generated = 'NEVER' ORDER BY ordinal_position"
+    )).scalars())
+    op.execute(f"INSERT INTO contacts ({columns}) SELECT {columns} FROM contacts_legacy")
+    op.execute("DROP TABLE contacts_legacy")
+    op.execute("ALTER SEQUENCE contacts_id_seq OWNED BY contacts.id")
+
+    op.execute(f"ALTER TABLE contacts ADD CONSTRAINT contacts_pkey PRIMARY KEY ({'workspace_id, id' if partitions else 'id'})")
+    op.execute(
+        "ALTER TABLE contacts ADD CONSTRAINT contacts_workspace_id_fkey "
+        "FOREIGN KEY (workspace_id) REFERENCES workspaces(id) ON DELETE CASCADE"
+    )
+    for column in CONTACT_COLUMN_INDEXES:
+        op.execute(f"CREATE INDEX ix_contacts_{column} ON contacts ({column})")
+
+
+def _contacts_partitioned() -> bool:
+    return op.get_bind().execute(sa.text(
+        "SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'contacts'::regclass"
+    )).first() is not None
+
+
+def upgrade() -> None:
+    """
+    Create workspaces with the default workspace and give every business
+    table a workspace_id owned by it.
+
+    The constant default makes ADD COLUMN metadata-only on PostgreSQL 11+,
+    so existing rows join the default workspace without a table rewrite
+    or batched backfill; the default is dropped right after. Foreign keys
+    are added NOT VALID where the table allows it, so adding them doesn't
+    scan the table under this revision's locks; 017 validates them after
+    this transaction commits.
+
+    PostgreSQL also gets (workspace_id, contact_id) foreign keys to
+    contacts, tenant-leading typeahead/search GIN indexes (btree_gin) and,
+    with TENANT_HASH_PARTITIONS > 0, contacts hash-partitioned by
+    workspace. Other databases get the columns and B-tree indexes only.
+    """
+    bind = op.get_bind()
+    postgresql = bind.dialect.name == "postgresql"
+    default_id = int(settings.DEFAULT_WORKSPACE_ID)
+
+    op.create_table(
+        'workspaces',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(255), nullable=False),
+        sa.Column('slug', sa.String(100), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_workspaces_id', 'workspaces', ['id'])
+    op.create_index('ix_workspaces_slug', 'workspaces', ['slug'], unique=True)
+    op.execute(sa.text(
+        "INSERT INTO workspaces (id, name, slug, created_at) VALUES (:id, 'Default', 'default', CURRENT_TIMESTAMP)"
+    ).bindparams(id=default_id))
+    if postgresql:
+        op.execute("SELECT setval('workspaces_id_seq', (SELECT max(id) FROM workspaces))")
+
+    for table in TENANT_TABLES:
+        op.add_column(table, sa.Column('workspace_id', sa.Integer(), nullable=False, server_default=str(default_id)))
+        if not postgresql:
+            continue
+        op.alter_column(table, 'workspace_id', server_default=None)
+        not_valid = "" if table in PARTITIONED_TABLES else " NOT VALID"
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {table}_workspace_id_fkey "
+            f"FOREIGN KEY (workspace_id) REFERENCES workspaces(id) ON DELETE CASCADE{not_valid}"
+        )
+
+    if postgresql:
+        for table in CONTACT_CHILD_TABLES:
+            op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_contact_id_fkey")
+        if settings.TENANT_HASH_PARTITIONS > 0:
+            _swap_contacts(int(settings.TENANT_HASH_PARTITIONS))
+
+    op.drop_index('ix_inventory_item_name', table_name='inventory', if_exists=True)
+    for name, table, columns in UNIQUE_CONSTRAINTS:
+        if postgresql:
+            op.create_unique_constraint(name, table, columns)
+        else:
+            op.create_index(name, table, columns, unique=True)
+
+    if postgresql:
+        for table in CONTACT_CHILD_TABLES:
+            not_valid = "" if table in PARTITIONED_TABLES else " NOT VALID"
+            op.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {table}_workspace_id_contact_id_fkey "
+                f"FOREIGN KEY (workspace_id, contact_id) REFERENCES contacts(workspace_id, id) "
+                f"ON DELETE CASCADE{not_valid}"
+            )
+
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+    for name, table, _ in SUPERSEDED_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+    if postgresql:
+        _recreate_gin_indexes(TENANT_GIN_INDEXES)
+
+
+def downgrade() -> None:
+    """
+    Drop workspaces: rows of every workspace stay, without their owner.
+
+    Fails if two workspaces hold inventory items with the same name
+    (item_name becomes globally unique again).
+    """
+    bind = op.get_bind()
+    postgresql = bind.dialect.name == "postgresql"
+
+    if postgresql:
+        for table in CONTACT_CHILD_TABLES:
+            op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {table}_workspace_id_contact_id_fkey")
+        if _contacts_partitioned():
+            _swap_contacts(0)
+        _recreate_gin_indexes(GIN_INDEXES)
+
+    # A rebuilt contacts table has only its plain column indexes
+    for name, table, columns in SUPERSEDED_INDEXES:
+        op.create_index(name, table, columns)
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
+
+    for name, table, _ in UNIQUE_CONSTRAINTS:
+        if postgresql:
+            op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}")
+        else:
+            op.drop_index(name, table_name=table)
+    op.create_index('ix_inventory_item_name', 'inventory', ['item_name'], unique=True)
+
+    if postgresql:
+        for table in CONTACT_CHILD_TABLES:
+            op.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {table}_contact_id_fkey "
+                f"FOREIGN KEY (contact_id) REFERENCES contacts(id) ON DELETE CASCADE"
+            )
+
+    for table in reversed(TENANT_TABLES):
+        if postgresql:
+            op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_workspace_id_fkey")
+        with op.batch_alter_table(table) as batch:
+            batch.drop_column('workspace_id')
+
+    op.drop_table('workspaces')
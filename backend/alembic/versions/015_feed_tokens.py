@@ -0,0 +1,34 @@
+"""Calendar feed tokens
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-20 09:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add users.feed_token_hash (SHA-256 of the user's calendar feed token).
+    
+    NULL until the user issues a token, and again after revoking it.
+    """
+    op.add_column('users', sa.Column('feed_token_hash', sa.String(length=64), nullable=True))
+    op.create_index('ix_users_feed_token_hash', 'users', ['feed_token_hash'], unique=True)
+
+
+def downgrade() -> None:
+    """
+    Drop users.feed_token_hash.
+    """
+    op.drop_index('ix_users_feed_token_hash', table_name='users')
+    op.drop_column('users', 'feed_token_hash')
@@ -0,0 +1,48 @@
+"""Import job progress shared by all workers
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-20 10:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Create import_jobs: progress and result of each bulk import, updated
+    with every committed batch and read by GET /imports/{id}.
+    """
+    op.create_table(
+        'import_jobs',
+        sa.Column('id', sa.String(32), primary_key=True),
+        sa.Column('kind', sa.String(20), nullable=False),
+        sa.Column('format', sa.String(10), nullable=False),
+        sa.Column('automation', sa.String(10), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('processed', sa.Integer(), nullable=False),
+        sa.Column('inserted', sa.Integer(), nullable=False),
+        sa.Column('duplicates', sa.Integer(), nullable=False),
+        sa.Column('failed', sa.Integer(), nullable=False),
+        sa.Column('automation_queued', sa.Integer(), nullable=False),
+        sa.Column('errors', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('workspace_id', sa.Integer(), sa.ForeignKey('workspaces.id', ondelete='CASCADE'), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop import_jobs.
+    """
+    op.drop_table('import_jobs')
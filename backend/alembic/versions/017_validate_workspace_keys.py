@@ -0,0 +1,57 @@
+"""Validate the workspace foreign keys added NOT VALID by 014
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-21 09:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+# Foreign keys 014 adds NOT VALID (every tenant table except the
+# range-partitioned alerts and messages)
+CONSTRAINTS = [
+    ('users', 'users_workspace_id_fkey'),
+    ('contacts', 'contacts_workspace_id_fkey'),
+    ('bookings', 'bookings_workspace_id_fkey'),
+    ('booking_series', 'booking_series_workspace_id_fkey'),
+    ('booking_series_exceptions', 'booking_series_exceptions_workspace_id_fkey'),
+    ('inventory', 'inventory_workspace_id_fkey'),
+    ('alerts_archive', 'alerts_archive_workspace_id_fkey'),
+    ('messages_archive', 'messages_archive_workspace_id_fkey'),
+    ('purge_requests', 'purge_requests_workspace_id_fkey'),
+    ('bookings', 'bookings_workspace_id_contact_id_fkey'),
+    ('booking_series', 'booking_series_workspace_id_contact_id_fkey'),
+    ('messages_archive', 'messages_archive_workspace_id_contact_id_fkey'),
+]
+
+
+def upgrade() -> None:
+    """
+    Validate the NOT VALID foreign keys (PostgreSQL only).
+
+    Runs outside the migration transaction: the preceding revisions
+    commit first, releasing the locks taken by 014's ALTER TABLEs, and
+    each VALIDATE then holds only SHARE UPDATE EXCLUSIVE on its table
+    while it scans, so reads and writes continue. Validating an already
+    valid constraint is a no-op, so a failed run can simply be repeated.
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        for table, constraint in CONSTRAINTS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {constraint}")
+
+
+def downgrade() -> None:
+    """
+    Nothing to undo: validation only checks existing rows.
+    """
@@ -0,0 +1,33 @@
+"""Index staff bookings by end time for availability overlap scans
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-21 10:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add composite (staff_id, end_time) index: availability selects every
+    booking overlapping a range (end_time > start, start_time < end), and
+    seeking on end_time reads only the bookings ending after the range
+    starts, whatever their length.
+    """
+    op.create_index('ix_bookings_staff_id_end_time', 'bookings', ['staff_id', 'end_time'])
+
+
+def downgrade() -> None:
+    """
+    Drop the (staff_id, end_time) index.
+    """
+    op.drop_index('ix_bookings_staff_id_end_time', table_name='bookings')
@@ -0,0 +1,355 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from array import array
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+import pickle
+import time
+from app.core.config import settings
+from app.core.database import Base, SessionLocal
+from app.core.tenancy import get_workspace
+
+# Session.info key collecting tags touched by the current transaction
+PENDING_TAGS_KEY = "cache_tags"
+
+
+def entity_tag(model, entity_id: Optional[int] = None) -> str:
+    """
+    Cache tag for a table, or for one row of it.
+
+    Writes to a row invalidate both its row tag and its table tag, so
+    single-row reads should be tagged with row_tags() and lists/counts
+    with the table tag.
+    """
+    table = model if isinstance(model, str) else model.__tablename__
+    return table if entity_id is None else f"{table}:{entity_id}"
+
+
+def bulk_tag(model) -> str:
+    """Tag bumped by bulk statements on a table (which rows they touch is unknown)."""
+    return f"{entity_tag(model)}:*"
+
+
+def row_tags(model, entity_id: int) -> List[str]:
+    """Tags for a single-row read: its row tag and the table's bulk tag."""
+    return [entity_tag(model, entity_id), bulk_tag(model)]
+
+
+def workspace_tag(model, workspace_id: int) -> str:
+    """Tag bumped by writes to one workspace's rows of a table."""
+    return f"{entity_tag(model)}@{workspace_id}"
+
+
+def table_tags(model, db: Session) -> List[str]:
+    """
+    Tags for a list/count read in `db`: the table's rows of the session's
+    workspace and bulk writes, so other workspaces' writes don't invalidate
+    it. Unscoped sessions use the table tag.
+    """
+    workspace_id = get_workspace(db)
+    if workspace_id is None:
+        return [entity_tag(model)]
+    return [workspace_tag(model, workspace_id), bulk_tag(model)]
+
+
+def workspace_key(db: Session, key: str) -> str:
+    """Cache key of a read in `db` (sessions of different workspaces see different rows)."""
+    workspace_id = get_workspace(db)
+    return key if workspace_id is None else f"ws{workspace_id}:{key}"
+
+
+class MemoryCacheBackend:
+    """
+    In-process LRU with TTL, bounded by entry count and total bytes.
+
+    Tag versions live in a fixed table of hashed slots rather than one
+    entry per tag (every row ever written has a tag), so they are never
+    evicted: an evicted version would reset and could revalidate stale
+    entries. Tags sharing a slot only cost each other extra misses. The
+    table counts toward `max_bytes`.
+    Per-process only: use a Redis backend when running several workers.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, version_slots: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._versions = array("Q", [0]) * version_slots
+        self._versions_bytes = version_slots * self._versions.itemsize
+        self._bytes = self._versions_bytes
+        self._lock = Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: int):
+        if len(value) + self._versions_bytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._bytes += len(value)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def get_versions(self, tags: List[str]) -> List[int]:
+        with self._lock:
+            return [self._versions[self._slot(tag)] for tag in tags]
+
+    def bump_versions(self, tags: Iterable[str]):
+        with self._lock:
+            for slot in {self._slot(tag) for tag in tags}:
+                self._versions[slot] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions = array("Q", [0]) * len(self._versions)
+            self._bytes = self._versions_bytes
+
+    def info(self) -> dict:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "version_slots": len(self._versions),
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def _remove(self, key: str):
+        _, value = self._entries.pop(key)
+        self._bytes -= len(value)
+
+    def _slot(self, tag: str) -> int:
+        return hash(tag) % len(self._versions)
+
+
+class RedisCacheBackend:
+    """
+    Backend for any Redis-protocol server (Redis, Valkey, KeyDB, ...).
+
+    Shared by every worker; expiry and memory bounds are the server's
+    (configure maxmemory with an LRU policy). Requires the `redis` package.
+    """
+
+    PREFIX = "careops:cache:"
+
+    def __init__(self, url: str):
+        import redis  # Optional dependency, only needed for this backend
+        self.client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.PREFIX + key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: int):
+        self.client.set(self.PREFIX + key, value, ex=ttl_seconds)
+
+    def get_versions(self, tags: List[str]) -> List[int]:
+        values = self.client.mget([self.PREFIX + "tag:" + tag for tag in tags])
+        return [int(value) if value else 0 for value in values]
+
+    def bump_versions(self, tags: Iterable[str]):
+        pipeline = self.client.pipeline(transaction=False)
+        for tag in tags:
+            pipeline.incr(self.PREFIX + "tag:" + tag)
+        pipeline.execute()
+
+    def clear(self):
+        for key in self.client.scan_iter(self.PREFIX + "*"):
+            self.client.delete(key)
+
+    def info(self) -> dict:
+        stats = self.client.info("stats")
+        return {
+            "backend": "redis",
+            "entries": self.client.dbsize(),
+            "evictions": stats.get("evicted_keys", 0),
+            "expirations": stats.get("expired_keys", 0),
+        }
+
+
+def create_backend(url: str):
+    """Build a backend from CACHE_URL (memory:// or redis://...)."""
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisCacheBackend(url)
+    return MemoryCacheBackend(
+        max_entries=settings.CACHE_MAX_ENTRIES,
+        max_bytes=settings.CACHE_MAX_BYTES,
+        version_slots=settings.CACHE_VERSION_SLOTS
+    )
+
+
+class ServiceCache:
+    """
+    Read-through cache for service reads.
+
+    Entries are tagged by entity. Each tag has a version; an entry stores
+    the versions it was computed under and is only served while they are
+    unchanged. Commits bump the versions of the tags they touched (see
+    the session listeners below), so our own writes can never leave a
+    stale entry behind. Values are pickled, so callers get their own copy.
+    """
+
+    def __init__(self, backend, ttl_seconds: int):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def read_through(self, key: str, tags: List[str], loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for `key`, or compute it with `loader` and cache it.
+
+        Tag versions are read before loading, so a write committed while
+        loading makes the stored entry immediately stale.
+        """
+        versions = self.backend.get_versions(tags)
+
+        raw = self.backend.get(key)
+        if raw is not None:
+            stored_versions, value = pickle.loads(raw)
+            if stored_versions == versions:
+                self._count("hits")
+                return value
+
+        self._count("misses")
+        value = loader()
+        self.backend.set(key, pickle.dumps((versions, value), pickle.HIGHEST_PROTOCOL), self.ttl_seconds)
+        return value
+
+    def invalidate(self, tags: Iterable[str]):
+        tags = list(tags)
+        if not tags:
+            return
+        self.backend.bump_versions(tags)
+        with self._lock:
+            self.invalidations += len(tags)
+
+    def clear(self):
+        self.backend.clear()
+        with self._lock:
+            self.hits = self.misses = self.invalidations = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            counters = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "invalidations": self.invalidations,
+            }
+        return {**counters, **self.backend.info()}
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+service_cache = ServiceCache(create_backend(settings.CACHE_URL), ttl_seconds=settings.CACHE_TTL_SECONDS)
+
+
+# Commit-driven invalidation
+
+# Table -> tables the database writes when one of its rows is deleted
+_cascades: Dict[str, Set[str]] = {}
+
+
+def cascaded_tables(table: str) -> Set[str]:
+    """
+    Tables whose rows the database changes when a row of `table` is
+    deleted: ON DELETE CASCADE / SET NULL foreign keys, followed through
+    cascades. The flush never sees these rows.
+    """
+    tables = _cascades.get(table)
+    if tables is None:
+        tables = set()
+        pending = [table]
+        while pending:
+            parent = pending.pop()
+            for child in Base.metadata.tables.values():
+                for foreign_key in child.foreign_keys:
+                    ondelete = (foreign_key.ondelete or "").upper()
+                    if foreign_key.column.table.name != parent or ondelete not in ("CASCADE", "SET NULL"):
+                        continue
+                    if child.name not in tables:
+                        tables.add(child.name)
+                        if ondelete == "CASCADE":
+                            pending.append(child.name)
+        _cascades[table] = tables
+    return tables
+
+
+def _pending_tags(session: Session) -> Set[str]:
+    return session.info.setdefault(PENDING_TAGS_KEY, set())
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _collect_flushed_tags(session: Session, flush_context):
+    """Record row, table and workspace tags of every object written in this flush."""
+    tags = _pending_tags(session)
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table is None:
+            continue
+        tags.add(table)
+        entity_id = getattr(obj, "id", None)
+        if entity_id is not None:
+            tags.add(entity_tag(table, entity_id))
+        workspace_id = getattr(obj, "workspace_id", None)
+        if workspace_id is not None:
+            tags.add(workspace_tag(table, workspace_id))
+    # Rows changed by the database's own cascades count as bulk writes
+    for obj in session.deleted:
+        table = getattr(obj, "__tablename__", None)
+        if table is not None:
+            for child in cascaded_tables(table):
+                tags.update((child, bulk_tag(child)))
+
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _collect_statement_tags(orm_execute_state):
+    """
+    Bulk INSERT/UPDATE/DELETE statements invalidate their whole table
+    (rows included), and bulk DELETEs the tables they cascade to.
+    """
+    if orm_execute_state.is_select:
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    name = getattr(table, "name", None)
+    if name:
+        tables = ({name} | cascaded_tables(name)) if orm_execute_state.is_delete else {name}
+        tags = _pending_tags(orm_execute_state.session)
+        for table_name in tables:
+            tags.update((table_name, bulk_tag(table_name)))
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _invalidate_committed_tags(session: Session):
+    tags = session.info.pop(PENDING_TAGS_KEY, None)
+    if tags:
+        service_cache.invalidate(tags)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_rolled_back_tags(session: Session):
+    session.info.pop(PENDING_TAGS_KEY, None)
@@ -0,0 +1,312 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional, Tuple
+import gzip
+import hashlib
+import zlib
+import brotli
+import msgpack
+import orjson
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Preferred first when the client accepts several with equal q
+ENCODINGS = ("br", "gzip")
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/msgpack",
+    "text/",
+    "application/xml",
+)
+
+
+def parse_accept(header: str) -> Dict[str, float]:
+    """Parse an Accept / Accept-Encoding header into {token: q}."""
+    accepted = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[token.strip().lower()] = q
+    return accepted
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Best supported content-coding for an Accept-Encoding header, or None."""
+    accepted = parse_accept(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in ENCODINGS:
+        q = accepted.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def wants_msgpack(accept: str) -> bool:
+    """True when the client explicitly prefers MessagePack over JSON."""
+    accepted = parse_accept(accept)
+    return accepted.get(MSGPACK_MEDIA_TYPE, 0.0) > accepted.get("application/json", 0.0)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a complete body."""
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.GZIP_LEVEL, mtime=0)
+
+
+def _json_to_msgpack(body: bytes) -> bytes:
+    return msgpack.packb(orjson.loads(body), use_bin_type=True)
+
+
+def _stream_compressor(encoding: str):
+    """Incremental compressor with compress()/flush() for streamed bodies."""
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=settings.BROTLI_QUALITY)
+        return compressor.process, compressor.finish
+    compressor = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    return compressor.compress, compressor.flush
+
+
+def _is_compressible(content_type: str) -> bool:
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def _add_vary(headers: MutableHeaders, status: int):
+    """
+    Vary on the request headers that can select this response's
+    representation, whether or not this request negotiated anything:
+    a shared cache must not serve one client's encoding to another.
+    A 304 (no content type) varies on Accept-Encoding like the body it
+    validates would.
+    """
+    if "content-encoding" in headers:
+        return  # Encoded by the route; nothing to negotiate
+    content_type = headers.get("content-type", "")
+    if content_type.startswith(("application/json", MSGPACK_MEDIA_TYPE)):
+        headers.add_vary_header("Accept")
+    if status == 304 or _is_compressible(content_type):
+        headers.add_vary_header("Accept-Encoding")
+
+
+def _weaken_etag(headers: MutableHeaders):
+    """
+    Mark the ETag weak: a compressed body is not byte-identical to the
+    one the strong validator was computed for.
+    """
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["etag"] = "W/" + etag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header against an ETag (as
+    RFC 9110 specifies for If-None-Match), so validators weakened by
+    compression still match.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+async def _offload(func, body: bytes, *args):
+    """Run a CPU-bound encoder, in the threadpool for large bodies."""
+    if len(body) >= settings.COMPRESSION_THREADPOOL_MIN_BYTES:
+        return await run_in_threadpool(func, body, *args)
+    return func(body, *args)
+
+
+class _CompressedBodyCache:
+    """
+    LRU of compressed bodies keyed by (encoding, body digest).
+
+    Repeated identical payloads (polled dashboards, unchanged lists) are
+    compressed once; hashing is far cheaper than compressing.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compress(self, body: bytes, encoding: str) -> bytes:
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+
+        compressed = compress(body, encoding)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = compressed
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return compressed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+compressed_cache = _CompressedBodyCache(max_entries=settings.COMPRESSION_CACHE_MAX_ENTRIES)
+
+
+class ContentNegotiationMiddleware:
+    """
+    Negotiated response encoding for the API.
+
+    - `Accept: application/msgpack` re-encodes complete JSON bodies as MessagePack.
+    - `Accept-Encoding: br/gzip` compresses bodies of at least
+      COMPRESSION_MIN_BYTES. Compressed bodies of cacheable GET responses
+      (no `Cache-Control: no-store/private`) are reused from an LRU.
+    - Streamed bodies (e.g. calendar feeds) are compressed incrementally.
+    - Negotiable responses always carry `Vary: Accept, Accept-Encoding`;
+      compressed ones get a weak ETag.
+    - Bodies (or stream chunks) of at least COMPRESSION_THREADPOOL_MIN_BYTES
+      are encoded in the threadpool instead of on the event loop.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(request_headers.get("accept-encoding", ""))
+        msgpack_requested = wants_msgpack(request_headers.get("accept", ""))
+
+        if encoding is None and not msgpack_requested:
+            async def send_with_vary(message: Message):
+                if message["type"] == "http.response.start":
+                    _add_vary(MutableHeaders(scope=message), message["status"])
+                await send(message)
+
+            await self.app(scope, receive, send_with_vary)
+            return
+
+        responder = _NegotiatingResponder(scope, send, encoding, msgpack_requested)
+        await self.app(scope, receive, responder.send)
+
+
+class _NegotiatingResponder:
+    """Per-request send wrapper buffering the start message until the body is known."""
+
+    def __init__(self, scope: Scope, send: Send, encoding: Optional[str], msgpack_requested: bool):
+        self.method = scope["method"]
+        self.downstream = send
+        self.encoding = encoding
+        self.msgpack_requested = msgpack_requested
+        self.start: Optional[Message] = None
+        self.passthrough = False
+        self.streaming = False
+        self.compress_chunk = None
+        self.flush = None
+
+    async def send(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.start = message
+            headers = MutableHeaders(scope=message)
+            _add_vary(headers, message["status"])
+            if message["status"] == 304 and self.encoding and "content-encoding" not in headers:
+                _weaken_etag(headers)  # The 200 it stands for would be compressed
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.downstream(message)
+            return
+
+        if self.streaming:
+            await self._send_stream_chunk(message)
+            return
+
+        headers = MutableHeaders(raw=self.start["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if (
+            self.method == "HEAD"
+            or self.start["status"] in (204, 304)
+            or "content-encoding" in headers
+        ):
+            await self._pass_through(message)
+            return
+
+        if more_body:
+            await self._begin_stream(headers, message)
+            return
+
+        # Complete body: optional MessagePack, then compression
+        if self.msgpack_requested and headers.get("content-type", "").startswith("application/json") and body:
+            body = await _offload(_json_to_msgpack, body)
+            headers["content-type"] = MSGPACK_MEDIA_TYPE
+
+        content_type = headers.get("content-type", "")
+        if self.encoding and len(body) >= settings.COMPRESSION_MIN_BYTES and _is_compressible(content_type):
+            if self._is_cacheable(headers):
+                body = await _offload(compressed_cache.get_or_compress, body, self.encoding)
+            else:
+                body = await _offload(compress, body, self.encoding)
+            headers["content-encoding"] = self.encoding
+            _weaken_etag(headers)
+
+        headers["content-length"] = str(len(body))
+        await self.downstream(self.start)
+        await self.downstream({"type": "http.response.body", "body": body})
+
+    def _is_cacheable(self, headers: MutableHeaders) -> bool:
+        cache_control = headers.get("cache-control", "").lower()
+        return self.method == "GET" and "no-store" not in cache_control and "private" not in cache_control
+
+    async def _pass_through(self, message: Message):
+        self.passthrough = True
+        await self.downstream(self.start)
+        await self.downstream(message)
+
+    async def _begin_stream(self, headers: MutableHeaders, message: Message):
+        if not self.encoding or not _is_compressible(headers.get("content-type", "")):
+            await self._pass_through(message)
+            return
+
+        self.streaming = True
+        self.compress_chunk, self.flush = _stream_compressor(self.encoding)
+        headers["content-encoding"] = self.encoding
+        _weaken_etag(headers)
+        del headers["content-length"]
+        await self.downstream(self.start)
+        await self._send_stream_chunk(message)
+
+    async def _send_stream_chunk(self, message: Message):
+        more_body = message.get("more_body", False)
+        chunk = await _offload(self.compress_chunk, message.get("body", b""))
+        if not more_body:
+            chunk += self.flush()
+        if chunk or not more_body:
+            await self.downstream({"type": "http.response.body", "body": chunk, "more_body": more_body})
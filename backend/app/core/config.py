@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 
 
 class Settings(BaseSettings):
@@ -28,11 +28,119 @@ class Settings(BaseSettings):
     TWILIO_AUTH_TOKEN: str = ""
     TWILIO_PHONE_NUMBER: str = ""
     
+    # Workspaces (tenants)
+    DEFAULT_WORKSPACE_ID: int = 1  # Existing data, sign-ups without a workspace name, public pages without ?workspace_id
+    TENANT_HASH_PARTITIONS: int = 0  # PostgreSQL: hash-partition contacts by workspace into this many partitions (migration 014; 0 = off)
+    
+    # Partitioning & archival
+    PARTITION_PREMAKE_MONTHS: int = 3  # Future monthly partitions kept ready
+    ALERT_ARCHIVE_AFTER_DAYS: int = 30  # Dismissed alerts older than this move to archive
+    MESSAGE_ARCHIVE_AFTER_DAYS: int = 365  # Messages older than this move to archive
+    ARCHIVE_BATCH_SIZE: int = 5000  # Rows moved per transaction
+    
+    # Availability
+    WORKING_DAYS: str = "0,1,2,3,4"  # Weekdays staff are bookable (Monday = 0)
+    WORKING_DAY_START_HOUR: int = 9
+    WORKING_DAY_END_HOUR: int = 17
+    AVAILABILITY_SLOT_MINUTES: int = 30  # Slot start granularity
+    AVAILABILITY_MAX_DAYS: int = 62  # Longest range per request
+    AVAILABILITY_CACHE_TTL_SECONDS: int = 300
+    AVAILABILITY_CACHE_MAX_ENTRIES: int = 20000  # Cached (staff, day) entries
+    
+    # Recurring bookings
+    RECURRENCE_HORIZON_DAYS: int = 90  # How far ahead "upcoming" counts expand series
+    
+    # Past-booking status job
+    BOOKING_NO_SHOW_GRACE_MINUTES: int = 60  # After end_time before a booking is closed out
+    BOOKING_STATUS_BATCH_SIZE: int = 1000  # Rows updated per statement
+    
+    # Calendar feeds
+    CALENDAR_FEED_PAST_DAYS: int = 90  # History included in iCalendar feeds
+    
+    # Response compression (see benchmarks/compression_bench.py)
+    COMPRESSION_MIN_BYTES: int = 1024  # Smaller bodies are sent uncompressed
+    GZIP_LEVEL: int = 4  # ~gzip-6 ratio on typical pages for ~20% less CPU
+    BROTLI_QUALITY: int = 4  # Smaller and faster than gzip on pages of 100+ rows
+    COMPRESSION_CACHE_MAX_ENTRIES: int = 256  # Compressed bodies kept for repeated payloads
+    COMPRESSION_THREADPOOL_MIN_BYTES: int = 65536  # Larger bodies are encoded off the event loop
+    
+    # Request coalescing (dashboard, conversations)
+    SINGLE_FLIGHT_GRACE_SECONDS: float = 0.5  # Reuse a just-finished result this long (0 = only while in flight)
+    
+    # Contact typeahead
+    CONTACT_LOOKUP_MEMORY_INDEX: bool = False  # Serve /contacts/lookup from an in-process sorted prefix index
+    CONTACT_LOOKUP_INDEX_REBUILD_SECONDS: int = 600  # Background rebuild interval for that index
+    CONTACT_LOOKUP_MAX_AGE_SECONDS: int = 30  # Cache-Control max-age on lookup responses
+    
+    # Contact deduplication
+    PHONE_DEFAULT_COUNTRY_CODE: str = "1"  # Country code assumed for numbers without +/00 prefix
+    PHONE_NATIONAL_NUMBER_LENGTH: int = 10  # National significant number length for that country
+    DEDUPE_ON_CREATE: bool = True  # POST /contacts returns an existing duplicate instead of inserting
+    DEDUPE_MATCH_THRESHOLD: float = 0.75  # Minimum pair score to treat two contacts as the same person
+    DEDUPE_MIN_NAME_SIMILARITY: float = 0.6  # Shared email/phone alone never merges different names
+    DEDUPE_MAX_BLOCK_SIZE: int = 50  # Larger blocks (shared placeholder emails/numbers) are skipped
+    DEDUPE_MERGE_BATCH_SIZE: int = 500  # Duplicate groups merged per transaction
+    
+    # Bulk import
+    IMPORT_BATCH_SIZE: int = 1000  # Rows validated, deduplicated and inserted per transaction
+    IMPORT_MAX_ERRORS: int = 100  # Row errors kept in an import's report (all are counted)
+    IMPORT_AUTOMATION_QUEUE_BATCHES: int = 20  # Queued automation batches before the import waits
+    
+    # Contact purge job
+    PURGE_BATCH_SIZE: int = 1000  # Rows deleted per statement/transaction
+    PURGE_CONTACTS_PER_CHUNK: int = 100  # Contacts purged together
+    PURGE_LOCK_TIMEOUT_MS: int = 2000  # PostgreSQL: give up a chunk rather than queue behind long locks
+    
+    # Streaming export
+    EXPORT_BATCH_SIZE: int = 2000  # Rows fetched per round trip from the server-side cursor
+    EXPORT_CHUNK_ROWS: int = 500  # Rows encoded per body chunk
+    
+    # Logging
+    LOG_FORMAT: str = "text"  # or "json" (one object per line, with request id and fields)
+    LOG_QUEUE_SIZE: int = 10000  # Records buffered for the writer thread; more are dropped, never waited on
+    LOG_SAMPLE_RATES: str = ""  # Fraction of info/debug lines kept per category, e.g. "AUTOMATION=0.1,INTEGRATION=0.1"
+    
+    # Query diagnostics
+    SLOW_QUERY_MS: int = 500  # Log statements slower than this, parameters redacted (0 = off)
+    SLOW_QUERY_EXPLAIN: bool = False  # Append the EXPLAIN plan of slow SELECTs to the log
+    QUERY_BUDGET_PER_REQUEST: int = 50  # Warn when a request runs more statements (0 = off)
+    N_PLUS_ONE_THRESHOLD: int = 5  # Warn when one statement runs this often in a request (0 = off)
+    
+    # Request tracing
+    SERVER_TIMING_ENABLED: bool = False  # Phase timings in a Server-Timing response header
+    TRACE_SAMPLE_RATE: float = 0.0  # Fraction of requests whose full trace is written (0 = none)
+    TRACE_FILE: str = "traces.ndjson"  # Sampled traces, one JSON object per line
+    
+    # Prometheus metrics (requires the prometheus-client package)
+    METRICS_ENABLED: bool = False  # Expose /metrics and instrument requests, the pool, automation and integrations
+    
+    # Service read cache
+    CACHE_URL: str = "memory://"  # or redis://host:6379/0 (shared across workers)
+    CACHE_TTL_SECONDS: int = 300
+    CACHE_MAX_ENTRIES: int = 10000  # Memory backend only
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # Memory backend only, version slots included
+    CACHE_VERSION_SLOTS: int = 65536  # Memory backend: hashed tag-version table (8 bytes per slot)
+    
     @property
     def cors_origins(self) -> List[str]:
         """Parse CORS origins from comma-separated string."""
         return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
     
+    @property
+    def working_days(self) -> List[int]:
+        """Parse bookable weekdays from comma-separated string."""
+        return [int(day) for day in self.WORKING_DAYS.split(",") if day.strip()]
+    
+    @property
+    def log_sample_rates(self) -> Dict[str, float]:
+        """Parse per-category log sampling from comma-separated CATEGORY=rate pairs."""
+        rates = {}
+        for pair in self.LOG_SAMPLE_RATES.split(","):
+            category, _, rate = pair.partition("=")
+            if category.strip():
+                rates[category.strip().upper()] = float(rate)
+        return rates
+    
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
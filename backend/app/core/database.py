@@ -1,7 +1,8 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, selectinload, noload
 from app.core.config import settings
+from app.core.query_tracking import track_engine
 
 # Create SQLAlchemy engine with connection pooling
 engine = create_engine(
@@ -12,6 +13,23 @@ engine = create_engine(
     echo=not settings.is_production,  # Log SQL in development
 )
 
+
+@event.listens_for(engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """
+    SQLite ignores foreign keys (and so ON DELETE CASCADE) unless enabled
+    per connection; relationships rely on the database cascades.
+    """
+    if engine.dialect.name == "sqlite":
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+# Per-request statement counts, N+1 warnings and the slow-query log
+track_engine(engine)
+
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -38,8 +56,33 @@ def get_db():
 
 def init_db():
     """
-    Initialize database tables.
+    Initialize database tables and the default workspace.
     Only use in development - use Alembic migrations in production.
     """
-    from app.models import user, contact, booking, inventory, alert, message
+    from app.models import workspace, user, contact, booking, booking_series, inventory, alert, message, search_index, purge_request
     Base.metadata.create_all(bind=engine)
+    
+    db = SessionLocal()
+    try:
+        if db.get(workspace.Workspace, settings.DEFAULT_WORKSPACE_ID) is None:
+            db.add(workspace.Workspace(id=settings.DEFAULT_WORKSPACE_ID, name="Default", slug="default"))
+            db.commit()
+    finally:
+        db.close()
+
+
+def relation_loaders(entity, relations, expand):
+    """
+    Loader options for optional relation expansion.
+    
+    Requested relations are loaded with selectinload (one extra query per
+    relation for the whole page); the others use noload so serializers
+    never trigger per-row lazy loads.
+    
+    Usage:
+        query.options(*relation_loaders(Booking, ("contact", "staff"), {"contact"}))
+    """
+    return [
+        selectinload(getattr(entity, name)) if name in expand else noload(getattr(entity, name))
+        for name in relations
+    ]
@@ -0,0 +1,66 @@
+from pydantic import BaseModel, ConfigDict, create_model
+from sqlalchemy.orm import load_only
+from sqlalchemy.inspection import inspect
+from fastapi import Response
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Mapping, Optional, Sequence, Type
+from app.core.serialization import list_response
+
+
+@lru_cache(maxsize=256)
+def partial_model(model: Type[BaseModel], fields: FrozenSet[str]) -> Type[BaseModel]:
+    """
+    Response model containing only `fields` of `model` (cached per field set).
+    """
+    definitions = {
+        name: (field.annotation, field)
+        for name, field in model.model_fields.items()
+        if name in fields
+    }
+    return create_model(
+        f"{model.__name__}Partial",
+        __config__=ConfigDict(from_attributes=True),
+        **definitions
+    )
+
+
+def load_only_options(
+    entity,
+    fields: Optional[FrozenSet[str]],
+    required: Sequence[str] = (),
+    derived: Optional[Mapping[str, Iterable[str]]] = None
+) -> list:
+    """
+    Column-only loading for a sparse fieldset.
+
+    Only requested columns (plus `required` ones such as the sort key and
+    foreign keys, and the inputs of `derived` properties) are selected;
+    large text columns that weren't asked for never leave the database.
+
+    Returns [] when no fieldset was requested.
+    """
+    if not fields:
+        return []
+
+    columns = set(required) | set(fields)
+    for name, inputs in (derived or {}).items():
+        if name in fields:
+            columns.update(inputs)
+
+    mapper_columns = inspect(entity).mapper.column_attrs.keys()
+    return [load_only(*[getattr(entity, name) for name in sorted(columns) if name in mapper_columns])]
+
+
+def sparse_response(
+    response: Response,
+    model: Type[BaseModel],
+    fields: FrozenSet[str],
+    items: List
+) -> Response:
+    """
+    Serialize `items` through the partial model of `model`.
+
+    Returned directly (bypassing the route's full response_model);
+    headers already set on `response` (e.g. X-Next-Cursor) are carried over.
+    """
+    return list_response(partial_model(model, fields), items, response)
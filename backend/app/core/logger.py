@@ -1,39 +1,211 @@
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+import atexit
 import logging
+import queue
+import random
+import re
 import sys
+import uuid
+import orjson
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.core.config import settings
 
 # Configure logging format
-LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(request_id)s - %(message)s"
 LOG_LEVEL = logging.DEBUG if not settings.is_production else logging.INFO
 
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Incoming request ids are echoed only if they look like ids
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._:-]{1,64}$")
+
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+def get_request_id() -> Optional[str]:
+    """Id of the request being handled, or None outside requests."""
+    return _request_id.get()
+
+
+def _category(message: str) -> Optional[str]:
+    """Category of a "[CATEGORY] ..." log line."""
+    if message.startswith("["):
+        end = message.find("]")
+        if end > 1:
+            return message[1:end]
+    return None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, category, message, request id and fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "category": _category(message),
+            "message": message,
+            "request_id": getattr(record, "request_id", None),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return orjson.dumps(entry, default=str).decode()
+
+
+class _TextFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        if getattr(record, "request_id", None) is None:
+            record.request_id = "-"
+        return super().format(record)
+
+
+class _RequestContext(logging.Filter):
+    """Stamp the request id on records in the logging thread (the context is lost after the queue)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = _request_id.get()
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Hand records to a bounded queue without waiting.
+
+    Arguments are merged into the message here (they may change once the
+    call returns); formatting and I/O happen on the listener thread. When
+    the queue is full the record is dropped and counted.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def queue_handlers(target: logging.Logger, *handlers: logging.Handler) -> NonBlockingQueueHandler:
+    """
+    Route `target`'s records through a bounded queue to `handlers`, which
+    run on a background listener thread (stopped and flushed at exit).
+    """
+    log_queue = queue.Queue(settings.LOG_QUEUE_SIZE)
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(_RequestContext())
+    target.addHandler(queue_handler)
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return queue_handler
+
+
 # Create logger
 logger = logging.getLogger("careops")
 logger.setLevel(LOG_LEVEL)
+logger.propagate = False
 
-# Console handler
+# Console handler, written from the listener thread
 console_handler = logging.StreamHandler(sys.stdout)
 console_handler.setLevel(LOG_LEVEL)
-console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+console_handler.setFormatter(JsonFormatter() if settings.LOG_FORMAT == "json" else _TextFormatter(LOG_FORMAT))
 
 # Add handler to logger
-logger.addHandler(console_handler)
+log_queue_handler = queue_handlers(logger, console_handler)
+
+# Category -> fraction of its info/debug lines kept
+_sample_rates = settings.log_sample_rates
+
+
+def _sampled(message: str) -> bool:
+    if not _sample_rates:
+        return True
+    rate = _sample_rates.get(_category(message))
+    return rate is None or random.random() < rate
+
 
+def _extra(fields: dict) -> Optional[dict]:
+    return {"fields": fields} if fields else None
 
-def log_info(message: str):
-    """Log info level message."""
-    logger.info(message)
 
+def log_info(message: str, *args, **fields):
+    """
+    Log info level message.
 
-def log_error(message: str, exc_info=None):
-    """Log error level message."""
-    logger.error(message, exc_info=exc_info)
+    Pass values as %-style args (`log_info("[API] Contact %s", contact_id)`)
+    so nothing is formatted when the line is disabled or sampled out;
+    keyword fields become keys of JSON log lines.
+    """
+    if logger.isEnabledFor(logging.INFO) and _sampled(message):
+        logger.info(message, *args, extra=_extra(fields))
 
 
-def log_warning(message: str):
-    """Log warning level message."""
-    logger.warning(message)
+def log_error(message: str, *args, exc_info=None, **fields):
+    """Log error level message (never sampled)."""
+    logger.error(message, *args, exc_info=exc_info, extra=_extra(fields))
 
 
-def log_debug(message: str):
+def log_warning(message: str, *args, **fields):
+    """Log warning level message (never sampled)."""
+    logger.warning(message, *args, extra=_extra(fields))
+
+
+def log_debug(message: str, *args, **fields):
     """Log debug level message."""
-    logger.debug(message)
+    if logger.isEnabledFor(logging.DEBUG) and _sampled(message):
+        logger.debug(message, *args, extra=_extra(fields))
+
+
+class RequestIdMiddleware:
+    """
+    Give every request an id (the client's X-Request-ID when valid, else a
+    new one), stamp it on its log lines and return it in X-Request-ID.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                candidate = value.decode("latin-1")
+                if _REQUEST_ID_PATTERN.match(candidate):
+                    request_id = candidate
+                break
+        request_id = request_id or uuid.uuid4().hex
+        token = _request_id.set(request_id)
+
+        async def send_with_id(message: Message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            _request_id.reset(token)
@@ -0,0 +1,316 @@
+from functools import wraps
+from time import perf_counter
+from typing import Callable, Dict, Tuple
+import os
+from sqlalchemy import event
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.core.query_tracking import current_queries
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Metrics:
+    """
+    Prometheus metric families of the API process.
+
+    Children are pre-bound per (method, route[, status]) and cached, so
+    the hot path is a dict lookup and a locked float add: no label
+    resolution, no allocation per request. Counters of the in-process
+    caches and the connection pool are read at scrape time by collectors.
+    """
+
+    def __init__(self):
+        try:
+            import prometheus_client  # Only imported with METRICS_ENABLED
+        except ImportError:
+            raise RuntimeError(
+                "METRICS_ENABLED=true requires the prometheus-client package (pip install -r requirements.txt)"
+            ) from None
+
+        self.prometheus = prometheus_client
+        self.registry = prometheus_client.CollectorRegistry(auto_describe=True)
+        factory = dict(registry=self.registry)
+
+        self.requests_in_flight = prometheus_client.Gauge(
+            "careops_http_requests_in_flight", "Requests being handled",
+            ["method", "route"], **factory
+        )
+        self.request_seconds = prometheus_client.Histogram(
+            "careops_http_request_duration_seconds", "Time to the last response body chunk",
+            ["method", "route"], **factory
+        )
+        self.responses = prometheus_client.Counter(
+            "careops_http_responses", "Responses by status code",
+            ["method", "route", "status"], **factory
+        )
+        self.request_queries = prometheus_client.Histogram(
+            "careops_http_request_queries", "SQL statements executed per request",
+            ["method", "route"], buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 250), **factory
+        )
+        self.pool_checkouts = prometheus_client.Counter(
+            "careops_db_pool_checkouts", "Connections checked out of the pool", **factory
+        )
+        self.pool_wait_seconds = prometheus_client.Histogram(
+            "careops_db_pool_wait_seconds", "Time to get a connection from the pool (including connects)",
+            buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+            **factory
+        )
+        self.integration_seconds = prometheus_client.Histogram(
+            "careops_integration_send_duration_seconds", "Outgoing integration call latency",
+            ["channel"], **factory
+        )
+        self.integration_sends = prometheus_client.Counter(
+            "careops_integration_sends", "Outgoing integration calls by outcome",
+            ["channel", "outcome"], **factory
+        )
+        self.automation_seconds = prometheus_client.Histogram(
+            "careops_automation_event_duration_seconds", "Automation event handling latency",
+            ["event"], **factory
+        )
+        self.automation_failures = prometheus_client.Counter(
+            "careops_automation_event_failures", "Automation events that raised",
+            ["event"], **factory
+        )
+
+        self._route_children: Dict[Tuple[str, str], tuple] = {}
+        self._status_children: Dict[Tuple[str, str, int], object] = {}
+
+        self.registry.register(_CacheCollector(prometheus_client))
+
+    def route_children(self, method: str, route: str) -> tuple:
+        """(in-flight, latency, queries) children of one route, bound once."""
+        key = (method, route)
+        children = self._route_children.get(key)
+        if children is None:
+            children = (
+                self.requests_in_flight.labels(method, route),
+                self.request_seconds.labels(method, route),
+                self.request_queries.labels(method, route),
+            )
+            self._route_children[key] = children
+        return children
+
+    def status_child(self, method: str, route: str, status: int):
+        key = (method, route, status)
+        child = self._status_children.get(key)
+        if child is None:
+            child = self._status_children[key] = self.responses.labels(method, route, str(status))
+        return child
+
+    def prebind_routes(self, routes):
+        """Bind children of every known route up front (also lists idle routes at 0)."""
+        for route in routes:
+            for method in getattr(route, "methods", None) or ():
+                self.route_children(method, route.path)
+
+    def render(self) -> Tuple[bytes, str]:
+        """Exposition body and content type; merges worker files in multiprocess mode."""
+        registry = self.registry
+        if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            from prometheus_client import multiprocess
+            registry = self.prometheus.CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        return self.prometheus.generate_latest(registry), self.prometheus.CONTENT_TYPE_LATEST
+
+
+class _CacheCollector:
+    """Hit/miss counters of the in-process caches, read at scrape time."""
+
+    def __init__(self, prometheus_client):
+        self.metric_families = prometheus_client.metrics_core
+
+    def describe(self):
+        return []
+
+    def collect(self):
+        from app.core.cache import service_cache
+        from app.core.compression import compressed_cache
+        from app.core.singleflight import single_flight
+
+        families = self.metric_families
+        lookups = families.CounterMetricFamily(
+            "careops_cache_lookups", "Cache lookups by result", labels=["cache", "result"]
+        )
+        stats = service_cache.stats()
+        lookups.add_metric(["service", "hit"], stats["hits"])
+        lookups.add_metric(["service", "miss"], stats["misses"])
+        lookups.add_metric(["compressed_body", "hit"], compressed_cache.hits)
+        lookups.add_metric(["compressed_body", "miss"], compressed_cache.misses)
+        yield lookups
+
+        yield families.CounterMetricFamily(
+            "careops_cache_invalidations", "Service cache tag invalidations",
+            value=stats["invalidations"]
+        )
+
+        coalescing = single_flight.stats()
+        calls = families.CounterMetricFamily(
+            "careops_single_flight_calls", "Coalesced reads by result", labels=["result"]
+        )
+        calls.add_metric(["executed"], coalescing["executions"])
+        calls.add_metric(["coalesced"], coalescing["coalesced"])
+        yield calls
+        yield families.GaugeMetricFamily(
+            "careops_single_flight_in_flight", "Distinct coalesced reads running",
+            value=coalescing["in_flight"]
+        )
+
+
+class _PoolCollector:
+    """Size, checked-out and overflow connections of a QueuePool, read at scrape time."""
+
+    def __init__(self, engine, prometheus_client):
+        self.engine = engine
+        self.metric_families = prometheus_client.metrics_core
+
+    def describe(self):
+        return []
+
+    def collect(self):
+        pool = self.engine.pool
+        if not hasattr(pool, "checkedout"):
+            return
+        connections = self.metric_families.GaugeMetricFamily(
+            "careops_db_pool_connections", "Pool connections by state", labels=["state"]
+        )
+        connections.add_metric(["checked_out"], pool.checkedout())
+        connections.add_metric(["idle"], pool.checkedin())
+        connections.add_metric(["overflow"], max(pool.overflow(), 0))
+        yield connections
+        yield self.metric_families.GaugeMetricFamily(
+            "careops_db_pool_size", "Configured pool size", value=pool.size()
+        )
+
+
+def instrument_engine(engine):
+    """
+    Count pool checkouts and time waits for a connection.
+
+    Checkouts are counted with the public `checkout` pool event. No public
+    event fires before a checkout starts, which is where QueuePool blocks
+    when every connection is in use, so the wait is timed by wrapping
+    Pool._do_get: the per-subclass hook Pool._checkout calls to get a
+    connection record (SQLAlchemy 2.0, pinned in requirements.txt). Check
+    this on SQLAlchemy upgrades; tests/test_metrics.py fails if the wait
+    histogram stops recording.
+    """
+    pool = engine.pool
+    get_connection = pool._do_get
+    checkouts = metrics.pool_checkouts
+    wait_seconds = metrics.pool_wait_seconds
+
+    def timed_get():
+        start = perf_counter()
+        try:
+            return get_connection()
+        finally:
+            wait_seconds.observe(perf_counter() - start)
+
+    pool._do_get = timed_get
+    event.listen(pool, "checkout", lambda dbapi_connection, record, proxy: checkouts.inc())
+    metrics.registry.register(_PoolCollector(engine, metrics.prometheus))
+
+
+class MetricsMiddleware:
+    """
+    Latency, in-flight, status and query-count metrics per route template
+    (`/contacts/{contact_id}`, not the raw path, so label cardinality stays
+    bounded). Unrouted paths share the `unmatched` label.
+    """
+
+    def __init__(self, app: ASGIApp, routes: list):
+        self.app = app
+        self.routes = routes
+        metrics.prebind_routes(routes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = self._route_of(scope)
+        in_flight, latency, queries = metrics.route_children(method, route)
+        status_code = 500
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight.inc()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            latency.observe(perf_counter() - start)
+            in_flight.dec()
+            stats = current_queries()
+            if stats is not None:
+                queries.observe(stats.count)
+            metrics.status_child(method, route, status_code).inc()
+
+    def _route_of(self, scope: Scope) -> str:
+        partial = None
+        for route in self.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route.path
+            if match == Match.PARTIAL and partial is None:
+                partial = route.path  # Wrong method (405)
+        return partial or UNMATCHED_ROUTE
+
+
+def timed_send(channel: str) -> Callable:
+    """
+    Record latency and sent/failed outcome of an integration method
+    returning True on success. No-op when metrics are disabled.
+    """
+    def decorator(func: Callable) -> Callable:
+        if metrics is None:
+            return func
+        latency = metrics.integration_seconds.labels(channel)
+        sent = metrics.integration_sends.labels(channel, "sent")
+        failed = metrics.integration_sends.labels(channel, "failed")
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            ok = False
+            try:
+                ok = func(*args, **kwargs)
+                return ok
+            finally:
+                latency.observe(perf_counter() - start)
+                (sent if ok else failed).inc()
+        return wrapper
+    return decorator
+
+
+def timed_event(name: str) -> Callable:
+    """Record latency and failures of an automation event handler. No-op when metrics are disabled."""
+    def decorator(func: Callable) -> Callable:
+        if metrics is None:
+            return func
+        latency = metrics.automation_seconds.labels(name)
+        failures = metrics.automation_failures.labels(name)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                failures.inc()
+                raise
+            finally:
+                latency.observe(perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+# None unless METRICS_ENABLED: every hook above is then skipped entirely
+metrics = Metrics() if settings.METRICS_ENABLED else None
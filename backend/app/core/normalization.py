@@ -0,0 +1,67 @@
+import re
+import unicodedata
+from typing import Optional
+from app.core.config import settings
+
+# Mailbox providers that ignore dots and "+tag" suffixes in the local part
+DOTLESS_EMAIL_DOMAINS = {"gmail.com": "gmail.com", "googlemail.com": "gmail.com"}
+
+# E.164 allows at most 15 digits; shorter than 8 is never a full number
+E164_MIN_DIGITS = 8
+E164_MAX_DIGITS = 15
+
+_NON_DIGITS = re.compile(r"\D")
+_NAME_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    """
+    Canonical form of an email address for duplicate matching.
+
+    Lowercased and trimmed; for providers in DOTLESS_EMAIL_DOMAINS dots and
+    "+tag" suffixes are dropped from the local part.
+    """
+    if not email:
+        return None
+    local, _, domain = email.strip().lower().rpartition("@")
+    if not local or not domain:
+        return None
+    if domain in DOTLESS_EMAIL_DOMAINS:
+        local = local.split("+", 1)[0].replace(".", "")
+        domain = DOTLESS_EMAIL_DOMAINS[domain]
+    return f"{local}@{domain}"
+
+
+def normalize_phone(phone: Optional[str], country_code: Optional[str] = None) -> Optional[str]:
+    """
+    E.164 form ("+14155550123") of a phone number, or None if it cannot be one.
+
+    Numbers without an international prefix ("+" or "00") are national
+    numbers of PHONE_DEFAULT_COUNTRY_CODE; a leading trunk "0" is dropped.
+    """
+    if not phone:
+        return None
+    country_code = country_code or settings.PHONE_DEFAULT_COUNTRY_CODE
+    raw = phone.strip()
+    digits = _NON_DIGITS.sub("", raw)
+
+    if raw.startswith("+"):
+        pass
+    elif digits.startswith("00"):
+        digits = digits[2:]
+    elif digits.startswith("0"):
+        digits = country_code + digits[1:]
+    elif not (digits.startswith(country_code) and len(digits) > settings.PHONE_NATIONAL_NUMBER_LENGTH):
+        digits = country_code + digits
+
+    if not E164_MIN_DIGITS <= len(digits) <= E164_MAX_DIGITS:
+        return None
+    return "+" + digits
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Accent-free lowercase name tokens, sorted ("Smith, José" -> "jose smith")."""
+    if not name:
+        return ""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return " ".join(sorted(_NAME_TOKEN.findall(ascii_name.lower())))
@@ -0,0 +1,114 @@
+from sqlalchemy import tuple_
+from fastapi import Response
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+import base64
+import json
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """Cursor could not be decoded or doesn't match the endpoint's sort key."""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode sort-key values as an opaque URL-safe cursor."""
+    payload = [{"$dt": v.isoformat()} if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _accepted_types(python_type: Optional[type]) -> Tuple[type, ...]:
+    """JSON value types a cursor may carry for a column of `python_type`."""
+    if python_type is None:
+        return (int, float, str, datetime)
+    if issubclass(python_type, datetime):
+        return (datetime,)
+    if issubclass(python_type, str):  # Includes str-based enums
+        return (str,)
+    if issubclass(python_type, (int, float)):
+        return (int, float)  # Numbers compare across int/float (e.g. a float rank of an integer sum)
+    return (python_type,)
+
+
+def column_types(columns: Sequence) -> List[Optional[type]]:
+    """Python types of sort-key columns (None where SQLAlchemy can't tell, e.g. computed ranks)."""
+    types = []
+    for column in columns:
+        try:
+            types.append(column.type.python_type)
+        except NotImplementedError:
+            types.append(None)
+    return types
+
+
+def decode_cursor(cursor: str, types: Sequence[Optional[type]]) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor for a sort key whose columns
+    have the given Python types.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or a value has the
+            wrong type for its column (would fail when bound)
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = [
+            datetime.fromisoformat(v["$dt"]) if isinstance(v, dict) else v
+            for v in payload
+        ]
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursorError("Invalid cursor")
+
+    if not isinstance(payload, list) or len(values) != len(types):
+        raise InvalidCursorError("Invalid cursor")
+    for value, python_type in zip(values, types):
+        if isinstance(value, bool) or not isinstance(value, _accepted_types(python_type)):
+            raise InvalidCursorError("Invalid cursor")
+    return values
+
+
+def paginate(
+    query,
+    columns: Sequence,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    descending: bool = False
+):
+    """
+    Order a query by an indexed (sort_key, id) tuple and take one page.
+
+    With a cursor the page starts right after the cursor's row using a
+    row-value comparison, so every page costs the same index seek.
+    Without one, `skip` (offset) is used for backward compatibility.
+    """
+    if cursor:
+        values = decode_cursor(cursor, column_types(columns))
+        key = tuple_(*columns)
+        query = query.filter(key < tuple_(*values) if descending else key > tuple_(*values))
+
+    query = query.order_by(*[column.desc() if descending else column for column in columns])
+
+    if not cursor and skip:
+        query = query.offset(skip)
+
+    return query.limit(limit)
+
+
+def next_cursor(items: Sequence, attrs: Sequence[str], limit: int) -> Optional[str]:
+    """Cursor for the page after `items`, or None when this was the last page."""
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor([getattr(last, attr) for attr in attrs])
+
+
+def set_next_cursor(response: Response, items: Sequence, attrs: Sequence[str], limit: int) -> None:
+    """Expose the next-page cursor on the response (body stays a plain list)."""
+    cursor = next_cursor(items, attrs, limit)
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
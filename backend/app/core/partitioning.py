@@ -0,0 +1,146 @@
+from datetime import datetime
+from typing import List
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from app.core.config import settings
+from app.core.logger import log_info, log_warning
+
+# Tables range-partitioned by month on created_at (see alembic revision 002)
+PARTITIONED_TABLES = ("alerts", "messages")
+
+
+def month_start(value: datetime) -> datetime:
+    """Truncate a datetime to the first instant of its month."""
+    return datetime(value.year, value.month, 1)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """Shift a month start by a number of months."""
+    index = value.year * 12 + (value.month - 1) + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    """Name of the monthly partition holding `month`, e.g. messages_y2026m02."""
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def is_partitioned(conn: Connection, table: str) -> bool:
+    """
+    Check whether a table is a native partitioned table.
+
+    Always False outside PostgreSQL (SQLite dev/test databases).
+    """
+    if conn.dialect.name != "postgresql":
+        return False
+
+    result = conn.execute(
+        text(
+            "SELECT 1 FROM pg_class c "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE c.relname = :table AND c.relkind = 'p' AND n.nspname = current_schema()"
+        ),
+        {"table": table}
+    )
+    return result.first() is not None
+
+
+def create_month_partition(conn: Connection, table: str, month: datetime) -> str:
+    """Create the monthly partition for `month` if it doesn't exist yet."""
+    name = partition_name(table, month)
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    ))
+    return name
+
+
+def create_default_partition(conn: Connection, table: str) -> str:
+    """Create the catch-all partition for rows outside every monthly range."""
+    name = f"{table}_default"
+    conn.execute(text(f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} DEFAULT"))
+    return name
+
+
+def ensure_future_partitions(bind, months_ahead: int = None) -> List[str]:
+    """
+    Make sure monthly partitions exist from the current month up to
+    `months_ahead` months in the future for every partitioned table.
+
+    Safe to call repeatedly (startup, archive job). No-op on databases
+    that aren't partitioned.
+
+    Args:
+        bind: Engine or Connection
+        months_ahead: Defaults to settings.PARTITION_PREMAKE_MONTHS
+
+    Returns:
+        Names of partitions that were checked/created
+    """
+    if months_ahead is None:
+        months_ahead = settings.PARTITION_PREMAKE_MONTHS
+
+    if isinstance(bind, Engine):
+        with bind.begin() as conn:
+            return ensure_future_partitions(conn, months_ahead)
+
+    conn = bind
+    if conn.dialect.name != "postgresql":
+        return []
+
+    current = month_start(datetime.utcnow())
+    ensured = []
+
+    for table in PARTITIONED_TABLES:
+        if not is_partitioned(conn, table):
+            continue
+
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            try:
+                # Savepoint so one conflicting range (rows already in the
+                # default partition) doesn't abort the whole batch
+                with conn.begin_nested():
+                    ensured.append(create_month_partition(conn, table, month))
+            except Exception as e:
+                log_warning("[PARTITION] Could not create %s: %s", partition_name(table, month), e)
+
+    log_info("[PARTITION] Ensured %s monthly partitions", len(ensured))
+    return ensured
+
+
+def drop_empty_partitions(conn: Connection, table: str, before: datetime) -> List[str]:
+    """
+    Drop monthly partitions entirely older than `before` that no longer hold rows.
+
+    Used after archival so hot indexes only span live months.
+    """
+    if not is_partitioned(conn, table):
+        return []
+
+    result = conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table AND c.relname LIKE :pattern"
+        ),
+        {"table": table, "pattern": f"{table}_y%m%"}
+    )
+
+    dropped = []
+    cutoff = month_start(before)
+    for (name,) in result.fetchall():
+        year, month = name[len(table) + 2:].split("m")
+        if add_months(datetime(int(year), int(month), 1), 1) > cutoff:
+            continue
+
+        if conn.execute(text(f"SELECT 1 FROM {name} LIMIT 1")).first() is not None:
+            continue
+
+        conn.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+
+    if dropped:
+        log_info("[PARTITION] Dropped empty partitions: %s", ', '.join(dropped))
+    return dropped
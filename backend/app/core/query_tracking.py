@@ -0,0 +1,187 @@
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Iterator, List, Optional
+from sqlalchemy import event
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.core.config import settings
+from app.core.logger import log_debug, log_warning
+
+# Statement text shown in logs and assertion messages
+STATEMENT_PREVIEW = 300
+
+
+class QueryStats:
+    """Statements executed within one request (or `track_queries` block)."""
+
+    __slots__ = ("count", "seconds", "shapes")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        # Statement text -> executions; bound parameters are not part of the
+        # text, so the same query for different rows shares one shape
+        self.shapes: Counter = Counter()
+
+    def repeated(self, threshold: int) -> List[tuple]:
+        """(statement, executions) of shapes run at least `threshold` times, most first."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+# Blocks of assert_max_queries waiting for requests served meanwhile
+_observers: List[List[QueryStats]] = []
+
+
+def current_queries() -> Optional[QueryStats]:
+    """Statistics of the enclosing request, or None outside one."""
+    return _current.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count and time the statements executed in this block (this context only)."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _preview(statement: str) -> str:
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= STATEMENT_PREVIEW else statement[:STATEMENT_PREVIEW] + "…"
+
+
+def redact(parameters) -> object:
+    """Bound parameters with values replaced by their type names."""
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return [redact(parameters[0]), f"... {len(parameters)} rows"]
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _explain(conn, statement: str, parameters) -> Optional[str]:
+    """Plan of a slow SELECT (plain EXPLAIN: the statement is not run again)."""
+    head = statement.lstrip()[:6].upper()
+    if head != "SELECT" and not head.startswith("WITH"):
+        return None
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        return "\n".join(" ".join(str(column) for column in row) for row in cursor.fetchall())
+    except Exception as e:
+        log_debug("[QUERY] EXPLAIN failed: %s", e)
+        return None
+    finally:
+        cursor.close()
+
+
+def track_engine(engine):
+    """Count and time every statement of `engine`; log slow ones."""
+
+    # The start time lives on the statement's execution context, which is
+    # discarded with it: a failing statement (no after_cursor_execute)
+    # leaves nothing behind on the pooled connection
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        context._query_start = perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _finish(conn, cursor, statement, parameters, context, executemany):
+        elapsed = perf_counter() - context._query_start
+
+        stats = _current.get()
+        if stats is not None:
+            stats.count += 1
+            stats.seconds += elapsed
+            stats.shapes[statement] += 1
+
+        if settings.SLOW_QUERY_MS and elapsed * 1000 >= settings.SLOW_QUERY_MS:
+            message = (
+                f"[QUERY] Slow query ({elapsed * 1000:.0f} ms): {_preview(statement)} "
+                f"params={redact(parameters)}"
+            )
+            if settings.SLOW_QUERY_EXPLAIN and not executemany:
+                plan = _explain(conn, statement, parameters)
+                if plan:
+                    message += f"\n{plan}"
+            log_warning(message)
+
+
+class QueryTrackingMiddleware:
+    """
+    Per-request statement count and time.
+
+    Warns when a request runs more than QUERY_BUDGET_PER_REQUEST statements
+    and when one statement shape repeats N_PLUS_ONE_THRESHOLD times or more
+    (a query per row of a result: the N+1 pattern).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                for observer in _observers:
+                    observer.append(stats)
+                if stats.count:
+                    self._check(f"{scope['method']} {scope['path']}", stats)
+
+    @staticmethod
+    def _check(request: str, stats: QueryStats):
+        budget = settings.QUERY_BUDGET_PER_REQUEST
+        if budget and stats.count > budget:
+            log_warning(
+                "[QUERY] %s ran %s statements in %.0f ms (budget %s)",
+                request, stats.count, stats.seconds * 1000, budget
+            )
+        if settings.N_PLUS_ONE_THRESHOLD:
+            for statement, executions in stats.repeated(settings.N_PLUS_ONE_THRESHOLD):
+                log_warning("[QUERY] Possible N+1 in %s: %sx %s", request, executions, _preview(statement))
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[List[QueryStats]]:
+    """
+    Fail if the block runs more than `limit` statements.
+
+    Counts statements run directly in the block and by requests served
+    while it is open (e.g. through a TestClient, whose requests run in
+    another thread):
+
+        with assert_max_queries(4):
+            client.get("/conversations", headers=auth)
+
+    Raises:
+        AssertionError: Listing the statements, most repeated first
+    """
+    served: List[QueryStats] = []
+    _observers.append(served)
+    try:
+        with track_queries() as direct:
+            yield served
+    finally:
+        _observers.remove(served)
+
+    total = QueryStats()
+    for stats in [direct, *served]:
+        total.count += stats.count
+        total.shapes.update(stats.shapes)
+    if total.count > limit:
+        statements = "\n".join(f"  {n}x {_preview(shape)}" for shape, n in total.shapes.most_common())
+        raise AssertionError(f"{total.count} statements executed, expected at most {limit}:\n{statements}")
@@ -1,7 +1,9 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 import bcrypt
+import hashlib
+import secrets
 from app.core.config import settings
 
 
@@ -94,3 +96,25 @@ def decode_access_token(token: str) -> Optional[dict]:
         return payload
     except JWTError:
         return None
+
+
+FEED_TOKEN_PREFIX = "feed_"
+
+
+def create_feed_token() -> Tuple[str, str]:
+    """
+    Create a calendar feed token.
+    
+    Feed tokens are random (not JWTs) and never expire; only their hash is
+    stored, so they can be revoked by clearing it.
+    
+    Returns:
+        (token, hash to store)
+    """
+    token = FEED_TOKEN_PREFIX + secrets.token_urlsafe(32)
+    return token, hash_feed_token(token)
+
+
+def hash_feed_token(token: str) -> str:
+    """SHA-256 hex digest of a feed token (tokens are random, so no salt is needed)."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
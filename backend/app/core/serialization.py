@@ -0,0 +1,59 @@
+from pydantic import BaseModel, TypeAdapter
+from fastapi import Response
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Type
+import orjson
+from app.core.tracing import span
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Cached TypeAdapter for List[model] (building one compiles a validator/serializer)."""
+    return TypeAdapter(List[model])
+
+
+def serialize_list(model: Type[BaseModel], items: Iterable[Any]) -> bytes:
+    """
+    Validate ORM objects (or dicts) once and serialize straight to JSON bytes.
+
+    Both steps run in pydantic-core; no intermediate dicts or stdlib json.
+    """
+    adapter = list_adapter(model)
+    with span("serialize"):
+        return adapter.dump_json(adapter.validate_python(list(items), from_attributes=True))
+
+
+def _carry_headers(response: Optional[Response]) -> dict:
+    """Headers already set on the injected Response (e.g. X-Next-Cursor)."""
+    if response is None:
+        return {}
+    return {key: value for key, value in response.headers.items() if key != "content-length"}
+
+
+def list_response(model: Type[BaseModel], items: Iterable[Any], response: Optional[Response] = None) -> Response:
+    """
+    Single-pass list response.
+
+    Returning a Response makes FastAPI skip its own response_model
+    validation and encoding, so each row is validated exactly once.
+    Keep response_model on the route for the OpenAPI schema.
+    """
+    return Response(
+        content=serialize_list(model, items),
+        media_type=JSON_MEDIA_TYPE,
+        headers=_carry_headers(response)
+    )
+
+
+def rows_response(content: Any, response: Optional[Response] = None) -> Response:
+    """
+    Serialize plain rows/dicts (no ORM objects, no models) with orjson.
+
+    For routes that select columns and shape the payload themselves.
+    datetimes and enums are encoded natively.
+    """
+    with span("serialize"):
+        body = orjson.dumps(content)
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=_carry_headers(response))
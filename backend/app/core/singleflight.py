@@ -0,0 +1,127 @@
+from fastapi import Request
+from sqlalchemy.orm import Session
+from threading import Event, Lock
+from typing import Any, Callable, Dict, Optional
+import time
+from app.core.config import settings
+
+
+class _Call:
+    """One in-flight (or recently finished) computation."""
+
+    def __init__(self):
+        self.done = Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.finished_at: Optional[float] = None
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent computations into one.
+
+    The first caller for a key runs the function; callers arriving while
+    it runs wait and share its result (or exception). With a grace period,
+    callers arriving shortly after it finished reuse the result as well.
+    Per-process; routes run in the threadpool, so waiting blocks a worker
+    thread rather than the event loop. Waiters should hold nothing else
+    (see `before_wait`): a follower keeping a pooled connection checked
+    out can starve the leader it is waiting for.
+    """
+
+    def __init__(self, grace_seconds: float = 0.0):
+        self.grace_seconds = grace_seconds
+        self._calls: Dict[str, _Call] = {}
+        self._lock = Lock()
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any], before_wait: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        Result of `fn` for `key`, computed once for concurrent callers.
+
+        `before_wait` runs in a caller that is about to wait for another
+        caller's computation, to release what it holds first.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None and call.finished_at is not None:
+                if time.monotonic() - call.finished_at > self.grace_seconds:
+                    call = None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+                self.executions += 1
+            else:
+                leader = False
+                self.coalesced += 1
+
+        if not leader:
+            if before_wait is not None and not call.done.is_set():
+                before_wait()
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                call.finished_at = time.monotonic()
+                # Errors are never reused; results only within the grace period
+                if call.error is not None or self.grace_seconds <= 0:
+                    if self._calls.get(key) is call:
+                        del self._calls[key]
+                self._prune()
+            call.done.set()
+
+        return call.result
+
+    def stats(self) -> dict:
+        with self._lock:
+            running = sum(1 for call in self._calls.values() if call.finished_at is None)
+            return {
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "in_flight": running,
+                "in_grace": len(self._calls) - running,
+            }
+
+    def _prune(self):
+        """Drop finished calls past their grace period (caller holds the lock)."""
+        now = time.monotonic()
+        expired = [
+            key for key, call in self._calls.items()
+            if call.finished_at is not None and now - call.finished_at > self.grace_seconds
+        ]
+        for key in expired:
+            del self._calls[key]
+
+
+single_flight = SingleFlight(grace_seconds=settings.SINGLE_FLIGHT_GRACE_SECONDS)
+
+
+def request_key(request: Request, scope: str) -> str:
+    """
+    Single-flight key for a GET: route path, normalized query params and
+    the caller's authorization scope (requests that may see different
+    data must never share a result).
+    """
+    params = "&".join(f"{name}={value}" for name, value in sorted(request.query_params.multi_items()))
+    return f"{request.method} {request.url.path}?{params}#{scope}"
+
+
+def coalesce(request: Request, scope: str, fn: Callable[[], Any], db: Optional[Session] = None) -> Any:
+    """
+    Run `fn` once for all identical concurrent requests.
+
+    Pass the request's session as `db`: a request that waits for another
+    one's result first ends its transaction (authentication already ran a
+    query), returning its connection to the pool while it waits.
+    """
+    return single_flight.do(request_key(request, scope), fn, before_wait=db.commit if db is not None else None)
@@ -0,0 +1,99 @@
+from sqlalchemy import Column, ForeignKey, Integer, event
+from sqlalchemy.orm import Session, declared_attr, with_loader_criteria
+from typing import Optional
+from app.core.database import SessionLocal
+
+# Session.info key holding the workspace every query of the session is scoped to
+WORKSPACE_KEY = "workspace_id"
+
+# Execution option that lifts the scoping for one statement (cross-tenant jobs)
+ALL_WORKSPACES = "all_workspaces"
+
+
+class WorkspaceScoped:
+    """
+    Mixin for business models owned by one workspace (tenant).
+
+    Adds a `workspace_id` column (last, so archive tables keep the hot
+    table's column order). Sessions with a workspace set only ever read,
+    update or delete that workspace's rows, and stamp it on the rows they
+    insert.
+    """
+
+    @declared_attr
+    def workspace_id(cls):
+        return Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False)
+
+
+def set_workspace(db: Session, workspace_id: int):
+    """Scope every later statement of `db` to one workspace."""
+    db.info[WORKSPACE_KEY] = workspace_id
+
+
+def get_workspace(db: Session) -> Optional[int]:
+    """Workspace `db` is scoped to, or None for unscoped (job) sessions."""
+    return db.info.get(WORKSPACE_KEY)
+
+
+def require_workspace(db: Session) -> int:
+    """
+    Workspace `db` is scoped to.
+
+    Raises:
+        ValueError: If the session is not scoped to a workspace
+    """
+    workspace_id = get_workspace(db)
+    if workspace_id is None:
+        raise ValueError("No workspace selected for this session")
+    return workspace_id
+
+
+def check_visible(db: Session, model, entity_id: Optional[int], label: str):
+    """
+    Check that a referenced row exists in the session's workspace.
+
+    Staff references are plain foreign keys (a composite one could not
+    SET NULL on user deletion without nulling workspace_id too), so
+    writes check them here; contact references are also enforced by the
+    composite (workspace_id, contact_id) keys on PostgreSQL.
+
+    Raises:
+        ValueError: If entity_id is set and the row is not visible
+    """
+    if entity_id is not None and not db.query(model.id).filter(model.id == entity_id).first():
+        raise ValueError(f"{label} {entity_id} not found")
+
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _scope_to_workspace(orm_execute_state):
+    """
+    Add `workspace_id = :current` to every ORM SELECT/UPDATE/DELETE of a
+    scoped session, for each workspace-owned entity it touches (joins,
+    subqueries, aliases and relationship loads included).
+    """
+    workspace_id = orm_execute_state.session.info.get(WORKSPACE_KEY)
+    if workspace_id is None or orm_execute_state.is_column_load:
+        return
+    if orm_execute_state.execution_options.get(ALL_WORKSPACES):
+        return
+    if orm_execute_state.is_select or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            with_loader_criteria(
+                WorkspaceScoped,
+                lambda cls: cls.workspace_id == workspace_id,
+                include_aliases=True
+            )
+        )
+
+
+@event.listens_for(SessionLocal, "before_flush")
+def _stamp_workspace(session: Session, flush_context, instances):
+    """
+    Set workspace_id on new workspace-owned objects from the session.
+
+    Raises:
+        ValueError: If an object has no workspace and the session is unscoped
+    """
+    for obj in session.new:
+        if isinstance(obj, WorkspaceScoped) and obj.workspace_id is None:
+            obj.workspace_id = require_workspace(session)
@@ -0,0 +1,223 @@
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import wraps
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+import logging
+import random
+import threading
+import uuid
+import orjson
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.core.logger import get_request_id, queue_handlers
+from app.core.query_tracking import current_queries
+
+# Sampled traces, one JSON object per line (see app/jobs/trace_export_job.py)
+trace_logger = logging.getLogger("careops.traces")
+trace_logger.propagate = False
+
+
+class Trace:
+    """
+    Phase timings of one request.
+
+    Phase totals are always kept (they make the Server-Timing header);
+    individual spans only for sampled requests.
+    """
+
+    __slots__ = ("start", "phases", "spans")
+
+    def __init__(self, sampled: bool):
+        self.start = perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.spans: Optional[List[tuple]] = [] if sampled else None
+
+    def record(self, phase: str, detail: Optional[str], start: float, end: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + (end - start)
+        if self.spans is not None:
+            self.spans.append((phase, detail, start - self.start, end - start, threading.get_ident()))
+
+
+_current: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+
+
+class _Span:
+    __slots__ = ("trace", "phase", "detail", "start")
+
+    def __init__(self, trace: Trace, phase: str, detail: Optional[str]):
+        self.trace = trace
+        self.phase = phase
+        self.detail = detail
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.trace.record(self.phase, self.detail, self.start, perf_counter())
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(phase: str, detail: Optional[str] = None):
+    """
+    Time a block as one phase of the current request (no-op outside traced requests).
+
+        with span("serialize"):
+            body = ...
+    """
+    trace = _current.get()
+    if trace is None:
+        return _NO_SPAN
+    return _Span(trace, phase, detail)
+
+
+def traced(phase: str, detail: Optional[str] = None) -> Callable:
+    """Decorator form of `span`."""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(phase, detail):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def trace_engine(engine):
+    """Add one span per statement to sampled traces (totals come from query tracking)."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        trace = _current.get()
+        if trace is not None and trace.spans is not None:
+            context._trace_start = perf_counter()  # Dropped with the context if the statement fails
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _finish(conn, cursor, statement, parameters, context, executemany):
+        trace = _current.get()
+        start = getattr(context, "_trace_start", None)
+        if trace is not None and trace.spans is not None and start is not None:
+            end = perf_counter()
+            detail = " ".join(statement.split())[:200]
+            trace.spans.append(("db", detail, start - trace.start, end - start, threading.get_ident()))
+
+
+def trace_fastapi_validation():
+    """
+    Time FastAPI's response_model validation and encoding as `validate`.
+
+    FastAPI has no hook for this step; its request handler looks up
+    `fastapi.routing.serialize_response` at call time, so it is wrapped
+    there. Routes returning a Response (list_response, rows_response)
+    skip it and are timed as `serialize` instead.
+    """
+    import fastapi.routing
+
+    serialize_response = fastapi.routing.serialize_response
+
+    @wraps(serialize_response)
+    async def timed_serialize_response(*args, **kwargs):
+        with span("validate"):
+            return await serialize_response(*args, **kwargs)
+
+    fastapi.routing.serialize_response = timed_serialize_response
+
+
+def _server_timing(trace: Trace, elapsed: float) -> str:
+    entries = [f"{phase};dur={seconds * 1000:.1f}" for phase, seconds in trace.phases.items()]
+    queries = current_queries()
+    if queries is not None and queries.count:
+        entries.append(f'db;dur={queries.seconds * 1000:.1f};desc="{queries.count} queries"')
+    entries.append(f"total;dur={elapsed * 1000:.1f}")
+    return ", ".join(entries)
+
+
+class TracingMiddleware:
+    """
+    Request phase timings: `Server-Timing` response header (when
+    SERVER_TIMING_ENABLED) and full traces of a TRACE_SAMPLE_RATE sample
+    of requests, written to TRACE_FILE as JSON lines.
+
+    Phases: auth (JWT decode and user lookup), db (statement time, from
+    query tracking), validate / serialize (response encoding), integration
+    (IntegrationService calls); `total` is the time to the response start.
+    Phases may overlap (the user lookup is also db time).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        if settings.TRACE_SAMPLE_RATE > 0 and not trace_logger.handlers:
+            handler = logging.FileHandler(settings.TRACE_FILE)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            trace_logger.setLevel(logging.INFO)
+            queue_handlers(trace_logger, handler)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        sampled = settings.TRACE_SAMPLE_RATE > 0 and random.random() < settings.TRACE_SAMPLE_RATE
+        trace = Trace(sampled)
+        token = _current.set(trace)
+        status_code = 500
+
+        async def send_with_timing(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if settings.SERVER_TIMING_ENABLED:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", _server_timing(trace, perf_counter() - trace.start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            if sampled:
+                self._write(scope, trace, status_code)
+
+    @staticmethod
+    def _write(scope: Scope, trace: Trace, status_code: int):
+        elapsed = perf_counter() - trace.start
+        queries = current_queries()
+        route = scope.get("route")
+        record = {
+            "trace_id": uuid.uuid4().hex,
+            "request_id": get_request_id(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": getattr(route, "path", None),
+            "status": status_code,
+            "duration_ms": round(elapsed * 1000, 3),
+            "phases_ms": {phase: round(seconds * 1000, 3) for phase, seconds in trace.phases.items()},
+            "queries": queries.count if queries is not None else None,
+            "db_ms": round(queries.seconds * 1000, 3) if queries is not None else None,
+            "spans": [
+                {
+                    "name": phase,
+                    "detail": detail,
+                    "start_ms": round(start * 1000, 3),
+                    "duration_ms": round(duration * 1000, 3),
+                    "thread": thread,
+                }
+                for phase, detail, start, duration, thread in trace.spans
+            ],
+        }
+        trace_logger.info(orjson.dumps(record).decode())
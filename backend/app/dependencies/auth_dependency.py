@@ -1,25 +1,83 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Optional, Tuple
 from app.core.database import get_db
-from app.core.security import decode_access_token
+from app.core.security import FEED_TOKEN_PREFIX, decode_access_token, hash_feed_token
+from app.core.tenancy import set_workspace
+from app.core.tracing import span
 from app.models.user import User, UserRole
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
 
+# Optional bearer scheme for endpoints that also accept ?token=
+optional_security = HTTPBearer(auto_error=False)
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
     """
     Dependency to get current authenticated user from JWT token.
+    
+    Scopes the request's session to the user's workspace.
+    """
+    return _get_user_from_token(credentials.credentials, db)
+
+
+def get_feed_user(
+    token: Optional[str] = Query(None, description="Feed token (POST /auth/feed-token) for calendar apps"),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    db: Session = Depends(get_db)
+) -> Tuple[User, bool]:
+    """
+    Dependency for subscription feeds (calendar clients).
+    
+    Accepts an access JWT in the Authorization header, or the user's feed
+    token as the `token` query parameter. Access JWTs are refused in the
+    query string (URLs end up in logs and calendar app settings).
+    
+    Returns:
+        (user, whether a feed token was used)
     """
+    if credentials is not None:
+        return _get_user_from_token(credentials.credentials, db), False
+
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    if not token.startswith(FEED_TOKEN_PREFIX):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Access tokens are not accepted in the URL; use a feed token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    with span("auth", "user"):
+        user = db.query(User).filter(User.feed_token_hash == hash_feed_token(token)).first()
+
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or revoked feed token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    set_workspace(db, user.workspace_id)
+    return user, True
+
 
-    token = credentials.credentials
-    payload = decode_access_token(token)
+def _get_user_from_token(token: str, db: Session) -> User:
+    """Resolve a JWT to its user or raise 401, and scope `db` to the user's workspace."""
+    with span("auth", "jwt"):
+        payload = decode_access_token(token)
 
     if payload is None:
         raise HTTPException(
@@ -47,7 +105,8 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    with span("auth", "user"):
+        user = db.query(User).filter(User.id == user_id).first()
 
     if user is None:
         raise HTTPException(
@@ -56,6 +115,7 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    set_workspace(db, user.workspace_id)
     return user
 
 
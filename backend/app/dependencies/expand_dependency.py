@@ -0,0 +1,30 @@
+from fastapi import HTTPException, Query, status
+from typing import Callable, Optional, Set
+
+
+def expand_param(*allowed: str) -> Callable[..., Set[str]]:
+    """
+    Build a dependency parsing `?expand=a,b` into a set of relation names.
+    
+    Unknown names are rejected with 400 so typos don't silently fall back
+    to per-item requests on the client.
+    
+    Usage:
+        expand: Set[str] = Depends(expand_param("contact", "staff"))
+    """
+    def dependency(
+        expand: Optional[str] = Query(None, description=f"Comma-separated: {', '.join(allowed)}")
+    ) -> Set[str]:
+        if not expand:
+            return set()
+        
+        requested = {name.strip() for name in expand.split(",") if name.strip()}
+        unknown = requested - set(allowed)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown expand value(s): {', '.join(sorted(unknown))}"
+            )
+        return requested
+    
+    return dependency
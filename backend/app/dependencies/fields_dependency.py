@@ -0,0 +1,33 @@
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+from typing import Callable, FrozenSet, Optional, Type
+
+
+def fields_param(model: Type[BaseModel], always: tuple = ("id",)) -> Callable[..., Optional[FrozenSet[str]]]:
+    """
+    Build a dependency parsing `?fields=a,b` into a sparse fieldset of `model`.
+    
+    `always` fields are included in every fieldset. Unknown names are
+    rejected with 400. Returns None when no fieldset was requested.
+    
+    Usage:
+        fields = Depends(fields_param(MessageResponse))
+    """
+    allowed = set(model.model_fields)
+    
+    def dependency(
+        fields: Optional[str] = Query(None, description="Comma-separated response fields")
+    ) -> Optional[FrozenSet[str]]:
+        if not fields:
+            return None
+        
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested - allowed
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown field(s): {', '.join(sorted(unknown))}"
+            )
+        return frozenset(requested | set(always))
+    
+    return dependency
@@ -0,0 +1,24 @@
+"""
+Archive job for alerts and messages.
+
+Run on a schedule (e.g. nightly cron):
+    python -m app.jobs.archive_job
+"""
+from app.core.database import SessionLocal
+from app.core.logger import log_info
+from app.services.archive_service import ArchiveService
+
+
+def run() -> dict:
+    """Premake partitions and move dismissed alerts / old messages to the archive."""
+    db = SessionLocal()
+    try:
+        result = ArchiveService(db).run()
+        log_info("[JOB] Archive job finished: %s", result)
+        return result
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,25 @@
+"""
+Past-booking status job.
+
+Moves bookings still PENDING/CONFIRMED after they ended to COMPLETED
+(form completed) or NO_SHOW. Run on a schedule (e.g. every 15 minutes):
+    python -m app.jobs.booking_status_job
+"""
+from app.core.database import SessionLocal
+from app.core.logger import log_info
+from app.services.booking_service import BookingService
+
+
+def run() -> dict:
+    """Close out past-due bookings in bounded batches."""
+    db = SessionLocal()
+    try:
+        result = BookingService(db).close_past_bookings()
+        log_info("[JOB] Booking status job finished: %s", result)
+        return result
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    run()
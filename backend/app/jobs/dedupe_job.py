@@ -0,0 +1,28 @@
+"""
+Contact deduplication job.
+
+Finds contacts sharing a normalized email or phone with a similar name and
+merges each group into its oldest contact. Run on a schedule (e.g. nightly):
+    python -m app.jobs.dedupe_job [--dry-run]
+"""
+import argparse
+from app.core.database import SessionLocal
+from app.core.logger import log_info
+from app.services.dedupe_service import DedupeService
+
+
+def run(dry_run: bool = False) -> dict:
+    """Merge every duplicate group (only report them with dry_run)."""
+    db = SessionLocal()
+    try:
+        result = DedupeService(db).run(dry_run=dry_run)
+        log_info("[JOB] Dedupe job finished: %s", result)
+        return result
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merge duplicate contacts")
+    parser.add_argument("--dry-run", action="store_true", help="Report duplicate groups without merging")
+    run(dry_run=parser.parse_args().dry_run)
@@ -0,0 +1,159 @@
+"""
+Streaming export job.
+
+Writes contacts, bookings, messages or alerts to a CSV or NDJSON file
+(optionally gzipped) with flat memory:
+    python -m app.jobs.export_job messages messages.ndjson.gz --from 2025-01-01
+    python -m app.jobs.export_job messages messages.ndjson.gz --from 2025-01-01 --resume
+
+--resume continues an interrupted export after the last complete row in
+the file. A partial last row is cut off first; a gzipped file gets a new
+gzip member (readers concatenate them), or is rewritten up to its last
+complete row when the write stopped inside a member.
+"""
+import argparse
+import csv
+import gzip
+import os
+import zlib
+from datetime import datetime
+from typing import BinaryIO, Iterator, Optional, Tuple
+import orjson
+from app.core.config import settings
+from app.core.logger import log_info
+from app.services.export_service import stream_export, EXPORT_ENTITIES, EXPORT_FORMATS
+
+# Read size when rewriting the intact part of a gzipped export
+COPY_BLOCK_BYTES = 1 << 20
+
+
+def _scan_export(path: str, fmt: str, compressed: bool) -> Tuple[Optional[int], int, bool]:
+    """
+    Find where an existing export's complete rows end (streams the whole file).
+
+    Returns the id of the last complete row, the uncompressed byte offset
+    just after it and whether the file holds nothing past that offset (no
+    partial row, no truncated gzip member).
+    """
+    opener = gzip.open if compressed else open
+    last_id, end, consumed, intact = None, 0, 0, True
+    with opener(path, "rb") as stream:
+
+        def complete_lines() -> Iterator[bytes]:
+            """Newline-terminated lines, stopping at a partial last line or a broken gzip member."""
+            nonlocal consumed, intact
+            try:
+                for line in stream:
+                    if not line.endswith(b"\n"):
+                        intact = False
+                        return
+                    consumed += len(line)
+                    yield line
+            except (EOFError, gzip.BadGzipFile, zlib.error):
+                intact = False
+
+        try:
+            if fmt == "csv":
+                # Quoted fields may span lines: a row is complete when csv returns it
+                reader = csv.reader((line.decode() for line in complete_lines()), strict=True)
+                header = next(reader, None)
+                end = consumed
+                for row in reader:
+                    if len(row) != len(header):
+                        raise ValueError(f"row with {len(row)} of {len(header)} columns")
+                    last_id, end = int(row[header.index("id")]), consumed
+            else:
+                for line in complete_lines():
+                    last_id, end = orjson.loads(line)["id"], consumed
+        except (csv.Error, ValueError):
+            # Malformed tail of an interrupted write; rows before it are intact
+            intact = False
+    return last_id, end, intact and end == consumed
+
+
+def _copy_gzip_prefix(path: str, size: int, out: BinaryIO):
+    """Write the first `size` uncompressed bytes of a gzipped export to `out` as one gzip member."""
+    with gzip.open(path, "rb") as source, gzip.GzipFile(fileobj=out, mode="wb", compresslevel=settings.GZIP_LEVEL) as target:
+        while size > 0:
+            block = source.read(min(size, COPY_BLOCK_BYTES))
+            target.write(block)
+            size -= len(block)
+
+
+def _write(out: BinaryIO, chunks: Iterator[bytes]) -> int:
+    written = 0
+    for chunk in chunks:
+        out.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def run(
+    entity: str,
+    path: str,
+    fmt: str = None,
+    date_from: datetime = None,
+    date_to: datetime = None,
+    status: str = None,
+    include_archived: bool = False,
+    resume: bool = False,
+    workspace_id: int = None
+) -> dict:
+    """Export one workspace's `entity` to `path`; the format and gzip follow the file name unless given."""
+    workspace_id = workspace_id or settings.DEFAULT_WORKSPACE_ID
+    compressed = path.endswith(".gz")
+    fmt = fmt or ("ndjson" if path.removesuffix(".gz").endswith((".ndjson", ".jsonl")) else "csv")
+
+    after_id, keep, intact = None, 0, True
+    if resume and os.path.exists(path):
+        after_id, keep, intact = _scan_export(path, fmt, compressed)
+        log_info("[JOB] Resuming %s export after id %s (tail %s)", entity, after_id, "intact" if intact else "dropped")
+
+    chunks = stream_export(
+        entity, fmt, workspace_id, gzip=compressed,
+        date_from=date_from, date_to=date_to, status=status,
+        after_id=after_id, include_archived=include_archived
+    )
+    if after_id is None:
+        with open(path, "wb") as out:
+            written = _write(out, chunks)
+    elif not compressed:
+        with open(path, "r+b") as out:
+            # Drop a partial last row before appending
+            out.truncate(keep)
+            out.seek(keep)
+            written = _write(out, chunks)
+    elif intact:
+        with open(path, "ab") as out:
+            written = _write(out, chunks)
+    else:
+        # Readers stop at a broken member, so a new one can't follow it:
+        # rewrite the intact rows, then append
+        partial = f"{path}.partial"
+        with open(partial, "wb") as out:
+            _copy_gzip_prefix(path, keep, out)
+            written = _write(out, chunks)
+        os.replace(partial, path)
+
+    result = {"entity": entity, "path": path, "bytes": written, "resumed_after_id": after_id}
+    log_info("[JOB] Export job finished: %s", result)
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export an entity to CSV/NDJSON")
+    parser.add_argument("entity", choices=tuple(EXPORT_ENTITIES))
+    parser.add_argument("path", help="Output file (.csv, .ndjson, optionally .gz)")
+    parser.add_argument("--format", choices=tuple(EXPORT_FORMATS), help="Default: from the file name")
+    parser.add_argument("--from", dest="date_from", type=datetime.fromisoformat)
+    parser.add_argument("--to", dest="date_to", type=datetime.fromisoformat)
+    parser.add_argument("--status")
+    parser.add_argument("--include-archived", action="store_true")
+    parser.add_argument("--resume", action="store_true", help="Append after the last row already in the file")
+    parser.add_argument("--workspace", type=int, help="Workspace id (default: DEFAULT_WORKSPACE_ID)")
+    args = parser.parse_args()
+    run(
+        args.entity, args.path, fmt=args.format,
+        date_from=args.date_from, date_to=args.date_to, status=args.status,
+        include_archived=args.include_archived, resume=args.resume, workspace_id=args.workspace
+    )
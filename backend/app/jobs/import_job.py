@@ -0,0 +1,60 @@
+"""
+Bulk import job for contacts and bookings.
+
+Streams a CSV (header row) or NDJSON file into the database in batches,
+logging progress per batch:
+    python -m app.jobs.import_job contacts contacts.csv
+    python -m app.jobs.import_job bookings bookings.ndjson --automation queue
+    python -m app.jobs.import_job contacts contacts.csv --workspace 42
+
+Columns: contacts - name, email, phone. Bookings - contact_id or
+contact_email/contact_phone, staff_id, start_time, end_time, service_type,
+notes, status, form_status.
+"""
+import argparse
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logger import log_info
+from app.core.tenancy import set_workspace
+from app.services.import_service import ImportService, create_import_job, automation_queue, IMPORT_KINDS, AUTOMATION_MODES
+
+
+def run(kind: str, path: str, fmt: str = None, automation: str = "suppress", workspace_id: int = None) -> dict:
+    """Import `path` into a workspace; with automation="queue", waits for the queued sends to finish."""
+    fmt = fmt or ("ndjson" if path.endswith((".ndjson", ".jsonl")) else "csv")
+    workspace_id = workspace_id or settings.DEFAULT_WORKSPACE_ID
+    db = SessionLocal()
+    set_workspace(db, workspace_id)
+    try:
+        progress = create_import_job(db, kind, fmt, automation)
+        with open(path, "rb") as stream:
+            ImportService(db).run(stream, progress)
+    finally:
+        db.close()
+
+    if automation == "queue":
+        automation_queue.join()
+
+    result = {
+        "status": progress.status,
+        "processed": progress.processed,
+        "inserted": progress.inserted,
+        "duplicates": progress.duplicates,
+        "failed": progress.failed,
+        "automation_queued": progress.automation_queued,
+    }
+    log_info("[JOB] Import job finished: %s", result)
+    for error in progress.errors:
+        log_info("[JOB] Line %s: %s", error['line'], error['error'])
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk import contacts or bookings")
+    parser.add_argument("kind", choices=IMPORT_KINDS)
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=("csv", "ndjson"), help="Default: from the file extension")
+    parser.add_argument("--automation", choices=AUTOMATION_MODES, default="suppress")
+    parser.add_argument("--workspace", type=int, help="Workspace id (default: DEFAULT_WORKSPACE_ID)")
+    args = parser.parse_args()
+    run(args.kind, args.path, fmt=args.format, automation=args.automation, workspace_id=args.workspace)
@@ -0,0 +1,26 @@
+"""
+Contact purge job.
+
+Erases contacts queued with POST /contacts/purge, together with their
+bookings, series and messages, in bounded chunks. Run on a schedule
+(e.g. every 10 minutes):
+    python -m app.jobs.purge_job
+"""
+from app.core.database import SessionLocal
+from app.core.logger import log_info
+from app.services.purge_service import PurgeService
+
+
+def run() -> dict:
+    """Process every pending purge request."""
+    db = SessionLocal()
+    try:
+        result = PurgeService(db).run()
+        log_info("[JOB] Purge job finished: %s", result)
+        return result
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    run()
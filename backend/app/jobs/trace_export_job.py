@@ -0,0 +1,80 @@
+"""
+Trace export job.
+
+Converts sampled request traces (TRACE_FILE, one JSON object per line) to
+the Chrome trace event format, viewable offline in https://ui.perfetto.dev
+or chrome://tracing (files are opened locally, nothing is uploaded):
+    python -m app.jobs.trace_export_job traces.ndjson traces.json
+    python -m app.jobs.trace_export_job traces.ndjson slow.json --min-ms 200
+
+Each request is one track; its phases (auth, db, validate, serialize,
+integration) are nested under the request span.
+"""
+import argparse
+from typing import Iterator, Optional
+import orjson
+from app.core.logger import log_info
+
+
+def _events(record: dict, track: int) -> Iterator[dict]:
+    """Request span and its phase spans, in microseconds from the request start."""
+    yield {
+        "name": f"{record['method']} {record['route'] or record['path']}",
+        "cat": "request",
+        "ph": "X",
+        "pid": 1,
+        "tid": track,
+        "ts": 0,
+        "dur": record["duration_ms"] * 1000,
+        "args": {
+            "trace_id": record["trace_id"],
+            "path": record["path"],
+            "status": record["status"],
+            "queries": record["queries"],
+            "timestamp": record["timestamp"],
+        },
+    }
+    for span in record["spans"]:
+        yield {
+            "name": span["name"],
+            "cat": span["name"],
+            "ph": "X",
+            "pid": 1,
+            "tid": track,
+            "ts": span["start_ms"] * 1000,
+            "dur": span["duration_ms"] * 1000,
+            "args": {"detail": span["detail"]},
+        }
+
+
+def run(source: str, destination: str, min_ms: Optional[float] = None) -> int:
+    """
+    Write the traces of `source` (slower than min_ms, if given) as one
+    Chrome trace file. Returns the number of requests exported.
+    """
+    events = []
+    exported = 0
+    with open(source, "rb") as lines:
+        for line in lines:
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            if min_ms is not None and record["duration_ms"] < min_ms:
+                continue
+            exported += 1
+            events.extend(_events(record, exported))
+
+    with open(destination, "wb") as output:
+        output.write(orjson.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+
+    log_info("[JOB] Exported %s traces from %s to %s", exported, source, destination)
+    return exported
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert sampled request traces to Chrome trace format")
+    parser.add_argument("source", help="Trace file (TRACE_FILE)")
+    parser.add_argument("destination", help="Output .json for ui.perfetto.dev / chrome://tracing")
+    parser.add_argument("--min-ms", type=float, default=None, help="Only requests at least this slow")
+    args = parser.parse_args()
+    run(args.source, args.destination, min_ms=args.min_ms)
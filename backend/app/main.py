@@ -1,9 +1,14 @@
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from app.core.config import settings
-from app.core.logger import log_info, log_error
-from app.routes import auth, contacts, bookings, inventory, alerts, messages, dashboard
+from app.core.logger import log_info, log_error, RequestIdMiddleware, REQUEST_ID_HEADER
+from app.core.pagination import InvalidCursorError, NEXT_CURSOR_HEADER
+from app.core.compression import ContentNegotiationMiddleware
+from app.core.metrics import MetricsMiddleware, instrument_engine, metrics
+from app.core.query_tracking import QueryTrackingMiddleware
+from app.core.tracing import TracingMiddleware, trace_engine, trace_fastapi_validation
+from app.routes import auth, contacts, bookings, booking_series, inventory, alerts, messages, dashboard
 
 # Create FastAPI application
 app = FastAPI(
@@ -14,6 +19,10 @@ app = FastAPI(
     redoc_url="/redoc" if not settings.is_production else None
 )
 
+# Middleware: Starlette runs the last one added outermost, so a request
+# passes through RequestId -> QueryTracking -> Tracing -> Metrics ->
+# ContentNegotiation -> CORS -> routes, and responses in reverse.
+
 # CORS Middleware
 app.add_middleware(
     CORSMiddleware,
@@ -21,8 +30,41 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, REQUEST_ID_HEADER],
 )
 
+# Negotiated compression (br/gzip) and MessagePack encoding
+app.add_middleware(ContentNegotiationMiddleware)
+
+# Prometheus instrumentation (outside encoding, so timings include it)
+if metrics is not None:
+    from app.core.database import engine
+    instrument_engine(engine)
+    app.add_middleware(MetricsMiddleware, routes=app.router.routes)
+
+# Server-Timing header and sampled request traces
+if settings.SERVER_TIMING_ENABLED or settings.TRACE_SAMPLE_RATE > 0:
+    from app.core.database import engine
+    trace_engine(engine)
+    trace_fastapi_validation()
+    app.add_middleware(TracingMiddleware)
+
+# Per-request query budget and N+1 warnings (outside metrics and tracing, which read its counts)
+app.add_middleware(QueryTrackingMiddleware)
+
+# Request ids on log lines and responses (added last: every log line of a request carries it)
+app.add_middleware(RequestIdMiddleware)
+
+
+# Invalid pagination cursor -> 400
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+    """Reject malformed or foreign pagination cursors."""
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": str(exc)}
+    )
+
 
 # Global Exception Handler
 @app.exception_handler(Exception)
@@ -32,7 +74,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     
     Returns structured JSON response and logs the error.
     """
-    log_error(f"Unhandled exception: {str(exc)}", exc_info=True)
+    log_error("Unhandled exception: %s", exc, exc_info=True)
     
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -55,6 +97,28 @@ def health_check():
     }
 
 
+@app.get("/health/cache", tags=["Health"])
+def cache_stats():
+    """Service cache hit/miss/eviction statistics."""
+    from app.core.cache import service_cache
+    return service_cache.stats()
+
+
+@app.get("/health/single-flight", tags=["Health"])
+def single_flight_stats():
+    """Request coalescing statistics."""
+    from app.core.singleflight import single_flight
+    return single_flight.stats()
+
+
+if metrics is not None:
+    @app.get("/metrics", include_in_schema=False)
+    def metrics_endpoint():
+        """Prometheus scrape endpoint."""
+        body, content_type = metrics.render()
+        return Response(content=body, media_type=content_type)
+
+
 # Startup Event
 @app.on_event("startup")
 async def startup_event():
@@ -64,13 +128,18 @@ async def startup_event():
     Initialize database tables in development.
     In production, use Alembic migrations instead.
     """
-    log_info(f"[STARTUP] Starting CareOps API in {settings.ENVIRONMENT} mode")
+    log_info("[STARTUP] Starting CareOps API in %s mode", settings.ENVIRONMENT)
     
     if not settings.is_production:
         log_info("[STARTUP] Initializing database tables (development mode)")
         from app.core.database import init_db
         init_db()
     
+    # Keep upcoming monthly partitions ready (no-op unless partitioned)
+    from app.core.database import engine
+    from app.core.partitioning import ensure_future_partitions
+    ensure_future_partitions(engine)
+    
     log_info("[STARTUP] Application started successfully")
 
 
@@ -85,6 +154,7 @@ async def shutdown_event():
 app.include_router(auth.router)
 app.include_router(dashboard.router)
 app.include_router(contacts.router)
+app.include_router(booking_series.router)  # Before bookings: /bookings/series vs /bookings/{id}
 app.include_router(bookings.router)
 app.include_router(inventory.router)
 app.include_router(alerts.router)
@@ -93,6 +163,18 @@ app.include_router(messages.router)
 from app.routes import conversations
 app.include_router(conversations.router)
 
+from app.routes import search
+app.include_router(search.router)
+
+from app.routes import imports
+app.include_router(imports.router)
+
+from app.routes import export
+app.include_router(export.router)
+
+from app.routes import workspaces
+app.include_router(workspaces.router)
+
 
 # Root Endpoint
 @app.get("/", tags=["Root"])
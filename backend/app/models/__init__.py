@@ -1,24 +1,38 @@
 # Import all models to ensure they're registered with SQLAlchemy Base
+from app.models.workspace import Workspace
 from app.models.user import User, UserRole
 from app.models.contact import Contact
 from app.models.booking import Booking, BookingStatus, FormStatus
+from app.models.booking_series import BookingSeries, BookingSeriesException, RecurrenceFrequency
 from app.models.inventory import Inventory
-from app.models.alert import Alert, AlertType, AlertSeverity
-from app.models.message import Message, MessageChannel, MessageDirection, MessageStatus
+from app.models.alert import Alert, AlertArchive, AlertType, AlertSeverity
+from app.models.message import Message, MessageArchive, MessageChannel, MessageDirection, MessageStatus
+from app.models.search_index import SearchIndexEntry
+from app.models.purge_request import PurgeRequest
+from app.models.import_job import ImportJob
 
 __all__ = [
+    "Workspace",
     "User",
     "UserRole",
     "Contact",
     "Booking",
     "BookingStatus",
     "FormStatus",
+    "BookingSeries",
+    "BookingSeriesException",
+    "RecurrenceFrequency",
     "Inventory",
     "Alert",
+    "AlertArchive",
     "AlertType",
     "AlertSeverity",
     "Message",
+    "MessageArchive",
     "MessageChannel",
     "MessageDirection",
     "MessageStatus",
+    "SearchIndexEntry",
+    "PurgeRequest",
+    "ImportJob",
 ]
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Index, Enum as SQLEnum
 from datetime import datetime
 import enum
 from app.core.database import Base
+from app.core.tenancy import WorkspaceScoped
 
 
 class AlertType(str, enum.Enum):
@@ -19,21 +20,32 @@ class AlertSeverity(str, enum.Enum):
     CRITICAL = "critical"
 
 
-class Alert(Base):
+class Alert(WorkspaceScoped, Base):
     """
     Alert model for system notifications.
     
     Alerts are never deleted, only dismissed.
     This maintains a complete audit trail.
+    
+    On PostgreSQL the table is range-partitioned by month on created_at.
+    Dismissed alerts are moved to AlertArchive by the archive job.
     """
     __tablename__ = "alerts"
+    __table_args__ = (
+        # Keyset pagination of list endpoints
+        Index("ix_alerts_workspace_id_created_at_id", "workspace_id", "created_at", "id"),
+        # Active alert count
+        Index("ix_alerts_workspace_id_is_dismissed", "workspace_id", "is_dismissed"),
+        # Alerts of one referenced entity, newest first (contact timeline)
+        Index("ix_alerts_reference_created_at_id", "reference_type", "reference_id", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     type = Column(SQLEnum(AlertType), nullable=False, index=True)
     severity = Column(SQLEnum(AlertSeverity), nullable=False, default=AlertSeverity.INFO, index=True)
     message = Column(String(1000), nullable=False)
     details = Column(String(2000), nullable=True)
-    is_dismissed = Column(Boolean, default=False, nullable=False, index=True)
+    is_dismissed = Column(Boolean, default=False, nullable=False)
     dismissed_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     
@@ -43,3 +55,31 @@ class Alert(Base):
     
     def __repr__(self):
         return f"<Alert(id={self.id}, type={self.type}, severity={self.severity}, is_dismissed={self.is_dismissed})>"
+
+
+class AlertArchive(WorkspaceScoped, Base):
+    """
+    Archive tier for dismissed alerts.
+    
+    Same columns as Alert, in the same order, so rows can be moved with
+    INSERT ... SELECT and read back through a UNION with the hot table.
+    Only lookup indexes are kept; storage is tuned for compression.
+    """
+    __tablename__ = "alerts_archive"
+    __table_args__ = (
+        Index("ix_alerts_archive_workspace_id_created_at", "workspace_id", "created_at"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    type = Column(SQLEnum(AlertType), nullable=False)
+    severity = Column(SQLEnum(AlertSeverity), nullable=False)
+    message = Column(String(1000), nullable=False)
+    details = Column(String(2000), nullable=True)
+    is_dismissed = Column(Boolean, nullable=False)
+    dismissed_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=False, index=True)
+    reference_type = Column(String(50), nullable=True)
+    reference_id = Column(Integer, nullable=True)
+    
+    def __repr__(self):
+        return f"<AlertArchive(id={self.id}, type={self.type}, created_at={self.created_at})>"
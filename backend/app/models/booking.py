@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, ForeignKeyConstraint, Index, DDL, event, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
 from app.core.database import Base
+from app.core.tenancy import WorkspaceScoped
 
 
 class BookingStatus(str, enum.Enum):
@@ -20,7 +21,33 @@ class FormStatus(str, enum.Enum):
     COMPLETED = "completed"
 
 
-class Booking(Base):
+# Staff double-booking is prevented by the database: no two non-cancelled
+# bookings of one staff member may overlap in [start, end).
+STAFF_OVERLAP_CONSTRAINT = "ex_bookings_staff_overlap"
+STAFF_OVERLAP_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS btree_gist",
+    f"ALTER TABLE bookings ADD CONSTRAINT {STAFF_OVERLAP_CONSTRAINT} "
+    "EXCLUDE USING gist (staff_id WITH =, tsrange(start_time, end_time, '[)') WITH &&) "
+    "WHERE (status <> 'CANCELLED')",
+]
+
+# SQLite (tests, local development) has no exclusion constraints: triggers
+# abort conflicting writes with the constraint's name, so the service maps
+# them to the same conflict error.
+_STAFF_OVERLAP_CHECK = (
+    f"BEGIN SELECT RAISE(ABORT, '{STAFF_OVERLAP_CONSTRAINT}') WHERE EXISTS ("
+    "SELECT 1 FROM bookings WHERE staff_id = NEW.staff_id AND status <> 'CANCELLED' "
+    "AND start_time < NEW.end_time AND end_time > NEW.start_time AND id IS NOT NEW.id); END"
+)
+STAFF_OVERLAP_SQLITE_DDL = [
+    "CREATE TRIGGER tr_bookings_staff_overlap_insert BEFORE INSERT ON bookings "
+    f"WHEN NEW.staff_id IS NOT NULL AND NEW.status <> 'CANCELLED' {_STAFF_OVERLAP_CHECK}",
+    "CREATE TRIGGER tr_bookings_staff_overlap_update BEFORE UPDATE OF staff_id, start_time, end_time, status "
+    f"ON bookings WHEN NEW.staff_id IS NOT NULL AND NEW.status <> 'CANCELLED' {_STAFF_OVERLAP_CHECK}",
+]
+
+
+class Booking(WorkspaceScoped, Base):
     """
     Booking model for appointments/reservations.
     
@@ -28,11 +55,33 @@ class Booking(Base):
     - On create: Send confirmation message (via automation_service)
     - Before start_time: Send reminder (via automation_service)
     - On form pending: Send form reminder (via automation_service)
+    
+    Overlapping bookings for the same staff member are rejected by the
+    STAFF_OVERLAP_CONSTRAINT exclusion constraint (PostgreSQL) or its
+    triggers (SQLite).
     """
     __tablename__ = "bookings"
+    __table_args__ = (
+        # Staff schedule range scans (calendars)
+        Index("ix_bookings_staff_id_start_time", "staff_id", "start_time"),
+        # Staff bookings overlapping a range (availability): end_time > range start
+        Index("ix_bookings_staff_id_end_time", "staff_id", "end_time"),
+        # Keyset pagination of list endpoints
+        Index("ix_bookings_workspace_id_start_time_id", "workspace_id", "start_time", "id"),
+        # Staff offering a service (public availability)
+        Index("ix_bookings_workspace_id_service_type", "workspace_id", "service_type"),
+        # Past-due scan of the status job (one workspace at a time)
+        Index("ix_bookings_workspace_id_status_end_time", "workspace_id", "status", "end_time"),
+        # Contact timeline
+        Index("ix_bookings_contact_id_start_time_id", "contact_id", "start_time", "id"),
+        # Contact of the same workspace only
+        ForeignKeyConstraint(
+            ["workspace_id", "contact_id"], ["contacts.workspace_id", "contacts.id"], ondelete="CASCADE"
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    contact_id = Column(Integer, ForeignKey("contacts.id", ondelete="CASCADE"), nullable=False, index=True)
+    contact_id = Column(Integer, nullable=False, index=True)
     staff_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
     status = Column(SQLEnum(BookingStatus), nullable=False, default=BookingStatus.PENDING, index=True)
     form_status = Column(SQLEnum(FormStatus), nullable=False, default=FormStatus.PENDING)
@@ -41,6 +90,7 @@ class Booking(Base):
     service_type = Column(String(255), nullable=True)
     notes = Column(String(1000), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
     # Relationships
     contact = relationship("Contact", back_populates="bookings")
@@ -48,3 +98,10 @@ class Booking(Base):
     
     def __repr__(self):
         return f"<Booking(id={self.id}, contact_id={self.contact_id}, status={self.status}, start_time={self.start_time})>"
+
+
+# Dev databases created with init_db() get the same constraint as migration 004
+for _statement in STAFF_OVERLAP_DDL:
+    event.listen(Booking.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in STAFF_OVERLAP_SQLITE_DDL:
+    event.listen(Booking.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
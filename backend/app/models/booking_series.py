@@ -0,0 +1,94 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, ForeignKeyConstraint, Index, UniqueConstraint, Enum as SQLEnum
+from sqlalchemy.orm import relationship
+from datetime import datetime
+import enum
+from app.core.database import Base
+from app.core.tenancy import WorkspaceScoped
+from app.models.booking import BookingStatus
+
+
+class RecurrenceFrequency(str, enum.Enum):
+    """Recurrence frequency enumeration (RRULE FREQ subset)."""
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+
+class BookingSeries(WorkspaceScoped, Base):
+    """
+    Recurring booking series stored once (RRULE-style).
+    
+    Occurrences are never stored as Booking rows. They are expanded lazily
+    for the queried window by recurrence_service.iter_occurrences.
+    Per-occurrence changes/cancellations live in BookingSeriesException.
+    """
+    __tablename__ = "booking_series"
+    __table_args__ = (
+        Index("ix_booking_series_staff_id_start_time", "staff_id", "start_time"),
+        # Series of a workspace active in a window (occurrence listings)
+        Index("ix_booking_series_workspace_id_start_time", "workspace_id", "start_time"),
+        # Contact of the same workspace only
+        ForeignKeyConstraint(
+            ["workspace_id", "contact_id"], ["contacts.workspace_id", "contacts.id"], ondelete="CASCADE"
+        ),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    contact_id = Column(Integer, nullable=False, index=True)
+    staff_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    status = Column(SQLEnum(BookingStatus), nullable=False, default=BookingStatus.PENDING, index=True)
+    service_type = Column(String(255), nullable=True)
+    notes = Column(String(1000), nullable=True)
+    
+    # Rule: first occurrence (DTSTART), FREQ, INTERVAL, BYDAY, UNTIL, COUNT
+    start_time = Column(DateTime, nullable=False, index=True)
+    duration_minutes = Column(Integer, nullable=False)
+    frequency = Column(SQLEnum(RecurrenceFrequency), nullable=False, default=RecurrenceFrequency.WEEKLY)
+    interval = Column(Integer, nullable=False, default=1)
+    by_weekday = Column(String(20), nullable=True)  # Weekly only, e.g. "0,3" (Monday = 0)
+    until = Column(DateTime, nullable=True, index=True)
+    count = Column(Integer, nullable=True)
+    
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    # Relationships
+    exceptions = relationship("BookingSeriesException", back_populates="series", passive_deletes=True)
+    
+    @property
+    def weekdays(self) -> list[int]:
+        """Weekly BYDAY as sorted weekday numbers (defaults to DTSTART's weekday)."""
+        if self.by_weekday:
+            return sorted({int(day) for day in self.by_weekday.split(",") if day.strip()})
+        return [self.start_time.weekday()]
+    
+    def __repr__(self):
+        return f"<BookingSeries(id={self.id}, contact_id={self.contact_id}, frequency={self.frequency}, start_time={self.start_time})>"
+
+
+class BookingSeriesException(WorkspaceScoped, Base):
+    """
+    Sparse override for one occurrence of a series.
+    
+    Keyed by the occurrence's original start. Can move it (start_time/end_time),
+    change its status (e.g. CANCELLED, COMPLETED) or its notes.
+    """
+    __tablename__ = "booking_series_exceptions"
+    __table_args__ = (
+        UniqueConstraint("series_id", "occurrence_start", name="uq_booking_series_exceptions_occurrence"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    series_id = Column(Integer, ForeignKey("booking_series.id", ondelete="CASCADE"), nullable=False)
+    occurrence_start = Column(DateTime, nullable=False)
+    start_time = Column(DateTime, nullable=True, index=True)
+    end_time = Column(DateTime, nullable=True)
+    status = Column(SQLEnum(BookingStatus), nullable=True)
+    notes = Column(String(1000), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    # Relationships
+    series = relationship("BookingSeries", back_populates="exceptions")
+    
+    def __repr__(self):
+        return f"<BookingSeriesException(series_id={self.series_id}, occurrence_start={self.occurrence_start}, status={self.status})>"
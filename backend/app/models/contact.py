@@ -1,15 +1,65 @@
-from sqlalchemy import Column, Integer, String, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, Index, UniqueConstraint, DDL, event, func
+from sqlalchemy.orm import relationship, validates
 from datetime import datetime
 from app.core.database import Base
+from app.core.normalization import normalize_email, normalize_phone
+from app.core.tenancy import WorkspaceScoped
 
 
-class Contact(Base):
+# Full-text search (PostgreSQL only): generated tsvector column + GIN index.
+# Not mapped on the model; SearchService references it by name.
+CONTACT_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', name), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(email, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(phone, '')), 'C')"
+)
+CONTACT_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS btree_gin",
+    f"ALTER TABLE contacts ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({CONTACT_SEARCH_VECTOR}) STORED",
+    "CREATE INDEX ix_contacts_search_vector ON contacts USING gin (workspace_id, search_vector)",
+]
+
+# Typeahead lookup (PostgreSQL only): prefix (text_pattern_ops) indexes on
+# lowercased name/email and on phone digits, plus a trigram index on the
+# name for word-prefix matches ("% ali%"), all led by workspace_id.
+# Expressions match ContactService.
+PHONE_SEPARATORS = " -().+/"
+PHONE_DIGITS_SQL = "coalesce(phone, '')"
+for _separator in PHONE_SEPARATORS:
+    PHONE_DIGITS_SQL = f"replace({PHONE_DIGITS_SQL}, '{_separator}', '')"
+
+CONTACT_LOOKUP_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS btree_gin",
+    "CREATE INDEX ix_contacts_name_prefix ON contacts (workspace_id, lower(name) text_pattern_ops)",
+    "CREATE INDEX ix_contacts_name_trgm ON contacts USING gin (workspace_id, lower(name) gin_trgm_ops)",
+    "CREATE INDEX ix_contacts_email_prefix ON contacts (workspace_id, lower(email) text_pattern_ops)",
+    f"CREATE INDEX ix_contacts_phone_digits_prefix ON contacts (workspace_id, ({PHONE_DIGITS_SQL}) text_pattern_ops)",
+]
+
+
+def phone_digits(column):
+    """SQL expression stripping separators from a phone column (matches PHONE_DIGITS_SQL)."""
+    expression = func.coalesce(column, "")
+    for separator in PHONE_SEPARATORS:
+        expression = func.replace(expression, separator, "")
+    return expression
+
+
+class Contact(WorkspaceScoped, Base):
     """
     Contact model for customers/leads.
     Represents people who interact with the business.
     """
     __tablename__ = "contacts"
+    __table_args__ = (
+        # Target of the (workspace_id, contact_id) foreign keys; also the
+        # tenant-leading index for keyset pagination
+        UniqueConstraint("workspace_id", "id", name="uq_contacts_workspace_id_id"),
+        # Duplicate detection within a workspace
+        Index("ix_contacts_workspace_id_email_key", "workspace_id", "email_key"),
+        Index("ix_contacts_workspace_id_phone_key", "workspace_id", "phone_key"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
@@ -17,9 +67,28 @@ class Contact(Base):
     phone = Column(String(50), nullable=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     
-    # Relationships
-    bookings = relationship("Booking", back_populates="contact", cascade="all, delete-orphan")
-    messages = relationship("Message", back_populates="contact", cascade="all, delete-orphan")
+    # Normalized blocking keys for duplicate detection (kept in step by the validators)
+    email_key = Column(String(255), nullable=True)
+    phone_key = Column(String(16), nullable=True)
+    
+    # Relationships (children are removed by the ON DELETE CASCADE foreign
+    # keys; passive_deletes keeps the ORM from loading them on delete)
+    bookings = relationship("Booking", back_populates="contact", cascade="all, delete-orphan", passive_deletes=True)
+    messages = relationship("Message", back_populates="contact", cascade="all, delete-orphan", passive_deletes=True)
+    
+    @validates("email")
+    def _set_email_key(self, key, email):
+        self.email_key = normalize_email(email)
+        return email
+    
+    @validates("phone")
+    def _set_phone_key(self, key, phone):
+        self.phone_key = normalize_phone(phone)
+        return phone
     
     def __repr__(self):
         return f"<Contact(id={self.id}, name={self.name}, email={self.email})>"
+
+
+for _statement in CONTACT_SEARCH_DDL + CONTACT_LOOKUP_DDL:
+    event.listen(Contact.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from datetime import datetime
+from app.core.database import Base
+from app.core.tenancy import WorkspaceScoped
+
+
+class ImportJob(WorkspaceScoped, Base):
+    """
+    Progress and result of one bulk import.
+
+    Updated by the importing process in each batch's transaction, so
+    GET /imports/{id} can be answered by any worker and the counts always
+    match the committed rows.
+    """
+    __tablename__ = "import_jobs"
+
+    id = Column(String(32), primary_key=True)
+    kind = Column(String(20), nullable=False)
+    format = Column(String(10), nullable=False)
+    automation = Column(String(10), nullable=False)
+    status = Column(String(20), nullable=False)
+    processed = Column(Integer, nullable=False, default=0)
+    inserted = Column(Integer, nullable=False, default=0)
+    duplicates = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    automation_queued = Column(Integer, nullable=False, default=0)
+    errors = Column(JSON, nullable=False, default=list)  # First IMPORT_MAX_ERRORS row errors
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<ImportJob(id={self.id}, kind={self.kind}, status={self.status})>"
@@ -1,9 +1,10 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint
 from datetime import datetime
 from app.core.database import Base
+from app.core.tenancy import WorkspaceScoped
 
 
-class Inventory(Base):
+class Inventory(WorkspaceScoped, Base):
     """
     Inventory model for tracking stock levels.
     
@@ -11,9 +12,13 @@ class Inventory(Base):
     - When quantity < threshold: Create alert (via inventory_service)
     """
     __tablename__ = "inventory"
+    __table_args__ = (
+        # Item names are unique per workspace
+        UniqueConstraint("workspace_id", "item_name", name="uq_inventory_workspace_id_item_name"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    item_name = Column(String(255), nullable=False, unique=True, index=True)
+    item_name = Column(String(255), nullable=False)
     quantity = Column(Integer, nullable=False, default=0)
     threshold = Column(Integer, nullable=False, default=10)
     unit = Column(String(50), nullable=True)
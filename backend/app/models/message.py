@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, ForeignKeyConstraint, Index, DDL, event, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
 from app.core.database import Base
+from app.core.tenancy import WorkspaceScoped
 
 
 class MessageChannel(str, enum.Enum):
@@ -26,17 +27,43 @@ class MessageStatus(str, enum.Enum):
     FAILED = "failed"
 
 
-class Message(Base):
+# Full-text search (PostgreSQL only): a generated tsvector column, so every
+# write path - ORM, bulk or raw SQL - keeps it current, plus a GIN index.
+# Not mapped on the model; SearchService references it by name.
+MESSAGE_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(subject, '')), 'A') || "
+    "setweight(to_tsvector('english', content), 'B')"
+)
+MESSAGE_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS btree_gin",
+    f"ALTER TABLE messages ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({MESSAGE_SEARCH_VECTOR}) STORED",
+    "CREATE INDEX ix_messages_search_vector ON messages USING gin (workspace_id, search_vector)",
+]
+
+
+class Message(WorkspaceScoped, Base):
     """
     Message model for communication tracking.
     
     Tracks all messages sent/received through various channels.
     Integration failures are logged but don't break the flow.
+    
+    On PostgreSQL the table is range-partitioned by month on created_at.
+    Old messages are moved to MessageArchive by the archive job.
     """
     __tablename__ = "messages"
+    __table_args__ = (
+        # Keyset pagination of list endpoints
+        Index("ix_messages_workspace_id_created_at_id", "workspace_id", "created_at", "id"),
+        Index("ix_messages_contact_id_created_at_id", "contact_id", "created_at", "id"),
+        # Contact of the same workspace only
+        ForeignKeyConstraint(
+            ["workspace_id", "contact_id"], ["contacts.workspace_id", "contacts.id"], ondelete="CASCADE"
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    contact_id = Column(Integer, ForeignKey("contacts.id", ondelete="CASCADE"), nullable=False, index=True)
+    contact_id = Column(Integer, nullable=False, index=True)
     staff_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
     channel = Column(SQLEnum(MessageChannel), nullable=False, index=True)
     direction = Column(SQLEnum(MessageDirection), nullable=False, index=True)
@@ -53,3 +80,39 @@ class Message(Base):
     
     def __repr__(self):
         return f"<Message(id={self.id}, contact_id={self.contact_id}, channel={self.channel}, direction={self.direction}, status={self.status})>"
+
+
+for _statement in MESSAGE_SEARCH_DDL:
+    event.listen(Message.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+
+
+class MessageArchive(WorkspaceScoped, Base):
+    """
+    Archive tier for old messages.
+    
+    Same columns as Message, in the same order, so rows can be moved with
+    INSERT ... SELECT and read back through a UNION with the hot table.
+    Only lookup indexes are kept; storage is tuned for compression.
+    """
+    __tablename__ = "messages_archive"
+    __table_args__ = (
+        Index("ix_messages_archive_workspace_id_created_at", "workspace_id", "created_at"),
+        ForeignKeyConstraint(
+            ["workspace_id", "contact_id"], ["contacts.workspace_id", "contacts.id"], ondelete="CASCADE"
+        ),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    contact_id = Column(Integer, nullable=False, index=True)
+    staff_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    channel = Column(SQLEnum(MessageChannel), nullable=False)
+    direction = Column(SQLEnum(MessageDirection), nullable=False)
+    status = Column(SQLEnum(MessageStatus), nullable=False)
+    content = Column(String(5000), nullable=False)
+    subject = Column(String(500), nullable=True)
+    error_message = Column(String(1000), nullable=True)
+    created_at = Column(DateTime, nullable=False, index=True)
+    sent_at = Column(DateTime, nullable=True)
+    
+    def __repr__(self):
+        return f"<MessageArchive(id={self.id}, contact_id={self.contact_id}, created_at={self.created_at})>"
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index
+from datetime import datetime
+from app.core.database import Base
+from app.core.tenancy import WorkspaceScoped
+
+
+class PurgeRequest(WorkspaceScoped, Base):
+    """
+    Pending or completed erasure of one contact and all its data
+    (GDPR requests, bulk cleanup).
+    
+    Processed by the purge job in bounded chunks. contact_id is not a
+    foreign key: the request outlives the contact as an audit record.
+    """
+    __tablename__ = "purge_requests"
+    __table_args__ = (
+        # Pending-request scan of the purge job
+        Index("ix_purge_requests_completed_at_id", "completed_at", "id"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    contact_id = Column(Integer, nullable=False, index=True)
+    requested_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    requested_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    completed_at = Column(DateTime, nullable=True)
+    rows_deleted = Column(Integer, nullable=True)
+    
+    def __repr__(self):
+        return f"<PurgeRequest(id={self.id}, contact_id={self.contact_id}, completed_at={self.completed_at})>"
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, Index
+from app.core.database import Base
+
+
+class SearchIndexEntry(Base):
+    """
+    Inverted index used for full-text search on databases without tsvector
+    (SQLite test runs). One row per (entity, term) with a weighted count.
+    
+    Maintained by SearchService session hooks; unused on PostgreSQL, which
+    searches generated tsvector columns instead.
+    """
+    __tablename__ = "search_index"
+    __table_args__ = (
+        Index("ix_search_index_term_entity", "term", "entity_type", "entity_id"),
+    )
+    
+    entity_type = Column(String(20), primary_key=True)
+    entity_id = Column(Integer, primary_key=True)
+    term = Column(String(100), primary_key=True)
+    weight = Column(Integer, nullable=False, default=1)
+    
+    def __repr__(self):
+        return f"<SearchIndexEntry({self.entity_type}:{self.entity_id}, term={self.term})>"
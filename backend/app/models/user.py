@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
 from app.core.database import Base
+from app.core.tenancy import WorkspaceScoped
 
 
 class UserRole(str, enum.Enum):
@@ -11,13 +12,16 @@ class UserRole(str, enum.Enum):
     STAFF = "staff"
 
 
-class User(Base):
+class User(WorkspaceScoped, Base):
     """
     User model for authentication and authorization.
     
     Roles:
     - admin: Full access to all features
     - staff: Limited access (cannot modify system logic)
+    
+    Each user belongs to one workspace; their requests are scoped to it.
+    Emails are unique across workspaces (login by email).
     """
     __tablename__ = "users"
     
@@ -25,12 +29,15 @@ class User(Base):
     name = Column(String(255), nullable=False)
     email = Column(String(255), unique=True, nullable=False, index=True)
     hashed_password = Column(String(60), nullable=False)  # Bcrypt hash is always 60 chars
+    feed_token_hash = Column(String(64), unique=True, index=True, nullable=True)  # SHA-256 of the calendar feed token
     role = Column(SQLEnum(UserRole), nullable=False, default=UserRole.STAFF)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Relationships
-    bookings_assigned = relationship("Booking", back_populates="staff", foreign_keys="Booking.staff_id")
-    messages_sent = relationship("Message", back_populates="staff", foreign_keys="Message.staff_id")
+    # staff_id is nulled by the ON DELETE SET NULL foreign keys
+    bookings_assigned = relationship("Booking", back_populates="staff", foreign_keys="Booking.staff_id", passive_deletes=True)
+    messages_sent = relationship("Message", back_populates="staff", foreign_keys="Message.staff_id", passive_deletes=True)
     
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, role={self.role})>"
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from datetime import datetime
+from app.core.database import Base
+
+
+class Workspace(Base):
+    """
+    Workspace (tenant): one business served by the deployment.
+    
+    Every business table carries a workspace_id (see
+    app.core.tenancy.WorkspaceScoped); deleting a workspace cascades to
+    all of its rows.
+    """
+    __tablename__ = "workspaces"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(255), nullable=False)
+    slug = Column(String(100), nullable=False, unique=True, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f"<Workspace(id={self.id}, slug={self.slug})>"
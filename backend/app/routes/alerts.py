@@ -1,36 +1,64 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Set
 from app.core.database import get_db
 from app.dependencies.auth_dependency import get_current_user
+from app.dependencies.expand_dependency import expand_param
+from app.dependencies.fields_dependency import fields_param
 from app.models.user import User
 from app.models.alert import AlertType, AlertSeverity
-from app.schemas.alert_schema import AlertResponse, AlertDismiss
-from app.services.alert_service import AlertService
+from app.schemas.alert_schema import AlertResponse, AlertExpandedResponse, AlertDismiss
+from app.services.alert_service import AlertService, SORT_KEY
+from app.core.pagination import set_next_cursor
+from app.core.fieldsets import sparse_response
+from app.core.serialization import list_response
 
 router = APIRouter(prefix="/alerts", tags=["Alerts"])
 
 
-@router.get("", response_model=List[AlertResponse])
+@router.get("", response_model=List[AlertExpandedResponse])
 def get_alerts(
     skip: int = 0,
     limit: int = 100,
     include_dismissed: bool = False,
     alert_type: Optional[AlertType] = None,
     severity: Optional[AlertSeverity] = None,
+    include_archived: bool = False,
+    expand: Set[str] = Depends(expand_param("reference")),
+    cursor: Optional[str] = None,
+    fields: Optional[frozenset] = Depends(fields_param(AlertExpandedResponse)),
+    response: Response = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get alerts with pagination and filters."""
+    """
+    Get alerts with pagination and filters.
+    
+    `expand=reference` embeds the referenced inventory item/booking
+    (one extra query per reference type on the page).
+    Pass the `X-Next-Cursor` response header back as `cursor` for the next page.
+    `fields=id,message,...` returns only those fields (column-only select).
+    """
     service = AlertService(db)
     alerts = service.get_alerts(
         skip=skip,
         limit=limit,
         include_dismissed=include_dismissed,
         alert_type=alert_type,
-        severity=severity
+        severity=severity,
+        include_archived=include_archived,
+        cursor=cursor,
+        fields=fields
     )
-    return [AlertResponse.model_validate(a) for a in alerts]
+    set_next_cursor(response, alerts, SORT_KEY, limit)
+    
+    references = service.get_references(alerts) if "reference" in expand else {}
+    for a in alerts:
+        a.reference = references.get((a.reference_type, a.reference_id))
+    
+    if fields:
+        return sparse_response(response, AlertExpandedResponse, fields, alerts)
+    return list_response(AlertExpandedResponse, alerts, response)
 
 
 @router.get("/count", response_model=dict)
@@ -1,46 +1,56 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
-from app.core.security import hash_password, verify_password, create_access_token
-from app.models.user import User
-from app.schemas.user_schema import UserCreate, UserLogin, TokenResponse, UserResponse
+from app.core.security import hash_password, verify_password, create_access_token, create_feed_token
+from app.models.user import User, UserRole
+from app.dependencies.auth_dependency import get_current_user
+from app.schemas.user_schema import UserRegister, UserLogin, TokenResponse, UserResponse, FeedTokenResponse
+from app.services.workspace_service import WorkspaceService
 from app.core.logger import log_info, log_warning
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+def register(user_data: UserRegister, db: Session = Depends(get_db)):
     """
     Register a new user.
     
+    Sign-up creates a new workspace (named `workspace_name`, or after the
+    user) and makes the user its admin. Joining an existing workspace is
+    only possible through its admins (POST /workspace/users).
+    
     Returns JWT token and user details.
     """
-    log_info(f"[AUTH] Registration attempt for email: {user_data.email}")
+    log_info("[AUTH] Registration attempt for email: %s", user_data.email)
     
     # Check if user already exists
     existing_user = db.query(User).filter(User.email == user_data.email).first()
     if existing_user:
-        log_warning(f"[AUTH] Registration failed - email already exists: {user_data.email}")
+        log_warning("[AUTH] Registration failed - email already exists: %s", user_data.email)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
+    # Every sign-up gets its own workspace (onboarding)
+    workspace = WorkspaceService(db).create_workspace(user_data.workspace_name or user_data.name)
+    
     # Create new user
     hashed_pw = hash_password(user_data.password)
     new_user = User(
         name=user_data.name,
         email=user_data.email,
         hashed_password=hashed_pw,
-        role=user_data.role
+        role=UserRole.ADMIN,
+        workspace_id=workspace.id
     )
     
     db.add(new_user)
     db.commit()
     db.refresh(new_user)
     
-    log_info(f"[AUTH] User registered successfully: {new_user.id}")
+    log_info("[AUTH] User registered successfully: %s", new_user.id)
     
     # Generate token (convert ID to string for JWT)
     access_token = create_access_token(data={"sub": str(new_user.id)})
@@ -58,12 +68,12 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
     
     Returns JWT token and user details.
     """
-    log_info(f"[AUTH] Login attempt for email: {credentials.email}")
+    log_info("[AUTH] Login attempt for email: %s", credentials.email)
     
     # Find user
     user = db.query(User).filter(User.email == credentials.email).first()
     if not user:
-        log_warning(f"[AUTH] Login failed - user not found: {credentials.email}")
+        log_warning("[AUTH] Login failed - user not found: %s", credentials.email)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
@@ -71,13 +81,13 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
     
     # Verify password
     if not verify_password(credentials.password, user.hashed_password):
-        log_warning(f"[AUTH] Login failed - invalid password: {credentials.email}")
+        log_warning("[AUTH] Login failed - invalid password: %s", credentials.email)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
     
-    log_info(f"[AUTH] Login successful: {user.id}")
+    log_info("[AUTH] Login successful: %s", user.id)
     
     # Generate token (convert ID to string for JWT)
     access_token = create_access_token(data={"sub": str(user.id)})
@@ -86,3 +96,38 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
         access_token=access_token,
         user=UserResponse.model_validate(user)
     )
+
+
+@router.post("/feed-token", response_model=FeedTokenResponse)
+def issue_feed_token(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Issue a calendar feed token for the current user, revoking any previous one.
+    
+    The token doesn't expire and only opens the user's own
+    `calendar.ics` feed; it is returned once (only its hash is stored).
+    """
+    token, token_hash = create_feed_token()
+    current_user.feed_token_hash = token_hash
+    db.commit()
+    
+    log_info("[AUTH] Feed token issued: %s", current_user.id)
+    
+    return FeedTokenResponse(
+        feed_token=token,
+        feed_url=f"/bookings/staff/{current_user.id}/calendar.ics?token={token}"
+    )
+
+
+@router.delete("/feed-token", status_code=status.HTTP_204_NO_CONTENT)
+def revoke_feed_token(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Revoke the current user's calendar feed token."""
+    current_user.feed_token_hash = None
+    db.commit()
+    
+    log_info("[AUTH] Feed token revoked: %s", current_user.id)
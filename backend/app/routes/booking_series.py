@@ -0,0 +1,149 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from typing import List
+from datetime import datetime
+from app.core.database import get_db
+from app.dependencies.auth_dependency import get_current_user
+from app.models.user import User
+from app.schemas.booking_series_schema import (
+    BookingSeriesCreate,
+    BookingSeriesUpdate,
+    BookingSeriesResponse,
+    SeriesExceptionCreate,
+    SeriesExceptionResponse,
+    OccurrenceResponse,
+)
+from app.services.recurrence_service import RecurrenceService
+from app.core.serialization import list_response
+
+router = APIRouter(prefix="/bookings/series", tags=["Booking Series"])
+
+
+@router.post("", response_model=BookingSeriesResponse, status_code=status.HTTP_201_CREATED)
+def create_series(
+    series_data: BookingSeriesCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Create a recurring booking series (stored once, expanded on read).
+    """
+    service = RecurrenceService(db)
+    try:
+        series = service.create_series(series_data)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    return BookingSeriesResponse.model_validate(series)
+
+
+@router.get("/occurrences", response_model=List[OccurrenceResponse])
+def get_occurrences(
+    date_from: datetime = Query(..., alias="from"),
+    date_to: datetime = Query(..., alias="to"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get occurrences of all active series overlapping [from, to)."""
+    service = RecurrenceService(db)
+    occurrences = service.iter_window_occurrences(date_from, date_to, include_cancelled=True)
+    return list_response(
+        OccurrenceResponse,
+        sorted(occurrences, key=lambda o: (o.start_time, o.series_id))
+    )
+
+
+@router.get("/{series_id}", response_model=BookingSeriesResponse)
+def get_series(
+    series_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get series by ID."""
+    service = RecurrenceService(db)
+    series = service.get_series(series_id)
+    if not series:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Booking series {series_id} not found"
+        )
+    return BookingSeriesResponse.model_validate(series)
+
+
+@router.patch("/{series_id}", response_model=BookingSeriesResponse)
+def update_series(
+    series_id: int,
+    series_data: BookingSeriesUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Update a whole series (status CANCELLED cancels every occurrence)."""
+    service = RecurrenceService(db)
+    try:
+        series = service.update_series(series_id, series_data)
+        return BookingSeriesResponse.model_validate(series)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+@router.get("/{series_id}/occurrences", response_model=List[OccurrenceResponse])
+def get_series_occurrences(
+    series_id: int,
+    date_from: datetime = Query(..., alias="from"),
+    date_to: datetime = Query(..., alias="to"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Expand one series for [from, to)."""
+    service = RecurrenceService(db)
+    try:
+        occurrences = service.get_series_occurrences(series_id, date_from, date_to)
+        return list_response(OccurrenceResponse, occurrences)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+@router.put("/{series_id}/exceptions", response_model=SeriesExceptionResponse)
+def put_series_exception(
+    series_id: int,
+    exception_data: SeriesExceptionCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Move, cancel or annotate one occurrence (keyed by its original start)."""
+    service = RecurrenceService(db)
+    try:
+        exception = service.add_exception(series_id, exception_data)
+        return SeriesExceptionResponse.model_validate(exception)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+@router.post("/{series_id}/send-reminder", status_code=status.HTTP_200_OK)
+def send_occurrence_reminder(
+    series_id: int,
+    occurrence_start: datetime,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Manually send a reminder for one occurrence."""
+    service = RecurrenceService(db)
+    try:
+        service.send_occurrence_reminder(series_id, occurrence_start)
+        return {"message": "Reminder sent successfully"}
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
@@ -1,12 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
+from datetime import date, datetime
+from app.core.config import settings
 from app.core.database import get_db
-from app.dependencies.auth_dependency import get_current_user
+from app.core.tenancy import set_workspace
+from app.core.compression import etag_matches
+from app.dependencies.auth_dependency import get_current_user, get_feed_user
+from app.dependencies.expand_dependency import expand_param
+from app.dependencies.fields_dependency import fields_param
 from app.models.user import User
 from app.models.booking import BookingStatus
-from app.schemas.booking_schema import BookingCreate, BookingUpdate, BookingResponse
-from app.services.booking_service import BookingService
+from app.schemas.booking_schema import BookingCreate, BookingUpdate, BookingResponse, BookingExpandedResponse, StaffAvailability
+from app.services.booking_service import BookingService, BookingConflictError, InvalidBookingTimeError, EXPANDABLE_RELATIONS, SORT_KEY
+from app.core.pagination import set_next_cursor
+from app.core.fieldsets import sparse_response
+from app.core.serialization import list_response
+from app.services.availability_service import AvailabilityService
+from app.services.calendar_service import CalendarService, stream_staff_calendar
 
 router = APIRouter(prefix="/bookings", tags=["Bookings"])
 
@@ -21,24 +33,138 @@ def create_booking(
     Create a new booking.
     
     EVENT TRIGGER: Sends confirmation message via automation.
+    
+    Returns 409 if the staff member is already booked for an overlapping time,
+    404 if the contact or staff member is not in the caller's workspace.
     """
     service = BookingService(db)
-    booking = service.create_booking(booking_data)
-    return BookingResponse.model_validate(booking)
+    try:
+        booking = service.create_booking(booking_data)
+        return BookingResponse.model_validate(booking)
+    except BookingConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except InvalidBookingTimeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
 
 
-@router.get("", response_model=List[BookingResponse])
+@router.get("", response_model=List[BookingExpandedResponse])
 def get_bookings(
     skip: int = 0,
     limit: int = 100,
     status: Optional[BookingStatus] = None,
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    staff_id: Optional[int] = None,
+    expand: Set[str] = Depends(expand_param(*EXPANDABLE_RELATIONS)),
+    cursor: Optional[str] = None,
+    fields: Optional[frozenset] = Depends(fields_param(BookingExpandedResponse)),
+    response: Response = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all bookings with pagination and optional status filter."""
+    """
+    Get bookings ordered by start time, with pagination and optional filters.
+    
+    `from`/`to` select bookings starting in [from, to) - use for calendar views.
+    `expand=contact,staff` embeds related rows (one extra query per relation).
+    Pass the `X-Next-Cursor` response header back as `cursor` for the next page.
+    `fields=id,start_time,...` returns only those fields (column-only select).
+    """
     service = BookingService(db)
-    bookings = service.get_bookings(skip=skip, limit=limit, status=status)
-    return [BookingResponse.model_validate(b) for b in bookings]
+    bookings = service.get_bookings(
+        skip=skip,
+        limit=limit,
+        status=status,
+        date_from=date_from,
+        date_to=date_to,
+        staff_id=staff_id,
+        expand=expand,
+        cursor=cursor,
+        fields=fields
+    )
+    set_next_cursor(response, bookings, SORT_KEY, limit)
+    if fields:
+        return sparse_response(response, BookingExpandedResponse, fields, bookings)
+    return list_response(BookingExpandedResponse, bookings, response)
+
+
+@router.get("/availability", response_model=List[StaffAvailability])
+def get_availability(
+    date_from: date,
+    date_to: date,
+    staff_id: Optional[int] = None,
+    service_type: Optional[str] = None,
+    duration_minutes: Optional[int] = Query(None, gt=0, le=24 * 60),
+    workspace_id: int = Query(settings.DEFAULT_WORKSPACE_ID, description="Workspace whose staff to search"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get free booking slots per staff member between two dates (inclusive).
+    
+    Public (no auth) - used by the public booking page. Only free slots are
+    returned, never booking details. Requires staff_id or service_type.
+    """
+    set_workspace(db, workspace_id)
+    service = AvailabilityService(db)
+    try:
+        return service.get_availability(
+            date_from=date_from,
+            date_to=date_to,
+            staff_id=staff_id,
+            service_type=service_type,
+            duration_minutes=duration_minutes
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get("/staff/{staff_id}/calendar.ics")
+def get_staff_calendar(
+    staff_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    feed_user: Tuple[User, bool] = Depends(get_feed_user)
+):
+    """
+    iCalendar subscription feed of a staff member's bookings.
+    
+    Streamed from a server-side cursor. Polling clients sending
+    If-None-Match get 304 until a booking for this staff member changes.
+    Calendar apps that can't send headers pass the staff member's feed
+    token as `?token=`; it only opens that staff member's own feed.
+    """
+    current_user, by_feed_token = feed_user
+    if by_feed_token and current_user.id != staff_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Feed token does not grant access to this calendar"
+        )
+    
+    etag = CalendarService(db).get_feed_etag(staff_id)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return StreamingResponse(
+        stream_staff_calendar(staff_id, current_user.workspace_id),
+        media_type="text/calendar",  # Starlette appends the charset
+        headers=headers
+    )
 
 
 @router.get("/{booking_id}", response_model=BookingResponse)
@@ -65,11 +191,25 @@ def update_booking(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Update booking details."""
+    """
+    Update booking details.
+    
+    Returns 409 if the new time overlaps another booking of the staff member.
+    """
     service = BookingService(db)
     try:
         booking = service.update_booking(booking_id, booking_data)
         return BookingResponse.model_validate(booking)
+    except BookingConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except InvalidBookingTimeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
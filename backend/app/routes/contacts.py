@@ -1,29 +1,58 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.core.database import get_db
 from app.dependencies.auth_dependency import get_current_user, require_admin
 from app.models.user import User
 from app.models.contact import Contact
-from app.schemas.contact_schema import ContactCreate, ContactUpdate, ContactResponse
+from app.schemas.contact_schema import ContactCreate, ContactUpdate, ContactMerge, ContactPurge, ContactPurgeResponse, ContactResponse, ContactSummary
 from app.services.automation_service import AutomationService
+from app.services.contact_service import ContactService
+from app.services.dedupe_service import DedupeService
+from app.services.purge_service import PurgeService
+from app.services.timeline_service import TimelineService, TIMELINE_TYPES, SORT_KEY as TIMELINE_SORT_KEY
+from app.schemas.timeline_schema import TimelineEvent
 from app.core.logger import log_info
+from app.core.config import settings
+from app.core.pagination import paginate, set_next_cursor, InvalidCursorError
+from app.core.serialization import list_response
 
 router = APIRouter(prefix="/contacts", tags=["Contacts"])
 
+# Keyset sort key for list pagination
+SORT_KEY = ("id",)
+
 
 @router.post("", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
 def create_contact(
     contact_data: ContactCreate,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Create a new contact.
     
-    EVENT TRIGGER: Sends welcome message via automation.
+    With DEDUPE_ON_CREATE, a contact matching an existing one (same
+    normalized email or phone and a similar name) is not inserted: the
+    existing contact is returned with 200, missing email/phone filled in.
+    
+    EVENT TRIGGER: Sends welcome message via automation (new contacts only).
     """
-    log_info(f"[API] Creating contact: {contact_data.name}")
+    log_info("[API] Creating contact: %s", contact_data.name)
+    
+    if settings.DEDUPE_ON_CREATE:
+        existing = DedupeService(db).find_duplicate(contact_data.name, contact_data.email, contact_data.phone)
+        if existing:
+            log_info("[API] Contact matches existing contact %s", existing.id)
+            if not existing.email and contact_data.email:
+                existing.email = contact_data.email
+            if not existing.phone and contact_data.phone:
+                existing.phone = contact_data.phone
+            db.commit()
+            db.refresh(existing)
+            response.status_code = status.HTTP_200_OK
+            return ContactResponse.model_validate(existing)
     
     contact = Contact(**contact_data.model_dump())
     db.add(contact)
@@ -41,12 +70,54 @@ def create_contact(
 def get_contacts(
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    response: Response = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all contacts with pagination."""
-    contacts = db.query(Contact).offset(skip).limit(limit).all()
-    return [ContactResponse.model_validate(c) for c in contacts]
+    """
+    Get all contacts ordered by id, with pagination.
+    
+    Pass the `X-Next-Cursor` response header back as `cursor` for the next page.
+    """
+    columns = [getattr(Contact, name) for name in SORT_KEY]
+    contacts = paginate(db.query(Contact), columns, cursor=cursor, skip=skip, limit=limit).all()
+    set_next_cursor(response, contacts, SORT_KEY, limit)
+    return list_response(ContactResponse, contacts, response)
+
+
+@router.get("/lookup", response_model=List[ContactSummary])
+def lookup_contacts(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=25),
+    response: Response = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Typeahead contact lookup: name/word prefix, email prefix or phone digits.
+    
+    Responses are privately cacheable for CONTACT_LOOKUP_MAX_AGE_SECONDS.
+    """
+    response.headers["Cache-Control"] = f"private, max-age={settings.CONTACT_LOOKUP_MAX_AGE_SECONDS}"
+    contacts = ContactService(db).lookup(q, limit=limit)
+    return list_response(ContactSummary, contacts, response)
+
+
+@router.post("/purge", response_model=ContactPurgeResponse, status_code=status.HTTP_202_ACCEPTED)
+def purge_contacts(
+    purge_data: ContactPurge,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)  # Admin only
+):
+    """
+    Queue contacts for erasure with all their bookings and messages (admin only).
+    
+    For GDPR requests and bulk cleanup: the purge job deletes them in
+    bounded chunks (see app/jobs/purge_job.py).
+    """
+    queued = PurgeService(db).request_purge(purge_data.contact_ids, requested_by=current_user.id)
+    return ContactPurgeResponse(queued=queued)
 
 
 @router.get("/{contact_id}", response_model=ContactResponse)
@@ -56,13 +127,55 @@ def get_contact(
     current_user: User = Depends(get_current_user)
 ):
     """Get contact by ID."""
-    contact = db.query(Contact).filter(Contact.id == contact_id).first()
+    contact = ContactService(db).get_contact(contact_id)
     if not contact:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Contact {contact_id} not found"
         )
-    return ContactResponse.model_validate(contact)
+    return contact
+
+
+@router.get("/{contact_id}/timeline", response_model=List[TimelineEvent])
+def get_contact_timeline(
+    contact_id: int,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    types: Optional[str] = Query(None, description="Comma-separated: booking,message,alert (default all)"),
+    include_archived: bool = False,
+    response: Response = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Bookings, messages and related alerts of a contact, newest first
+    (archived messages and alerts only with `include_archived=true`).
+    
+    Pass the `X-Next-Cursor` response header back as `cursor` for the next page.
+    """
+    requested = {t.strip() for t in types.split(",") if t.strip()} if types else set(TIMELINE_TYPES)
+    unknown = requested - set(TIMELINE_TYPES)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown timeline type(s): {', '.join(sorted(unknown))}"
+        )
+    
+    try:
+        events = TimelineService(db).get_timeline(
+            contact_id, limit=limit, cursor=cursor, types=requested, include_archived=include_archived
+        )
+    except InvalidCursorError:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    
+    events = [TimelineEvent(**event) for event in events]
+    set_next_cursor(response, events, TIMELINE_SORT_KEY, limit)
+    return list_response(TimelineEvent, events, response)
 
 
 @router.patch("/{contact_id}", response_model=ContactResponse)
@@ -90,13 +203,41 @@ def update_contact(
     return ContactResponse.model_validate(contact)
 
 
+@router.post("/{contact_id}/merge", response_model=ContactResponse)
+def merge_contacts(
+    contact_id: int,
+    merge_data: ContactMerge,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)  # Admin only
+):
+    """
+    Merge duplicate contacts into this one (admin only).
+    
+    Bookings, series and messages of the duplicates move to this contact;
+    the duplicates are deleted.
+    """
+    try:
+        contact = DedupeService(db).merge(contact_id, merge_data.contact_ids)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    return ContactResponse.model_validate(contact)
+
+
 @router.delete("/{contact_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_contact(
     contact_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)  # Admin only
 ):
-    """Delete contact (admin only)."""
+    """
+    Delete contact (admin only).
+    
+    Bookings and messages are removed by the database cascade in the same
+    statement; queue large deletions with POST /contacts/purge instead.
+    """
     contact = db.query(Contact).filter(Contact.id == contact_id).first()
     if not contact:
         raise HTTPException(
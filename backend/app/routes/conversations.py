@@ -1,79 +1,119 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from typing import List, Dict, Any
 from app.core.database import get_db
 from app.dependencies.auth_dependency import get_current_user
 from app.models.user import User
-from app.models.message import Message
+from app.models.message import Message, MessageDirection
 from app.models.contact import Contact
+from app.core.serialization import rows_response
+from app.core.singleflight import coalesce
 
 router = APIRouter(prefix="/conversations", tags=["Conversations"])
 
+# Columns needed to render a conversation (rows only, no ORM objects)
+MESSAGE_COLUMNS = (
+    Message.id,
+    Message.contact_id,
+    Message.content,
+    Message.direction,
+    Message.channel,
+    Message.created_at,
+    Message.status,
+)
+CONTACT_COLUMNS = (Contact.name, Contact.email, Contact.phone)
+
+
+def _message_payload(row) -> Dict[str, Any]:
+    return {
+        "id": str(row.id),
+        "content": row.content,
+        "sender": "staff" if row.direction == MessageDirection.OUTGOING else "contact",
+        "channel": row.channel,
+        "timestamp": row.created_at,
+        "status": row.status
+    }
+
+
+def _conversation_payload(contact_id: int, contact, rows: List) -> Dict[str, Any]:
+    return {
+        "id": str(contact_id),  # Use contact ID as conversation ID
+        "contactId": contact_id,
+        "contactName": contact.name,
+        "contactEmail": contact.email,
+        "contactPhone": contact.phone,
+        "messages": [_message_payload(row) for row in rows],
+        "status": "Open",  # Default status
+        "automationStatus": "Active"  # Placeholder
+    }
+
+
 @router.get("", response_model=List[Dict[str, Any]])
 def get_conversations(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get all conversations grouped by contact.
+    Get all conversations grouped by contact, most recently active first.
+    
+    One column-only query for the page of contacts (ordered by their latest
+    message) and one for their messages; rows are shaped and encoded with
+    orjson without building ORM objects. Identical concurrent requests share
+    one computation (single-flight).
     """
-    # 1. Get distinct contact_ids from messages
-    # This is a bit inefficient, but without a Conversation model, we aggregate on the fly
+    conversations = coalesce(
+        request,
+        f"{current_user.workspace_id}:{current_user.role.value}",
+        lambda: _build_conversations(db, skip, limit),
+        db=db
+    )
+    return rows_response(conversations)
+
+
+def _build_conversations(db: Session, skip: int, limit: int) -> List[Dict[str, Any]]:
+    """Load one page of conversations as plain dicts."""
+    last_at = func.max(Message.created_at).label("last_at")
+    page = db.query(Message.contact_id, last_at).group_by(Message.contact_id).order_by(
+        last_at.desc(), Message.contact_id.desc()
+    ).offset(skip).limit(limit).all()
     
-    # Get all contacts that have messages
-    contacts_with_messages = db.query(Contact).join(Message).distinct().all()
+    if not page:
+        return []
     
-    conversations = []
+    rows = db.query(*MESSAGE_COLUMNS, *CONTACT_COLUMNS).join(
+        Contact, Contact.id == Message.contact_id
+    ).filter(
+        Message.contact_id.in_([contact_id for contact_id, _ in page])
+    ).order_by(Message.contact_id, Message.created_at, Message.id).all()
     
-    for contact in contacts_with_messages:
-        # Get messages for this contact
-        messages = db.query(Message).filter(
-            Message.contact_id == contact.id
-        ).order_by(Message.created_at.asc()).all()
-        
+    grouped: Dict[int, List] = {}
+    for row in rows:
+        grouped.setdefault(row.contact_id, []).append(row)
+    
+    conversations = []
+    for contact_id, _ in page:
+        messages = grouped.get(contact_id)
         if not messages:
             continue
-            
-        last_message = messages[-1]
-        
-        # Calculate unread count (incoming messages that are not read)
-        # Assuming we don't have a 'read' status yet, logic would go here.
-        # For now, just a placeholder or based on status if applicable.
-        unread_count = 0 
         
-        conversations.append({
-            "id": str(contact.id), # Use contact ID as conversation ID
-            "contactId": contact.id,
-            "contactName": f"{contact.first_name} {contact.last_name}",
-            "contactEmail": contact.email,
-            "contactPhone": contact.phone,
-            "messages": [
-                {
-                    "id": str(m.id),
-                    "content": m.content,
-                    "sender": "staff" if m.direction == "outgoing" else "contact",
-                    "channel": m.channel,
-                    "timestamp": m.created_at.isoformat(),
-                    "status": m.status
-                } for m in messages
-            ],
+        last_message = messages[-1]
+        conversation = _conversation_payload(contact_id, last_message, messages)
+        conversation.update({
             "lastMessage": {
                 "content": last_message.content,
-                "timestamp": last_message.created_at.isoformat()
+                "timestamp": last_message.created_at
             },
-            "unreadCount": unread_count,
-            "status": "Open", # Default status
-            "updatedAt": last_message.created_at.isoformat(),
-            "automationStatus": "Active" # Placeholder
+            # No read tracking yet
+            "unreadCount": 0,
+            "updatedAt": last_message.created_at
         })
+        conversations.append(conversation)
     
-    # Sort by updated_at desc
-    conversations.sort(key=lambda x: x["updatedAt"], reverse=True)
-    
-    return conversations[skip : skip + limit]
+    return conversations
 
 @router.get("/{id}", response_model=Dict[str, Any])
 def get_conversation(
@@ -82,33 +122,15 @@ def get_conversation(
     current_user: User = Depends(get_current_user)
 ):
     """Get a single conversation by ID (Contact ID)."""
-    contact = db.query(Contact).filter(Contact.id == id).first()
+    contact = db.query(*CONTACT_COLUMNS).filter(Contact.id == id).first()
     if not contact:
         raise HTTPException(status_code=404, detail="Conversation not found")
-        
-    messages = db.query(Message).filter(
+    
+    rows = db.query(*MESSAGE_COLUMNS).filter(
         Message.contact_id == id
-    ).order_by(Message.created_at.asc()).all()
+    ).order_by(Message.created_at, Message.id).all()
     
-    return {
-        "id": str(contact.id),
-        "contactId": contact.id,
-        "contactName": f"{contact.first_name} {contact.last_name}",
-        "contactEmail": contact.email,
-        "contactPhone": contact.phone,
-        "messages": [
-            {
-                "id": str(m.id),
-                "content": m.content,
-                "sender": "staff" if m.direction == "outgoing" else "contact",
-                "channel": m.channel,
-                "timestamp": m.created_at.isoformat(),
-                "status": m.status
-            } for m in messages
-        ],
-        "status": "Open",
-        "automationStatus": "Active"
-    }
+    return rows_response(_conversation_payload(id, contact, rows))
 
 @router.post("/{id}/messages", status_code=status.HTTP_201_CREATED)
 def send_message(
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import datetime, timedelta
@@ -10,12 +10,16 @@ from app.models.contact import Contact
 from app.models.inventory import Inventory
 from app.models.alert import Alert
 from app.models.message import Message, MessageDirection
+from app.services.recurrence_service import RecurrenceService
+from app.core.config import settings
+from app.core.singleflight import coalesce
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
 
 @router.get("")
 def get_dashboard(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -23,19 +27,41 @@ def get_dashboard(
     Get dashboard statistics and overview.
     
     Returns key metrics for the business operations.
+    Identical concurrent requests share one computation (single-flight).
     """
+    return coalesce(
+        request,
+        f"{current_user.workspace_id}:{current_user.role.value}",
+        lambda: _build_dashboard(db),
+        db=db
+    )
+
+
+def _build_dashboard(db: Session) -> dict:
+    """Run the dashboard aggregate queries."""
     today = datetime.utcnow().date()
     week_ago = datetime.utcnow() - timedelta(days=7)
     
-    # Booking stats
+    # Booking stats (recurring series are expanded only for the counted window)
+    now = datetime.utcnow()
+    today_start = datetime.combine(today, datetime.min.time())
+    active_statuses = [BookingStatus.PENDING, BookingStatus.CONFIRMED]
+    recurrence = RecurrenceService(db)
+    
     total_bookings = db.query(Booking).count()
+    # Cancelled bookings are left out, as cancelled series occurrences are
     todays_bookings = db.query(Booking).filter(
-        func.date(Booking.start_time) == today
-    ).count()
+        func.date(Booking.start_time) == today,
+        Booking.status != BookingStatus.CANCELLED
+    ).count() + recurrence.count_occurrences(today_start, today_start + timedelta(days=1))
     upcoming_bookings = db.query(Booking).filter(
-        Booking.start_time > datetime.utcnow(),
-        Booking.status.in_([BookingStatus.PENDING, BookingStatus.CONFIRMED])
-    ).count()
+        Booking.start_time > now,
+        Booking.status.in_(active_statuses)
+    ).count() + recurrence.count_occurrences(
+        now,
+        now + timedelta(days=settings.RECURRENCE_HORIZON_DAYS),
+        statuses=active_statuses
+    )
     
     # Contact stats
     total_contacts = db.query(Contact).count()
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import datetime
+from app.core.database import get_db
+from app.dependencies.auth_dependency import require_admin
+from app.models.user import User
+from app.services.export_service import ExportService, stream_export, EXPORT_ENTITIES, EXPORT_FORMATS
+from app.core.logger import log_info
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+
+@router.get("/{entity}")
+def export_entity(
+    entity: str,
+    format: str = Query("csv", description="csv or ndjson"),
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    after_id: Optional[int] = Query(None, description="Resume after the id of the last row received"),
+    include_archived: bool = False,
+    gzip: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)  # Admin only
+):
+    """
+    Export contacts, bookings, messages or alerts as CSV or NDJSON (admin only).
+    
+    Rows are streamed in id order from a server-side cursor; memory stays
+    flat whatever the size. `from`/`to` filter on created_at (bookings:
+    start_time); `status` on booking/message status or alert severity.
+    `gzip=true` returns a .gz file. After an interrupted download, pass the
+    last received id as `after_id` to continue (CSV omits the header row).
+    """
+    if entity not in EXPORT_ENTITIES or format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND if entity not in EXPORT_ENTITIES else status.HTTP_400_BAD_REQUEST,
+            detail=f"Export {entity}.{format} not available (entities: {', '.join(EXPORT_ENTITIES)}; formats: csv, ndjson)"
+        )
+    
+    filters = {
+        "date_from": date_from,
+        "date_to": date_to,
+        "status": status_filter,
+        "after_id": after_id,
+        "include_archived": include_archived,
+    }
+    # Validate filters before the response starts
+    try:
+        ExportService(db).build_query(entity, **filters)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    log_info("[API] Export of %s requested by user %s", entity, current_user.id)
+    
+    filename = f"{entity}-{datetime.utcnow():%Y%m%d}.{format}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        stream_export(entity, format, current_user.workspace_id, gzip=gzip, **filters),
+        media_type="application/gzip" if gzip else EXPORT_FORMATS[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store",
+        }
+    )
@@ -0,0 +1,84 @@
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from typing import BinaryIO, Optional
+import tempfile
+from app.core.database import SessionLocal, get_db
+from app.core.tenancy import set_workspace
+from app.dependencies.auth_dependency import require_admin
+from app.models.import_job import ImportJob
+from app.models.user import User
+from app.schemas.import_schema import ImportJobResponse
+from app.services.import_service import (
+    ImportService, ImportProgress, create_import_job, IMPORT_KINDS, IMPORT_FORMATS, AUTOMATION_MODES
+)
+from app.core.logger import log_info
+
+router = APIRouter(prefix="/imports", tags=["Imports"])
+
+
+def _run_import(spool: BinaryIO, progress: ImportProgress):
+    """Background task: import the spooled body with its own session (in the caller's workspace)."""
+    db = SessionLocal()
+    set_workspace(db, progress.workspace_id)
+    try:
+        ImportService(db).run(spool, progress)
+    finally:
+        db.close()
+        spool.close()
+
+
+@router.post("/{kind}", response_model=ImportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def start_import(
+    kind: str,
+    request: Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    format: Optional[str] = Query(None, description="csv or ndjson (default: from Content-Type)"),
+    automation: str = Query("suppress", description="suppress or queue welcome/confirmation sends"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)  # Admin only
+):
+    """
+    Bulk import contacts or bookings from a CSV (header row) or NDJSON body (admin only).
+    
+    The body is streamed to a temporary file and imported in the background;
+    poll `GET /imports/{id}` (the `Location` header) for progress, on any
+    server process.
+    """
+    fmt = format or IMPORT_FORMATS.get(request.headers.get("content-type", "").split(";")[0].strip())
+    if kind not in IMPORT_KINDS or fmt not in IMPORT_FORMATS.values() or automation not in AUTOMATION_MODES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Expected kind in {IMPORT_KINDS}, format csv/ndjson and automation in {AUTOMATION_MODES}"
+        )
+    
+    # The upload can take minutes: don't hold the auth lookup's pooled connection meanwhile
+    await run_in_threadpool(db.close)
+    spool = tempfile.TemporaryFile()
+    async for chunk in request.stream():
+        await run_in_threadpool(spool.write, chunk)
+    spool.seek(0)
+    
+    progress = await run_in_threadpool(create_import_job, db, kind, fmt, automation)
+    log_info("[API] Import %s queued: %s (%s)", progress.id, kind, fmt)
+    background_tasks.add_task(_run_import, spool, progress)
+    
+    response.headers["Location"] = f"/imports/{progress.id}"
+    return ImportJobResponse.model_validate(progress)
+
+
+@router.get("/{job_id}", response_model=ImportJobResponse)
+def get_import(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)  # Admin only
+):
+    """Progress (or result) of an import of the caller's workspace."""
+    job = db.query(ImportJob).filter(ImportJob.id == job_id).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Import {job_id} not found"
+        )
+    return ImportJobResponse.model_validate(job)
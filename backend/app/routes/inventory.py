@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.core.database import get_db
 from app.dependencies.auth_dependency import get_current_user
+from app.dependencies.fields_dependency import fields_param
 from app.models.user import User
 from app.schemas.inventory_schema import InventoryCreate, InventoryUpdate, InventoryResponse
-from app.services.inventory_service import InventoryService
+from app.services.inventory_service import InventoryService, SORT_KEY
+from app.core.pagination import set_next_cursor
+from app.core.fieldsets import sparse_response
+from app.core.serialization import list_response
 
 router = APIRouter(prefix="/inventory", tags=["Inventory"])
 
@@ -30,13 +34,24 @@ def create_inventory(
 def get_inventory(
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Optional[frozenset] = Depends(fields_param(InventoryResponse)),
+    response: Response = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all inventory items with pagination."""
+    """
+    Get all inventory items ordered by name, with pagination.
+    
+    Pass the `X-Next-Cursor` response header back as `cursor` for the next page.
+    `fields=id,item_name,...` returns only those fields (column-only select).
+    """
     service = InventoryService(db)
-    items = service.get_all_inventory(skip=skip, limit=limit)
-    return [InventoryResponse.model_validate(i) for i in items]
+    items = service.get_all_inventory(skip=skip, limit=limit, cursor=cursor, fields=fields)
+    set_next_cursor(response, items, SORT_KEY, limit)
+    if fields:
+        return sparse_response(response, InventoryResponse, fields, items)
+    return list_response(InventoryResponse, items, response)
 
 
 @router.get("/low-stock", response_model=List[InventoryResponse])
@@ -47,7 +62,7 @@ def get_low_stock(
     """Get all items with low stock."""
     service = InventoryService(db)
     items = service.get_low_stock_items()
-    return [InventoryResponse.model_validate(i) for i in items]
+    return list_response(InventoryResponse, items)
 
 
 @router.get("/{inventory_id}", response_model=InventoryResponse)
@@ -64,7 +79,7 @@ def get_inventory_item(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Inventory item {inventory_id} not found"
         )
-    return InventoryResponse.model_validate(item)
+    return item
 
 
 @router.patch("/{inventory_id}", response_model=InventoryResponse)
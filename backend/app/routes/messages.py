@@ -1,14 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
-from app.core.database import get_db
+from typing import List, Optional, Set
+from app.core.database import get_db, relation_loaders
+from app.core.tenancy import check_visible
 from app.dependencies.auth_dependency import get_current_user
+from app.dependencies.expand_dependency import expand_param
+from app.dependencies.fields_dependency import fields_param
 from app.models.user import User
+from app.models.contact import Contact
 from app.models.message import Message
-from app.schemas.message_schema import MessageCreate, MessageResponse
+from app.schemas.message_schema import MessageCreate, MessageResponse, MessageExpandedResponse
+from app.services.archive_service import with_archived
+from app.core.pagination import paginate, set_next_cursor
+from app.core.fieldsets import load_only_options, sparse_response
+from app.core.serialization import list_response
 
 router = APIRouter(prefix="/messages", tags=["Messages"])
 
+# Relations that list endpoints can embed with ?expand=
+EXPANDABLE_RELATIONS = ("contact", "staff")
+
+# Keyset sort key for list pagination, newest first (ix_messages_workspace_id_created_at_id)
+SORT_KEY = ("created_at", "id")
+
 
 @router.post("", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
 def create_message(
@@ -17,6 +31,14 @@ def create_message(
     current_user: User = Depends(get_current_user)
 ):
     """Create a new message."""
+    try:
+        check_visible(db, Contact, message_data.contact_id, "Contact")
+        check_visible(db, User, message_data.staff_id, "Staff member")
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
     message = Message(**message_data.model_dump())
     db.add(message)
     db.commit()
@@ -25,32 +47,70 @@ def create_message(
     return MessageResponse.model_validate(message)
 
 
-@router.get("/{contact_id}", response_model=List[MessageResponse])
+@router.get("/{contact_id}", response_model=List[MessageExpandedResponse])
 def get_messages_by_contact(
     contact_id: int,
     skip: int = 0,
     limit: int = 100,
+    include_archived: bool = False,
+    expand: Set[str] = Depends(expand_param(*EXPANDABLE_RELATIONS)),
+    cursor: Optional[str] = None,
+    fields: Optional[frozenset] = Depends(fields_param(MessageExpandedResponse)),
+    response: Response = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all messages for a specific contact."""
-    messages = db.query(Message).filter(
-        Message.contact_id == contact_id
-    ).order_by(Message.created_at.desc()).offset(skip).limit(limit).all()
+    """
+    Get all messages for a specific contact (optionally including archived ones).
+    
+    `expand=contact,staff` embeds related rows (one extra query per relation).
+    Pass the `X-Next-Cursor` response header back as `cursor` for the next page.
+    `fields=id,subject,...` returns only those fields (content is not loaded unless asked).
+    """
+    entity = with_archived(Message) if include_archived else Message
+    query = db.query(entity).options(
+        *relation_loaders(entity, EXPANDABLE_RELATIONS, expand),
+        *load_only_options(entity, fields, required=SORT_KEY + ("contact_id", "staff_id"))
+    ).filter(entity.contact_id == contact_id)
     
-    return [MessageResponse.model_validate(m) for m in messages]
+    columns = [getattr(entity, name) for name in SORT_KEY]
+    messages = paginate(query, columns, cursor=cursor, skip=skip, limit=limit, descending=True).all()
+    set_next_cursor(response, messages, SORT_KEY, limit)
+    if fields:
+        return sparse_response(response, MessageExpandedResponse, fields, messages)
+    
+    return list_response(MessageExpandedResponse, messages, response)
 
 
-@router.get("", response_model=List[MessageResponse])
+@router.get("", response_model=List[MessageExpandedResponse])
 def get_all_messages(
     skip: int = 0,
     limit: int = 100,
+    include_archived: bool = False,
+    expand: Set[str] = Depends(expand_param(*EXPANDABLE_RELATIONS)),
+    cursor: Optional[str] = None,
+    fields: Optional[frozenset] = Depends(fields_param(MessageExpandedResponse)),
+    response: Response = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all messages with pagination."""
-    messages = db.query(Message).order_by(
-        Message.created_at.desc()
-    ).offset(skip).limit(limit).all()
+    """
+    Get all messages with pagination (optionally including archived ones).
+    
+    `expand=contact,staff` embeds related rows (one extra query per relation).
+    Pass the `X-Next-Cursor` response header back as `cursor` for the next page.
+    `fields=id,subject,...` returns only those fields (content is not loaded unless asked).
+    """
+    entity = with_archived(Message) if include_archived else Message
+    query = db.query(entity).options(
+        *relation_loaders(entity, EXPANDABLE_RELATIONS, expand),
+        *load_only_options(entity, fields, required=SORT_KEY + ("contact_id", "staff_id"))
+    )
+    
+    columns = [getattr(entity, name) for name in SORT_KEY]
+    messages = paginate(query, columns, cursor=cursor, skip=skip, limit=limit, descending=True).all()
+    set_next_cursor(response, messages, SORT_KEY, limit)
+    if fields:
+        return sparse_response(response, MessageExpandedResponse, fields, messages)
     
-    return [MessageResponse.model_validate(m) for m in messages]
+    return list_response(MessageExpandedResponse, messages, response)
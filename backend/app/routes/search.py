@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.core.database import get_db
+from app.dependencies.auth_dependency import get_current_user
+from app.models.user import User
+from app.schemas.search_schema import SearchResult
+from app.services.search_service import SearchService, SEARCH_TYPES, SORT_KEY
+from app.core.pagination import set_next_cursor
+from app.core.serialization import list_response
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+@router.get("", response_model=List[SearchResult])
+def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    types: Optional[str] = Query(None, description="Comma-separated: message,contact (default both)"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    response: Response = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Full-text search over messages (subject, content) and contacts
+    (name, email, phone), best match first.
+    
+    Pass the `X-Next-Cursor` response header back as `cursor` for the next page.
+    """
+    requested = {t.strip() for t in types.split(",") if t.strip()} if types else set(SEARCH_TYPES)
+    unknown = requested - set(SEARCH_TYPES)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown search type(s): {', '.join(sorted(unknown))}"
+        )
+    
+    service = SearchService(db)
+    results = [SearchResult(**r) for r in service.search(q, types=requested, limit=limit, cursor=cursor)]
+    set_next_cursor(response, results, SORT_KEY, limit)
+    return list_response(SearchResult, results, response)
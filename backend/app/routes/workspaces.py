@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List
+from app.core.database import get_db
+from app.core.security import hash_password
+from app.dependencies.auth_dependency import get_current_user, require_admin
+from app.models.user import User
+from app.schemas.user_schema import UserCreate, UserResponse
+from app.schemas.workspace_schema import WorkspaceResponse
+from app.services.workspace_service import WorkspaceService
+from app.core.logger import log_info
+
+router = APIRouter(prefix="/workspace", tags=["Workspace"])
+
+
+@router.get("", response_model=WorkspaceResponse)
+def get_workspace(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get the caller's workspace."""
+    return WorkspaceResponse.model_validate(WorkspaceService(db).get_workspace(current_user.workspace_id))
+
+
+@router.get("/users", response_model=List[UserResponse])
+def get_workspace_users(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """List the users of the caller's workspace."""
+    users = db.query(User).order_by(User.id).all()
+    return [UserResponse.model_validate(user) for user in users]
+
+
+@router.post("/users", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+def add_workspace_user(
+    user_data: UserCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)  # Admin only
+):
+    """Add a user (staff or admin) to the caller's workspace (admin only)."""
+    log_info("[API] Adding user %s to workspace %s", user_data.email, current_user.workspace_id)
+    
+    # Emails are unique across workspaces
+    if db.query(User.id).filter(User.email == user_data.email).execution_options(all_workspaces=True).first():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+    
+    user = User(
+        name=user_data.name,
+        email=user_data.email,
+        hashed_password=hash_password(user_data.password),
+        role=user_data.role
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return UserResponse.model_validate(user)
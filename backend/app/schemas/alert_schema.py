@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 from app.models.alert import AlertType, AlertSeverity
 
 
@@ -36,3 +36,8 @@ class AlertResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+class AlertExpandedResponse(AlertResponse):
+    """Alert response with the referenced entity embedded (?expand=reference)."""
+    reference: Optional[Dict[str, Any]] = None
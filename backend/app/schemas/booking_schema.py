@@ -1,7 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from app.models.booking import BookingStatus, FormStatus
+from app.schemas.contact_schema import ContactResponse
+from app.schemas.user_schema import StaffSummary
 
 
 # Request Schemas
@@ -13,6 +15,12 @@ class BookingCreate(BaseModel):
     end_time: datetime
     service_type: Optional[str] = None
     notes: Optional[str] = None
+    
+    @model_validator(mode="after")
+    def check_time_range(self):
+        if self.end_time <= self.start_time:
+            raise ValueError("end_time must be after start_time")
+        return self
 
 
 class BookingUpdate(BaseModel):
@@ -39,6 +47,25 @@ class BookingResponse(BaseModel):
     service_type: Optional[str]
     notes: Optional[str]
     created_at: datetime
+    updated_at: datetime
     
     class Config:
         from_attributes = True
+
+
+class BookingExpandedResponse(BookingResponse):
+    """Booking response with optional embedded relations (?expand=contact,staff)."""
+    contact: Optional[ContactResponse] = None
+    staff: Optional[StaffSummary] = None
+
+
+class AvailabilitySlot(BaseModel):
+    """Schema for a single free slot."""
+    start_time: datetime
+    end_time: datetime
+
+
+class StaffAvailability(BaseModel):
+    """Schema for free slots of one staff member."""
+    staff_id: int
+    slots: List[AvailabilitySlot]
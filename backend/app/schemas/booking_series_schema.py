@@ -0,0 +1,109 @@
+from pydantic import BaseModel, Field, field_validator
+from datetime import datetime
+from typing import Optional
+from app.models.booking import BookingStatus
+from app.models.booking_series import RecurrenceFrequency
+
+
+def _check_weekdays(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return value
+    days = [day.strip() for day in value.split(",") if day.strip()]
+    if not days or any(not day.isdigit() or int(day) > 6 for day in days):
+        raise ValueError("by_weekday must be comma-separated weekday numbers 0-6 (Monday = 0)")
+    return ",".join(days)
+
+
+# Request Schemas
+class BookingSeriesCreate(BaseModel):
+    """Schema for creating a recurring booking series."""
+    contact_id: int
+    staff_id: Optional[int] = None
+    start_time: datetime
+    duration_minutes: int = Field(gt=0, le=24 * 60)
+    frequency: RecurrenceFrequency = RecurrenceFrequency.WEEKLY
+    interval: int = Field(1, ge=1)
+    by_weekday: Optional[str] = None
+    until: Optional[datetime] = None
+    count: Optional[int] = Field(None, ge=1)
+    service_type: Optional[str] = None
+    notes: Optional[str] = None
+    
+    _validate_weekdays = field_validator("by_weekday")(_check_weekdays)
+
+
+class BookingSeriesUpdate(BaseModel):
+    """Schema for updating a whole series."""
+    staff_id: Optional[int] = None
+    status: Optional[BookingStatus] = None
+    duration_minutes: Optional[int] = Field(None, gt=0, le=24 * 60)
+    interval: Optional[int] = Field(None, ge=1)
+    by_weekday: Optional[str] = None
+    until: Optional[datetime] = None
+    count: Optional[int] = Field(None, ge=1)
+    service_type: Optional[str] = None
+    notes: Optional[str] = None
+    
+    _validate_weekdays = field_validator("by_weekday")(_check_weekdays)
+
+
+class SeriesExceptionCreate(BaseModel):
+    """Schema for overriding or cancelling one occurrence."""
+    occurrence_start: datetime
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    status: Optional[BookingStatus] = None
+    notes: Optional[str] = None
+
+
+# Response Schemas
+class BookingSeriesResponse(BaseModel):
+    """Schema for series response."""
+    id: int
+    contact_id: int
+    staff_id: Optional[int]
+    status: BookingStatus
+    start_time: datetime
+    duration_minutes: int
+    frequency: RecurrenceFrequency
+    interval: int
+    by_weekday: Optional[str]
+    until: Optional[datetime]
+    count: Optional[int]
+    service_type: Optional[str]
+    notes: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class SeriesExceptionResponse(BaseModel):
+    """Schema for occurrence override response."""
+    id: int
+    series_id: int
+    occurrence_start: datetime
+    start_time: Optional[datetime]
+    end_time: Optional[datetime]
+    status: Optional[BookingStatus]
+    notes: Optional[str]
+    
+    class Config:
+        from_attributes = True
+
+
+class OccurrenceResponse(BaseModel):
+    """Schema for one expanded occurrence."""
+    series_id: int
+    contact_id: int
+    staff_id: Optional[int]
+    status: BookingStatus
+    start_time: datetime
+    end_time: datetime
+    occurrence_start: datetime
+    service_type: Optional[str]
+    notes: Optional[str]
+    
+    class Config:
+        from_attributes = True
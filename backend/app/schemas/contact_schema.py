@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 # Request Schemas
@@ -18,7 +18,28 @@ class ContactUpdate(BaseModel):
     phone: Optional[str] = None
 
 
+class ContactMerge(BaseModel):
+    """Schema for merging duplicates into a surviving contact."""
+    contact_ids: List[int]
+
+
+class ContactPurge(BaseModel):
+    """Schema for queueing contacts for erasure."""
+    contact_ids: List[int]
+
+
 # Response Schemas
+class ContactSummary(BaseModel):
+    """Compact contact for typeahead lookups."""
+    id: int
+    name: str
+    email: Optional[str]
+    phone: Optional[str]
+    
+    class Config:
+        from_attributes = True
+
+
 class ContactResponse(BaseModel):
     """Schema for contact response."""
     id: int
@@ -29,3 +50,8 @@ class ContactResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+class ContactPurgeResponse(BaseModel):
+    """Schema for a queued purge."""
+    queued: int
@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Optional
+
+
+# Response Schemas
+class ImportRowError(BaseModel):
+    """One rejected row of an import."""
+    line: int
+    error: str
+
+
+class ImportJobResponse(BaseModel):
+    """Progress / result of a bulk import."""
+    id: str
+    kind: str
+    format: str
+    automation: str
+    status: str
+    processed: int
+    inserted: int
+    duplicates: int
+    failed: int
+    automation_queued: int
+    errors: List[ImportRowError]
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    
+    class Config:
+        from_attributes = True
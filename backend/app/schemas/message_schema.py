@@ -2,6 +2,8 @@ from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional
 from app.models.message import MessageChannel, MessageDirection, MessageStatus
+from app.schemas.contact_schema import ContactResponse
+from app.schemas.user_schema import StaffSummary
 
 
 # Request Schemas
@@ -32,3 +34,9 @@ class MessageResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+class MessageExpandedResponse(MessageResponse):
+    """Message response with optional embedded relations (?expand=contact,staff)."""
+    contact: Optional[ContactResponse] = None
+    staff: Optional[StaffSummary] = None
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+
+# Response Schemas
+class SearchResult(BaseModel):
+    """One ranked search hit (a message or a contact)."""
+    type: str
+    id: int
+    rank: float
+    title: Optional[str]
+    snippet: Optional[str]
+    contact_id: int
+    created_at: datetime
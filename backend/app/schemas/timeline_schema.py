@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+
+# Response Schemas
+class TimelineEvent(BaseModel):
+    """One entry of a contact's activity timeline (a booking, message or alert)."""
+    type: str
+    id: int
+    occurred_at: datetime
+    title: str
+    detail: Optional[str]
+    status: Optional[str]
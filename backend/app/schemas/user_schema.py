@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime
 from typing import Optional
 from app.models.user import UserRole
@@ -13,6 +13,19 @@ class UserCreate(BaseModel):
     role: UserRole = UserRole.STAFF
 
 
+class UserRegister(BaseModel):
+    """
+    Schema for sign-up: always creates a new workspace with the user as its admin.
+    
+    There is no role: colleagues are added to a workspace by its admins
+    (POST /workspace/users).
+    """
+    name: str
+    email: EmailStr
+    password: str
+    workspace_name: Optional[str] = Field(None, min_length=1, max_length=255)
+
+
 class UserLogin(BaseModel):
     """Schema for user login."""
     email: EmailStr
@@ -33,12 +46,30 @@ class UserResponse(BaseModel):
     name: str
     email: str
     role: UserRole
+    workspace_id: int
     created_at: datetime
     
     class Config:
         from_attributes = True
 
 
+class StaffSummary(BaseModel):
+    """Schema for staff embedded in other responses."""
+    id: int
+    name: str
+    email: str
+    role: UserRole
+    
+    class Config:
+        from_attributes = True
+
+
+class FeedTokenResponse(BaseModel):
+    """Schema for a newly issued calendar feed token (shown once)."""
+    feed_token: str
+    feed_url: str
+
+
 class TokenResponse(BaseModel):
     """Schema for authentication token response."""
     access_token: str
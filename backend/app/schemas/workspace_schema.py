@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from datetime import datetime
+
+
+# Response Schemas
+class WorkspaceResponse(BaseModel):
+    """Schema for workspace response."""
+    id: int
+    name: str
+    slug: str
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
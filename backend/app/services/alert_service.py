@@ -1,8 +1,25 @@
 from sqlalchemy.orm import Session
 from datetime import datetime
-from app.models.alert import Alert, AlertType, AlertSeverity
+from app.models.alert import Alert, AlertArchive, AlertType, AlertSeverity
+from app.models.booking import Booking
+from app.models.inventory import Inventory
 from app.schemas.alert_schema import AlertCreate
+from app.schemas.booking_schema import BookingResponse
+from app.schemas.inventory_schema import InventoryResponse
+from app.services.archive_service import with_archived
+from app.core.pagination import paginate
+from app.core.fieldsets import load_only_options
 from app.core.logger import log_info
+from app.core.cache import service_cache, table_tags, workspace_key
+
+# reference_type -> (model, response schema) for ?expand=reference
+REFERENCE_MODELS = {
+    "inventory": (Inventory, InventoryResponse),
+    "booking": (Booking, BookingResponse),
+}
+
+# Keyset sort key for list pagination, newest first (ix_alerts_workspace_id_created_at_id)
+SORT_KEY = ("created_at", "id")
 
 
 class AlertService:
@@ -10,6 +27,7 @@ class AlertService:
     Alert service for managing system notifications.
     
     Alerts are never deleted, only dismissed.
+    Old dismissed alerts live in the archive tier and are still readable here.
     """
     
     def __init__(self, db: Session):
@@ -17,7 +35,7 @@ class AlertService:
     
     def create_alert(self, alert_data: AlertCreate) -> Alert:
         """Create a new alert."""
-        log_info(f"[SERVICE] Creating alert: {alert_data.type} - {alert_data.message}")
+        log_info("[SERVICE] Creating alert: %s - %s", alert_data.type, alert_data.message)
         
         alert = Alert(**alert_data.model_dump())
         self.db.add(alert)
@@ -28,10 +46,14 @@ class AlertService:
     
     def dismiss_alert(self, alert_id: int) -> Alert:
         """Dismiss an alert (doesn't delete it)."""
-        log_info(f"[SERVICE] Dismissing alert {alert_id}")
+        log_info("[SERVICE] Dismissing alert %s", alert_id)
         
         alert = self.db.query(Alert).filter(Alert.id == alert_id).first()
         if not alert:
+            # Archived alerts are already dismissed
+            archived = self.db.query(AlertArchive).filter(AlertArchive.id == alert_id).first()
+            if archived:
+                return archived
             raise ValueError(f"Alert {alert_id} not found")
         
         alert.is_dismissed = True
@@ -43,8 +65,11 @@ class AlertService:
         return alert
     
     def get_alert(self, alert_id: int) -> Alert:
-        """Get alert by ID."""
-        return self.db.query(Alert).filter(Alert.id == alert_id).first()
+        """Get alert by ID, falling back to the archive."""
+        alert = self.db.query(Alert).filter(Alert.id == alert_id).first()
+        if alert:
+            return alert
+        return self.db.query(AlertArchive).filter(AlertArchive.id == alert_id).first()
     
     def get_alerts(
         self,
@@ -52,22 +77,62 @@ class AlertService:
         limit: int = 100,
         include_dismissed: bool = False,
         alert_type: AlertType = None,
-        severity: AlertSeverity = None
+        severity: AlertSeverity = None,
+        include_archived: bool = False,
+        cursor: str = None,
+        fields: frozenset = None
     ) -> list[Alert]:
-        """Get alerts with pagination and filters."""
-        query = self.db.query(Alert)
+        """
+        Get alerts with pagination and filters.
         
-        if not include_dismissed:
-            query = query.filter(Alert.is_dismissed == False)
+        Archived alerts are only read when include_archived is set
+        (they are always dismissed, so include_dismissed is implied).
+        cursor: keyset cursor over SORT_KEY; takes precedence over skip.
+        fields: sparse fieldset - only these columns (plus keys) are loaded.
+        """
+        entity = with_archived(Alert) if include_archived else Alert
+        query = self.db.query(entity).options(
+            *load_only_options(entity, fields, required=SORT_KEY + ("reference_type", "reference_id"))
+        )
+        
+        if not include_dismissed and not include_archived:
+            query = query.filter(entity.is_dismissed == False)
         
         if alert_type:
-            query = query.filter(Alert.type == alert_type)
+            query = query.filter(entity.type == alert_type)
         
         if severity:
-            query = query.filter(Alert.severity == severity)
+            query = query.filter(entity.severity == severity)
         
-        return query.order_by(Alert.created_at.desc()).offset(skip).limit(limit).all()
+        columns = [getattr(entity, name) for name in SORT_KEY]
+        return paginate(query, columns, cursor=cursor, skip=skip, limit=limit, descending=True).all()
     
     def get_active_alert_count(self) -> int:
-        """Get count of active (non-dismissed) alerts."""
-        return self.db.query(Alert).filter(Alert.is_dismissed == False).count()
+        """Get count of active (non-dismissed) alerts (read-through cached; invalidated on commit)."""
+        return service_cache.read_through(
+            workspace_key(self.db, "alerts:active_count"),
+            tags=table_tags(Alert, self.db),
+            loader=lambda: self.db.query(Alert).filter(Alert.is_dismissed == False).count()
+        )
+    
+    def get_references(self, alerts: list[Alert]) -> dict:
+        """
+        Load the entities referenced by a page of alerts.
+        
+        One query per reference_type present on the page (not per alert).
+        
+        Returns:
+            {(reference_type, reference_id): serialized entity}
+        """
+        ids_by_type: dict[str, set] = {}
+        for alert in alerts:
+            if alert.reference_type in REFERENCE_MODELS and alert.reference_id is not None:
+                ids_by_type.setdefault(alert.reference_type, set()).add(alert.reference_id)
+        
+        references = {}
+        for reference_type, ids in ids_by_type.items():
+            model, schema = REFERENCE_MODELS[reference_type]
+            for entity in self.db.query(model).filter(model.id.in_(ids)).all():
+                references[(reference_type, entity.id)] = schema.model_validate(entity).model_dump(mode="json")
+        
+        return references
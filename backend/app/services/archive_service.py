@@ -0,0 +1,125 @@
+from sqlalchemy import select, insert, delete, union_all
+from sqlalchemy.orm import Session, aliased
+from datetime import datetime, timedelta
+from app.core.config import settings
+from app.core.logger import log_info
+from app.core.partitioning import ensure_future_partitions, drop_empty_partitions
+from app.models.alert import Alert, AlertArchive
+from app.models.message import Message, MessageArchive
+
+# Hot model -> archive model
+ARCHIVE_MODELS = {
+    Alert: AlertArchive,
+    Message: MessageArchive,
+}
+
+
+def with_archived(model):
+    """
+    Return an ORM entity reading from the hot table UNION ALL its archive.
+
+    Usage:
+        entity = with_archived(Alert)
+        db.query(entity).filter(entity.is_dismissed == True)
+
+    Rows are read-only snapshots; writes must go through the hot model.
+    """
+    archive = ARCHIVE_MODELS[model].__table__
+    hot = model.__table__
+    combined = union_all(
+        select(*hot.columns),
+        select(*[archive.columns[column.name] for column in hot.columns])
+    ).subquery(f"{hot.name}_all")
+    return aliased(model, combined)
+
+
+class ArchiveService:
+    """
+    Archival tier for alerts and messages.
+
+    Moves dismissed alerts and old messages out of the hot (partitioned)
+    tables into compact archive tables in bounded batches, so hot indexes
+    only cover live data. Archived rows stay readable via with_archived().
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def archive_dismissed_alerts(self, older_than_days: int = None, batch_size: int = None) -> int:
+        """Move alerts dismissed more than `older_than_days` ago to the archive."""
+        days = older_than_days if older_than_days is not None else settings.ALERT_ARCHIVE_AFTER_DAYS
+        cutoff = datetime.utcnow() - timedelta(days=days)
+
+        log_info("[ARCHIVE] Archiving alerts dismissed before %s", cutoff.isoformat())
+
+        moved = self._move_in_batches(
+            Alert,
+            [Alert.is_dismissed == True, Alert.dismissed_at < cutoff],
+            batch_size
+        )
+
+        log_info("[ARCHIVE] Alerts archived: %s", moved)
+        return moved
+
+    def archive_old_messages(self, older_than_days: int = None, batch_size: int = None) -> int:
+        """Move messages created more than `older_than_days` ago to the archive."""
+        days = older_than_days if older_than_days is not None else settings.MESSAGE_ARCHIVE_AFTER_DAYS
+        cutoff = datetime.utcnow() - timedelta(days=days)
+
+        log_info("[ARCHIVE] Archiving messages created before %s", cutoff.isoformat())
+
+        moved = self._move_in_batches(Message, [Message.created_at < cutoff], batch_size)
+
+        # Whole months are now empty - drop their partitions
+        drop_empty_partitions(self.db.connection(), Message.__tablename__, cutoff)
+        self.db.commit()
+
+        log_info("[ARCHIVE] Messages archived: %s", moved)
+        return moved
+
+    def run(self) -> dict:
+        """Full archive pass: premake partitions, then archive both tables."""
+        ensure_future_partitions(self.db.connection())
+        self.db.commit()
+
+        return {
+            "alerts": self.archive_dismissed_alerts(),
+            "messages": self.archive_old_messages(),
+        }
+
+    def _move_in_batches(self, model, conditions: list, batch_size: int = None) -> int:
+        """
+        Move matching rows from `model` to its archive table.
+
+        Each batch is one INSERT ... SELECT plus one DELETE by primary key,
+        committed separately so locks are held only briefly.
+        """
+        batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+        hot = model.__table__
+        archive = ARCHIVE_MODELS[model].__table__
+        columns = [column.name for column in hot.columns]
+        total = 0
+
+        while True:
+            ids = self.db.execute(
+                select(hot.c.id).where(*conditions).order_by(hot.c.id).limit(batch_size)
+            ).scalars().all()
+
+            if not ids:
+                break
+
+            self.db.execute(
+                insert(archive).from_select(
+                    columns,
+                    select(*[hot.c[name] for name in columns]).where(hot.c.id.in_(ids))
+                )
+            )
+            self.db.execute(delete(hot).where(hot.c.id.in_(ids)))
+            self.db.commit()
+
+            total += len(ids)
+
+            if len(ids) < batch_size:
+                break
+
+        return total
@@ -1,8 +1,10 @@
 from sqlalchemy.orm import Session
 from app.core.logger import log_info
+from app.core.metrics import timed_event
 from app.models.contact import Contact
 from app.models.booking import Booking
 from app.services.integration_service import IntegrationService
+from app.services.contact_service import ContactService
 
 
 class AutomationService:
@@ -19,13 +21,15 @@ class AutomationService:
     def __init__(self, db: Session):
         self.db = db
         self.integration = IntegrationService(db)
+        self.contacts = ContactService(db)
     
+    @timed_event("new_contact")
     def handle_new_contact(self, contact: Contact):
         """
         EVENT: New contact created
         ACTION: Send welcome message
         """
-        log_info(f"[AUTOMATION] Handling new contact event: {contact.id}")
+        log_info("[AUTOMATION] Handling new contact event: %s", contact.id)
         
         if contact.email:
             success = self.integration.send_email(
@@ -34,7 +38,7 @@ class AutomationService:
                 content=f"Hi {contact.name},\n\nThank you for contacting us. We'll be in touch soon!",
                 contact_id=contact.id
             )
-            log_info(f"[AUTOMATION] Welcome email sent: {success}")
+            log_info("[AUTOMATION] Welcome email sent: %s", success)
         
         if contact.phone:
             success = self.integration.send_sms(
@@ -42,18 +46,19 @@ class AutomationService:
                 content=f"Hi {contact.name}, thank you for contacting us!",
                 contact_id=contact.id
             )
-            log_info(f"[AUTOMATION] Welcome SMS sent: {success}")
+            log_info("[AUTOMATION] Welcome SMS sent: %s", success)
     
+    @timed_event("booking_created")
     def handle_booking_created(self, booking: Booking):
         """
         EVENT: Booking created
         ACTION: Send confirmation message
         """
-        log_info(f"[AUTOMATION] Handling booking created event: {booking.id}")
+        log_info("[AUTOMATION] Handling booking created event: %s", booking.id)
         
-        contact = self.db.query(Contact).filter(Contact.id == booking.contact_id).first()
+        contact = self.contacts.get_contact(booking.contact_id)
         if not contact:
-            log_info(f"[AUTOMATION] Contact not found for booking {booking.id}")
+            log_info("[AUTOMATION] Contact not found for booking %s", booking.id)
             return
         
         message = f"Hi {contact.name}, your booking is confirmed for {booking.start_time.strftime('%Y-%m-%d %H:%M')}."
@@ -65,7 +70,7 @@ class AutomationService:
                 content=message,
                 contact_id=contact.id
             )
-            log_info(f"[AUTOMATION] Booking confirmation email sent: {success}")
+            log_info("[AUTOMATION] Booking confirmation email sent: %s", success)
         
         if contact.phone:
             success = self.integration.send_sms(
@@ -73,7 +78,7 @@ class AutomationService:
                 content=message,
                 contact_id=contact.id
             )
-            log_info(f"[AUTOMATION] Booking confirmation SMS sent: {success}")
+            log_info("[AUTOMATION] Booking confirmation SMS sent: %s", success)
         
         # Create calendar event
         if contact.email:
@@ -84,14 +89,15 @@ class AutomationService:
                 attendee_email=contact.email
             )
     
+    @timed_event("booking_reminder")
     def handle_booking_reminder(self, booking: Booking):
         """
         EVENT: Booking reminder (triggered by scheduler)
         ACTION: Send reminder message
         """
-        log_info(f"[AUTOMATION] Handling booking reminder event: {booking.id}")
+        log_info("[AUTOMATION] Handling booking reminder event: %s", booking.id)
         
-        contact = self.db.query(Contact).filter(Contact.id == booking.contact_id).first()
+        contact = self.contacts.get_contact(booking.contact_id)
         if not contact:
             return
         
@@ -112,14 +118,15 @@ class AutomationService:
                 contact_id=contact.id
             )
     
+    @timed_event("form_pending_reminder")
     def handle_form_pending_reminder(self, booking: Booking):
         """
         EVENT: Form still pending (triggered by scheduler)
         ACTION: Send form reminder
         """
-        log_info(f"[AUTOMATION] Handling form pending reminder event: {booking.id}")
+        log_info("[AUTOMATION] Handling form pending reminder event: %s", booking.id)
         
-        contact = self.db.query(Contact).filter(Contact.id == booking.contact_id).first()
+        contact = self.contacts.get_contact(booking.contact_id)
         if not contact:
             return
         
@@ -140,6 +147,25 @@ class AutomationService:
                 contact_id=contact.id
             )
     
+    @timed_event("bookings_status_changed")
+    def handle_bookings_status_changed(self, workspace_id: int, status: str, bookings: list[dict]):
+        """
+        EVENT: Batch of one workspace's bookings changed status (status job)
+        ACTION: Emit one webhook for the whole batch
+        """
+        if not bookings:
+            return
+        
+        log_info(
+            "[AUTOMATION] Handling bulk status change to %s: %s bookings (workspace %s)",
+            status, len(bookings), workspace_id
+        )
+        
+        self.integration.trigger_webhook(
+            "booking.status_changed",
+            {"workspace_id": workspace_id, "status": status, "bookings": bookings}
+        )
+    
     def should_stop_automation(self, contact_id: int) -> bool:
         """
         Check if automation should stop for a contact.
@@ -0,0 +1,306 @@
+from sqlalchemy.orm import Session
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+import time
+from app.core.cache import service_cache, table_tags
+from app.core.config import settings
+from app.core.logger import log_info
+from app.models.booking import Booking, BookingStatus
+from app.models.booking_series import BookingSeries, BookingSeriesException
+from app.models.user import User
+
+Interval = Tuple[datetime, datetime]
+
+# Tables whose writes change busy time
+SCHEDULE_MODELS = (Booking, BookingSeries, BookingSeriesException)
+
+
+def merge_intervals(intervals: List[Interval]) -> List[Interval]:
+    """
+    Merge overlapping/touching intervals.
+
+    Args:
+        intervals: Intervals sorted by start time
+
+    Returns:
+        Disjoint intervals sorted by start time
+    """
+    merged: List[List[datetime]] = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def free_slots(
+    window_start: datetime,
+    window_end: datetime,
+    busy: List[Interval],
+    duration: timedelta,
+    step: timedelta
+) -> List[Interval]:
+    """
+    Cut the gaps between merged busy intervals into bookable slots.
+
+    Slot starts are aligned to `step` from window_start.
+    """
+    slots = []
+    cursor = window_start
+
+    for busy_start, busy_end in busy + [(window_end, window_end)]:
+        gap_end = min(busy_start, window_end)
+
+        # Align to the slot grid
+        offset = (cursor - window_start) % step
+        slot_start = cursor if not offset else cursor + (step - offset)
+
+        while slot_start + duration <= gap_end:
+            slots.append((slot_start, slot_start + duration))
+            slot_start += step
+
+        cursor = max(cursor, busy_end)
+        if cursor >= window_end:
+            break
+
+    return slots
+
+
+class _BusyCache:
+    """
+    Per-process cache of merged busy intervals keyed by (staff_id, day).
+
+    Bounded (LRU) with a TTL. Invalidation is commit-driven and shared:
+    each entry stores the versions of the workspace's schedule tags (see
+    `availability_tags`) it was computed under and is only served while
+    they are unchanged. Commits bump them in the service cache backend,
+    so with a shared backend (CACHE_URL=redis://) a booking written by
+    one worker invalidates every worker's entries. Versions are read
+    before loading, so a computation that raced with a write is stale.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[int, date], Tuple[float, List[int], List[Interval]]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, staff_id: int, day: date, versions: List[int]) -> Optional[List[Interval]]:
+        key = (staff_id, day)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, stored_versions, busy = entry
+            if expires_at < time.monotonic() or stored_versions != versions:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return busy
+
+    def set_many(self, values: Dict[Tuple[int, date], List[Interval]], versions: List[int]):
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            for key, busy in values.items():
+                self._entries[key] = (expires_at, versions, busy)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+busy_cache = _BusyCache(
+    ttl_seconds=settings.AVAILABILITY_CACHE_TTL_SECONDS,
+    max_entries=settings.AVAILABILITY_CACHE_MAX_ENTRIES
+)
+
+
+def availability_tags(db: Session) -> List[str]:
+    """
+    Service cache tags of the session's workspace schedule (bookings,
+    series and their exceptions), bumped by every commit writing them,
+    including bulk statements and database cascades.
+    """
+    tags = []
+    for model in SCHEDULE_MODELS:
+        tags.extend(table_tags(model, db))
+    return tags
+
+
+class AvailabilityService:
+    """
+    Free-slot search for staff schedules.
+
+    Busy time comes from a single range scan of the bookings overlapping
+    the range, ordered by (staff_id, start_time), plus recurring series expanded for the range,
+    merged per staff and cached per staff/day. Cache entries are
+    invalidated by any committed write to the workspace's schedule.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def resolve_staff(self, staff_id: Optional[int] = None, service_type: Optional[str] = None) -> List[int]:
+        """
+        Resolve which staff to search.
+
+        - staff_id: that staff member only
+        - service_type: staff who have been booked for that service
+
+        Raises:
+            ValueError: If neither is given, or the staff member is not in the session's workspace
+        """
+        if staff_id is not None:
+            if not self.db.query(User.id).filter(User.id == staff_id).first():
+                raise ValueError(f"Staff member {staff_id} not found")
+            return [staff_id]
+
+        if not service_type:
+            raise ValueError("Either staff_id or service_type is required")
+
+        rows = self.db.query(Booking.staff_id).filter(
+            Booking.service_type == service_type,
+            Booking.staff_id.isnot(None)
+        ).distinct().all()
+        return sorted(row[0] for row in rows)
+
+    def get_availability(
+        self,
+        date_from: date,
+        date_to: date,
+        staff_id: Optional[int] = None,
+        service_type: Optional[str] = None,
+        duration_minutes: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Get free slots per staff member between two dates (inclusive).
+
+        Returns:
+            [{"staff_id": int, "slots": [{"start_time", "end_time"}, ...]}, ...]
+        """
+        if date_to < date_from:
+            raise ValueError("date_to must not be before date_from")
+        if (date_to - date_from).days + 1 > settings.AVAILABILITY_MAX_DAYS:
+            raise ValueError(f"Date range cannot exceed {settings.AVAILABILITY_MAX_DAYS} days")
+
+        staff_ids = self.resolve_staff(staff_id, service_type)
+        days = [
+            date_from + timedelta(days=offset)
+            for offset in range((date_to - date_from).days + 1)
+            if (date_from + timedelta(days=offset)).weekday() in settings.working_days
+        ]
+
+        busy = self._get_busy(staff_ids, days)
+
+        step = timedelta(minutes=settings.AVAILABILITY_SLOT_MINUTES)
+        duration = timedelta(minutes=duration_minutes) if duration_minutes else step
+        now = datetime.utcnow()
+
+        result = []
+        for sid in staff_ids:
+            slots = []
+            for day in days:
+                window_start = datetime.combine(day, datetime.min.time()) + timedelta(hours=settings.WORKING_DAY_START_HOUR)
+                window_end = datetime.combine(day, datetime.min.time()) + timedelta(hours=settings.WORKING_DAY_END_HOUR)
+                if window_end <= now:
+                    continue
+
+                for start, end in free_slots(window_start, window_end, busy[(sid, day)], duration, step):
+                    if start >= now:
+                        slots.append({"start_time": start, "end_time": end})
+
+            result.append({"staff_id": sid, "slots": slots})
+
+        return result
+
+    def _get_busy(self, staff_ids: List[int], days: List[date]) -> Dict[Tuple[int, date], List[Interval]]:
+        """
+        Merged busy intervals per (staff_id, day), served from cache where possible.
+
+        All cache misses are filled by ONE query over the smallest range covering them.
+        """
+        busy: Dict[Tuple[int, date], List[Interval]] = {}
+        missing: List[Tuple[int, date]] = []
+        versions = service_cache.backend.get_versions(availability_tags(self.db))
+
+        for sid in staff_ids:
+            for day in days:
+                cached = busy_cache.get(sid, day, versions)
+                if cached is None:
+                    missing.append((sid, day))
+                else:
+                    busy[(sid, day)] = cached
+
+        if not missing:
+            return busy
+
+        missing_staff = sorted({sid for sid, _ in missing})
+        first_day = min(day for _, day in missing)
+        last_day = max(day for _, day in missing)
+        range_start = datetime.combine(first_day, datetime.min.time())
+        range_end = datetime.combine(last_day + timedelta(days=1), datetime.min.time())
+
+        log_info("[SERVICE] Availability scan: %s staff, %s to %s", len(missing_staff), first_day, last_day)
+
+        rows = self.db.query(Booking.staff_id, Booking.start_time, Booking.end_time).filter(
+            Booking.staff_id.in_(missing_staff),
+            # Any booking overlapping the range, however long; the
+            # (staff_id, end_time) index bounds the scan to bookings ending after it starts
+            Booking.end_time > range_start,
+            Booking.start_time < range_end,
+            Booking.status != BookingStatus.CANCELLED
+        ).order_by(Booking.staff_id, Booking.start_time).all()
+
+        # Recurring series occurrences, expanded only for this range
+        from app.services.recurrence_service import RecurrenceService
+        occurrences = RecurrenceService(self.db).iter_window_occurrences(range_start, range_end, missing_staff)
+        recurring: Dict[int, List[Interval]] = {}
+        for occurrence in occurrences:
+            recurring.setdefault(occurrence.staff_id, []).append((occurrence.start_time, occurrence.end_time))
+
+        # Rows arrive sorted by (staff_id, start_time) - merge per staff in one pass
+        merged_by_staff: Dict[int, List[Interval]] = {}
+        current_staff = None
+        intervals: List[Interval] = []
+        for sid, start, end in rows:
+            if sid != current_staff:
+                if current_staff is not None:
+                    merged_by_staff[current_staff] = self._merge_staff(intervals, recurring.pop(current_staff, None))
+                current_staff, intervals = sid, []
+            intervals.append((start, end))
+        if current_staff is not None:
+            merged_by_staff[current_staff] = self._merge_staff(intervals, recurring.pop(current_staff, None))
+        for sid, extra in recurring.items():
+            merged_by_staff[sid] = self._merge_staff([], extra)
+
+        # Clip merged intervals into per-day buckets
+        computed: Dict[Tuple[int, date], List[Interval]] = {key: [] for key in missing}
+        for sid, merged in merged_by_staff.items():
+            for start, end in merged:
+                day = max(start.date(), first_day)
+                while day <= min(end.date(), last_day):
+                    key = (sid, day)
+                    if key in computed:
+                        day_start = datetime.combine(day, datetime.min.time())
+                        clipped = (max(start, day_start), min(end, day_start + timedelta(days=1)))
+                        if clipped[0] < clipped[1]:
+                            computed[key].append(clipped)
+                    day += timedelta(days=1)
+
+        busy_cache.set_many(computed, versions)
+        busy.update(computed)
+        return busy
+
+    @staticmethod
+    def _merge_staff(intervals: List[Interval], recurring: Optional[List[Interval]]) -> List[Interval]:
+        """Merge sorted booking intervals with (unsorted) series occurrences."""
+        if recurring:
+            intervals = sorted(intervals + recurring)
+        return merge_intervals(intervals)
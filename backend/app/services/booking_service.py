@@ -1,8 +1,33 @@
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
-from app.models.booking import Booking, BookingStatus
+from sqlalchemy.exc import IntegrityError, DataError
+from datetime import datetime, timedelta
+from app.models.booking import Booking, BookingStatus, FormStatus, STAFF_OVERLAP_CONSTRAINT
+from app.models.contact import Contact
+from app.models.user import User
+from app.models.workspace import Workspace
 from app.schemas.booking_schema import BookingCreate, BookingUpdate
 from app.services.automation_service import AutomationService
-from app.core.logger import log_info
+from app.core.config import settings
+from app.core.database import relation_loaders
+from app.core.pagination import paginate
+from app.core.fieldsets import load_only_options
+from app.core.logger import log_info, log_warning
+from app.core.tenancy import check_visible, get_workspace, set_workspace
+
+# Relations that list endpoints can embed with ?expand=
+EXPANDABLE_RELATIONS = ("contact", "staff")
+
+# Keyset sort key for list pagination (indexed as ix_bookings_workspace_id_start_time_id)
+SORT_KEY = ("start_time", "id")
+
+
+class BookingConflictError(Exception):
+    """Booking overlaps another booking of the same staff member."""
+
+
+class InvalidBookingTimeError(Exception):
+    """Booking end_time is not after start_time."""
 
 
 class BookingService:
@@ -22,15 +47,17 @@ class BookingService:
         
         EVENT TRIGGER: handle_booking_created
         """
-        log_info(f"[SERVICE] Creating booking for contact {booking_data.contact_id}")
+        log_info("[SERVICE] Creating booking for contact %s", booking_data.contact_id)
         
-        # Create booking
+        self._check_references(booking_data.contact_id, booking_data.staff_id)
+        
+        # Create booking (overlap is checked by the database)
         booking = Booking(**booking_data.model_dump())
         self.db.add(booking)
-        self.db.commit()
+        self._commit_or_raise_conflict()
         self.db.refresh(booking)
         
-        log_info(f"[SERVICE] Booking created: {booking.id}")
+        log_info("[SERVICE] Booking created: %s", booking.id)
         
         # EXPLICIT EVENT TRIGGER
         self.automation.handle_booking_created(booking)
@@ -44,7 +71,7 @@ class BookingService:
         No automatic event triggers on update.
         Events must be triggered explicitly if needed.
         """
-        log_info(f"[SERVICE] Updating booking {booking_id}")
+        log_info("[SERVICE] Updating booking %s", booking_id)
         
         booking = self.db.query(Booking).filter(Booking.id == booking_id).first()
         if not booking:
@@ -52,15 +79,44 @@ class BookingService:
         
         # Update fields
         update_data = booking_data.model_dump(exclude_unset=True)
+        self._check_references(update_data.get("contact_id"), update_data.get("staff_id"))
         for field, value in update_data.items():
             setattr(booking, field, value)
         
-        self.db.commit()
+        if booking.end_time <= booking.start_time:
+            self.db.rollback()
+            raise InvalidBookingTimeError("end_time must be after start_time")
+        
+        self._commit_or_raise_conflict()
         self.db.refresh(booking)
         
-        log_info(f"[SERVICE] Booking updated: {booking.id}")
+        log_info("[SERVICE] Booking updated: %s", booking.id)
         return booking
     
+    def _check_references(self, contact_id: int = None, staff_id: int = None):
+        """Raise ValueError unless the contact and staff member are in this workspace."""
+        check_visible(self.db, Contact, contact_id, "Contact")
+        check_visible(self.db, User, staff_id, "Staff member")
+    
+    def _commit_or_raise_conflict(self):
+        """
+        Commit, translating the staff overlap exclusion violation into BookingConflictError.
+        
+        No application-level locking: concurrent inserts are serialized by the constraint.
+        """
+        try:
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            if STAFF_OVERLAP_CONSTRAINT in str(e.orig):
+                log_warning("[SERVICE] Booking rejected: staff already booked for this time")
+                raise BookingConflictError("Staff member is already booked for this time") from e
+            raise
+        except DataError as e:
+            # tsrange() rejects end_time before start_time
+            self.db.rollback()
+            raise InvalidBookingTimeError("end_time must be after start_time") from e
+    
     def get_booking(self, booking_id: int) -> Booking:
         """Get booking by ID."""
         return self.db.query(Booking).filter(Booking.id == booking_id).first()
@@ -69,15 +125,43 @@ class BookingService:
         self,
         skip: int = 0,
         limit: int = 100,
-        status: BookingStatus = None
+        status: BookingStatus = None,
+        date_from: datetime = None,
+        date_to: datetime = None,
+        staff_id: int = None,
+        expand: set = None,
+        cursor: str = None,
+        fields: frozenset = None
     ) -> list[Booking]:
-        """Get bookings with pagination and optional status filter."""
-        query = self.db.query(Booking)
+        """
+        Get bookings with pagination and optional filters.
+        
+        expand: relations to eager-load ("contact", "staff"); others are not loaded.
+        cursor: keyset cursor over SORT_KEY; takes precedence over skip.
+        fields: sparse fieldset - only these columns (plus keys) are loaded.
+        date_from/date_to select bookings starting in [date_from, date_to).
+        Results are ordered by start_time; with staff_id the range is served
+        by the (staff_id, start_time) index.
+        """
+        query = self.db.query(Booking).options(
+            *relation_loaders(Booking, EXPANDABLE_RELATIONS, expand or set()),
+            *load_only_options(Booking, fields, required=SORT_KEY + ("contact_id", "staff_id"))
+        )
+        
+        if staff_id is not None:
+            query = query.filter(Booking.staff_id == staff_id)
+        
+        if date_from:
+            query = query.filter(Booking.start_time >= date_from)
+        
+        if date_to:
+            query = query.filter(Booking.start_time < date_to)
         
         if status:
             query = query.filter(Booking.status == status)
         
-        return query.offset(skip).limit(limit).all()
+        columns = [getattr(Booking, name) for name in SORT_KEY]
+        return paginate(query, columns, cursor=cursor, skip=skip, limit=limit).all()
     
     def send_reminder(self, booking_id: int):
         """
@@ -85,7 +169,7 @@ class BookingService:
         
         EVENT TRIGGER: handle_booking_reminder
         """
-        log_info(f"[SERVICE] Sending reminder for booking {booking_id}")
+        log_info("[SERVICE] Sending reminder for booking %s", booking_id)
         
         booking = self.get_booking(booking_id)
         if not booking:
@@ -100,7 +184,7 @@ class BookingService:
         
         EVENT TRIGGER: handle_form_pending_reminder
         """
-        log_info(f"[SERVICE] Sending form reminder for booking {booking_id}")
+        log_info("[SERVICE] Sending form reminder for booking %s", booking_id)
         
         booking = self.get_booking(booking_id)
         if not booking:
@@ -108,3 +192,85 @@ class BookingService:
         
         # EXPLICIT EVENT TRIGGER
         self.automation.handle_form_pending_reminder(booking)
+    
+    def close_past_bookings(self, grace_minutes: int = None, batch_size: int = None) -> dict:
+        """
+        Close out bookings still PENDING/CONFIRMED after they ended.
+        
+        - form completed -> COMPLETED
+        - otherwise      -> NO_SHOW
+        
+        Set-based: bounded UPDATE ... WHERE id IN (SELECT ... LIMIT n) RETURNING
+        statements, one commit and one bulk change event per batch. An
+        unscoped (job) session processes each workspace in turn, so every
+        batch and its event belong to one workspace.
+        
+        EVENT TRIGGER: handle_bookings_status_changed (per workspace and batch)
+        """
+        grace = grace_minutes if grace_minutes is not None else settings.BOOKING_NO_SHOW_GRACE_MINUTES
+        batch_size = batch_size or settings.BOOKING_STATUS_BATCH_SIZE
+        cutoff = datetime.utcnow() - timedelta(minutes=grace)
+        
+        log_info("[SERVICE] Closing bookings that ended before %s", cutoff.isoformat())
+        
+        scope = get_workspace(self.db)
+        workspace_ids = [scope] if scope is not None else [
+            row.id for row in self.db.query(Workspace.id).order_by(Workspace.id)
+        ]
+        
+        result = {BookingStatus.COMPLETED.value: 0, BookingStatus.NO_SHOW.value: 0}
+        try:
+            for workspace_id in workspace_ids:
+                set_workspace(self.db, workspace_id)
+                for status, closed in self._close_workspace_bookings(workspace_id, cutoff, batch_size).items():
+                    result[status] += closed
+        finally:
+            set_workspace(self.db, scope)
+        
+        log_info("[SERVICE] Past bookings closed: %s", result)
+        return result
+    
+    def _close_workspace_bookings(self, workspace_id: int, cutoff: datetime, batch_size: int) -> dict:
+        """Close past bookings of the workspace the session is scoped to."""
+        transitions = [
+            (FormStatus.COMPLETED, BookingStatus.COMPLETED),
+            (FormStatus.PENDING, BookingStatus.NO_SHOW),
+        ]
+        result = {}
+        
+        for form_status, new_status in transitions:
+            total = 0
+            while True:
+                batch = select(Booking.id).where(
+                    Booking.status.in_([BookingStatus.PENDING, BookingStatus.CONFIRMED]),
+                    Booking.end_time < cutoff,
+                    Booking.form_status == form_status
+                ).order_by(Booking.id).limit(batch_size)
+                
+                rows = self.db.execute(
+                    update(Booking)
+                    .where(Booking.id.in_(batch.scalar_subquery()))
+                    .values(status=new_status, updated_at=datetime.utcnow())
+                    .returning(Booking.id, Booking.contact_id, Booking.staff_id)
+                    .execution_options(synchronize_session=False)
+                ).all()
+                self.db.commit()
+                
+                if not rows:
+                    break
+                
+                total += len(rows)
+                self.automation.handle_bookings_status_changed(
+                    workspace_id,
+                    new_status.value,
+                    [{"id": r.id, "contact_id": r.contact_id, "staff_id": r.staff_id} for r in rows]
+                )
+                
+                if len(rows) < batch_size:
+                    break
+            
+            result[new_status.value] = total
+        
+        if any(result.values()):
+            log_info("[SERVICE] Workspace %s: past bookings closed: %s", workspace_id, result)
+        return result
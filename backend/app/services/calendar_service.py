@@ -0,0 +1,133 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+from typing import Iterator
+import hashlib
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logger import log_info
+from app.core.tenancy import set_workspace
+from app.models.booking import Booking, BookingStatus
+from app.models.contact import Contact
+
+# Rows fetched per round trip from the server-side cursor
+FEED_BATCH_SIZE = 500
+
+ICAL_STATUS = {
+    BookingStatus.PENDING: "TENTATIVE",
+    BookingStatus.CONFIRMED: "CONFIRMED",
+    BookingStatus.COMPLETED: "CONFIRMED",
+    BookingStatus.NO_SHOW: "CONFIRMED",
+    BookingStatus.CANCELLED: "CANCELLED",
+}
+
+
+def _ical_time(value: datetime) -> str:
+    """Format a naive UTC datetime as an iCalendar UTC timestamp."""
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
+def _ical_text(value: str) -> str:
+    """Escape text per RFC 5545."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _ical_fold(line: str) -> str:
+    """Fold content lines longer than 75 characters (RFC 5545 section 3.1)."""
+    if len(line) <= 75:
+        return line
+    chunks = [line[:75]] + [line[i:i + 74] for i in range(75, len(line), 74)]
+    return "\r\n ".join(chunks)
+
+
+class CalendarService:
+    """
+    Per-staff iCalendar subscription feeds.
+
+    Feeds are streamed from a server-side cursor and versioned with an
+    ETag derived from the staff member's latest booking change.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def feed_window_start(self) -> datetime:
+        """Oldest booking start included in feeds."""
+        return datetime.utcnow() - timedelta(days=settings.CALENDAR_FEED_PAST_DAYS)
+
+    def get_feed_etag(self, staff_id: int) -> str:
+        """
+        ETag for a staff feed: changes whenever a booking is created,
+        updated or deleted for that staff member.
+        """
+        latest, count = self.db.query(
+            func.max(Booking.updated_at),
+            func.count(Booking.id)
+        ).filter(Booking.staff_id == staff_id).one()
+
+        version = f"{staff_id}:{latest.isoformat() if latest else ''}:{count}"
+        return '"' + hashlib.sha1(version.encode()).hexdigest() + '"'
+
+
+def stream_staff_calendar(staff_id: int, workspace_id: int) -> Iterator[bytes]:
+    """
+    Yield an iCalendar document for one staff member, one event at a time.
+
+    Owns its session: the request-scoped session is closed before a
+    streaming response body is sent.
+    """
+    db = SessionLocal()
+    set_workspace(db, workspace_id)
+    try:
+        window_start = CalendarService(db).feed_window_start()
+        stamp = _ical_time(datetime.utcnow())
+
+        log_info("[SERVICE] Streaming calendar feed for staff %s", staff_id)
+
+        yield (
+            "BEGIN:VCALENDAR\r\n"
+            "VERSION:2.0\r\n"
+            "PRODID:-//CareOps//Staff Schedule//EN\r\n"
+            "CALSCALE:GREGORIAN\r\n"
+            f"X-WR-CALNAME:CareOps schedule (staff {staff_id})\r\n"
+        ).encode()
+
+        rows = db.query(
+            Booking.id,
+            Booking.status,
+            Booking.start_time,
+            Booking.end_time,
+            Booking.service_type,
+            Booking.notes,
+            Booking.updated_at,
+            Contact.name
+        ).join(Contact, Contact.id == Booking.contact_id).filter(
+            Booking.staff_id == staff_id,
+            Booking.start_time >= window_start
+        ).order_by(Booking.start_time, Booking.id).execution_options(yield_per=FEED_BATCH_SIZE)
+
+        for row in rows:
+            summary = f"{row.service_type or 'Booking'} - {row.name}"
+            lines = [
+                "BEGIN:VEVENT",
+                f"UID:booking-{row.id}@careops",
+                f"DTSTAMP:{stamp}",
+                f"LAST-MODIFIED:{_ical_time(row.updated_at)}",
+                f"DTSTART:{_ical_time(row.start_time)}",
+                f"DTEND:{_ical_time(row.end_time)}",
+                f"SUMMARY:{_ical_text(summary)}",
+                f"STATUS:{ICAL_STATUS[row.status]}",
+            ]
+            if row.notes:
+                lines.append(f"DESCRIPTION:{_ical_text(row.notes)}")
+            lines.append("END:VEVENT")
+            yield ("\r\n".join(_ical_fold(line) for line in lines) + "\r\n").encode()
+
+        yield b"END:VCALENDAR\r\n"
+    finally:
+        db.close()
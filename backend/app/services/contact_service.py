@@ -0,0 +1,300 @@
+from sqlalchemy import case, event, func, or_
+from sqlalchemy.orm import Session
+from bisect import bisect_left, insort
+from threading import Lock, Thread
+from typing import Dict, List, Optional, Tuple
+import re
+import time
+from app.models.contact import Contact, phone_digits
+from app.schemas.contact_schema import ContactResponse, ContactSummary
+from app.core.cache import service_cache, row_tags, table_tags, workspace_key
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logger import log_info
+from app.core.tenancy import require_workspace
+
+# Match kinds, best first
+NAME_START, NAME_WORD, EMAIL, PHONE = range(4)
+
+# Phone matching starts at this many digits (shorter is too unselective)
+MIN_PHONE_DIGITS = 3
+
+# Session.info key collecting contact changes for the in-memory index
+PENDING_CHANGES_KEY = "contact_lookup_changes"
+
+# (workspace_id, name, email, phone)
+ContactTuple = Tuple[int, str, Optional[str], Optional[str]]
+
+
+def normalize_query(q: str) -> Tuple[str, str]:
+    """Lowercased text term and its digits (for phone matching)."""
+    term = q.strip().lower()
+    return term, re.sub(r"\D", "", term)
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class _ContactPrefixIndex:
+    """
+    In-memory sorted prefix index for typeahead (CONTACT_LOOKUP_MEMORY_INDEX).
+
+    One sorted list of (key, kind, contact_id) per workspace - name, each
+    name word, email and phone digits - searched with bisect, so a
+    keystroke costs microseconds and never scans other workspaces. Kept
+    current from committed ORM writes in this process and rebuilt in the
+    background every CONTACT_LOOKUP_INDEX_REBUILD_SECONDS (picks up other
+    workers' and bulk writes). The first build runs in the background too;
+    until it is loaded, lookups return None and callers use SQL.
+    """
+
+    # Entries scanned per lookup, as a multiple of the limit
+    SCAN_FACTOR = 50
+
+    def __init__(self, rebuild_seconds: int):
+        self.rebuild_seconds = rebuild_seconds
+        self._keys: Dict[int, List[Tuple[str, int, int]]] = {}
+        self._contacts: Dict[int, ContactTuple] = {}
+        self._built_at: Optional[float] = None
+        self._rebuilding = False
+        self._replay: List[Tuple[int, Optional[ContactTuple]]] = []
+        self._lock = Lock()
+
+    def lookup(self, workspace_id: int, term: str, digits: str, limit: int) -> Optional[List[ContactSummary]]:
+        if self._built_at is None:
+            self._rebuild_in_background()
+            return None
+        if time.monotonic() - self._built_at > self.rebuild_seconds:
+            self._rebuild_in_background()
+
+        best: Dict[int, int] = {}
+        with self._lock:
+            keys = self._keys.get(workspace_id, [])
+            self._scan(keys, term, (NAME_START, NAME_WORD, EMAIL), limit, best)
+            if len(digits) >= MIN_PHONE_DIGITS:
+                self._scan(keys, digits, (PHONE,), limit, best)
+            contacts = {contact_id: self._contacts[contact_id] for contact_id in best}
+
+        ranked = sorted(best, key=lambda contact_id: (best[contact_id], contacts[contact_id][1].lower(), contact_id))
+        return [
+            ContactSummary(id=contact_id, name=contacts[contact_id][1], email=contacts[contact_id][2], phone=contacts[contact_id][3])
+            for contact_id in ranked[:limit]
+        ]
+
+    def apply(self, changes: Dict[int, Optional[ContactTuple]]):
+        """Apply committed changes (None = deleted)."""
+        with self._lock:
+            if self._rebuilding:
+                # The snapshot being loaded may predate these
+                self._replay.extend(changes.items())
+            if self._built_at is None:
+                return
+            for contact_id, contact in changes.items():
+                self._remove(contact_id)
+                if contact is not None:
+                    self._add(contact_id, contact)
+
+    def rebuild(self):
+        """Load every contact and swap in a fresh index (no-op while another build runs)."""
+        if self._start_rebuild():
+            self._build()
+
+    def _rebuild_in_background(self):
+        if self._start_rebuild():
+            Thread(target=self._build, daemon=True).start()
+
+    def _start_rebuild(self) -> bool:
+        """Claim the single build; False when one is already running."""
+        with self._lock:
+            if self._rebuilding:
+                return False
+            self._rebuilding = True
+            return True
+
+    def _build(self):
+        started = time.monotonic()
+        contacts: Dict[int, ContactTuple] = {}
+        db = SessionLocal()
+        try:
+            rows = db.query(
+                Contact.id, Contact.workspace_id, Contact.name, Contact.email, Contact.phone
+            ).execution_options(yield_per=5000)
+            for row in rows:
+                contacts[row.id] = (row.workspace_id, row.name, row.email, row.phone)
+        except Exception:
+            with self._lock:
+                self._rebuilding = False
+                self._replay = []
+            raise
+        finally:
+            db.close()
+
+        self.load(contacts)
+        log_info(
+            "[SERVICE] Contact lookup index built: %s contacts in %.2fs", len(contacts), time.monotonic() - started
+        )
+
+    def load(self, contacts: Dict[int, ContactTuple]):
+        """Swap in an index over `contacts` ({id: (workspace_id, name, email, phone)})."""
+        keys: Dict[int, List[Tuple[str, int, int]]] = {}
+        for contact_id, contact in contacts.items():
+            keys.setdefault(contact[0], []).extend(self._keys_for(contact_id, contact))
+        for workspace_keys in keys.values():
+            workspace_keys.sort()
+
+        with self._lock:
+            self._keys, self._contacts = keys, contacts
+            # Changes committed while loading may be missing from the snapshot
+            for contact_id, contact in self._replay:
+                self._remove(contact_id)
+                if contact is not None:
+                    self._add(contact_id, contact)
+            self._replay = []
+            self._rebuilding = False
+            self._built_at = time.monotonic()
+
+    def _scan(self, keys: List[Tuple[str, int, int]], prefix: str, kinds: Tuple[int, ...], limit: int, best: Dict[int, int]):
+        if not prefix:
+            return
+        position = bisect_left(keys, (prefix,))
+        end = min(position + limit * self.SCAN_FACTOR, len(keys))
+        while position < end:
+            key, kind, contact_id = keys[position]
+            if not key.startswith(prefix):
+                break
+            if kind in kinds and kind < best.get(contact_id, PHONE + 1):
+                best[contact_id] = kind
+            position += 1
+
+    @staticmethod
+    def _keys_for(contact_id: int, contact: ContactTuple) -> List[Tuple[str, int, int]]:
+        _, name, email, phone = contact
+        lowered = name.lower()
+        keys = [(lowered, NAME_START, contact_id)]
+        keys += [(word, NAME_WORD, contact_id) for word in set(lowered.split()[1:])]
+        if email:
+            keys.append((email.lower(), EMAIL, contact_id))
+        digits = re.sub(r"\D", "", phone or "")
+        if digits:
+            keys.append((digits, PHONE, contact_id))
+        return keys
+
+    def _add(self, contact_id: int, contact: ContactTuple):
+        self._contacts[contact_id] = contact
+        keys = self._keys.setdefault(contact[0], [])
+        for key in self._keys_for(contact_id, contact):
+            insort(keys, key)
+
+    def _remove(self, contact_id: int):
+        contact = self._contacts.pop(contact_id, None)
+        if contact is None:
+            return
+        keys = self._keys.get(contact[0], [])
+        for key in self._keys_for(contact_id, contact):
+            position = bisect_left(keys, key)
+            if position < len(keys) and keys[position] == key:
+                del keys[position]
+
+
+prefix_index = _ContactPrefixIndex(rebuild_seconds=settings.CONTACT_LOOKUP_INDEX_REBUILD_SECONDS)
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _collect_contact_changes(session: Session, flush_context):
+    if not settings.CONTACT_LOOKUP_MEMORY_INDEX:
+        return
+    changes = session.info.setdefault(PENDING_CHANGES_KEY, {})
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Contact) and obj.id is not None:
+            changes[obj.id] = (obj.workspace_id, obj.name, obj.email, obj.phone)
+    for obj in session.deleted:
+        if isinstance(obj, Contact):
+            changes[obj.id] = None
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _apply_contact_changes(session: Session):
+    changes = session.info.pop(PENDING_CHANGES_KEY, None)
+    if changes:
+        prefix_index.apply(changes)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_contact_changes(session: Session):
+    session.info.pop(PENDING_CHANGES_KEY, None)
+
+
+class ContactService:
+    """
+    Contact reads shared by routes and automation.
+
+    Lookups by id are read-through cached and invalidated when a commit
+    touches the contact. Writes stay in the routes.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_contact(self, contact_id: int) -> Optional[ContactResponse]:
+        """Get contact by ID as a read-only snapshot."""
+        def load():
+            contact = self.db.query(Contact).filter(Contact.id == contact_id).first()
+            return ContactResponse.model_validate(contact) if contact else None
+
+        return service_cache.read_through(
+            workspace_key(self.db, f"contacts:get:{contact_id}"),
+            tags=row_tags(Contact, contact_id),
+            loader=load
+        )
+
+    def lookup(self, q: str, limit: int = 10) -> List[ContactSummary]:
+        """
+        Typeahead: contacts whose name (or any word of it) or email starts
+        with `q`, or whose phone digits start with the digits of `q`.
+
+        Ordered by match kind (name start, name word, email, phone), then name.
+        Served from the in-memory prefix index when enabled and built,
+        otherwise from indexed prefix queries (read-through cached per query).
+        """
+        term, digits = normalize_query(q)
+        if not term:
+            return []
+
+        if settings.CONTACT_LOOKUP_MEMORY_INDEX:
+            results = prefix_index.lookup(require_workspace(self.db), term, digits, limit)
+            if results is not None:
+                return results
+
+        return service_cache.read_through(
+            workspace_key(self.db, f"contacts:lookup:{limit}:{term}"),
+            tags=table_tags(Contact, self.db),
+            loader=lambda: self._lookup_query(term, digits, limit)
+        )
+
+    def _lookup_query(self, term: str, digits: str, limit: int) -> List[ContactSummary]:
+        """Prefix LIKE queries matching the CONTACT_LOOKUP_DDL indexes."""
+        prefix = _escape_like(term) + "%"
+        name = func.lower(Contact.name)
+        email = func.lower(Contact.email)
+
+        conditions = [
+            name.like(prefix, escape="\\"),
+            name.like("% " + prefix, escape="\\"),
+            email.like(prefix, escape="\\"),
+        ]
+        if len(digits) >= MIN_PHONE_DIGITS:
+            conditions.append(phone_digits(Contact.phone).like(digits + "%"))
+
+        kind = case(
+            (name.like(prefix, escape="\\"), NAME_START),
+            (name.like("% " + prefix, escape="\\"), NAME_WORD),
+            (email.like(prefix, escape="\\"), EMAIL),
+            else_=PHONE
+        )
+
+        rows = self.db.query(Contact.id, Contact.name, Contact.email, Contact.phone).filter(
+            or_(*conditions)
+        ).order_by(kind, name, Contact.id).limit(limit).all()
+
+        return [ContactSummary(id=row.id, name=row.name, email=row.email, phone=row.phone) for row in rows]
@@ -0,0 +1,302 @@
+from sqlalchemy import and_, bindparam, delete, func, or_, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Tuple
+import time
+from app.core.config import settings
+from app.core.logger import log_info
+from app.core.normalization import normalize_email, normalize_name, normalize_phone
+from app.core.tenancy import get_workspace, set_workspace
+from app.models.booking import Booking
+from app.models.booking_series import BookingSeries
+from app.models.contact import Contact
+from app.models.message import Message, MessageArchive
+from app.models.workspace import Workspace
+from app.services.contact_service import PENDING_CHANGES_KEY
+
+# Tables whose contact_id moves to the survivor on merge
+CONTACT_CHILD_MODELS = (Booking, BookingSeries, Message, MessageArchive)
+
+# Score contributed by each matching blocking key; the name similarity
+# (0..1) contributes NAME_WEIGHT times itself
+EMAIL_WEIGHT = 0.35
+PHONE_WEIGHT = 0.35
+NAME_WEIGHT = 0.5
+
+# Candidate row used for scoring: (id, normalized name, email_key, phone_key)
+Candidate = Tuple[int, str, Optional[str], Optional[str]]
+
+
+def name_similarity(a: str, b: str) -> float:
+    """
+    Similarity of two normalized names (0..1).
+
+    A name whose words are all contained in the other ("bob" vs "bob smith",
+    typical of SMS sign-ups) scores 0.9.
+    """
+    if not a or not b:
+        return 0.0
+    if a == b:
+        return 1.0
+    words_a, words_b = set(a.split()), set(b.split())
+    if words_a <= words_b or words_b <= words_a:
+        return 0.9
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def score_pair(a: Candidate, b: Candidate) -> float:
+    """Match score of two candidates (0 when their names are too different)."""
+    similarity = name_similarity(a[1], b[1])
+    if similarity < settings.DEDUPE_MIN_NAME_SIMILARITY:
+        return 0.0
+    score = NAME_WEIGHT * similarity
+    if a[2] and a[2] == b[2]:
+        score += EMAIL_WEIGHT
+    if a[3] and a[3] == b[3]:
+        score += PHONE_WEIGHT
+    return min(score, 1.0)
+
+
+def backfill_blocking_keys(connection: Connection, only_missing: bool = False, batch_size: int = 5000) -> int:
+    """
+    Recompute email_key/phone_key in id-ordered batches.
+
+    Used by the migration and before batch dedupe, for rows written
+    without the ORM (the model validators keep ORM writes in step).
+    Returns the number of rows processed.
+    """
+    table = Contact.__table__
+    stale = or_(
+        and_(table.c.email.isnot(None), table.c.email_key.is_(None)),
+        and_(table.c.phone.isnot(None), table.c.phone_key.is_(None))
+    )
+    statement = update(table).where(table.c.id == bindparam("row_id")).values(
+        email_key=bindparam("new_email_key"), phone_key=bindparam("new_phone_key")
+    )
+
+    updated, last_id = 0, 0
+    while True:
+        query = select(table.c.id, table.c.email, table.c.phone).where(table.c.id > last_id)
+        if only_missing:
+            query = query.where(stale)
+        rows = connection.execute(query.order_by(table.c.id).limit(batch_size)).all()
+        if not rows:
+            return updated
+        connection.execute(statement, [
+            {"row_id": row.id, "new_email_key": normalize_email(row.email), "new_phone_key": normalize_phone(row.phone)}
+            for row in rows
+        ])
+        updated += len(rows)
+        last_id = rows[-1].id
+
+
+class _DisjointSet:
+    """Union-find over contact ids; the smallest id is each group's root."""
+
+    def __init__(self):
+        self.parent: Dict[int, int] = {}
+
+    def find(self, item: int) -> int:
+        root = self.parent.setdefault(item, item)
+        while root != self.parent[root]:
+            root = self.parent[root]
+        while item != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a: int, b: int):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    def groups(self) -> Dict[int, List[int]]:
+        groups: Dict[int, List[int]] = {}
+        for item in self.parent:
+            groups.setdefault(self.find(item), []).append(item)
+        return {root: sorted(members) for root, members in groups.items() if len(members) > 1}
+
+
+def cluster_candidates(candidates: Iterable[Candidate]) -> Dict[int, List[int]]:
+    """
+    Group candidates into duplicate clusters {survivor_id: [ids...]}.
+
+    Candidates are blocked by email_key and by phone_key; pairs are only
+    scored within a block, so work grows with block sizes, not n². Blocks
+    larger than DEDUPE_MAX_BLOCK_SIZE (shared or placeholder values) are
+    skipped. Matches are transitive; the oldest (smallest) id survives.
+    """
+    blocks: Dict[Tuple[int, str], List[Candidate]] = {}
+    for candidate in candidates:
+        for position in (2, 3):
+            if candidate[position]:
+                blocks.setdefault((position, candidate[position]), []).append(candidate)
+
+    clusters = _DisjointSet()
+    skipped = 0
+    for block in blocks.values():
+        if len(block) > settings.DEDUPE_MAX_BLOCK_SIZE:
+            skipped += 1
+            continue
+        for i, a in enumerate(block):
+            for b in block[i + 1:]:
+                if score_pair(a, b) >= settings.DEDUPE_MATCH_THRESHOLD:
+                    clusters.union(a[0], b[0])
+
+    if skipped:
+        log_info("[DEDUPE] Skipped %s oversized blocks", skipped)
+    return clusters.groups()
+
+
+class DedupeService:
+    """
+    Contact deduplication and merging.
+
+    Email and phone are normalized (see app.core.normalization) into
+    indexed blocking keys on the contact. New contacts are matched with
+    one indexed lookup; the batch job loads only contacts sharing a key
+    with another contact and scores pairs within those blocks. Merges
+    move bookings, series and messages to the survivor with set-based
+    UPDATEs and delete the duplicates.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def find_duplicate(self, name: str, email: Optional[str], phone: Optional[str]) -> Optional[Contact]:
+        """Best existing match for a new contact, or None (indexed lookup)."""
+        email_key, phone_key = normalize_email(email), normalize_phone(phone)
+        conditions = []
+        if email_key:
+            conditions.append(Contact.email_key == email_key)
+        if phone_key:
+            conditions.append(Contact.phone_key == phone_key)
+        if not conditions:
+            return None
+
+        existing = self.db.query(Contact).filter(or_(*conditions)).order_by(Contact.id).limit(
+            settings.DEDUPE_MAX_BLOCK_SIZE
+        ).all()
+
+        incoming = (0, normalize_name(name), email_key, phone_key)
+        scored = [
+            (score_pair(incoming, (contact.id, normalize_name(contact.name), contact.email_key, contact.phone_key)), contact)
+            for contact in existing
+        ]
+        # Highest score wins; ties go to the oldest contact
+        best_score, best = max(scored, key=lambda item: (item[0], -item[1].id), default=(0.0, None))
+        return best if best_score >= settings.DEDUPE_MATCH_THRESHOLD else None
+
+    def find_clusters(self) -> Dict[int, List[int]]:
+        """
+        Duplicate clusters {survivor_id: [ids...]} among the session's
+        contacts (run per workspace: contacts never match across tenants).
+        """
+        shared_emails = select(Contact.email_key).where(Contact.email_key.isnot(None)).group_by(
+            Contact.email_key
+        ).having(func.count() > 1)
+        shared_phones = select(Contact.phone_key).where(Contact.phone_key.isnot(None)).group_by(
+            Contact.phone_key
+        ).having(func.count() > 1)
+
+        rows = self.db.query(Contact.id, Contact.name, Contact.email_key, Contact.phone_key).filter(
+            or_(Contact.email_key.in_(shared_emails), Contact.phone_key.in_(shared_phones))
+        ).execution_options(yield_per=5000)
+
+        return cluster_candidates((row.id, normalize_name(row.name), row.email_key, row.phone_key) for row in rows)
+
+    def merge(self, survivor_id: int, duplicate_ids: List[int], commit: bool = True) -> Contact:
+        """
+        Merge duplicates into the survivor.
+
+        Children are re-pointed with one UPDATE per table; missing email or
+        phone on the survivor is filled from the oldest duplicate that has one.
+
+        Raises:
+            ValueError: If a contact does not exist
+        """
+        duplicate_ids = sorted(set(duplicate_ids) - {survivor_id})
+        survivor = self.db.query(Contact).filter(Contact.id == survivor_id).first()
+        if not survivor:
+            raise ValueError(f"Contact {survivor_id} not found")
+        if not duplicate_ids:
+            return survivor
+
+        duplicates = self.db.query(Contact.id, Contact.email, Contact.phone).filter(
+            Contact.id.in_(duplicate_ids)
+        ).order_by(Contact.id).all()
+        missing = set(duplicate_ids) - {row.id for row in duplicates}
+        if missing:
+            raise ValueError(f"Contact {min(missing)} not found")
+
+        log_info("[DEDUPE] Merging contacts %s into %s", duplicate_ids, survivor_id)
+
+        for row in duplicates:
+            if not survivor.email and row.email:
+                survivor.email = row.email
+            if not survivor.phone and row.phone:
+                survivor.phone = row.phone
+
+        for model in CONTACT_CHILD_MODELS:
+            self.db.execute(
+                update(model).where(model.contact_id.in_(duplicate_ids)).values(contact_id=survivor_id)
+            )
+        self.db.execute(delete(Contact).where(Contact.id.in_(duplicate_ids)))
+
+        # Bulk deletes bypass the flush; tell the typeahead index directly
+        if settings.CONTACT_LOOKUP_MEMORY_INDEX:
+            changes = self.db.info.setdefault(PENDING_CHANGES_KEY, {})
+            changes.update({duplicate_id: None for duplicate_id in duplicate_ids})
+
+        if commit:
+            self.db.commit()
+            self.db.refresh(survivor)
+        return survivor
+
+    def run(self, dry_run: bool = False, batch_size: int = None) -> dict:
+        """
+        Find and merge every duplicate cluster, committing in batches.
+
+        An unscoped (job) session processes each workspace in turn.
+        """
+        batch_size = batch_size or settings.DEDUPE_MERGE_BATCH_SIZE
+        started = time.monotonic()
+
+        backfilled = backfill_blocking_keys(self.db.connection(), only_missing=True)
+        self.db.commit()
+
+        scope = get_workspace(self.db)
+        workspace_ids = [scope] if scope is not None else [
+            row.id for row in self.db.query(Workspace.id).order_by(Workspace.id)
+        ]
+
+        groups = duplicates = merged = 0
+        try:
+            for workspace_id in workspace_ids:
+                set_workspace(self.db, workspace_id)
+                clusters = self.find_clusters()
+                found = sum(len(members) - 1 for members in clusters.values())
+                log_info(
+                    "[DEDUPE] Workspace %s: %s duplicate groups (%s duplicates)", workspace_id, len(clusters), found
+                )
+                groups += len(clusters)
+                duplicates += found
+
+                if not dry_run:
+                    for number, (survivor_id, members) in enumerate(sorted(clusters.items()), start=1):
+                        self.merge(survivor_id, members, commit=False)
+                        merged += len(members) - 1
+                        if number % batch_size == 0:
+                            self.db.commit()
+                            self.db.expunge_all()
+                    self.db.commit()
+        finally:
+            set_workspace(self.db, scope)
+
+        return {
+            "backfilled": backfilled,
+            "groups": groups,
+            "duplicates": duplicates,
+            "merged": merged,
+            "seconds": round(time.monotonic() - started, 2),
+        }
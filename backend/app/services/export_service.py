@@ -0,0 +1,178 @@
+from sqlalchemy.orm import Session
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, List, Optional
+import csv
+import enum
+import io
+import zlib
+import orjson
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logger import log_info
+from app.core.tenancy import set_workspace
+from app.models.alert import Alert
+from app.models.booking import Booking
+from app.models.contact import Contact
+from app.models.message import Message
+from app.services.archive_service import ARCHIVE_MODELS, with_archived
+
+# Starlette appends "; charset=utf-8" to text/* media types
+EXPORT_FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """What one export endpoint reads: columns, date-range column and optional status column."""
+    model: type
+    columns: tuple
+    time_column: str = "created_at"
+    status_column: Optional[str] = None
+
+
+EXPORT_ENTITIES = {
+    "contacts": ExportSpec(Contact, ("id", "name", "email", "phone", "created_at")),
+    "bookings": ExportSpec(
+        Booking,
+        ("id", "contact_id", "staff_id", "status", "form_status", "start_time", "end_time",
+         "service_type", "notes", "created_at", "updated_at"),
+        time_column="start_time",
+        status_column="status"
+    ),
+    "messages": ExportSpec(
+        Message,
+        ("id", "contact_id", "staff_id", "channel", "direction", "status", "subject", "content",
+         "error_message", "created_at", "sent_at"),
+        status_column="status"
+    ),
+    "alerts": ExportSpec(
+        Alert,
+        ("id", "type", "severity", "message", "details", "is_dismissed", "dismissed_at",
+         "created_at", "reference_type", "reference_id"),
+        status_column="severity"
+    ),
+}
+
+
+def _plain(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _encode_csv(rows: Iterator, columns: tuple, header: bool) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(["" if value is None else _plain(value) for value in row])
+        if count % settings.EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def _encode_ndjson(rows: Iterator, columns: tuple) -> Iterator[bytes]:
+    chunk: List[bytes] = []
+    for row in rows:
+        chunk.append(orjson.dumps(dict(zip(columns, row)), option=orjson.OPT_APPEND_NEWLINE))
+        if len(chunk) >= settings.EXPORT_CHUNK_ROWS:
+            yield b"".join(chunk)
+            chunk = []
+    yield b"".join(chunk)
+
+
+def _gzip(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+class ExportService:
+    """
+    Constant-memory exports of contacts, bookings, messages and alerts.
+
+    Rows are read in id order from a server-side cursor (yield_per) and
+    encoded as CSV or NDJSON in chunks of EXPORT_CHUNK_ROWS, optionally
+    gzipped, so memory stays flat whatever the table size. Exports resume
+    after the id of the last row received (`after_id`).
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def build_query(
+        self,
+        entity: str,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        status: Optional[str] = None,
+        after_id: Optional[int] = None,
+        include_archived: bool = False
+    ):
+        """
+        Query for matching rows as tuples of EXPORT_ENTITIES[entity].columns
+        (not executed; iterate it to stream).
+
+        Raises:
+            ValueError: If a filter does not apply to the entity
+        """
+        spec = EXPORT_ENTITIES[entity]
+        entity_model = spec.model
+        if include_archived:
+            if spec.model not in ARCHIVE_MODELS:
+                raise ValueError(f"{entity} have no archive")
+            entity_model = with_archived(spec.model)
+
+        query = self.db.query(*[getattr(entity_model, name) for name in spec.columns])
+
+        time_column = getattr(entity_model, spec.time_column)
+        if date_from:
+            query = query.filter(time_column >= date_from)
+        if date_to:
+            query = query.filter(time_column < date_to)
+        if status:
+            if not spec.status_column:
+                raise ValueError(f"{entity} have no status filter")
+            column = getattr(entity_model, spec.status_column)
+            try:
+                query = query.filter(column == column.type.enum_class(status))
+            except ValueError:
+                raise ValueError(f"Unknown {spec.status_column} '{status}' for {entity}")
+        if after_id is not None:
+            query = query.filter(entity_model.id > after_id)
+
+        return query.order_by(entity_model.id).execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+
+    @staticmethod
+    def encode(rows: Iterator[tuple], entity: str, fmt: str, gzip: bool = False, header: bool = True) -> Iterator[bytes]:
+        """Encode rows as CSV (with header row unless resuming) or NDJSON chunks."""
+        columns = EXPORT_ENTITIES[entity].columns
+        chunks = _encode_csv(rows, columns, header) if fmt == "csv" else _encode_ndjson(rows, columns)
+        return _gzip(chunks) if gzip else chunks
+
+
+def stream_export(entity: str, fmt: str, workspace_id: int, gzip: bool = False, **filters) -> Iterator[bytes]:
+    """
+    Yield an export of one workspace's rows chunk by chunk.
+
+    Owns its session: the request-scoped session is closed before a
+    streaming response body is sent. Validate filters with
+    ExportService.build_query before starting the response.
+    """
+    db = SessionLocal()
+    set_workspace(db, workspace_id)
+    try:
+        log_info("[SERVICE] Streaming %s export (%s%s)", entity, fmt, ', gzip' if gzip else '')
+        service = ExportService(db)
+        rows = iter(service.build_query(entity, **filters))
+        yield from service.encode(rows, entity, fmt, gzip=gzip, header=filters.get("after_id") is None)
+    finally:
+        db.close()
@@ -0,0 +1,432 @@
+from sqlalchemy import insert, or_, tuple_, update
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError, DataError
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from queue import Queue
+from threading import Lock, Thread
+from types import SimpleNamespace
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+import csv
+import io
+import uuid
+import orjson
+from pydantic import ValidationError
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logger import log_info, log_error
+from app.core.normalization import normalize_email, normalize_name, normalize_phone
+from app.core.tenancy import require_workspace, set_workspace
+from app.models.booking import Booking, BookingStatus, FormStatus
+from app.models.contact import Contact
+from app.models.import_job import ImportJob
+from app.models.user import User
+from app.schemas.booking_schema import BookingCreate
+from app.schemas.contact_schema import ContactCreate
+from app.services.automation_service import AutomationService
+from app.services.contact_service import PENDING_CHANGES_KEY
+from app.services.dedupe_service import score_pair
+from app.services.search_service import index_inserted
+
+IMPORT_KINDS = ("contacts", "bookings")
+
+# Accepted formats by Content-Type
+IMPORT_FORMATS = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+# What happens to welcome/confirmation automation for imported rows
+AUTOMATION_MODES = ("suppress", "queue")
+
+
+@dataclass
+class ImportProgress:
+    """Live report of one import, saved to its ImportJob row with every batch."""
+    kind: str
+    format: str
+    automation: str = "suppress"
+    workspace_id: Optional[int] = None
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = "queued"
+    processed: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    automation_queued: int = 0
+    errors: List[dict] = field(default_factory=list)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    def fail(self, line: int, error: str):
+        self.failed += 1
+        if len(self.errors) < settings.IMPORT_MAX_ERRORS:
+            self.errors.append({"line": line, "error": error})
+
+
+def create_import_job(db: Session, kind: str, fmt: str, automation: str) -> ImportProgress:
+    """Record a queued import in the session's workspace (committed)."""
+    progress = ImportProgress(kind=kind, format=fmt, automation=automation, workspace_id=require_workspace(db))
+    db.add(ImportJob(id=progress.id, kind=kind, format=fmt, automation=automation, **_job_fields(progress)))
+    db.commit()
+    return progress
+
+
+def _job_fields(progress: ImportProgress) -> dict:
+    return {
+        "status": progress.status,
+        "processed": progress.processed,
+        "inserted": progress.inserted,
+        "duplicates": progress.duplicates,
+        "failed": progress.failed,
+        "automation_queued": progress.automation_queued,
+        "errors": list(progress.errors),
+        "started_at": progress.started_at,
+        "finished_at": progress.finished_at,
+    }
+
+
+class _AutomationQueue:
+    """
+    Deferred automation fan-out for imported rows.
+
+    Batches of ids are handed to one worker thread with its own session
+    (scoped to the batch's workspace), which runs the normal new-contact / booking-created handlers. The queue
+    is bounded, so a fast import waits for the sends instead of buffering
+    a million ids.
+    """
+
+    def __init__(self, max_batches: int):
+        self._queue: "Queue[Tuple[str, int, List[int]]]" = Queue(maxsize=max_batches)
+        self._worker: Optional[Thread] = None
+        self._lock = Lock()
+
+    def put(self, kind: str, workspace_id: int, ids: List[int]):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = Thread(target=self._run, daemon=True)
+                self._worker.start()
+        self._queue.put((kind, workspace_id, ids))
+
+    def join(self):
+        """Wait until every queued batch has been handled."""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            kind, workspace_id, ids = self._queue.get()
+            db = SessionLocal()
+            set_workspace(db, workspace_id)
+            try:
+                automation = AutomationService(db)
+                if kind == "contacts":
+                    for contact in db.query(Contact).filter(Contact.id.in_(ids)).order_by(Contact.id):
+                        automation.handle_new_contact(contact)
+                else:
+                    for booking in db.query(Booking).filter(Booking.id.in_(ids)).order_by(Booking.id):
+                        automation.handle_booking_created(booking)
+            except Exception as e:
+                log_error("[IMPORT] Automation batch failed (%s, %s rows): %s", kind, len(ids), e, exc_info=True)
+            finally:
+                db.close()
+                self._queue.task_done()
+
+
+automation_queue = _AutomationQueue(max_batches=settings.IMPORT_AUTOMATION_QUEUE_BATCHES)
+
+
+def read_rows(stream: BinaryIO, fmt: str) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """
+    Parse CSV (header row) or NDJSON incrementally.
+
+    Yields (line, row, error) - one row in memory at a time. Blank values
+    become None.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="" if fmt == "csv" else None)
+
+    if fmt == "csv":
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, _clean(row), None
+        return
+
+    for line, raw in enumerate(text, start=1):
+        if not raw.strip():
+            continue
+        try:
+            row = orjson.loads(raw)
+        except orjson.JSONDecodeError as e:
+            yield line, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(row, dict):
+            yield line, None, "Expected a JSON object"
+            continue
+        yield line, _clean(row), None
+
+
+def _clean(row: dict) -> dict:
+    cleaned = {}
+    for key, value in row.items():
+        if key is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip() or None
+        cleaned[key.strip()] = value
+    return cleaned
+
+
+def _batched(rows: Iterable, size: int) -> Iterator[list]:
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}" for item in error.errors()
+    )
+
+
+class ImportService:
+    """
+    Streaming bulk import of contacts and bookings.
+
+    Rows are parsed incrementally and handled in batches of
+    IMPORT_BATCH_SIZE: validated with the API schemas, checked for
+    duplicates with one indexed lookup per batch, inserted with one
+    multi-row INSERT ... RETURNING and committed. Memory is bounded by the
+    batch size, whatever the file size.
+
+    Automation is suppressed by default; with automation="queue" each
+    committed batch is handed to the deferred automation queue.
+    
+    Rows go to the workspace the session is scoped to.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def run(self, stream: BinaryIO, progress: ImportProgress) -> ImportProgress:
+        """Import every row of `stream` into `progress.kind`, updating `progress` as it goes."""
+        self.workspace_id = require_workspace(self.db)
+        import_batch = self._import_contacts if progress.kind == "contacts" else self._import_bookings
+        progress.status = "running"
+        progress.started_at = datetime.utcnow()
+        log_info("[IMPORT] Starting %s import %s (%s)", progress.kind, progress.id, progress.format)
+
+        self._save(progress)
+        try:
+            for batch in _batched(read_rows(stream, progress.format), settings.IMPORT_BATCH_SIZE):
+                rows = []
+                for line, row, error in batch:
+                    progress.processed += 1
+                    if error:
+                        progress.fail(line, error)
+                    else:
+                        rows.append((line, row))
+
+                inserted_ids = import_batch(rows, progress)
+                progress.inserted += len(inserted_ids)
+                queue = bool(inserted_ids) and progress.automation == "queue"
+                if queue:
+                    progress.automation_queued += len(inserted_ids)
+                # Counts commit with the batch's rows
+                self._save(progress)
+
+                if queue:
+                    automation_queue.put(progress.kind, self.workspace_id, inserted_ids)
+
+                log_info(
+                    "[IMPORT] %s: %s rows, %s inserted, %s duplicates, %s failed",
+                    progress.id, progress.processed, progress.inserted, progress.duplicates, progress.failed
+                )
+            progress.status = "completed"
+        except Exception as e:
+            self.db.rollback()
+            progress.status = "failed"
+            progress.fail(progress.processed, f"Import aborted: {str(e)}")
+            log_error("[IMPORT] %s aborted: %s", progress.id, e, exc_info=True)
+        progress.finished_at = datetime.utcnow()
+        self._save(progress)
+
+        log_info("[IMPORT] Finished %s import %s: %s", progress.kind, progress.id, progress.status)
+        return progress
+
+    def _save(self, progress: ImportProgress):
+        """Write `progress` to its import_jobs row and commit (with any pending rows)."""
+        self.db.execute(update(ImportJob).where(ImportJob.id == progress.id).values(**_job_fields(progress)))
+        self.db.commit()
+
+    # Contacts
+
+    def _import_contacts(self, rows: List[Tuple[int, dict]], progress: ImportProgress) -> List[int]:
+        """Insert new contacts; rows matching an existing or earlier row count as duplicates."""
+        candidates = []
+        for line, row in rows:
+            try:
+                contact = ContactCreate.model_validate(row)
+            except ValidationError as e:
+                progress.fail(line, _validation_message(e))
+                continue
+            candidates.append((contact, normalize_email(contact.email), normalize_phone(contact.phone)))
+
+        # Existing contacts sharing a key with this batch, grouped by key
+        blocks: Dict[str, list] = {}
+        email_keys = {email_key for _, email_key, _ in candidates if email_key}
+        phone_keys = {phone_key for _, _, phone_key in candidates if phone_key}
+        if email_keys or phone_keys:
+            existing = self.db.query(Contact.id, Contact.name, Contact.email_key, Contact.phone_key).filter(
+                or_(Contact.email_key.in_(email_keys), Contact.phone_key.in_(phone_keys))
+            )
+            for row in existing:
+                self._add_to_blocks(blocks, (row.id, normalize_name(row.name), row.email_key, row.phone_key))
+
+        values = []
+        for contact, email_key, phone_key in candidates:
+            candidate = (0, normalize_name(contact.name), email_key, phone_key)
+            matches = blocks.get(email_key, []) + blocks.get(phone_key, [])
+            if any(score_pair(candidate, match) >= settings.DEDUPE_MATCH_THRESHOLD for match in matches):
+                progress.duplicates += 1
+                continue
+            self._add_to_blocks(blocks, candidate)
+            values.append({
+                **contact.model_dump(), "email_key": email_key, "phone_key": phone_key, "workspace_id": self.workspace_id
+            })
+
+        if not values:
+            return []
+
+        ids = list(self.db.scalars(insert(Contact).returning(Contact.id, sort_by_parameter_order=True), values))
+        inserted = [SimpleNamespace(id=contact_id, **value) for contact_id, value in zip(ids, values)]
+        index_inserted(self.db.connection(), "contact", inserted)
+
+        # Bulk inserts bypass the flush; tell the typeahead index directly
+        if settings.CONTACT_LOOKUP_MEMORY_INDEX:
+            changes = self.db.info.setdefault(PENDING_CHANGES_KEY, {})
+            changes.update({obj.id: (obj.workspace_id, obj.name, obj.email, obj.phone) for obj in inserted})
+        return ids
+
+    @staticmethod
+    def _add_to_blocks(blocks: Dict[str, list], candidate: tuple):
+        for key in candidate[2:]:
+            if key:
+                blocks.setdefault(key, []).append(candidate)
+
+    # Bookings
+
+    def _import_bookings(self, rows: List[Tuple[int, dict]], progress: ImportProgress) -> List[int]:
+        """
+        Insert new bookings. The contact is `contact_id`, or is found by
+        `contact_email` / `contact_phone`. A booking of the same contact at
+        the same start time counts as a duplicate.
+        """
+        contact_ids = self._resolve_contacts(rows)
+
+        bookings = []
+        for line, row in rows:
+            contact_id = row.get("contact_id") or contact_ids.get(line)
+            if contact_id is None:
+                progress.fail(line, "contact not found (contact_id, contact_email or contact_phone)")
+                continue
+            try:
+                booking = BookingCreate.model_validate({**row, "contact_id": contact_id})
+                status = BookingStatus(row["status"]) if row.get("status") else BookingStatus.PENDING
+                form_status = FormStatus(row["form_status"]) if row.get("form_status") else FormStatus.PENDING
+            except ValidationError as e:
+                progress.fail(line, _validation_message(e))
+                continue
+            except ValueError as e:
+                progress.fail(line, str(e))
+                continue
+            bookings.append((line, {
+                **booking.model_dump(), "status": status, "form_status": form_status, "workspace_id": self.workspace_id
+            }))
+
+        # Staff must belong to this workspace (staff_id is a plain foreign key)
+        staff_ids = {values["staff_id"] for _, values in bookings if values["staff_id"] is not None}
+        known_staff = {row.id for row in self.db.query(User.id).filter(User.id.in_(staff_ids))} if staff_ids else set()
+        valid = []
+        for line, values in bookings:
+            if values["staff_id"] is not None and values["staff_id"] not in known_staff:
+                progress.fail(line, f"staff {values['staff_id']} not found")
+                continue
+            valid.append((line, values))
+        bookings = valid
+
+        # Existing bookings of these contacts at these start times
+        slots = {(values["contact_id"], values["start_time"]) for _, values in bookings}
+        seen = set()
+        if slots:
+            seen = set(self.db.query(Booking.contact_id, Booking.start_time).filter(
+                tuple_(Booking.contact_id, Booking.start_time).in_(slots)
+            ).all())
+
+        new = []
+        for line, values in bookings:
+            slot = (values["contact_id"], values["start_time"])
+            if slot in seen:
+                progress.duplicates += 1
+                continue
+            seen.add(slot)
+            new.append((line, values))
+
+        return self._insert_bookings(new, progress)
+
+    def _resolve_contacts(self, rows: List[Tuple[int, dict]]) -> Dict[int, int]:
+        """Map line -> contact id for rows identifying the contact by email/phone (one query)."""
+        wanted = {}
+        for line, row in rows:
+            if row.get("contact_id") is None:
+                wanted[line] = (normalize_email(row.get("contact_email")), normalize_phone(row.get("contact_phone")))
+
+        email_keys = {email_key for email_key, _ in wanted.values() if email_key}
+        phone_keys = {phone_key for _, phone_key in wanted.values() if phone_key}
+        if not email_keys and not phone_keys:
+            return {}
+
+        by_key: Dict[str, int] = {}
+        existing = self.db.query(Contact.id, Contact.email_key, Contact.phone_key).filter(
+            or_(Contact.email_key.in_(email_keys), Contact.phone_key.in_(phone_keys))
+        ).order_by(Contact.id.desc())
+        for row in existing:
+            # Oldest contact wins when several share a key
+            for key in (row.email_key, row.phone_key):
+                if key:
+                    by_key[key] = row.id
+
+        resolved = {}
+        for line, (email_key, phone_key) in wanted.items():
+            contact_id = by_key.get(email_key) or by_key.get(phone_key)
+            if contact_id is not None:
+                resolved[line] = contact_id
+        return resolved
+
+    def _insert_bookings(self, bookings: List[Tuple[int, dict]], progress: ImportProgress) -> List[int]:
+        """
+        One multi-row insert; if the database rejects it (staff overlap,
+        unknown contact/staff), retry row by row in savepoints so only the
+        offending rows fail.
+        """
+        if not bookings:
+            return []
+
+        statement = insert(Booking).returning(Booking.id, sort_by_parameter_order=True)
+        try:
+            with self.db.begin_nested():
+                return list(self.db.scalars(statement, [values for _, values in bookings]))
+        except (IntegrityError, DataError):
+            pass
+
+        ids = []
+        for line, values in bookings:
+            try:
+                with self.db.begin_nested():
+                    ids.append(self.db.scalar(statement, values))
+            except (IntegrityError, DataError) as e:
+                progress.fail(line, f"rejected by database: {str(e.orig).splitlines()[0]}")
+        return ids
@@ -2,6 +2,8 @@ from typing import Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
 from app.core.logger import log_info, log_error
+from app.core.metrics import timed_send
+from app.core.tracing import traced
 from app.models.message import Message, MessageChannel, MessageDirection, MessageStatus
 from app.models.alert import Alert, AlertType, AlertSeverity
 
@@ -19,6 +21,8 @@ class IntegrationService:
     def __init__(self, db: Session):
         self.db = db
     
+    @timed_send("email")
+    @traced("integration", "email")
     def send_email(
         self,
         to_email: str,
@@ -46,7 +50,7 @@ class IntegrationService:
         try:
             # TODO: Implement actual SendGrid integration
             # For now, simulate success
-            log_info(f"[INTEGRATION] Sending email to {to_email}: {subject}")
+            log_info("[INTEGRATION] Sending email to %s: %s", to_email, subject)
             
             # Simulate email sending
             message.status = MessageStatus.SENT
@@ -55,11 +59,11 @@ class IntegrationService:
             self.db.add(message)
             self.db.commit()
             
-            log_info(f"[INTEGRATION] Email sent successfully to {to_email}")
+            log_info("[INTEGRATION] Email sent successfully to %s", to_email)
             return True
             
         except Exception as e:
-            log_error(f"[INTEGRATION] Failed to send email to {to_email}: {str(e)}", exc_info=True)
+            log_error("[INTEGRATION] Failed to send email to %s: %s", to_email, e, exc_info=True)
             
             # Update message status
             message.status = MessageStatus.FAILED
@@ -78,6 +82,8 @@ class IntegrationService:
             self.db.commit()
             return False
     
+    @timed_send("sms")
+    @traced("integration", "sms")
     def send_sms(
         self,
         to_phone: str,
@@ -103,7 +109,7 @@ class IntegrationService:
         try:
             # TODO: Implement actual Twilio integration
             # For now, simulate success
-            log_info(f"[INTEGRATION] Sending SMS to {to_phone}")
+            log_info("[INTEGRATION] Sending SMS to %s", to_phone)
             
             # Simulate SMS sending
             message.status = MessageStatus.SENT
@@ -112,11 +118,11 @@ class IntegrationService:
             self.db.add(message)
             self.db.commit()
             
-            log_info(f"[INTEGRATION] SMS sent successfully to {to_phone}")
+            log_info("[INTEGRATION] SMS sent successfully to %s", to_phone)
             return True
             
         except Exception as e:
-            log_error(f"[INTEGRATION] Failed to send SMS to {to_phone}: {str(e)}", exc_info=True)
+            log_error("[INTEGRATION] Failed to send SMS to %s: %s", to_phone, e, exc_info=True)
             
             # Update message status
             message.status = MessageStatus.FAILED
@@ -135,6 +141,8 @@ class IntegrationService:
             self.db.commit()
             return False
     
+    @timed_send("calendar")
+    @traced("integration", "calendar")
     def create_calendar_event(
         self,
         title: str,
@@ -150,14 +158,14 @@ class IntegrationService:
         """
         try:
             # TODO: Implement actual calendar integration
-            log_info(f"[INTEGRATION] Creating calendar event: {title} at {start_time}")
+            log_info("[INTEGRATION] Creating calendar event: %s at %s", title, start_time)
             
             # Simulate calendar event creation
-            log_info(f"[INTEGRATION] Calendar event created successfully")
+            log_info("[INTEGRATION] Calendar event created successfully")
             return True
             
         except Exception as e:
-            log_error(f"[INTEGRATION] Failed to create calendar event: {str(e)}", exc_info=True)
+            log_error("[INTEGRATION] Failed to create calendar event: %s", e, exc_info=True)
             
             # Create integration alert
             alert = Alert(
@@ -171,6 +179,8 @@ class IntegrationService:
             
             return False
     
+    @timed_send("webhook")
+    @traced("integration", "webhook")
     def trigger_webhook(self, event_type: str, payload: dict) -> bool:
         """
         Trigger webhook for external integrations.
@@ -180,14 +190,14 @@ class IntegrationService:
         """
         try:
             # TODO: Implement actual webhook integration
-            log_info(f"[INTEGRATION] Triggering webhook: {event_type}")
+            log_info("[INTEGRATION] Triggering webhook: %s", event_type)
             
             # Simulate webhook trigger
-            log_info(f"[INTEGRATION] Webhook triggered successfully")
+            log_info("[INTEGRATION] Webhook triggered successfully")
             return True
             
         except Exception as e:
-            log_error(f"[INTEGRATION] Failed to trigger webhook: {str(e)}", exc_info=True)
+            log_error("[INTEGRATION] Failed to trigger webhook: %s", e, exc_info=True)
             
             # Create integration alert
             alert = Alert(
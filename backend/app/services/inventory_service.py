@@ -1,9 +1,19 @@
 from sqlalchemy.orm import Session
 from datetime import datetime
+from typing import Optional
 from app.models.inventory import Inventory
 from app.models.alert import Alert, AlertType, AlertSeverity
-from app.schemas.inventory_schema import InventoryCreate, InventoryUpdate
+from app.schemas.inventory_schema import InventoryCreate, InventoryUpdate, InventoryResponse
 from app.core.logger import log_info, log_warning
+from app.core.pagination import paginate
+from app.core.fieldsets import load_only_options
+from app.core.cache import service_cache, row_tags, table_tags, workspace_key
+
+# Keyset sort key for list pagination (unique per workspace, see uq_inventory_workspace_id_item_name)
+SORT_KEY = ("item_name", "id")
+
+# Computed response fields and the columns they read
+DERIVED_FIELDS = {"is_low_stock": ("quantity", "threshold")}
 
 
 class InventoryService:
@@ -19,7 +29,7 @@ class InventoryService:
     
     def create_inventory(self, inventory_data: InventoryCreate) -> Inventory:
         """Create a new inventory item."""
-        log_info(f"[SERVICE] Creating inventory item: {inventory_data.item_name}")
+        log_info("[SERVICE] Creating inventory item: %s", inventory_data.item_name)
         
         inventory = Inventory(**inventory_data.model_dump())
         self.db.add(inventory)
@@ -37,7 +47,7 @@ class InventoryService:
         
         EVENT TRIGGER: Create alert if quantity drops below threshold
         """
-        log_info(f"[SERVICE] Updating inventory {inventory_id}")
+        log_info("[SERVICE] Updating inventory %s", inventory_id)
         
         inventory = self.db.query(Inventory).filter(Inventory.id == inventory_id).first()
         if not inventory:
@@ -59,22 +69,53 @@ class InventoryService:
         if 'quantity' in update_data and inventory.quantity != old_quantity:
             self._check_and_create_alert(inventory)
         
-        log_info(f"[SERVICE] Inventory updated: {inventory.id}")
+        log_info("[SERVICE] Inventory updated: %s", inventory.id)
         return inventory
     
-    def get_inventory(self, inventory_id: int) -> Inventory:
-        """Get inventory by ID."""
-        return self.db.query(Inventory).filter(Inventory.id == inventory_id).first()
+    def get_inventory(self, inventory_id: int) -> Optional[InventoryResponse]:
+        """Get inventory by ID (read-through cached; invalidated on commit)."""
+        def load():
+            item = self.db.query(Inventory).filter(Inventory.id == inventory_id).first()
+            return InventoryResponse.model_validate(item) if item else None
+        
+        return service_cache.read_through(
+            workspace_key(self.db, f"inventory:get:{inventory_id}"),
+            tags=row_tags(Inventory, inventory_id),
+            loader=load
+        )
     
-    def get_all_inventory(self, skip: int = 0, limit: int = 100) -> list[Inventory]:
-        """Get all inventory items with pagination."""
-        return self.db.query(Inventory).offset(skip).limit(limit).all()
+    def get_all_inventory(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str = None,
+        fields: frozenset = None
+    ) -> list[Inventory]:
+        """
+        Get all inventory items ordered by name, with pagination.
+        
+        cursor: keyset cursor over SORT_KEY; takes precedence over skip.
+        fields: sparse fieldset - only these columns (plus keys) are loaded.
+        """
+        query = self.db.query(Inventory).options(
+            *load_only_options(Inventory, fields, required=SORT_KEY, derived=DERIVED_FIELDS)
+        )
+        columns = [getattr(Inventory, name) for name in SORT_KEY]
+        return paginate(query, columns, cursor=cursor, skip=skip, limit=limit).all()
     
-    def get_low_stock_items(self) -> list[Inventory]:
-        """Get all items with low stock."""
-        return self.db.query(Inventory).filter(
-            Inventory.quantity < Inventory.threshold
-        ).all()
+    def get_low_stock_items(self) -> list[InventoryResponse]:
+        """Get all items with low stock (read-through cached; invalidated on commit)."""
+        def load():
+            items = self.db.query(Inventory).filter(
+                Inventory.quantity < Inventory.threshold
+            ).all()
+            return [InventoryResponse.model_validate(item) for item in items]
+        
+        return service_cache.read_through(
+            workspace_key(self.db, "inventory:low_stock"),
+            tags=table_tags(Inventory, self.db),
+            loader=load
+        )
     
     def _check_and_create_alert(self, inventory: Inventory):
         """
@@ -86,7 +127,9 @@ class InventoryService:
         if not inventory.is_low_stock:
             return
         
-        log_warning(f"[SERVICE] Low stock detected for {inventory.item_name}: {inventory.quantity}/{inventory.threshold}")
+        log_warning(
+            "[SERVICE] Low stock detected for %s: %s/%s", inventory.item_name, inventory.quantity, inventory.threshold
+        )
         
         # Check if active alert already exists
         existing_alert = self.db.query(Alert).filter(
@@ -97,7 +140,7 @@ class InventoryService:
         ).first()
         
         if existing_alert:
-            log_info(f"[SERVICE] Active alert already exists for {inventory.item_name}, skipping")
+            log_info("[SERVICE] Active alert already exists for %s, skipping", inventory.item_name)
             return
         
         # Create new alert
@@ -113,4 +156,4 @@ class InventoryService:
         self.db.add(alert)
         self.db.commit()
         
-        log_info(f"[SERVICE] Low stock alert created for {inventory.item_name}")
+        log_info("[SERVICE] Low stock alert created for %s", inventory.item_name)
@@ -0,0 +1,138 @@
+from sqlalchemy import delete, select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import OperationalError
+from collections import Counter
+from datetime import datetime
+from typing import List
+from app.core.config import settings
+from app.core.logger import log_info, log_warning
+from app.models.booking import Booking
+from app.models.booking_series import BookingSeries
+from app.models.contact import Contact
+from app.models.message import Message, MessageArchive
+from app.models.purge_request import PurgeRequest
+from app.services.contact_service import PENDING_CHANGES_KEY
+from app.services.search_service import remove_from_index
+
+# Child tables emptied before the contacts themselves (series exceptions
+# follow their series through ON DELETE CASCADE)
+PURGE_CHILD_MODELS = (Message, MessageArchive, Booking, BookingSeries)
+
+
+class PurgeService:
+    """
+    Chunked erasure of contacts and everything that references them.
+
+    A single DELETE of a contact cascades in the database, which is right
+    for one contact but holds locks on every child row for the whole
+    statement when purging many. Purge requests are instead processed by
+    the purge job: children are deleted PURGE_BATCH_SIZE rows per
+    transaction, then the contacts, and on PostgreSQL each transaction
+    gives up after PURGE_LOCK_TIMEOUT_MS instead of queueing behind
+    long-running locks (the request stays pending for the next run).
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def request_purge(self, contact_ids: List[int], requested_by: int = None) -> int:
+        """
+        Queue contacts for purging; returns how many new requests were recorded.
+
+        Ids the session cannot see (other workspaces, already deleted) are ignored.
+        """
+        visible = {row.id for row in self.db.query(Contact.id).filter(Contact.id.in_(contact_ids))}
+        pending = {
+            row.contact_id for row in self.db.query(PurgeRequest.contact_id).filter(
+                PurgeRequest.contact_id.in_(contact_ids),
+                PurgeRequest.completed_at.is_(None)
+            )
+        }
+        new_ids = sorted(visible - pending)
+        self.db.add_all([PurgeRequest(contact_id=contact_id, requested_by=requested_by) for contact_id in new_ids])
+        self.db.commit()
+
+        log_info("[SERVICE] Purge requested for %s contacts", len(new_ids))
+        return len(new_ids)
+
+    def run(self, batch_size: int = None) -> dict:
+        """Process pending purge requests, oldest first."""
+        batch_size = batch_size or settings.PURGE_BATCH_SIZE
+        result = {"contacts": 0, "rows": 0, "deferred": 0}
+
+        while True:
+            requests = self.db.query(PurgeRequest).filter(
+                PurgeRequest.completed_at.is_(None)
+            ).order_by(PurgeRequest.id).limit(settings.PURGE_CONTACTS_PER_CHUNK).all()
+            if not requests:
+                break
+
+            contact_ids = sorted({request.contact_id for request in requests})
+            try:
+                deleted = self._purge_chunk(contact_ids, batch_size)
+            except OperationalError as e:
+                # Lock timeout: leave the rest for the next run
+                self.db.rollback()
+                log_warning(
+                    "[SERVICE] Purge deferred for %s contacts: %s", len(contact_ids), str(e.orig).splitlines()[0]
+                )
+                result["deferred"] = len(contact_ids)
+                break
+
+            now = datetime.utcnow()
+            for request in requests:
+                request.completed_at = now
+                request.rows_deleted = deleted[request.contact_id]
+            self.db.commit()
+
+            result["contacts"] += len(contact_ids)
+            result["rows"] += sum(deleted.values())
+
+        log_info("[SERVICE] Purge finished: %s", result)
+        return result
+
+    def _purge_chunk(self, contact_ids: List[int], batch_size: int) -> Counter:
+        """Delete the contacts' children in bounded batches, then the contacts. Returns rows per contact."""
+        deleted: Counter = Counter()
+
+        for model in PURGE_CHILD_MODELS:
+            while True:
+                self._begin_bounded_transaction()
+                batch = select(model.id).where(model.contact_id.in_(contact_ids)).limit(batch_size)
+                rows = self.db.execute(
+                    delete(model)
+                    .where(model.id.in_(batch.scalar_subquery()))
+                    .returning(model.id, model.contact_id)
+                    .execution_options(synchronize_session=False)
+                ).all()
+
+                if model is Message:
+                    remove_from_index(self.db.connection(), "message", [row.id for row in rows])
+                self.db.commit()
+
+                deleted.update(row.contact_id for row in rows)
+                if len(rows) < batch_size:
+                    break
+
+        self._begin_bounded_transaction()
+        rows = self.db.execute(
+            delete(Contact)
+            .where(Contact.id.in_(contact_ids))
+            .returning(Contact.id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        purged = [row.id for row in rows]
+        remove_from_index(self.db.connection(), "contact", purged)
+        deleted.update(purged)
+
+        # Bulk deletes bypass the flush; tell the typeahead index directly
+        if settings.CONTACT_LOOKUP_MEMORY_INDEX:
+            self.db.info.setdefault(PENDING_CHANGES_KEY, {}).update({contact_id: None for contact_id in purged})
+
+        self.db.commit()
+        return deleted
+
+    def _begin_bounded_transaction(self):
+        """Cap lock waits for the transaction about to start (PostgreSQL only)."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            self.db.execute(text(f"SET LOCAL lock_timeout = {int(settings.PURGE_LOCK_TIMEOUT_MS)}"))
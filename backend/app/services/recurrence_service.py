@@ -0,0 +1,357 @@
+from sqlalchemy import or_, and_
+from sqlalchemy.orm import Session
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import calendar
+from app.models.booking import BookingStatus
+from app.models.booking_series import BookingSeries, BookingSeriesException, RecurrenceFrequency
+from app.models.contact import Contact
+from app.models.user import User
+from app.schemas.booking_series_schema import BookingSeriesCreate, BookingSeriesUpdate, SeriesExceptionCreate
+from app.services.automation_service import AutomationService
+from app.core.logger import log_info
+from app.core.tenancy import check_visible
+
+
+@dataclass
+class Occurrence:
+    """
+    One expanded occurrence of a series.
+
+    Exposes the Booking attributes used by automation and availability,
+    so it can be passed wherever a Booking is read.
+    """
+    series_id: int
+    contact_id: int
+    staff_id: Optional[int]
+    status: BookingStatus
+    start_time: datetime
+    end_time: datetime
+    occurrence_start: datetime
+    service_type: Optional[str]
+    notes: Optional[str]
+
+    @property
+    def id(self) -> str:
+        return f"{self.series_id}:{self.occurrence_start.isoformat()}"
+
+
+def _add_months(value: datetime, months: int) -> Optional[datetime]:
+    """Same day-of-month `months` later, or None when that month is too short."""
+    index = value.year * 12 + (value.month - 1) + months
+    year, month = index // 12, index % 12 + 1
+    if value.day > calendar.monthrange(year, month)[1]:
+        return None
+    return value.replace(year=year, month=month)
+
+
+def iter_rule_starts(series: BookingSeries, not_before: datetime) -> Iterator[Tuple[int, datetime]]:
+    """
+    Lazily yield (index, start) for a series rule, beginning at the first
+    start >= not_before. `index` is the occurrence number from DTSTART,
+    used for COUNT. Daily/weekly rules jump straight to the window.
+    """
+    dtstart = series.start_time
+    interval = max(series.interval or 1, 1)
+
+    if series.frequency == RecurrenceFrequency.DAILY:
+        period = timedelta(days=interval)
+        index = max(0, -(-(not_before - dtstart) // period))
+        while True:
+            yield index, dtstart + index * period
+            index += 1
+
+    elif series.frequency == RecurrenceFrequency.WEEKLY:
+        weekdays = series.weekdays
+        week0 = dtstart - timedelta(days=dtstart.weekday())
+        period = timedelta(weeks=interval)
+        first_week = [day for day in weekdays if day >= dtstart.weekday()]
+        week = max(0, (not_before - week0) // period)
+
+        while True:
+            days = first_week if week == 0 else weekdays
+            base = 0 if week == 0 else len(first_week) + (week - 1) * len(weekdays)
+            for position, day in enumerate(days):
+                start = week0 + week * period + timedelta(days=day)
+                if start >= not_before:
+                    yield base + position, start
+            week += 1
+
+    else:
+        # Monthly: at most 12 steps per year, so walk from DTSTART
+        index, months = 0, 0
+        while True:
+            start = _add_months(dtstart, months)
+            if start is not None:
+                if start >= not_before:
+                    yield index, start
+                index += 1
+            months += interval
+
+
+def iter_occurrences(
+    series: BookingSeries,
+    window_start: datetime,
+    window_end: datetime,
+    exceptions: Optional[Dict[datetime, BookingSeriesException]] = None
+) -> Iterator[Occurrence]:
+    """
+    Lazily expand a series for [window_start, window_end).
+
+    Only occurrences overlapping the window are generated; the series is
+    never materialized. Exceptions (keyed by original start) are applied
+    sparsely; cancelled occurrences are still yielded with status CANCELLED.
+    """
+    exceptions = exceptions or {}
+    duration = timedelta(minutes=series.duration_minutes)
+    seen = set()
+
+    for index, start in iter_rule_starts(series, window_start - duration):
+        if start >= window_end:
+            break
+        if series.until is not None and start > series.until:
+            break
+        if series.count is not None and index >= series.count:
+            break
+
+        seen.add(start)
+        occurrence = _build_occurrence(series, start, duration, exceptions.get(start))
+        if occurrence.start_time < window_end and occurrence.end_time > window_start:
+            yield occurrence
+
+    # Occurrences moved into the window from outside it
+    for original, exception in exceptions.items():
+        if original in seen or exception.start_time is None:
+            continue
+        occurrence = _build_occurrence(series, original, duration, exception)
+        if occurrence.start_time < window_end and occurrence.end_time > window_start:
+            yield occurrence
+
+
+def _build_occurrence(
+    series: BookingSeries,
+    start: datetime,
+    duration: timedelta,
+    exception: Optional[BookingSeriesException]
+) -> Occurrence:
+    occurrence = Occurrence(
+        series_id=series.id,
+        contact_id=series.contact_id,
+        staff_id=series.staff_id,
+        status=series.status,
+        start_time=start,
+        end_time=start + duration,
+        occurrence_start=start,
+        service_type=series.service_type,
+        notes=series.notes
+    )
+    if exception is not None:
+        if exception.start_time is not None:
+            occurrence.start_time = exception.start_time
+            occurrence.end_time = exception.end_time or exception.start_time + duration
+        if exception.status is not None:
+            occurrence.status = exception.status
+        if exception.notes is not None:
+            occurrence.notes = exception.notes
+    return occurrence
+
+
+class RecurrenceService:
+    """
+    Recurring booking series with lazy occurrence expansion.
+
+    Series are stored once; occurrences only exist for the window being read.
+    Availability, dashboard counts and reminders read through this service.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.automation = AutomationService(db)
+
+    def create_series(self, series_data: BookingSeriesCreate) -> BookingSeries:
+        """
+        Create a recurring series.
+
+        Raises:
+            ValueError: If the contact or staff member is not in this workspace
+        """
+        log_info("[SERVICE] Creating booking series for contact %s", series_data.contact_id)
+
+        check_visible(self.db, Contact, series_data.contact_id, "Contact")
+        check_visible(self.db, User, series_data.staff_id, "Staff member")
+
+        series = BookingSeries(**series_data.model_dump())
+        self.db.add(series)
+        self.db.commit()
+        self.db.refresh(series)
+
+        log_info("[SERVICE] Booking series created: %s", series.id)
+        return series
+
+    def update_series(self, series_id: int, series_data: BookingSeriesUpdate) -> BookingSeries:
+        """
+        Update a series (applies to every occurrence at once).
+
+        Setting status CANCELLED cancels the whole series.
+        """
+        log_info("[SERVICE] Updating booking series %s", series_id)
+
+        series = self.get_series(series_id)
+        if not series:
+            raise ValueError(f"Booking series {series_id} not found")
+
+        update_data = series_data.model_dump(exclude_unset=True)
+        check_visible(self.db, User, update_data.get("staff_id"), "Staff member")
+        for field, value in update_data.items():
+            setattr(series, field, value)
+
+        self.db.commit()
+        self.db.refresh(series)
+        return series
+
+    def add_exception(self, series_id: int, exception_data: SeriesExceptionCreate) -> BookingSeriesException:
+        """
+        Override or cancel one occurrence, identified by its original start.
+
+        Re-posting for the same occurrence replaces the previous override.
+        """
+        log_info("[SERVICE] Adding exception to series %s at %s", series_id, exception_data.occurrence_start)
+
+        series = self.get_series(series_id)
+        if not series:
+            raise ValueError(f"Booking series {series_id} not found")
+
+        if not self._is_rule_start(series, exception_data.occurrence_start):
+            raise ValueError(f"No occurrence of series {series_id} starts at {exception_data.occurrence_start}")
+
+        exception = self.db.query(BookingSeriesException).filter(
+            BookingSeriesException.series_id == series_id,
+            BookingSeriesException.occurrence_start == exception_data.occurrence_start
+        ).first()
+
+        if exception is None:
+            exception = BookingSeriesException(series_id=series_id)
+            self.db.add(exception)
+
+        for field, value in exception_data.model_dump().items():
+            setattr(exception, field, value)
+
+        self.db.commit()
+        self.db.refresh(exception)
+        return exception
+
+    def get_series(self, series_id: int) -> BookingSeries:
+        """Get series by ID."""
+        return self.db.query(BookingSeries).filter(BookingSeries.id == series_id).first()
+
+    def get_series_occurrences(self, series_id: int, window_start: datetime, window_end: datetime) -> List[Occurrence]:
+        """Expand one series for a window."""
+        series = self.get_series(series_id)
+        if not series:
+            raise ValueError(f"Booking series {series_id} not found")
+
+        exceptions = self._load_exceptions([series.id], window_start, window_end)
+        return list(iter_occurrences(series, window_start, window_end, exceptions.get(series.id)))
+
+    def iter_window_occurrences(
+        self,
+        window_start: datetime,
+        window_end: datetime,
+        staff_ids: Optional[Iterable[int]] = None,
+        include_cancelled: bool = False
+    ) -> Iterator[Occurrence]:
+        """
+        Lazily yield occurrences of every live series overlapping a window.
+
+        One query for candidate series (by start/until), one for their
+        exceptions in the window, then per-series generators.
+        """
+        query = self.db.query(BookingSeries).filter(
+            BookingSeries.status != BookingStatus.CANCELLED,
+            BookingSeries.start_time < window_end,
+            or_(BookingSeries.until.is_(None), BookingSeries.until >= window_start - timedelta(days=1))
+        )
+        if staff_ids is not None:
+            query = query.filter(BookingSeries.staff_id.in_(list(staff_ids)))
+
+        series_list = query.order_by(BookingSeries.id).all()
+        if not series_list:
+            return
+
+        exceptions = self._load_exceptions([series.id for series in series_list], window_start, window_end)
+
+        for series in series_list:
+            for occurrence in iter_occurrences(series, window_start, window_end, exceptions.get(series.id)):
+                if include_cancelled or occurrence.status != BookingStatus.CANCELLED:
+                    yield occurrence
+
+    def count_occurrences(
+        self,
+        window_start: datetime,
+        window_end: datetime,
+        statuses: Optional[List[BookingStatus]] = None
+    ) -> int:
+        """Count occurrences in a window without materializing them."""
+        return sum(
+            1 for occurrence in self.iter_window_occurrences(window_start, window_end)
+            if statuses is None or occurrence.status in statuses
+        )
+
+    def send_occurrence_reminder(self, series_id: int, occurrence_start: datetime):
+        """
+        Manually trigger a reminder for one occurrence.
+
+        EVENT TRIGGER: handle_booking_reminder
+        """
+        log_info("[SERVICE] Sending reminder for series %s occurrence %s", series_id, occurrence_start)
+
+        window_end = occurrence_start + timedelta(minutes=1)
+        occurrence = next(
+            (o for o in self.get_series_occurrences(series_id, occurrence_start, window_end)
+             if o.occurrence_start == occurrence_start),
+            None
+        )
+        if occurrence is None or occurrence.status == BookingStatus.CANCELLED:
+            raise ValueError(f"No active occurrence of series {series_id} at {occurrence_start}")
+
+        # EXPLICIT EVENT TRIGGER
+        self.automation.handle_booking_reminder(occurrence)
+
+    def _load_exceptions(
+        self,
+        series_ids: List[int],
+        window_start: datetime,
+        window_end: datetime
+    ) -> Dict[int, Dict[datetime, BookingSeriesException]]:
+        """Exceptions whose original or moved start falls near the window, grouped by series."""
+        # Originals just before the window can still overlap it
+        margin = timedelta(days=1)
+        rows = self.db.query(BookingSeriesException).filter(
+            BookingSeriesException.series_id.in_(series_ids),
+            or_(
+                and_(
+                    BookingSeriesException.occurrence_start >= window_start - margin,
+                    BookingSeriesException.occurrence_start < window_end
+                ),
+                and_(
+                    BookingSeriesException.start_time >= window_start - margin,
+                    BookingSeriesException.start_time < window_end
+                )
+            )
+        ).all()
+
+        grouped: Dict[int, Dict[datetime, BookingSeriesException]] = {}
+        for row in rows:
+            grouped.setdefault(row.series_id, {})[row.occurrence_start] = row
+        return grouped
+
+    def _is_rule_start(self, series: BookingSeries, start: datetime) -> bool:
+        """Check that `start` is generated by the series rule."""
+        for index, candidate in iter_rule_starts(series, start):
+            if series.count is not None and index >= series.count:
+                return False
+            if series.until is not None and candidate > series.until:
+                return False
+            return candidate == start
+        return False
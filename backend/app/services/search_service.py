@@ -0,0 +1,276 @@
+from sqlalchemy import Float, and_, cast, event, func, or_, literal, literal_column, select, insert, delete, union_all, tuple_
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+import re
+from app.core.database import SessionLocal
+from app.core.pagination import paginate
+from app.core.logger import log_info
+from app.models.contact import Contact
+from app.models.message import Message
+from app.models.search_index import SearchIndexEntry
+
+# type -> (model, [(field, weight)]) indexed for search; weights mirror the
+# tsvector setweight classes (A=4, B=2, C=1) used on PostgreSQL
+SEARCH_TYPES = {
+    "message": (Message, [("subject", 4), ("content", 2)]),
+    "contact": (Contact, [("name", 4), ("email", 2), ("phone", 1)]),
+}
+
+# PostgreSQL text search configuration per type (matches the generated columns)
+TS_CONFIG = {"message": "english", "contact": "simple"}
+
+# Keyset sort key of a result page, best match first
+SORT_KEY = ("rank", "type", "id")
+
+SNIPPET_LENGTH = 160
+MAX_TERM_LENGTH = 100
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercased alphanumeric terms (emails/phones split on punctuation)."""
+    if not text:
+        return []
+    return [token[:MAX_TERM_LENGTH] for token in _TOKEN.findall(text.lower())]
+
+
+def index_terms(entity_type: str, obj) -> Dict[str, int]:
+    """Weighted term counts for one entity (fallback inverted index)."""
+    _, fields = SEARCH_TYPES[entity_type]
+    weights: Counter = Counter()
+    for field, weight in fields:
+        for term in tokenize(getattr(obj, field)):
+            weights[term] += weight
+    return dict(weights)
+
+
+def _index_rows(entity_type: str, obj) -> List[dict]:
+    return [
+        {"entity_type": entity_type, "entity_id": obj.id, "term": term, "weight": weight}
+        for term, weight in index_terms(entity_type, obj).items()
+    ]
+
+
+def rebuild_fallback_index(connection: Connection, batch_size: int = 1000) -> int:
+    """
+    Rebuild the fallback inverted index from scratch (non-PostgreSQL only).
+
+    Used by the migration and for repairs after bulk writes that bypass the ORM.
+    """
+    table = SearchIndexEntry.__table__
+    connection.execute(delete(table))
+    total = 0
+
+    for entity_type, (model, fields) in SEARCH_TYPES.items():
+        columns = [model.__table__.c.id] + [model.__table__.c[field] for field, _ in fields]
+        rows = []
+        for row in connection.execute(select(*columns)):
+            rows.extend(_index_rows(entity_type, row))
+            if len(rows) >= batch_size:
+                connection.execute(insert(table), rows)
+                total += len(rows)
+                rows = []
+        if rows:
+            connection.execute(insert(table), rows)
+            total += len(rows)
+
+    return total
+
+
+def index_inserted(connection: Connection, entity_type: str, objs: Iterable) -> None:
+    """
+    Add rows inserted without the ORM unit of work (bulk imports) to the
+    fallback index. No-op on PostgreSQL.
+    """
+    if connection.dialect.name == "postgresql":
+        return
+    rows = [row for obj in objs for row in _index_rows(entity_type, obj)]
+    if rows:
+        connection.execute(insert(SearchIndexEntry.__table__), rows)
+
+
+def remove_from_index(connection: Connection, entity_type: str, ids: List[int]) -> None:
+    """Drop rows deleted without the ORM from the fallback index. No-op on PostgreSQL."""
+    if connection.dialect.name == "postgresql" or not ids:
+        return
+    table = SearchIndexEntry.__table__
+    connection.execute(delete(table).where(table.c.entity_type == entity_type, table.c.entity_id.in_(ids)))
+
+
+def _entity_type(obj) -> Optional[str]:
+    for entity_type, (model, _) in SEARCH_TYPES.items():
+        if type(obj) is model:
+            return entity_type
+    return None
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _maintain_fallback_index(session: Session, flush_context):
+    """
+    Keep the fallback inverted index in step with ORM writes, in the same
+    transaction. PostgreSQL maintains its generated tsvector columns itself.
+    """
+    connection = session.connection()
+    if connection.dialect.name == "postgresql":
+        return
+
+    table = SearchIndexEntry.__table__
+    stale: List[Tuple[str, int]] = []
+    rows: List[dict] = []
+
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        entity_type = _entity_type(obj)
+        if entity_type is None or obj.id is None:
+            continue
+        stale.append((entity_type, obj.id))
+        if obj not in session.deleted:
+            rows.extend(_index_rows(entity_type, obj))
+
+    if stale:
+        connection.execute(
+            delete(table).where(tuple_(table.c.entity_type, table.c.entity_id).in_(stale))
+        )
+    if rows:
+        connection.execute(insert(table), rows)
+
+
+class SearchService:
+    """
+    Ranked full-text search over messages and contacts.
+
+    PostgreSQL: generated tsvector columns with GIN indexes, ranked with
+    ts_rank_cd. Elsewhere: a weighted inverted index (search_index).
+    Results use keyset pagination over (rank, type, id).
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search(
+        self,
+        q: str,
+        types: Iterable[str] = tuple(SEARCH_TYPES),
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Search messages (subject, content) and contacts (name, email, phone).
+
+        Returns ranked results:
+            [{"type", "id", "rank", "title", "snippet", "contact_id", "created_at"}, ...]
+        """
+        types = [t for t in SEARCH_TYPES if t in set(types)]
+        log_info("[SERVICE] Search %s: %r", types, q)
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            ranked = self._ranked_postgres(q, types)
+        else:
+            ranked = self._ranked_fallback(q, types)
+        if ranked is None:
+            return []
+
+        columns = [ranked.c[name] for name in SORT_KEY]
+        page = paginate(
+            self.db.query(*columns), columns, cursor=cursor, limit=limit, descending=True
+        ).all()
+
+        return self._hydrate(page, q)
+
+    def _ranked_postgres(self, q: str, types: List[str]):
+        """
+        UNION ALL of per-type matches, ranked by ts_rank_cd.
+
+        ts_rank_cd returns float4; widened to double precision, the rank
+        round-trips exactly through the cursor, so the keyset seek doesn't
+        skip rows tied with the last one of a page.
+        """
+        selects = []
+        for entity_type in types:
+            model, _ = SEARCH_TYPES[entity_type]
+            vector = literal_column(f"{model.__tablename__}.search_vector")
+            query = func.websearch_to_tsquery(TS_CONFIG[entity_type], q)
+            selects.append(
+                select(
+                    literal(entity_type).label("type"),
+                    model.id.label("id"),
+                    cast(func.ts_rank_cd(vector, query), Float(53)).label("rank")
+                ).where(vector.op("@@")(query))
+            )
+        return union_all(*selects).subquery("ranked") if selects else None
+
+    def _ranked_fallback(self, q: str, types: List[str]):
+        """Entities containing every query term, ranked by summed term weight."""
+        terms = sorted(set(tokenize(q)))
+        if not terms or not types:
+            return None
+
+        entry = SearchIndexEntry
+        # The index is shared by all workspaces; keep entities the session can see
+        visible = or_(*[
+            and_(entry.entity_type == entity_type, entry.entity_id.in_(select(SEARCH_TYPES[entity_type][0].id)))
+            for entity_type in types
+        ])
+        return select(
+            entry.entity_type.label("type"),
+            entry.entity_id.label("id"),
+            func.sum(entry.weight).label("rank")
+        ).where(
+            entry.term.in_(terms),
+            visible
+        ).group_by(
+            entry.entity_type, entry.entity_id
+        ).having(
+            func.count(entry.term) == len(terms)
+        ).subquery("ranked")
+
+    def _hydrate(self, page: List, q: str) -> List[dict]:
+        """Load display columns for one page (one query per type present)."""
+        ids_by_type: Dict[str, List[int]] = {}
+        for row in page:
+            ids_by_type.setdefault(row.type, []).append(row.id)
+
+        display: Dict[Tuple[str, int], dict] = {}
+
+        if "message" in ids_by_type:
+            rows = self.db.query(
+                Message.id, Message.contact_id, Message.subject, Message.content, Message.created_at
+            ).filter(Message.id.in_(ids_by_type["message"])).all()
+            for row in rows:
+                display[("message", row.id)] = {
+                    "title": row.subject,
+                    "snippet": _snippet(row.content, q),
+                    "contact_id": row.contact_id,
+                    "created_at": row.created_at,
+                }
+
+        if "contact" in ids_by_type:
+            rows = self.db.query(
+                Contact.id, Contact.name, Contact.email, Contact.phone, Contact.created_at
+            ).filter(Contact.id.in_(ids_by_type["contact"])).all()
+            for row in rows:
+                display[("contact", row.id)] = {
+                    "title": row.name,
+                    "snippet": " · ".join(value for value in (row.email, row.phone) if value) or None,
+                    "contact_id": row.id,
+                    "created_at": row.created_at,
+                }
+
+        # Rows removed outside the ORM can linger in the fallback index; skip them
+        return [
+            {"type": row.type, "id": row.id, "rank": float(row.rank), **display[(row.type, row.id)]}
+            for row in page
+            if (row.type, row.id) in display
+        ]
+
+
+def _snippet(content: str, q: str) -> str:
+    """Excerpt of `content` around the first query term."""
+    lowered = content.lower()
+    positions = [lowered.find(term) for term in tokenize(q)]
+    positions = [position for position in positions if position >= 0]
+    start = max(min(positions) - SNIPPET_LENGTH // 4, 0) if positions else 0
+    excerpt = content[start:start + SNIPPET_LENGTH]
+    return ("…" if start else "") + excerpt + ("…" if start + SNIPPET_LENGTH < len(content) else "")
@@ -0,0 +1,169 @@
+from sqlalchemy import and_, tuple_
+from sqlalchemy.orm import Session
+from datetime import datetime
+from heapq import merge
+from itertools import islice
+from typing import Iterable, List, Optional, Tuple
+from app.core.logger import log_info
+from app.core.pagination import InvalidCursorError, decode_cursor
+from app.models.alert import Alert
+from app.models.booking import Booking
+from app.models.contact import Contact
+from app.models.message import Message
+from app.services.archive_service import with_archived
+
+# Sources merged into a timeline
+TIMELINE_TYPES = ("alert", "booking", "message")
+
+# Keyset sort key of a timeline page, newest first; ties between sources
+# at the same instant are broken by type, then id
+SORT_KEY = ("occurred_at", "type", "id")
+
+DETAIL_LENGTH = 200
+
+
+def _after_cursor(source: str, time_column, id_column, cursor: Optional[Tuple]):
+    """
+    Condition selecting a source's rows that come after the cursor in the
+    merged (occurred_at, type, id) DESC order, as an indexed (time, id) seek.
+    """
+    if cursor is None:
+        return None
+    occurred_at, cursor_type, cursor_id = cursor
+    if source == cursor_type:
+        return tuple_(time_column, id_column) < tuple_(occurred_at, cursor_id)
+    if source < cursor_type:
+        return time_column <= occurred_at
+    return time_column < occurred_at
+
+
+def _truncate(text: Optional[str]) -> Optional[str]:
+    if text is None or len(text) <= DETAIL_LENGTH:
+        return text
+    return text[:DETAIL_LENGTH] + "…"
+
+
+class TimelineService:
+    """
+    Unified activity timeline of one contact: bookings, messages and the
+    alerts that reference the contact or its bookings.
+
+    Each source is read with an indexed, time-ordered query limited to one
+    page after the cursor; the sorted streams are combined with a heap-based
+    k-way merge. A page costs O(sources × page size) whatever the length of
+    the contact's history, and one opaque cursor covers all sources.
+
+    Messages and alerts moved out by the archive job are only included
+    when include_archived is set, like the message and alert listings.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_timeline(
+        self,
+        contact_id: int,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        types: Iterable[str] = TIMELINE_TYPES,
+        include_archived: bool = False
+    ) -> List[dict]:
+        """
+        Newest-first events: [{"type", "id", "occurred_at", "title", "detail", "status"}, ...]
+
+        Raises:
+            ValueError: If the contact does not exist
+            InvalidCursorError: If the cursor is malformed
+        """
+        if not self.db.query(Contact.id).filter(Contact.id == contact_id).first():
+            raise ValueError(f"Contact {contact_id} not found")
+
+        position = None
+        if cursor:
+            position = tuple(decode_cursor(cursor, (datetime, str, int)))
+            if position[1] not in TIMELINE_TYPES:
+                raise InvalidCursorError("Invalid cursor")
+
+        log_info("[SERVICE] Timeline for contact %s (limit %s)", contact_id, limit)
+
+        alerts = with_archived(Alert) if include_archived else Alert
+        messages = with_archived(Message) if include_archived else Message
+        loaders = {
+            "alert": lambda: self._alerts(alerts, contact_id, position, limit),
+            "booking": lambda: self._bookings(contact_id, position, limit),
+            "message": lambda: self._messages(messages, contact_id, position, limit),
+        }
+        streams = [loaders[source]() for source in TIMELINE_TYPES if source in set(types)]
+
+        ordered = merge(*streams, key=lambda event: (event["occurred_at"], event["type"], event["id"]), reverse=True)
+        return list(islice(ordered, limit))
+
+    def _bookings(self, contact_id: int, position: Optional[Tuple], limit: int) -> List[dict]:
+        query = self.db.query(
+            Booking.id, Booking.start_time, Booking.service_type, Booking.notes, Booking.status
+        ).filter(Booking.contact_id == contact_id)
+        query = self._page(query, "booking", Booking.start_time, Booking.id, position, limit)
+        return [
+            {
+                "type": "booking",
+                "id": row.id,
+                "occurred_at": row.start_time,
+                "title": row.service_type or "Booking",
+                "detail": _truncate(row.notes),
+                "status": row.status.value,
+            }
+            for row in query
+        ]
+
+    def _messages(self, entity, contact_id: int, position: Optional[Tuple], limit: int) -> List[dict]:
+        query = self.db.query(
+            entity.id, entity.created_at, entity.channel, entity.direction,
+            entity.subject, entity.content, entity.status
+        ).filter(entity.contact_id == contact_id)
+        query = self._page(query, "message", entity.created_at, entity.id, position, limit)
+        return [
+            {
+                "type": "message",
+                "id": row.id,
+                "occurred_at": row.created_at,
+                "title": row.subject or f"{row.direction.value.capitalize()} {row.channel.value}",
+                "detail": _truncate(row.content),
+                "status": row.status.value,
+            }
+            for row in query
+        ]
+
+    def _alerts(self, entity, contact_id: int, position: Optional[Tuple], limit: int) -> List[dict]:
+        """Alerts referencing the contact or one of its bookings (two indexed seeks)."""
+        columns = (entity.id, entity.created_at, entity.message, entity.details, entity.severity, entity.is_dismissed)
+        direct = self.db.query(*columns).filter(
+            entity.reference_type == "contact", entity.reference_id == contact_id
+        )
+        via_booking = self.db.query(*columns).join(
+            Booking, and_(entity.reference_type == "booking", entity.reference_id == Booking.id)
+        ).filter(Booking.contact_id == contact_id)
+
+        rows = merge(
+            self._page(direct, "alert", entity.created_at, entity.id, position, limit).all(),
+            self._page(via_booking, "alert", entity.created_at, entity.id, position, limit).all(),
+            key=lambda row: (row.created_at, row.id),
+            reverse=True
+        )
+        return [
+            {
+                "type": "alert",
+                "id": row.id,
+                "occurred_at": row.created_at,
+                "title": row.message,
+                "detail": _truncate(row.details),
+                "status": "dismissed" if row.is_dismissed else row.severity.value,
+            }
+            for row in islice(rows, limit)
+        ]
+
+    @staticmethod
+    def _page(query, source: str, time_column, id_column, position: Optional[Tuple], limit: int):
+        condition = _after_cursor(source, time_column, id_column, position)
+        if condition is not None:
+            query = query.filter(condition)
+        return query.order_by(time_column.desc(), id_column.desc()).limit(limit)
@@ -0,0 +1,48 @@
+from sqlalchemy.orm import Session
+import re
+from app.models.workspace import Workspace
+from app.core.logger import log_info
+
+
+def slugify(name: str) -> str:
+    """URL-safe slug of a workspace name."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")[:80] or "workspace"
+
+
+class WorkspaceService:
+    """
+    Workspaces (tenants) and their membership.
+    
+    Business data is scoped to the caller's workspace by the session
+    (see app.core.tenancy); this service only manages the workspaces.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def create_workspace(self, name: str) -> Workspace:
+        """Create a workspace with a unique slug (not committed)."""
+        base = slugify(name)
+        slug, suffix = base, 1
+        while self.db.query(Workspace.id).filter(Workspace.slug == slug).first():
+            suffix += 1
+            slug = f"{base}-{suffix}"
+        
+        workspace = Workspace(name=name, slug=slug)
+        self.db.add(workspace)
+        self.db.flush()
+        
+        log_info("[SERVICE] Workspace created: %s (%s)", workspace.id, slug)
+        return workspace
+    
+    def get_workspace(self, workspace_id: int) -> Workspace:
+        """
+        Get a workspace by id.
+        
+        Raises:
+            ValueError: If the workspace does not exist
+        """
+        workspace = self.db.get(Workspace, workspace_id)
+        if not workspace:
+            raise ValueError(f"Workspace {workspace_id} not found")
+        return workspace
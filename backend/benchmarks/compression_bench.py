@@ -0,0 +1,59 @@
+"""
+Microbenchmark: CPU cost versus bytes saved for response encodings.
+
+Run from backend/:
+    python -m benchmarks.compression_bench [--repeat 20]
+
+Bodies are /messages-shaped JSON pages of increasing size. The results
+drive COMPRESSION_MIN_BYTES, GZIP_LEVEL and BROTLI_QUALITY in settings.
+"""
+import argparse
+import gzip
+import time
+import brotli
+import msgpack
+import orjson
+from app.schemas.message_schema import MessageExpandedResponse
+from app.core.serialization import serialize_list
+from benchmarks.serialization_bench import build_messages
+
+ROW_COUNTS = (1, 3, 10, 100, 1000)
+
+CODECS = (
+    ("gzip-1", lambda body: gzip.compress(body, compresslevel=1, mtime=0)),
+    ("gzip-4", lambda body: gzip.compress(body, compresslevel=4, mtime=0)),
+    ("gzip-6", lambda body: gzip.compress(body, compresslevel=6, mtime=0)),
+    ("br-4", lambda body: brotli.compress(body, quality=4)),
+    ("br-6", lambda body: brotli.compress(body, quality=6)),
+    ("br-11", lambda body: brotli.compress(body, quality=11)),
+    ("msgpack", lambda body: msgpack.packb(orjson.loads(body), use_bin_type=True)),
+)
+
+
+def measure(fn, body: bytes, repeat: int):
+    output = fn(body)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(body)
+    return (time.perf_counter() - started) / repeat, len(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Response encoding microbenchmark")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for rows in ROW_COUNTS:
+        body = serialize_list(MessageExpandedResponse, build_messages(rows))
+        print(f"\n{rows} rows, {len(body)} bytes JSON")
+        for name, fn in CODECS:
+            seconds, size = measure(fn, body, args.repeat)
+            saved = len(body) - size
+            print(
+                f"  {name:>8}: {seconds * 1e6:9.1f} us  {size:8d} bytes  "
+                f"saved {saved / len(body):6.1%}  {saved / max(seconds * 1e6, 1e-9):8.0f} bytes/us"
+            )
+
+
+if __name__ == "__main__":
+    main()
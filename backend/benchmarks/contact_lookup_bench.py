@@ -0,0 +1,66 @@
+"""
+Microbenchmark: typeahead latency of the in-memory contact prefix index.
+
+Run from backend/:
+    python -m benchmarks.contact_lookup_bench [--contacts 500000] [--workspaces 1]
+
+Simulates typing names, emails and phone numbers one keystroke at a time
+against synthetic contacts spread over --workspaces workspaces; one frame
+at 60 Hz is 16.7 ms.
+"""
+import argparse
+import random
+import string
+import time
+from app.services.contact_service import _ContactPrefixIndex, normalize_query
+
+FIRST = ["Alice", "Bob", "Carla", "Dmitri", "Eve", "Fatima", "Gus", "Hana", "Ivan", "Julia", "Kwame", "Li", "Maria", "Noah"]
+
+
+def build_contacts(count: int, workspaces: int = 1, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    contacts = {}
+    for contact_id in range(1, count + 1):
+        last = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9))).title()
+        first = rng.choice(FIRST)
+        contacts[contact_id] = (
+            contact_id % workspaces + 1,
+            f"{first} {last}",
+            f"{first.lower()}.{last.lower()}{contact_id}@example.com",
+            f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}"
+        )
+    return contacts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Contact typeahead microbenchmark")
+    parser.add_argument("--contacts", type=int, default=500000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--workspaces", type=int, default=1)
+    args = parser.parse_args()
+
+    contacts = build_contacts(args.contacts, args.workspaces)
+    index = _ContactPrefixIndex(rebuild_seconds=3600)
+
+    started = time.perf_counter()
+    index.load(contacts)
+    print(f"built index over {args.contacts} contacts in {time.perf_counter() - started:.2f}s")
+
+    rng = random.Random(11)
+    samples = [contacts[rng.randint(1, args.contacts)] for _ in range(args.queries)]
+    latencies = []
+    for workspace_id, name, email, phone in samples:
+        for text in (name.split()[1], email, phone):
+            for length in range(1, min(len(text), 10) + 1):
+                term, digits = normalize_query(text[:length])
+                started = time.perf_counter()
+                index.lookup(workspace_id, term, digits, limit=10)
+                latencies.append(time.perf_counter() - started)
+
+    latencies.sort()
+    pick = lambda q: latencies[min(int(q * len(latencies)), len(latencies) - 1)] * 1000
+    print(f"{len(latencies)} keystrokes: p50 {pick(0.5):.3f} ms  p99 {pick(0.99):.3f} ms  max {latencies[-1] * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
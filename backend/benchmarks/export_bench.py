@@ -0,0 +1,96 @@
+"""
+Benchmark: streaming message export throughput and memory.
+
+Run from backend/:
+    python -m benchmarks.export_bench [--rows 1000000] [--format ndjson] [--gzip]
+
+Fills a scratch SQLite database with synthetic messages and exports them
+to /dev/null, reporting rows/s and peak RSS after a quarter of the output
+and at the end - the two should match if memory is bounded by the batch
+and chunk sizes rather than the table size.
+"""
+import argparse
+import os
+import resource
+import tempfile
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+from app.core.database import Base
+from app.models import workspace, user, contact, booking, booking_series, message, search_index  # noqa: F401 (tables)
+from app.models.contact import Contact
+from app.models.message import Message, MessageChannel, MessageDirection, MessageStatus
+from app.models.workspace import Workspace
+from app.services.export_service import ExportService
+
+
+def populate(db: Session, rows: int, batch: int = 5000):
+    db.execute(insert(Workspace), [{"id": 1, "name": "Bench", "slug": "bench"}])
+    db.execute(insert(Contact), [{"name": f"Person {i}", "workspace_id": 1} for i in range(1, 1001)])
+    start = datetime(2025, 1, 1)
+    for offset in range(0, rows, batch):
+        db.execute(insert(Message), [
+            {
+                "contact_id": i % 1000 + 1,
+                "channel": MessageChannel.EMAIL,
+                "direction": MessageDirection.OUTGOING,
+                "status": MessageStatus.SENT,
+                "subject": f"Reminder {i}",
+                "content": f"Hi Person {i % 1000 + 1}, see you soon. " * 3,
+                "created_at": start + timedelta(minutes=i),
+                "workspace_id": 1,
+            }
+            for i in range(offset, min(offset + batch, rows))
+        ])
+    db.commit()
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Message export benchmark")
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--format", choices=("csv", "ndjson"), default="ndjson")
+    parser.add_argument("--gzip", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        engine = create_engine(f"sqlite:///{os.path.join(scratch, 'export.db')}")
+        Base.metadata.create_all(engine)
+        db = Session(bind=engine)
+        populate(db, args.rows)
+        db.expunge_all()
+        loaded_rss = peak_rss_mb()
+
+        service = ExportService(db)
+        checkpoint = {}
+        exported = 0
+
+        def counted(rows):
+            nonlocal exported
+            for row in rows:
+                exported += 1
+                if exported == args.rows // 4:
+                    checkpoint["rss"] = peak_rss_mb()
+                yield row
+
+        written = 0
+        started = time.perf_counter()
+        with open(os.devnull, "wb") as out:
+            rows = counted(service.build_query("messages"))
+            for chunk in service.encode(rows, "messages", args.format, gzip=args.gzip):
+                out.write(chunk)
+                written += len(chunk)
+        elapsed = time.perf_counter() - started
+        db.close()
+
+    print(f"{exported} rows, {written / 1e6:.1f} MB in {elapsed:.1f}s ({exported / elapsed:,.0f} rows/s)")
+    print(f"peak RSS after load: {loaded_rss:.0f} MB, after 25%: {checkpoint.get('rss', 0):.0f} MB, "
+          f"at end: {peak_rss_mb():.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
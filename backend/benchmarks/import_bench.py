@@ -0,0 +1,77 @@
+"""
+Benchmark: streaming contact import throughput and memory.
+
+Run from backend/:
+    python -m benchmarks.import_bench [--rows 1000000]
+
+Writes a CSV of synthetic contacts (10% duplicates of earlier rows) to a
+temporary file and imports it into a scratch SQLite database, reporting
+rows/s and peak RSS after a quarter of the rows and at the end - the two
+should match if memory is bounded by the batch size.
+"""
+import argparse
+import os
+import random
+import resource
+import tempfile
+import time
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from app.core.database import Base
+from app.core.tenancy import set_workspace
+from app.models import workspace, user, contact, booking, booking_series, message, search_index  # noqa: F401 (tables)
+from app.models.workspace import Workspace
+from app.services.import_service import ImportService, ImportProgress
+
+
+def write_csv(path: str, rows: int, seed: int = 7):
+    rng = random.Random(seed)
+    with open(path, "w") as out:
+        out.write("name,email,phone\n")
+        for i in range(1, rows + 1):
+            n = rng.randint(1, i - 1) if i > 1 and rng.random() < 0.1 else i
+            out.write(f"Person {n},person{n}@example.com,(212) {n // 10000 % 1000:03d}-{n % 10000:04d}\n")
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Contact import benchmark")
+    parser.add_argument("--rows", type=int, default=1000000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        csv_path = os.path.join(scratch, "contacts.csv")
+        write_csv(csv_path, args.rows)
+
+        engine = create_engine(f"sqlite:///{os.path.join(scratch, 'import.db')}")
+        Base.metadata.create_all(engine)
+        db = Session(bind=engine)
+        db.add(Workspace(id=1, name="Bench", slug="bench"))
+        db.commit()
+        set_workspace(db, 1)
+
+        progress = ImportProgress(kind="contacts", format="csv", workspace_id=1)
+        checkpoint = {}
+
+        class Reporting(ImportService):
+            def _import_contacts(self, rows, progress):
+                if "rss" not in checkpoint and progress.processed >= args.rows // 4:
+                    checkpoint["rss"] = peak_rss_mb()
+                return super()._import_contacts(rows, progress)
+
+        started = time.perf_counter()
+        with open(csv_path, "rb") as stream:
+            Reporting(db).run(stream, progress)
+        elapsed = time.perf_counter() - started
+        db.close()
+
+    print(f"{progress.processed} rows in {elapsed:.1f}s ({progress.processed / elapsed:,.0f} rows/s): "
+          f"{progress.inserted} inserted, {progress.duplicates} duplicates, {progress.failed} failed")
+    print(f"peak RSS after 25%: {checkpoint.get('rss', 0):.0f} MB, at end: {peak_rss_mb():.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Microbenchmark: list response serialization, before and after single-pass encoding.
+
+Run from backend/:
+    python -m benchmarks.serialization_bench [--rows 1000] [--repeat 50]
+
+before: per-row model_validate in the route, then FastAPI's response_model
+        validation/serialization and stdlib json (what list routes used to do)
+after:  one cached TypeAdapter validate + pydantic-core dump_json to bytes
+rows:   column rows shaped as dicts and encoded with orjson (no ORM objects)
+"""
+from datetime import datetime, timedelta
+from typing import List
+import argparse
+import asyncio
+import time
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from app.models.message import Message, MessageChannel, MessageDirection, MessageStatus
+from app.schemas.message_schema import MessageExpandedResponse
+from app.core.serialization import serialize_list, rows_response
+
+
+def build_messages(count: int) -> List[Message]:
+    """Transient ORM objects shaped like a page of /messages."""
+    now = datetime.utcnow()
+    return [
+        Message(
+            id=i,
+            contact_id=i % 50,
+            staff_id=None,
+            channel=MessageChannel.EMAIL,
+            direction=MessageDirection.OUTGOING,
+            status=MessageStatus.SENT,
+            content="Hi, your booking is confirmed. " * 4,
+            subject="Booking Confirmation",
+            error_message=None,
+            created_at=now - timedelta(minutes=i),
+            sent_at=now - timedelta(minutes=i)
+        )
+        for i in range(count)
+    ]
+
+
+def before(messages: List[Message], field) -> bytes:
+    content = [MessageExpandedResponse.model_validate(m) for m in messages]
+    encoded = asyncio.run(serialize_response(field=field, response_content=content, is_coroutine=False))
+    return JSONResponse(encoded).body
+
+
+def after(messages: List[Message], field) -> bytes:
+    return serialize_list(MessageExpandedResponse, messages)
+
+
+def rows(messages: List[Message], field) -> bytes:
+    data = [
+        {
+            "id": m.id,
+            "contact_id": m.contact_id,
+            "channel": m.channel,
+            "direction": m.direction,
+            "status": m.status,
+            "content": m.content,
+            "subject": m.subject,
+            "created_at": m.created_at,
+        }
+        for m in messages
+    ]
+    return rows_response(data).body
+
+
+def measure(fn, messages, field, repeat: int) -> float:
+    fn(messages, field)  # warm caches
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(messages, field)
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List serialization microbenchmark")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    messages = build_messages(args.rows)
+    field = create_response_field(name="response", type_=List[MessageExpandedResponse])
+
+    baseline = None
+    for name, fn in (("before", before), ("after", after), ("rows", rows)):
+        seconds = measure(fn, messages, field, args.repeat)
+        baseline = baseline or seconds
+        print(
+            f"{name:>7}: {seconds * 1000:8.2f} ms/response  "
+            f"{args.rows / seconds:10.0f} rows/s  x{baseline / seconds:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Test setup: the app against a throwaway SQLite database, or the database
+at TEST_DATABASE_URL (e.g. an empty PostgreSQL database).
+
+Settings are read when `app` is imported, so the environment is set
+first. Tables and the default workspace are created by the startup
+event (init_db); every test module shares that database, so tests create
+their own rows (unique emails) rather than assuming an empty table.
+"""
+import os
+import tempfile
+import uuid
+
+_db_dir = tempfile.mkdtemp(prefix="careops-tests-")
+os.environ["DATABASE_URL"] = os.environ.get("TEST_DATABASE_URL") or f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ["SECRET_KEY"] = "test-secret"
+os.environ["ENVIRONMENT"] = "test"
+os.environ["CACHE_URL"] = "memory://"
+os.environ["SINGLE_FLIGHT_GRACE_SECONDS"] = "0"  # Every request computes (or joins an in-flight call)
+os.environ["METRICS_ENABLED"] = "true"
+os.environ["SERVER_TIMING_ENABLED"] = "true"
+
+import pytest
+from fastapi.testclient import TestClient
+from app.core.cache import service_cache
+from app.core.database import SessionLocal
+from app.core.tenancy import set_workspace
+from app.main import app
+
+
+def unique(prefix: str = "x") -> str:
+    """Unique token for emails and names (tests share one database)."""
+    return f"{prefix}{uuid.uuid4().hex[:10]}"
+
+
+def unique_phone() -> str:
+    """Unique ten-digit phone number."""
+    return f"555{uuid.uuid4().int % 10 ** 7:07d}"
+
+
+class Account:
+    """A registered user: id, workspace and request headers."""
+
+    def __init__(self, response: dict):
+        self.user_id = response["user"]["id"]
+        self.workspace_id = response["user"]["workspace_id"]
+        self.headers = {"Authorization": f"Bearer {response['access_token']}"}
+
+
+def register(client: TestClient) -> Account:
+    """Sign up: the admin of a new workspace."""
+    payload = {
+        "name": unique("User "), "email": f"{unique()}@example.com", "password": "pw",
+        "workspace_name": unique("Workspace "),
+    }
+    response = client.post("/auth/register", json=payload)
+    assert response.status_code == 201, response.text
+    return Account(response.json())
+
+
+def add_user(client: TestClient, admin: Account, role: str = "staff") -> Account:
+    """A user added to the admin's workspace, logged in."""
+    email = f"{unique()}@example.com"
+    response = client.post("/workspace/users", json={
+        "name": unique("User "), "email": email, "password": "pw", "role": role,
+    }, headers=admin.headers)
+    assert response.status_code == 201, response.text
+    return Account(client.post("/auth/login", json={"email": email, "password": "pw"}).json())
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(autouse=True)
+def _fresh_service_cache():
+    service_cache.clear()
+    yield
+
+
+@pytest.fixture
+def admin(client) -> Account:
+    """Admin of a new workspace (no rows but its own)."""
+    return register(client)
+
+
+@pytest.fixture
+def other_admin(client) -> Account:
+    """Admin of a second, separate workspace."""
+    return register(client)
+
+
+@pytest.fixture
+def db(admin):
+    """Session scoped to `admin`'s workspace."""
+    session = SessionLocal()
+    set_workspace(session, admin.workspace_id)
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def make_contact(client):
+    """Create a contact through the API and return its JSON."""
+    def create(account: Account, **fields) -> dict:
+        payload = {"name": unique("Contact "), "email": f"{unique()}@example.com", **fields}
+        response = client.post("/contacts", json=payload, headers=account.headers)
+        assert response.status_code in (200, 201), response.text
+        return response.json()
+    return create
@@ -0,0 +1,78 @@
+"""Archive tier: old messages and dismissed alerts move out of the hot tables and stay readable."""
+from datetime import datetime
+from sqlalchemy import update
+from app.core.database import SessionLocal
+from app.models.alert import Alert, AlertSeverity, AlertType
+from app.models.message import Message
+from app.services.archive_service import ArchiveService
+
+# Rows are backdated to this; the job only moves rows older than ARCHIVE_AGE_DAYS
+LONG_AGO = datetime(2000, 1, 1)
+ARCHIVE_AGE_DAYS = 365 * 20
+
+
+def _archive():
+    job = SessionLocal()
+    try:
+        return ArchiveService(job).archive_old_messages(older_than_days=ARCHIVE_AGE_DAYS), \
+            ArchiveService(job).archive_dismissed_alerts(older_than_days=ARCHIVE_AGE_DAYS)
+    finally:
+        job.close()
+
+
+def _ids(client, account, path, **params) -> set:
+    response = client.get(path, params={"limit": 1000, **params}, headers=account.headers)
+    assert response.status_code == 200, response.text
+    return {row["id"] for row in response.json()}
+
+
+def _send(client, account, contact_id) -> int:
+    response = client.post("/messages", json={
+        "contact_id": contact_id, "channel": "sms", "direction": "incoming", "content": "Archived soon",
+    }, headers=account.headers)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def test_old_messages_are_archived_and_readable_on_request(client, admin, make_contact, db):
+    contact = make_contact(admin)
+    old = {_send(client, admin, contact["id"]) for _ in range(2)}
+    recent = _send(client, admin, contact["id"])
+    db.execute(update(Message).where(Message.id.in_(old)).values(created_at=LONG_AGO))
+    db.commit()
+
+    moved, _ = _archive()
+
+    path = f"/messages/{contact['id']}"
+    assert moved >= 2
+    assert db.query(Message).filter(Message.id.in_(old)).count() == 0
+    assert old.isdisjoint(_ids(client, admin, path)) and recent in _ids(client, admin, path)
+    assert old | {recent} <= _ids(client, admin, path, include_archived=True)
+
+
+def test_only_long_dismissed_alerts_are_archived(client, admin, db):
+    dismissed = Alert(type=AlertType.SYSTEM, severity=AlertSeverity.INFO, message="Old news",
+                      is_dismissed=True, dismissed_at=LONG_AGO)
+    recently = Alert(type=AlertType.SYSTEM, severity=AlertSeverity.INFO, message="Just dismissed",
+                     is_dismissed=True, dismissed_at=datetime.utcnow())
+    db.add_all([dismissed, recently])
+    db.commit()
+    old_id, recent_id = dismissed.id, recently.id
+
+    _archive()
+
+    live = _ids(client, admin, "/alerts", include_dismissed=True)
+    assert recent_id in live and old_id not in live
+    assert {old_id, recent_id} <= _ids(client, admin, "/alerts", include_archived=True)
+
+
+def test_archived_rows_stay_in_their_workspace(client, admin, other_admin, make_contact, db):
+    contact = make_contact(admin)
+    message = _send(client, admin, contact["id"])
+    db.execute(update(Message).where(Message.id == message).values(created_at=LONG_AGO))
+    db.commit()
+
+    _archive()
+
+    assert message not in _ids(client, other_admin, "/messages", include_archived=True)
+    assert message in _ids(client, admin, "/messages", include_archived=True)
@@ -0,0 +1,62 @@
+"""Public availability: free slots per staff member around bookings of any length."""
+from datetime import date, datetime, timedelta
+import pytest
+from conftest import add_user
+
+
+def _monday(weeks_ahead: int) -> date:
+    today = date.today()
+    return today + timedelta(days=7 * weeks_ahead - today.weekday())
+
+
+@pytest.fixture
+def staff(client, admin):
+    return add_user(client, admin)
+
+
+def _slots(client, admin, staff, day: date) -> list:
+    response = client.get("/bookings/availability", params={
+        "date_from": day.isoformat(), "date_to": day.isoformat(),
+        "staff_id": staff.user_id, "workspace_id": admin.workspace_id,
+    })
+    assert response.status_code == 200, response.text
+    [availability] = response.json()
+    return [slot["start_time"] for slot in availability["slots"]]
+
+
+def _book(client, admin, make_contact, staff, start: datetime, end: datetime):
+    response = client.post("/bookings", json={
+        "contact_id": make_contact(admin)["id"], "staff_id": staff.user_id,
+        "start_time": start.isoformat(), "end_time": end.isoformat(),
+    }, headers=admin.headers)
+    assert response.status_code == 201, response.text
+
+
+def test_booked_time_is_not_offered(client, admin, staff, make_contact):
+    day = _monday(5)
+    assert len(_slots(client, admin, staff, day)) == 16
+
+    _book(client, admin, make_contact, staff, datetime.combine(day, datetime.min.time()).replace(hour=10),
+          datetime.combine(day, datetime.min.time()).replace(hour=11))
+
+    slots = _slots(client, admin, staff, day)
+    assert len(slots) == 14
+    assert f"{day.isoformat()}T10:00:00" not in slots
+    assert f"{day.isoformat()}T11:00:00" in slots
+
+
+def test_booking_started_days_before_the_range_blocks_it(client, admin, staff, make_contact):
+    day = _monday(6) + timedelta(days=2)
+    start = datetime.combine(day - timedelta(days=3), datetime.min.time()).replace(hour=12)
+
+    _book(client, admin, make_contact, staff, start, datetime.combine(day, datetime.min.time()).replace(hour=13))
+
+    assert _slots(client, admin, staff, day)[0] == f"{day.isoformat()}T13:00:00"
+
+
+def test_staff_of_another_workspace_is_400(client, admin, other_admin, staff):
+    response = client.get("/bookings/availability", params={
+        "date_from": _monday(5).isoformat(), "date_to": _monday(5).isoformat(),
+        "staff_id": staff.user_id, "workspace_id": other_admin.workspace_id,
+    })
+    assert response.status_code == 400
@@ -0,0 +1,57 @@
+"""Staff double-booking: overlapping bookings of one staff member are rejected with 409."""
+import pytest
+from conftest import add_user
+
+DAY = "2032-03-01"
+
+
+@pytest.fixture
+def staff(client, admin):
+    return add_user(client, admin)
+
+
+@pytest.fixture
+def book(client, admin, make_contact, staff):
+    contact = make_contact(admin)
+
+    def create(start: str, end: str, staff_id: int = None):
+        return client.post("/bookings", json={
+            "contact_id": contact["id"], "staff_id": staff_id or staff.user_id,
+            "start_time": f"{DAY}T{start}", "end_time": f"{DAY}T{end}",
+        }, headers=admin.headers)
+    return create
+
+
+def test_overlapping_booking_is_409(book):
+    assert book("10:00:00", "11:00:00").status_code == 201
+
+    response = book("10:30:00", "11:30:00")
+
+    assert response.status_code == 409
+    assert "already booked" in response.json()["detail"]
+
+
+def test_adjacent_and_other_staff_bookings_are_allowed(client, admin, book):
+    assert book("10:00:00", "11:00:00").status_code == 201
+    assert book("11:00:00", "12:00:00").status_code == 201
+    assert book("10:00:00", "11:00:00", staff_id=add_user(client, admin).user_id).status_code == 201
+
+
+def test_moving_into_another_booking_is_409(client, admin, book):
+    book("10:00:00", "11:00:00")
+    later = book("12:00:00", "13:00:00").json()
+
+    response = client.patch(f"/bookings/{later['id']}", json={
+        "start_time": f"{DAY}T10:30:00", "end_time": f"{DAY}T11:30:00",
+    }, headers=admin.headers)
+
+    assert response.status_code == 409
+    assert client.get(f"/bookings/{later['id']}", headers=admin.headers).json()["start_time"] == f"{DAY}T12:00:00"
+
+
+def test_cancelled_bookings_free_their_time(client, admin, book):
+    first = book("10:00:00", "11:00:00").json()
+    response = client.patch(f"/bookings/{first['id']}", json={"status": "cancelled"}, headers=admin.headers)
+    assert response.status_code == 200, response.text
+
+    assert book("10:00:00", "11:00:00").status_code == 201
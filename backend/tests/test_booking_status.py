@@ -0,0 +1,62 @@
+"""Past-booking status job: bookings still open after they ended become completed or no-show."""
+from datetime import datetime, timedelta
+from app.jobs import booking_status_job
+from app.services.booking_service import BookingService
+
+
+def _book(client, account, contact, start: datetime, **changes) -> int:
+    response = client.post("/bookings", json={
+        "contact_id": contact["id"], "start_time": start.isoformat(),
+        "end_time": (start + timedelta(hours=1)).isoformat(),
+    }, headers=account.headers)
+    assert response.status_code == 201, response.text
+    booking_id = response.json()["id"]
+    if changes:
+        response = client.patch(f"/bookings/{booking_id}", json=changes, headers=account.headers)
+        assert response.status_code == 200, response.text
+    return booking_id
+
+
+def _status(client, account, booking_id) -> str:
+    return client.get(f"/bookings/{booking_id}", headers=account.headers).json()["status"]
+
+
+def test_past_bookings_are_closed_by_form_status(client, admin, other_admin, make_contact):
+    contact, other_contact = make_contact(admin), make_contact(other_admin)
+    yesterday = datetime.utcnow().replace(microsecond=0) - timedelta(days=1)
+    attended = _book(client, admin, contact, yesterday, form_status="completed")
+    missed = _book(client, admin, contact, yesterday - timedelta(hours=2))
+    cancelled = _book(client, admin, contact, yesterday - timedelta(hours=4), status="cancelled")
+    upcoming = _book(client, admin, contact, yesterday + timedelta(days=2))
+    elsewhere = _book(client, other_admin, other_contact, yesterday)
+
+    result = booking_status_job.run()
+
+    assert result["completed"] >= 1 and result["no_show"] >= 2
+    assert _status(client, admin, attended) == "completed"
+    assert _status(client, admin, missed) == "no_show"
+    assert _status(client, admin, cancelled) == "cancelled"
+    assert _status(client, admin, upcoming) == "pending"
+    assert _status(client, other_admin, elsewhere) == "no_show"
+
+
+def test_batches_close_every_booking(client, admin, make_contact, db):
+    contact = make_contact(admin)
+    start = datetime.utcnow().replace(microsecond=0) - timedelta(days=3)
+    bookings = [_book(client, admin, contact, start + timedelta(hours=2 * index)) for index in range(5)]
+
+    result = BookingService(db).close_past_bookings(batch_size=2)
+
+    assert result["no_show"] == 5
+    assert {_status(client, admin, booking) for booking in bookings} == {"no_show"}
+
+
+def test_grace_period_keeps_just_ended_bookings_open(client, admin, make_contact, db):
+    contact = make_contact(admin)
+    just_ended = _book(client, admin, contact, datetime.utcnow().replace(microsecond=0) - timedelta(minutes=61))
+
+    BookingService(db).close_past_bookings(grace_minutes=30)
+    assert _status(client, admin, just_ended) == "pending"
+
+    BookingService(db).close_past_bookings(grace_minutes=0)
+    assert _status(client, admin, just_ended) == "no_show"
@@ -0,0 +1,89 @@
+"""Read-through service cache: commit-driven invalidation and the memory backend's bounds."""
+from sqlalchemy import update
+from app.core.cache import MemoryCacheBackend, service_cache
+from app.core.database import SessionLocal
+from app.core.tenancy import set_workspace
+from app.models.alert import Alert, AlertSeverity, AlertType
+from app.models.contact import Contact
+from app.services.alert_service import AlertService
+from app.services.contact_service import ContactService
+
+
+def _session(account):
+    db = SessionLocal()
+    set_workspace(db, account.workspace_id)
+    return db
+
+
+def _alert() -> Alert:
+    return Alert(type=AlertType.SYSTEM, severity=AlertSeverity.INFO, message="Cache test")
+
+
+def test_commit_invalidates_cached_row(admin, make_contact, db):
+    contact = make_contact(admin, name="Before")
+    service = ContactService(db)
+    assert service.get_contact(contact["id"]).name == "Before"
+    assert service.get_contact(contact["id"]).name == "Before"
+    assert service_cache.stats()["hits"] == 1
+
+    writer = _session(admin)
+    writer.get(Contact, contact["id"]).name = "After"
+    writer.commit()
+    writer.close()
+
+    assert service.get_contact(contact["id"]).name == "After"
+
+
+def test_bulk_statement_invalidates_the_table(admin, make_contact, db):
+    contact = make_contact(admin, name="Bulk before")
+    service = ContactService(db)
+    service.get_contact(contact["id"])
+
+    db.execute(update(Contact).where(Contact.id == contact["id"]).values(name="Bulk after"))
+    db.commit()
+
+    assert service.get_contact(contact["id"]).name == "Bulk after"
+
+
+def test_rollback_and_other_workspaces_keep_entries(admin, other_admin, db):
+    service = AlertService(db)
+    assert service.get_active_alert_count() == 0
+
+    db.add(_alert())
+    db.flush()
+    db.rollback()
+    other = _session(other_admin)
+    other.add(_alert())
+    other.commit()
+    other.close()
+
+    assert service.get_active_alert_count() == 0
+    assert service_cache.stats()["hits"] == 1
+
+    db.add(_alert())
+    db.commit()
+    assert service.get_active_alert_count() == 1
+
+
+def test_tag_versions_use_a_fixed_table_counted_in_max_bytes():
+    backend = MemoryCacheBackend(max_entries=100, max_bytes=64 * 1024, version_slots=1024)
+    assert backend.info()["bytes"] == 1024 * 8
+
+    backend.bump_versions(f"contacts:{row}" for row in range(100_000))
+
+    assert backend.info()["bytes"] == 1024 * 8
+    assert backend.get_versions(["contacts:1"]) != [0]
+    # The table leaves 56 KiB for entries
+    backend.set("too-big", b"x" * (57 * 1024), ttl_seconds=60)
+    backend.set("fits", b"x" * (56 * 1024), ttl_seconds=60)
+    assert backend.get("too-big") is None
+    assert backend.get("fits") is not None
+
+
+def test_tags_sharing_a_slot_only_cost_a_miss():
+    backend = MemoryCacheBackend(max_entries=100, max_bytes=64 * 1024, version_slots=1)
+    before = backend.get_versions(["inventory:1"])
+
+    backend.bump_versions(["contacts:1"])
+
+    assert backend.get_versions(["inventory:1"]) != before
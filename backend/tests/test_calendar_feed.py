@@ -0,0 +1,49 @@
+"""Calendar feed authentication: revocable feed tokens instead of JWTs in the URL."""
+import pytest
+
+
+@pytest.fixture
+def feed(client, admin) -> dict:
+    response = client.post("/auth/feed-token", headers=admin.headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _calendar(client, staff_id, **kwargs):
+    return client.get(f"/bookings/staff/{staff_id}/calendar.ics", **kwargs)
+
+
+def test_feed_url_opens_the_owners_calendar(client, admin, feed):
+    response = client.get(feed["feed_url"])
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/calendar")
+    assert response.text.startswith("BEGIN:VCALENDAR")
+
+
+def test_feed_token_only_opens_its_own_calendar(client, other_admin, feed):
+    response = _calendar(client, other_admin.user_id, params={"token": feed["feed_token"]})
+    assert response.status_code == 403
+
+
+def test_access_token_is_refused_in_the_url(client, admin):
+    access_token = admin.headers["Authorization"].removeprefix("Bearer ")
+    response = _calendar(client, admin.user_id, params={"token": access_token})
+    assert response.status_code == 401
+
+
+def test_header_auth_still_works(client, admin):
+    assert _calendar(client, admin.user_id, headers=admin.headers).status_code == 200
+
+
+def test_revoked_and_rotated_tokens_stop_working(client, admin, feed):
+    rotated = client.post("/auth/feed-token", headers=admin.headers).json()
+    assert _calendar(client, admin.user_id, params={"token": feed["feed_token"]}).status_code == 401
+
+    assert client.delete("/auth/feed-token", headers=admin.headers).status_code == 204
+    assert _calendar(client, admin.user_id, params={"token": rotated["feed_token"]}).status_code == 401
+
+
+def test_feed_token_is_not_an_api_credential(client, feed):
+    response = client.get("/contacts", headers={"Authorization": f"Bearer {feed['feed_token']}"})
+    assert response.status_code == 401
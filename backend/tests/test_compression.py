@@ -0,0 +1,104 @@
+"""Content negotiation: br/gzip above a threshold, MessagePack, Vary and weakened ETags."""
+import msgpack
+import orjson
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+from app.core.compression import ContentNegotiationMiddleware, compressed_cache, etag_matches
+
+PAYLOAD = [{"id": index, "content": f"Message {index}"} for index in range(200)]
+BODY = orjson.dumps(PAYLOAD)
+ETAG = '"v1"'
+
+
+@pytest.fixture(scope="module")
+def negotiating():
+    app = FastAPI()
+    app.add_middleware(ContentNegotiationMiddleware)
+
+    @app.get("/large")
+    def large(request: Request):
+        if etag_matches(request.headers.get("if-none-match"), ETAG):
+            return Response(status_code=304, headers={"ETag": ETAG})
+        return Response(BODY, media_type="application/json", headers={"ETag": ETAG})
+
+    @app.get("/private")
+    def private():
+        return Response(BODY, media_type="application/json", headers={"Cache-Control": "private"})
+
+    @app.get("/small")
+    def small():
+        return Response(b'{"ok":true}', media_type="application/json")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([BODY[:2000], BODY[2000:]]), media_type="application/json")
+
+    return TestClient(app)
+
+
+def _get(client, path, encoding="gzip, br", **headers):
+    return client.get(path, headers={"Accept-Encoding": encoding, **headers})
+
+
+def test_large_json_is_compressed_with_the_preferred_encoding(negotiating):
+    brotli = _get(negotiating, "/large")
+    gzip = _get(negotiating, "/large", encoding="gzip")
+
+    assert brotli.headers["content-encoding"] == "br" and gzip.headers["content-encoding"] == "gzip"
+    assert int(gzip.headers["content-length"]) < len(BODY)
+    assert brotli.json() == gzip.json() == PAYLOAD
+
+
+def test_small_and_unaccepted_bodies_are_sent_as_is_with_vary(negotiating):
+    small = _get(negotiating, "/small")
+    identity = _get(negotiating, "/large", encoding="identity")
+
+    for response in (small, identity):
+        assert "content-encoding" not in response.headers
+        assert {"Accept", "Accept-Encoding"} <= {v.strip() for v in response.headers["vary"].split(",")}
+    assert identity.content == BODY
+
+
+def test_compressed_responses_weaken_the_etag_and_still_revalidate(negotiating):
+    first = _get(negotiating, "/large")
+    assert first.headers["etag"] == f"W/{ETAG}"
+
+    revalidated = _get(negotiating, "/large", **{"If-None-Match": first.headers["etag"]})
+
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == f"W/{ETAG}"
+    assert "Accept-Encoding" in revalidated.headers["vary"]
+
+
+def test_msgpack_is_negotiated_by_accept(negotiating):
+    response = _get(negotiating, "/large", encoding="identity", Accept="application/msgpack")
+
+    assert response.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == PAYLOAD
+
+
+def test_cacheable_bodies_are_compressed_once(negotiating):
+    compressed_cache.clear()
+
+    _get(negotiating, "/large", encoding="gzip")
+    _get(negotiating, "/large", encoding="gzip")
+    _get(negotiating, "/private", encoding="gzip")
+
+    assert (compressed_cache.misses, compressed_cache.hits) == (1, 1)
+
+
+def test_streamed_bodies_are_compressed_incrementally(negotiating):
+    response = _get(negotiating, "/stream", encoding="gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.json() == PAYLOAD
+
+
+def test_api_responses_are_negotiated(client, admin):
+    response = client.get("/bookings", headers={**admin.headers, "Accept": "application/msgpack"})
+
+    assert response.headers["content-type"] == "application/msgpack"
+    assert "Accept" in response.headers["vary"]
@@ -0,0 +1,62 @@
+"""`expand=`: related rows embedded in list responses, validated names."""
+import pytest
+from app.models.alert import Alert, AlertSeverity, AlertType
+from conftest import add_user
+
+
+@pytest.fixture
+def booking(client, admin, make_contact):
+    staff = add_user(client, admin)
+    contact = make_contact(admin)
+    response = client.post("/bookings", json={
+        "contact_id": contact["id"], "staff_id": staff.user_id,
+        "start_time": "2033-01-03T10:00:00", "end_time": "2033-01-03T11:00:00",
+    }, headers=admin.headers)
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def _get(client, account, path, **params):
+    response = client.get(path, params=params, headers=account.headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_bookings_embed_requested_relations_only(client, admin, booking):
+    [plain] = _get(client, admin, "/bookings")
+    [expanded] = _get(client, admin, "/bookings", expand="contact,staff")
+    [contact_only] = _get(client, admin, "/bookings", expand="contact")
+
+    assert plain["contact"] is None and plain["staff"] is None
+    assert expanded["contact"]["id"] == booking["contact_id"]
+    assert expanded["staff"]["id"] == booking["staff_id"]
+    assert contact_only["contact"]["id"] == booking["contact_id"] and contact_only["staff"] is None
+
+
+def test_messages_embed_their_contact(client, admin, booking):
+    messages = _get(client, admin, f"/messages/{booking['contact_id']}", expand="contact")
+
+    assert messages and {message["contact"]["id"] for message in messages} == {booking["contact_id"]}
+
+
+def test_alerts_embed_the_referenced_booking(client, admin, booking, db):
+    db.add(Alert(type=AlertType.BOOKING, severity=AlertSeverity.INFO, message="Check booking",
+                 reference_type="booking", reference_id=booking["id"]))
+    db.commit()
+
+    alerts = _get(client, admin, "/alerts", expand="reference")
+
+    [alert] = [alert for alert in alerts if alert["reference_type"] == "booking"]
+    assert alert["reference"]["id"] == booking["id"]
+
+
+@pytest.mark.parametrize("path, expand", [
+    ("/bookings", "contact,staf"),
+    ("/messages", "owner"),
+    ("/alerts", "contact"),
+])
+def test_unknown_expand_is_400(client, admin, path, expand):
+    response = client.get(path, params={"expand": expand}, headers=admin.headers)
+
+    assert response.status_code == 400
+    assert "Unknown expand" in response.json()["detail"]
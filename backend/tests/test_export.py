@@ -0,0 +1,86 @@
+"""Streaming export and resuming an interrupted export file."""
+import gzip
+import pytest
+from app.jobs import export_job
+
+
+@pytest.fixture
+def exported(client, admin, make_contact, tmp_path):
+    """Full reference exports of six contacts (one with a multi-line name) in each format."""
+    for index in range(6):
+        make_contact(admin, name=f"Resume {index}\nsecond line" if index == 3 else f"Resume {index}")
+
+    def export(name: str) -> bytes:
+        path = tmp_path / f"reference-{name}"
+        export_job.run("contacts", str(path), workspace_id=admin.workspace_id)
+        return path.read_bytes()
+
+    return export
+
+
+def _resume(admin, path, content: bytes) -> bytes:
+    path.write_bytes(content)
+    export_job.run("contacts", str(path), resume=True, workspace_id=admin.workspace_id)
+    return path.read_bytes()
+
+
+def _row_end(content: bytes, rows: int) -> int:
+    """Offset just after the first `rows` lines (the header counts for CSV)."""
+    end = 0
+    for _ in range(rows):
+        end = content.index(b"\n", end) + 1
+    return end
+
+
+def test_csv_cut_mid_row_is_replaced(admin, exported, tmp_path):
+    reference = exported("contacts.csv")
+    cut = _row_end(reference, 3) + 4  # Inside the third contact's row
+
+    resumed = _resume(admin, tmp_path / "contacts.csv", reference[:cut])
+
+    assert resumed == reference
+
+
+def test_csv_cut_inside_a_quoted_field_is_replaced(admin, exported, tmp_path):
+    reference = exported("contacts.csv")
+    cut = reference.index(b"second line")  # After the newline inside the quoted name
+
+    assert _resume(admin, tmp_path / "contacts.csv", reference[:cut]) == reference
+
+
+def test_ndjson_partial_line_is_replaced(admin, exported, tmp_path):
+    reference = exported("contacts.ndjson")
+    cut = _row_end(reference, 2) + 10
+
+    assert _resume(admin, tmp_path / "contacts.ndjson", reference[:cut]) == reference
+
+
+def test_intact_export_gets_only_new_rows(client, admin, exported, make_contact, tmp_path):
+    reference = exported("contacts.ndjson")
+    make_contact(admin, name="Resume later")
+
+    resumed = _resume(admin, tmp_path / "contacts.ndjson", reference)
+
+    assert resumed.startswith(reference)
+    assert resumed[len(reference):].count(b"\n") == 1
+
+
+def test_truncated_gzip_member_is_rewritten(admin, exported, tmp_path):
+    reference = gzip.decompress(exported("contacts.csv.gz"))
+    first = _row_end(reference, 3)
+    # One intact member, then a member cut off mid-stream by the interruption
+    broken = gzip.compress(reference[:first]) + gzip.compress(reference[first:])[:-12]
+
+    resumed = _resume(admin, tmp_path / "contacts.csv.gz", broken)
+
+    assert gzip.decompress(resumed) == reference
+
+
+def test_intact_gzip_gets_a_new_member(admin, exported, tmp_path):
+    compressed = exported("contacts.ndjson.gz")
+    reference = gzip.decompress(compressed)
+    first = _row_end(reference, 4)
+
+    resumed = _resume(admin, tmp_path / "contacts.ndjson.gz", gzip.compress(reference[:first]))
+
+    assert gzip.decompress(resumed) == reference
@@ -0,0 +1,53 @@
+"""`fields=`: sparse fieldsets, loaded column by column and validated."""
+import pytest
+from app.core.query_tracking import assert_max_queries
+
+
+@pytest.fixture
+def conversation(client, admin, make_contact):
+    contact = make_contact(admin)
+    response = client.post("/messages", json={
+        "contact_id": contact["id"], "channel": "email", "direction": "incoming",
+        "subject": "Hello", "content": "A long body " * 50,
+    }, headers=admin.headers)
+    assert response.status_code == 201, response.text
+    return contact
+
+
+def _statements(served) -> str:
+    return "\n".join(shape for stats in served for shape in stats.shapes)
+
+
+def test_only_requested_fields_and_id_are_returned(client, admin):
+    client.post("/inventory", json={"item_name": "Gloves", "quantity": 3, "notes": "Box of 100"}, headers=admin.headers)
+
+    response = client.get("/inventory", params={"fields": "item_name,quantity"}, headers=admin.headers)
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": response.json()[0]["id"], "item_name": "Gloves", "quantity": 3}]
+
+
+def test_unrequested_columns_are_not_loaded(client, admin, conversation):
+    with assert_max_queries(10 ** 6) as served:
+        response = client.get(f"/messages/{conversation['id']}", params={"fields": "subject"}, headers=admin.headers)
+
+    assert response.status_code == 200
+    assert {row["subject"] for row in response.json()} >= {"Hello"}
+    assert "messages.content" not in _statements(served)
+
+
+def test_fields_combine_with_expand(client, admin, conversation):
+    response = client.get(
+        f"/messages/{conversation['id']}", params={"fields": "contact", "expand": "contact"}, headers=admin.headers
+    )
+
+    assert response.status_code == 200
+    assert all(set(row) == {"id", "contact"} and row["contact"]["id"] == conversation["id"] for row in response.json())
+
+
+@pytest.mark.parametrize("path", ["/bookings", "/messages", "/alerts", "/inventory"])
+def test_unknown_field_is_400(client, admin, path):
+    response = client.get(path, params={"fields": "id,password"}, headers=admin.headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown field(s): password"
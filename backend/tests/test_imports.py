@@ -0,0 +1,112 @@
+"""Bulk import accounting: inserted, duplicate and failed rows."""
+import tempfile
+import orjson
+from app.core.database import engine
+from app.models.import_job import ImportJob
+from app.routes import imports
+from conftest import unique, unique_phone
+
+
+def _import(client, account, kind, body: bytes, content_type: str) -> dict:
+    response = client.post(f"/imports/{kind}", content=body, headers={**account.headers, "Content-Type": content_type})
+    assert response.status_code == 202, response.text
+    # The TestClient runs the background import before returning
+    progress = client.get(response.headers["location"], headers=account.headers)
+    assert progress.status_code == 200
+    return progress.json()
+
+
+def test_contact_import_counts_every_row(client, admin, make_contact):
+    existing = make_contact(admin, name="Ada Lovelace")
+    new_email = f"{unique()}@example.com"
+    csv = "\n".join([
+        "name,email,phone",
+        f"Grace Hopper,{new_email},",  # line 2: inserted
+        f"ada lovelace,{existing['email'].upper()},",  # line 3: duplicate of an existing contact
+        f"Grace Hopper,{new_email},",  # line 4: duplicate of line 2
+        "No Email,not-an-email,",  # line 5: invalid
+        f"Alan Turing,,{unique_phone()}",  # line 6: inserted
+    ]).encode()
+
+    result = _import(client, admin, "contacts", csv, "text/csv")
+
+    assert result["status"] == "completed"
+    assert (result["processed"], result["inserted"], result["duplicates"], result["failed"]) == (5, 2, 2, 1)
+    assert [error["line"] for error in result["errors"]] == [5]
+
+
+def test_booking_import_resolves_contacts_and_rejects_bad_rows(client, admin, other_admin, make_contact):
+    contact = make_contact(admin)
+    client.post("/bookings", json={
+        "contact_id": contact["id"], "staff_id": admin.user_id,
+        "start_time": "2031-06-01T09:00:00", "end_time": "2031-06-01T10:00:00",
+    }, headers=admin.headers)
+    rows = [
+        # Inserted (contact found by email)
+        {"contact_email": contact["email"], "staff_id": admin.user_id,
+         "start_time": "2031-06-02T09:00:00", "end_time": "2031-06-02T10:00:00"},
+        # Duplicate: same contact and start time as the booking above
+        {"contact_id": contact["id"], "start_time": "2031-06-01T09:00:00", "end_time": "2031-06-01T10:00:00"},
+        # Failed: unknown contact
+        {"contact_email": f"{unique()}@example.com", "start_time": "2031-06-03T09:00:00", "end_time": "2031-06-03T10:00:00"},
+        # Failed: staff of another workspace
+        {"contact_id": contact["id"], "staff_id": other_admin.user_id,
+         "start_time": "2031-06-04T09:00:00", "end_time": "2031-06-04T10:00:00"},
+    ]
+    body = b"\n".join(orjson.dumps(row) for row in rows) + b"\n{not json\n"
+
+    result = _import(client, admin, "bookings", body, "application/x-ndjson")
+
+    assert (result["processed"], result["inserted"], result["duplicates"], result["failed"]) == (5, 1, 1, 3)
+    errors = {error["line"]: error["error"] for error in result["errors"]}
+    assert sorted(errors) == [3, 4, 5]
+    assert "contact not found" in errors[3]
+    assert f"staff {other_admin.user_id} not found" in errors[4]
+    assert errors[5].startswith("Invalid JSON")
+
+
+def test_imported_rows_land_in_the_importers_workspace(client, admin, other_admin):
+    email = f"{unique()}@example.com"
+    _import(client, admin, "contacts", f"name,email\nImported Person,{email}\n".encode(), "text/csv")
+
+    mine = client.get("/contacts/lookup", params={"q": email}, headers=admin.headers).json()
+    theirs = client.get("/contacts/lookup", params={"q": email}, headers=other_admin.headers).json()
+    assert [contact["email"] for contact in mine] == [email]
+    assert theirs == []
+
+
+def test_import_jobs_are_private_to_their_workspace(client, admin, other_admin):
+    response = client.post(
+        "/imports/contacts", content=b"name\nSomeone\n", headers={**admin.headers, "Content-Type": "text/csv"}
+    )
+    assert client.get(response.headers["location"], headers=other_admin.headers).status_code == 404
+
+
+def test_progress_is_persisted_for_every_worker(client, admin, db):
+    csv = f"name,email\nStored Person,{unique()}@example.com\nBad,not-an-email\n".encode()
+    result = _import(client, admin, "contacts", csv, "text/csv")
+
+    job = db.query(ImportJob).filter(ImportJob.id == result["id"]).one()
+    assert (job.status, job.processed, job.inserted, job.failed) == ("completed", 2, 1, 1)
+    assert job.errors == result["errors"]
+
+
+def test_upload_is_spooled_without_a_database_connection(client, admin, monkeypatch):
+    checked_out = []
+    temporary_file = tempfile.TemporaryFile
+
+    class Spool:
+        def __init__(self):
+            self.file = temporary_file()
+
+        def write(self, chunk):
+            checked_out.append(engine.pool.checkedout())
+            return self.file.write(chunk)
+
+        def __getattr__(self, name):
+            return getattr(self.file, name)
+
+    monkeypatch.setattr(imports.tempfile, "TemporaryFile", Spool)
+    _import(client, admin, "contacts", f"name,email\nSpooled,{unique()}@example.com\n".encode(), "text/csv")
+
+    assert checked_out and set(checked_out) == {0}
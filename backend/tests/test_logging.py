@@ -0,0 +1,91 @@
+"""Queued logging: request ids, lazy formatting, sampling and the JSON format."""
+import logging
+import queue
+import orjson
+import pytest
+from app.core import logger as logging_setup
+from app.core.logger import JsonFormatter, NonBlockingQueueHandler, log_debug, log_info
+from conftest import unique
+
+
+@pytest.fixture
+def records(monkeypatch):
+    """Records as the queue handler enqueues them (filtered, stamped and formatted)."""
+    captured = []
+    monkeypatch.setattr(logging_setup.log_queue_handler, "enqueue", captured.append)
+    return captured
+
+
+def test_request_lines_carry_the_request_id(client, admin, records):
+    name = unique("Logged ")
+
+    response = client.post("/contacts", json={"name": name}, headers={**admin.headers, "X-Request-ID": "req-42"})
+
+    assert response.headers["x-request-id"] == "req-42"
+    assert any(record.request_id == "req-42" and name in record.getMessage() for record in records)
+
+
+def test_invalid_request_ids_are_replaced(client):
+    response = client.get("/health", headers={"X-Request-ID": "not valid\tid"})
+
+    assert response.headers["x-request-id"] != "not valid\tid"
+    assert len(response.headers["x-request-id"]) == 32
+
+
+class _Exploding:
+    def __str__(self):
+        raise AssertionError("formatted")
+
+
+def test_disabled_lines_are_not_formatted(records):
+    level = logging_setup.logger.level
+    logging_setup.logger.setLevel(logging.INFO)
+    try:
+        log_debug("[SERVICE] Disabled %s", _Exploding())
+    finally:
+        logging_setup.logger.setLevel(level)
+
+    assert records == []
+
+
+def test_arguments_are_merged_when_enqueued(records):
+    values = ["before"]
+
+    log_info("[SERVICE] Values %s", values)
+    values.append("after")
+
+    assert records[-1].getMessage() == "[SERVICE] Values ['before']"
+
+
+def test_categories_are_sampled(records, monkeypatch):
+    monkeypatch.setattr(logging_setup, "_sample_rates", {"AUTOMATION": 0.0})
+
+    log_info("[AUTOMATION] Reminder queued")
+    log_info("[SERVICE] Kept")
+    logging_setup.log_warning("[AUTOMATION] Warnings are never sampled")
+
+    assert [record.getMessage() for record in records] == ["[SERVICE] Kept", "[AUTOMATION] Warnings are never sampled"]
+
+
+def test_full_queue_drops_instead_of_blocking():
+    handler = NonBlockingQueueHandler(queue.Queue(1))
+    logger = logging.getLogger("careops.tests.full_queue")
+    logger.propagate = False
+    logger.addHandler(handler)
+
+    for index in range(3):
+        logger.warning("Line %s", index)
+
+    assert handler.dropped == 2
+    logger.removeHandler(handler)
+
+
+def test_json_lines_include_category_request_id_and_fields():
+    record = logging.LogRecord("careops", logging.INFO, __file__, 1, "[IMPORT] Batch %s", (3,), None)
+    record.request_id = "req-7"
+    record.fields = {"rows": 500}
+
+    entry = orjson.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "[IMPORT] Batch 3"
+    assert (entry["category"], entry["request_id"], entry["rows"], entry["level"]) == ("IMPORT", "req-7", 500, "INFO")
@@ -0,0 +1,85 @@
+"""Typeahead contact lookup: SQL prefix queries and the in-memory prefix index."""
+import pytest
+from app.core.config import settings
+from app.services import contact_service
+from app.services.contact_service import ContactService, _ContactPrefixIndex, normalize_query
+from conftest import unique
+
+
+def _lookup(client, account, q):
+    response = client.get("/contacts/lookup", params={"q": q}, headers=account.headers)
+    assert response.status_code == 200, response.text
+    return [contact["id"] for contact in response.json()]
+
+
+@pytest.fixture
+def ranked(admin, make_contact):
+    """Contacts matching one term by name start, name word, email and phone."""
+    term = unique("kaz")
+    return term, [
+        make_contact(admin, name=f"{term} Start")["id"],
+        make_contact(admin, name=f"Word {term}")["id"],
+        make_contact(admin, name="By Email", email=f"{term}@example.com")["id"],
+    ]
+
+
+def test_matches_rank_by_kind(client, admin, ranked):
+    term, expected = ranked
+    assert _lookup(client, admin, term) == expected
+
+
+def test_phone_digits_match(client, admin, make_contact):
+    contact = make_contact(admin, phone="(555) 818-2044")
+    assert contact["id"] in _lookup(client, admin, "555-818")
+
+
+def test_other_workspaces_are_not_matched(client, other_admin, ranked):
+    term, _ = ranked
+    assert _lookup(client, other_admin, term) == []
+
+
+class _DeferredThread:
+    """Stands in for threading.Thread: records builds instead of starting them."""
+
+    started = []
+
+    def __init__(self, target, daemon):
+        self.target = target
+
+    def start(self):
+        self.started.append(self.target)
+
+
+@pytest.fixture
+def memory_index(monkeypatch):
+    index = _ContactPrefixIndex(rebuild_seconds=600)
+    monkeypatch.setattr(settings, "CONTACT_LOOKUP_MEMORY_INDEX", True)
+    monkeypatch.setattr(contact_service, "prefix_index", index)
+    monkeypatch.setattr(contact_service, "Thread", _DeferredThread)
+    _DeferredThread.started = []
+    return index
+
+
+def test_first_lookups_use_sql_while_a_single_build_runs(client, admin, ranked, memory_index, monkeypatch):
+    term, expected = ranked
+
+    assert _lookup(client, admin, term) == expected
+    assert _lookup(client, admin, term) == expected
+    assert len(_DeferredThread.started) == 1
+
+    _DeferredThread.started[0]()
+    monkeypatch.setattr(ContactService, "_lookup_query", lambda *args: pytest.fail("SQL path used"))
+    assert _lookup(client, admin, term) == expected
+
+
+def test_changes_committed_during_the_first_build_are_kept(client, admin, make_contact, memory_index):
+    memory_index.lookup(admin.workspace_id, "x", "", 10)
+    # Snapshot taken before the contact existed
+    snapshot = {}
+
+    contact = make_contact(admin, name=unique("Latecomer"))
+    memory_index.load(snapshot)
+
+    term, digits = normalize_query(contact["name"])
+    results = memory_index.lookup(admin.workspace_id, term, digits, 10)
+    assert [result.id for result in results] == [contact["id"]]
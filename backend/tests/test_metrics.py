@@ -0,0 +1,45 @@
+"""Prometheus metrics: per-route request metrics and connection pool instrumentation."""
+from app.core.metrics import UNMATCHED_ROUTE, metrics
+
+
+def _sample(name: str, **labels) -> float:
+    return metrics.registry.get_sample_value(name, labels) or 0.0
+
+
+def test_responses_are_counted_by_route_template(client, admin, make_contact):
+    contact = make_contact(admin)
+    labels = dict(method="GET", route="/contacts/{contact_id}", status="200")
+    before = _sample("careops_http_responses_total", **labels)
+
+    client.get(f"/contacts/{contact['id']}", headers=admin.headers)
+
+    assert _sample("careops_http_responses_total", **labels) == before + 1
+    assert _sample("careops_http_request_duration_seconds_count", method="GET", route="/contacts/{contact_id}") >= 1
+
+
+def test_unrouted_paths_share_one_label(client):
+    before = _sample("careops_http_responses_total", method="GET", route=UNMATCHED_ROUTE, status="404")
+
+    client.get("/no-such-page/1")
+    client.get("/no-such-page/2")
+
+    assert _sample("careops_http_responses_total", method="GET", route=UNMATCHED_ROUTE, status="404") == before + 2
+
+
+def test_pool_checkouts_and_waits_are_recorded(client, admin):
+    checkouts = _sample("careops_db_pool_checkouts_total")
+    waits = _sample("careops_db_pool_wait_seconds_count")
+
+    client.get("/contacts", headers=admin.headers)
+
+    assert _sample("careops_db_pool_checkouts_total") > checkouts
+    assert _sample("careops_db_pool_wait_seconds_count") > waits
+
+
+def test_endpoint_serves_the_exposition_format(client):
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert b"careops_db_pool_connections" in response.content
+    assert b"careops_cache_lookups_total" in response.content
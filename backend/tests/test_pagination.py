@@ -0,0 +1,91 @@
+"""Keyset cursor pagination of the list endpoints."""
+import base64
+from datetime import datetime
+import pytest
+from app.core.pagination import encode_cursor
+
+
+def _walk(client, account, path, limit, **params) -> list:
+    """Every row of a list endpoint, following X-Next-Cursor."""
+    rows, cursor = [], None
+    while True:
+        query = {"limit": limit, **params, **({"cursor": cursor} if cursor else {})}
+        response = client.get(path, params=query, headers=account.headers)
+        assert response.status_code == 200, response.text
+        rows.extend(response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            return rows
+
+
+@pytest.fixture
+def bookings(client, admin, make_contact):
+    """Seven bookings, three sharing one start time."""
+    contact = make_contact(admin)
+    starts = ["2034-01-02T09:00:00"] * 3 + [f"2034-01-0{day}T09:00:00" for day in range(3, 7)]
+    for start in starts:
+        response = client.post("/bookings", json={
+            "contact_id": contact["id"], "start_time": start, "end_time": start.replace("T09", "T10"),
+        }, headers=admin.headers)
+        assert response.status_code == 201, response.text
+    return admin
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 7])
+def test_cursor_pages_cover_every_row_once_in_order(client, bookings, limit):
+    full = client.get("/bookings", params={"limit": 100}, headers=bookings.headers).json()
+
+    paged = _walk(client, bookings, "/bookings", limit)
+
+    assert [row["id"] for row in paged] == [row["id"] for row in full]
+    assert [(row["start_time"], row["id"]) for row in full] == sorted((row["start_time"], row["id"]) for row in full)
+
+
+def test_rows_inserted_before_the_cursor_do_not_shift_pages(client, admin, make_contact):
+    contacts = [make_contact(admin)["id"] for _ in range(4)]
+    first = client.get("/contacts", params={"limit": 2}, headers=admin.headers)
+    make_contact(admin)  # Sorts after every existing id
+
+    second = client.get("/contacts", params={"limit": 2, "cursor": first.headers["x-next-cursor"]},
+                        headers=admin.headers)
+
+    assert [row["id"] for row in first.json() + second.json()] == contacts
+
+
+def test_last_page_has_no_cursor(client, bookings):
+    response = client.get("/bookings", params={"limit": 100}, headers=bookings.headers)
+    assert "x-next-cursor" not in response.headers
+
+
+def test_cursor_takes_precedence_over_skip(client, bookings):
+    first = client.get("/bookings", params={"limit": 2}, headers=bookings.headers)
+
+    with_skip = client.get("/bookings", params={"limit": 2, "skip": 5, "cursor": first.headers["x-next-cursor"]},
+                           headers=bookings.headers)
+    without = client.get("/bookings", params={"limit": 2, "cursor": first.headers["x-next-cursor"]},
+                         headers=bookings.headers)
+
+    assert with_skip.json() == without.json()
+
+
+@pytest.mark.parametrize("path", ["/contacts", "/bookings", "/messages", "/alerts", "/inventory"])
+@pytest.mark.parametrize("cursor", [
+    "%%%",  # Not base64
+    encode_cursor([]),  # Wrong length for every sort key
+    encode_cursor([datetime(2030, 1, 1), 1, 2, 3]),
+    encode_cursor([True, True]),  # Booleans are not ids
+    base64.urlsafe_b64encode(b'{"id": 1}').decode(),  # Not a list
+])
+def test_malformed_cursor_is_400(client, admin, path, cursor):
+    response = client.get(path, params={"cursor": cursor}, headers=admin.headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("path, cursor", [
+    ("/bookings", encode_cursor(["Gloves", 1])),  # An inventory cursor (item_name, id)
+    ("/inventory", encode_cursor([datetime(2030, 1, 1), 1])),  # A bookings cursor (start_time, id)
+    ("/contacts", encode_cursor(["1"])),  # Id as a string
+])
+def test_cursor_of_another_sort_key_is_400(client, admin, path, cursor):
+    response = client.get(path, params={"cursor": cursor}, headers=admin.headers)
+    assert response.status_code == 400
@@ -0,0 +1,120 @@
+"""
+Statement budgets of the hot endpoints and automation paths.
+
+Each list is read with a fixed number of statements whatever its length
+(eager loads, no N+1); the budgets are the current counts, so a change
+that adds a query per row, or per request, fails here.
+"""
+import pytest
+from app.core.query_tracking import assert_max_queries
+from app.services.booking_service import BookingService
+from conftest import unique
+
+
+@pytest.fixture
+def populated(client, admin, make_contact):
+    """Contacts with a booking and a message each: enough rows for an N+1 to show."""
+    for day in range(1, 6):
+        contact = make_contact(admin)
+        response = client.post("/bookings", json={
+            "contact_id": contact["id"],
+            "staff_id": admin.user_id,
+            "start_time": f"2031-03-0{day}T10:00:00",
+            "end_time": f"2031-03-0{day}T11:00:00",
+        }, headers=admin.headers)
+        assert response.status_code == 201, response.text
+        response = client.post("/messages", json={
+            "contact_id": contact["id"], "channel": "email", "direction": "incoming", "content": "Hello",
+        }, headers=admin.headers)
+        assert response.status_code == 201, response.text
+    return admin
+
+
+@pytest.mark.parametrize("path, budget", [
+    ("/conversations", 3),  # user, page of contacts, their messages
+    ("/bookings?expand=contact,staff", 4),  # user, bookings, contacts, staff
+    ("/dashboard", 14),  # user and one aggregate per figure
+])
+def test_list_budget(client, populated, path, budget):
+    with assert_max_queries(budget):
+        response = client.get(path, headers=populated.headers)
+    assert response.status_code == 200
+
+
+def test_list_budget_does_not_grow_with_rows(client, populated, make_contact):
+    with assert_max_queries(10 ** 6) as before:
+        client.get("/bookings?expand=contact,staff", headers=populated.headers)
+    for day in range(1, 4):
+        contact = make_contact(populated)
+        client.post("/bookings", json={
+            "contact_id": contact["id"],
+            "staff_id": populated.user_id,
+            "start_time": f"2031-04-0{day}T10:00:00",
+            "end_time": f"2031-04-0{day}T11:00:00",
+        }, headers=populated.headers)
+    with assert_max_queries(10 ** 6) as after:
+        client.get("/bookings?expand=contact,staff", headers=populated.headers)
+    assert sum(stats.count for stats in after) == sum(stats.count for stats in before)
+
+
+def test_new_contact_automation_budget(client, admin):
+    # Duplicate lookup, insert and the welcome message automation
+    with assert_max_queries(14):
+        response = client.post("/contacts", json={
+            "name": unique("New "), "email": f"{unique()}@example.com", "phone": "555-010-2030",
+        }, headers=admin.headers)
+    assert response.status_code == 201
+
+
+def test_booking_created_automation_budget(client, admin, make_contact):
+    contact = make_contact(admin)
+    with assert_max_queries(10):
+        response = client.post("/bookings", json={
+            "contact_id": contact["id"],
+            "staff_id": admin.user_id,
+            "start_time": "2032-01-05T10:00:00",
+            "end_time": "2032-01-05T11:00:00",
+        }, headers=admin.headers)
+    assert response.status_code == 201
+
+
+def test_staff_reply_budget(client, admin, make_contact):
+    contact = make_contact(admin)
+    with assert_max_queries(7):
+        response = client.post("/messages", json={
+            "contact_id": contact["id"], "staff_id": admin.user_id,
+            "channel": "email", "direction": "outgoing", "content": "Reply",
+        }, headers=admin.headers)
+    assert response.status_code == 201
+
+
+def test_low_stock_automation_budget(client, admin):
+    item = client.post("/inventory", json={
+        "item_name": unique("Item "), "quantity": 10, "threshold": 5,
+    }, headers=admin.headers).json()
+    with assert_max_queries(7):
+        response = client.patch(f"/inventory/{item['id']}", json={"quantity": 1}, headers=admin.headers)
+    assert response.status_code == 200
+    assert response.json()["is_low_stock"] is True
+
+
+def test_booking_status_job_budget(client, admin, make_contact, db):
+    contact = make_contact(admin)
+    for day in range(1, 5):
+        client.post("/bookings", json={
+            "contact_id": contact["id"],
+            "staff_id": admin.user_id,
+            "start_time": f"2020-01-0{day}T10:00:00",
+            "end_time": f"2020-01-0{day}T11:00:00",
+        }, headers=admin.headers)
+
+    # One UPDATE ... RETURNING per status, whatever the number of bookings
+    with assert_max_queries(2):
+        result = BookingService(db).close_past_bookings()
+    assert result == {"completed": 0, "no_show": 4}
+
+
+def test_budget_failure_lists_statements(client, admin):
+    with pytest.raises(AssertionError, match="statements executed, expected at most 0"):
+        with assert_max_queries(0):
+            client.get("/dashboard", headers=admin.headers)
@@ -0,0 +1,83 @@
+"""Recurring booking series: lazy expansion for a window and sparse per-occurrence exceptions."""
+import pytest
+
+# 2032-03-01 is a Monday
+MONDAYS_AND_WEDNESDAYS = ["2032-03-01T09:00:00", "2032-03-03T09:00:00", "2032-03-08T09:00:00", "2032-03-10T09:00:00"]
+
+
+@pytest.fixture
+def series(client, admin, make_contact):
+    """Mondays and Wednesdays 09:00-10:00, four occurrences."""
+    response = client.post("/bookings/series", json={
+        "contact_id": make_contact(admin)["id"], "start_time": "2032-03-01T09:00:00",
+        "duration_minutes": 60, "frequency": "weekly", "by_weekday": "0,2", "count": 4,
+    }, headers=admin.headers)
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def _occurrences(client, admin, series, start: str, end: str) -> list:
+    response = client.get(
+        f"/bookings/series/{series['id']}/occurrences", params={"from": start, "to": end}, headers=admin.headers
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _except(client, admin, series, **fields):
+    return client.put(f"/bookings/series/{series['id']}/exceptions", json=fields, headers=admin.headers)
+
+
+def test_rule_expands_to_count_occurrences(client, admin, series):
+    occurrences = _occurrences(client, admin, series, "2032-02-01T00:00:00", "2032-06-01T00:00:00")
+
+    assert [o["start_time"] for o in occurrences] == MONDAYS_AND_WEDNESDAYS
+    assert all(o["end_time"][11:] == "10:00:00" for o in occurrences)
+
+
+def test_window_yields_only_overlapping_occurrences(client, admin, series):
+    # Starts mid-way through the first Wednesday occurrence
+    occurrences = _occurrences(client, admin, series, "2032-03-03T09:30:00", "2032-03-08T12:00:00")
+
+    assert [o["start_time"] for o in occurrences] == MONDAYS_AND_WEDNESDAYS[1:3]
+
+
+def test_exceptions_move_and_cancel_single_occurrences(client, admin, series):
+    moved = _except(client, admin, series, occurrence_start=MONDAYS_AND_WEDNESDAYS[1],
+                    start_time="2032-03-04T14:00:00", end_time="2032-03-04T15:00:00")
+    cancelled = _except(client, admin, series, occurrence_start=MONDAYS_AND_WEDNESDAYS[2], status="cancelled")
+    assert moved.status_code == cancelled.status_code == 200
+
+    occurrences = _occurrences(client, admin, series, "2032-03-01T00:00:00", "2032-03-31T00:00:00")
+
+    by_original = {o["occurrence_start"]: o for o in occurrences}
+    assert by_original[MONDAYS_AND_WEDNESDAYS[1]]["start_time"] == "2032-03-04T14:00:00"
+    assert by_original[MONDAYS_AND_WEDNESDAYS[2]]["status"] == "cancelled"
+    assert by_original[MONDAYS_AND_WEDNESDAYS[3]]["status"] == series["status"]
+
+
+def test_occurrence_moved_into_the_window_is_included(client, admin, series):
+    _except(client, admin, series, occurrence_start=MONDAYS_AND_WEDNESDAYS[3],
+            start_time="2032-03-05T09:00:00", end_time="2032-03-05T10:00:00")
+
+    occurrences = _occurrences(client, admin, series, "2032-03-05T00:00:00", "2032-03-06T00:00:00")
+
+    assert [(o["occurrence_start"], o["start_time"]) for o in occurrences] == [
+        (MONDAYS_AND_WEDNESDAYS[3], "2032-03-05T09:00:00")
+    ]
+
+
+def test_exception_for_a_time_the_rule_never_produces_is_404(client, admin, series):
+    response = _except(client, admin, series, occurrence_start="2032-03-02T09:00:00", status="cancelled")
+    assert response.status_code == 404
+
+
+def test_cancelled_series_leaves_the_workspace_calendar(client, admin, series):
+    window = {"from": "2032-03-01T00:00:00", "to": "2032-03-31T00:00:00"}
+    listed = client.get("/bookings/series/occurrences", params=window, headers=admin.headers).json()
+    assert {o["series_id"] for o in listed} >= {series["id"]}
+
+    client.patch(f"/bookings/series/{series['id']}", json={"status": "cancelled"}, headers=admin.headers)
+
+    listed = client.get("/bookings/series/occurrences", params=window, headers=admin.headers).json()
+    assert series["id"] not in {o["series_id"] for o in listed}
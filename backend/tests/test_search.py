@@ -0,0 +1,108 @@
+"""Full-text search: ranking, paging and the fallback inverted index (non-PostgreSQL databases)."""
+from sqlalchemy.dialects import postgresql
+from app.services.search_service import SearchService
+from conftest import unique
+
+
+def _search(client, account, q, **params):
+    response = client.get("/search", params={"q": q, **params}, headers=account.headers)
+    assert response.status_code == 200, response.text
+    return response
+
+
+def test_contact_and_message_terms_are_indexed(client, admin, make_contact):
+    term = unique("zephyr")
+    contact = make_contact(admin, name=f"Ada {term}")
+    client.post("/messages", json={
+        "contact_id": contact["id"], "channel": "email", "direction": "incoming",
+        "subject": "Question", "content": f"Is {term} available on Monday?",
+    }, headers=admin.headers)
+
+    results = _search(client, admin, term).json()
+
+    assert {(result["type"], result["contact_id"]) for result in results} == {
+        ("contact", contact["id"]), ("message", contact["id"])
+    }
+
+
+def test_every_term_must_match(client, admin, make_contact):
+    term = unique("quill")
+    both = make_contact(admin, name=f"Ada {term} Lovelace")
+    make_contact(admin, name=f"Grace {term} Hopper")
+
+    results = _search(client, admin, f"{term} lovelace", types="contact").json()
+
+    assert [result["id"] for result in results] == [both["id"]]
+
+
+def test_weighted_rank_prefers_name_over_email(client, admin, make_contact):
+    term = unique("orbit")
+    by_email = make_contact(admin, name="Email Match", email=f"{term}@example.com")
+    by_name = make_contact(admin, name=f"{term} Name Match")
+
+    results = _search(client, admin, term, types="contact").json()
+
+    assert [result["id"] for result in results] == [by_name["id"], by_email["id"]]
+    assert results[0]["rank"] > results[1]["rank"]
+
+
+def test_index_follows_updates_and_deletes(client, admin, make_contact):
+    old, new = unique("before"), unique("after")
+    contact = make_contact(admin, name=f"Renamed {old}")
+
+    # Contacts only: the welcome message quotes the original name
+    client.patch(f"/contacts/{contact['id']}", json={"name": f"Renamed {new}"}, headers=admin.headers)
+    assert _search(client, admin, old, types="contact").json() == []
+    assert [result["id"] for result in _search(client, admin, new, types="contact").json()] == [contact["id"]]
+
+    client.delete(f"/contacts/{contact['id']}", headers=admin.headers)
+    assert _search(client, admin, new).json() == []
+
+
+def test_keyset_pages_cover_all_results_once(client, admin, make_contact):
+    term = unique("page")
+    ids = {make_contact(admin, name=f"{term} {index}")["id"] for index in range(5)}
+
+    seen, cursor = [], None
+    while True:
+        params = {"types": "contact", "limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = _search(client, admin, term, **params)
+        seen.extend(result["id"] for result in response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+
+    assert sorted(seen) == sorted(ids)
+
+
+def test_pages_split_rank_ties_without_skipping(client, admin, make_contact):
+    term = unique("tie")
+    ids = {make_contact(admin, name=f"{term} Same")["id"] for _ in range(5)}
+
+    seen, ranks, cursor = [], set(), None
+    while True:
+        params = {"types": "contact", "limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = _search(client, admin, term, **params)
+        seen.extend(result["id"] for result in response.json())
+        ranks.update(result["rank"] for result in response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+
+    assert len(ranks) == 1  # Every result ties with the cursor row
+    assert sorted(seen) == sorted(ids)
+
+
+def test_postgresql_rank_round_trips_through_the_cursor(db):
+    # float4 ts_rank_cd values only compare equal to the cursor's float as double precision
+    ranked = SearchService(db)._ranked_postgres("ada", ["message", "contact"])
+    sql = str(ranked.element.compile(dialect=postgresql.dialect()))
+    assert sql.count("CAST(ts_rank_cd(") == 2
+    assert "AS FLOAT(53))" in sql
+
+
+def test_other_workspaces_are_not_searched(client, admin, other_admin, make_contact):
+    term = unique("private")
+    make_contact(admin, name=f"Secret {term}")
+
+    assert _search(client, other_admin, term).json() == []
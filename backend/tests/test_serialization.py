@@ -0,0 +1,61 @@
+"""Single-pass list serialization and the rows (no ORM) path of /conversations."""
+import json
+from app.core.serialization import list_adapter, serialize_list
+from app.models.booking import Booking
+from app.schemas.booking_schema import BookingResponse
+
+
+def _message(client, account, contact_id, content, direction="incoming"):
+    response = client.post("/messages", json={
+        "contact_id": contact_id, "channel": "sms", "direction": direction, "content": content,
+    }, headers=account.headers)
+    assert response.status_code == 201, response.text
+
+
+def test_list_adapters_are_built_once_per_model():
+    assert list_adapter(BookingResponse) is list_adapter(BookingResponse)
+
+
+def test_single_pass_matches_per_row_validation(client, admin, make_contact, db):
+    contact = make_contact(admin)
+    for day in (1, 2):
+        client.post("/bookings", json={
+            "contact_id": contact["id"], "start_time": f"2035-01-0{day}T10:00:00",
+            "end_time": f"2035-01-0{day}T11:00:00", "notes": "Üñïcode",
+        }, headers=admin.headers)
+    bookings = db.query(Booking).filter(Booking.contact_id == contact["id"]).order_by(Booking.id).all()
+
+    body = serialize_list(BookingResponse, bookings)
+
+    assert json.loads(body) == [BookingResponse.model_validate(b).model_dump(mode="json") for b in bookings]
+
+
+def test_list_route_returns_the_response_model_shape(client, admin, make_contact):
+    contact = make_contact(admin)
+    client.post("/bookings", json={
+        "contact_id": contact["id"], "start_time": "2035-02-01T10:00:00", "end_time": "2035-02-01T11:00:00",
+    }, headers=admin.headers)
+
+    response = client.get("/bookings", headers=admin.headers)
+
+    assert response.headers["content-type"] == "application/json"
+    [booking] = response.json()
+    assert set(BookingResponse.model_fields) <= set(booking)
+    assert booking["status"] == "pending" and booking["start_time"] == "2035-02-01T10:00:00"
+
+
+def test_conversations_are_grouped_rows_newest_first(client, admin, make_contact):
+    quiet, busy = make_contact(admin), make_contact(admin)
+    _message(client, admin, quiet["id"], "Earlier")
+    _message(client, admin, busy["id"], "Hi")
+    _message(client, admin, busy["id"], "On my way", direction="outgoing")
+
+    conversations = client.get("/conversations", headers=admin.headers).json()
+
+    ours = [c for c in conversations if c["contactId"] in (quiet["id"], busy["id"])]
+    assert [c["contactId"] for c in ours] == [busy["id"], quiet["id"]]
+    latest = ours[0]
+    assert latest["contactName"] == busy["name"]
+    assert latest["lastMessage"]["content"] == "On my way"
+    assert latest["messages"][-1]["sender"] == "staff" and latest["messages"][-1]["channel"] == "sms"
+    assert latest["updatedAt"] == latest["messages"][-1]["timestamp"]
@@ -0,0 +1,111 @@
+"""Single-flight: identical concurrent computations run once and share the result."""
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+import time
+import pytest
+from starlette.requests import Request
+from app.core.singleflight import SingleFlight, request_key, single_flight
+from app.routes import conversations
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def _run_concurrently(flight: SingleFlight, callers: int, fn, **kwargs):
+    """Start `callers` identical calls while the first one's fn is blocked; return their results."""
+    release = Event()
+
+    def blocked():
+        release.wait(5)
+        return fn()
+
+    with ThreadPoolExecutor(callers) as pool:
+        futures = [pool.submit(flight.do, "key", blocked, **kwargs) for _ in range(callers)]
+        _wait_for(lambda: flight.stats()["coalesced"] == callers - 1)
+        release.set()
+        return [future.exception() or future.result() for future in futures]
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+
+    results = _run_concurrently(flight, 5, object)
+
+    assert flight.executions == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_waiters_release_before_waiting_and_share_errors():
+    flight = SingleFlight()
+    released = []
+
+    results = _run_concurrently(flight, 3, lambda: 1 / 0, before_wait=lambda: released.append(True))
+
+    assert all(isinstance(result, ZeroDivisionError) for result in results)
+    assert len(released) == 2  # Followers only
+    # Errors are not reused
+    assert flight.do("key", lambda: "retried") == "retried"
+
+
+def test_results_are_reused_only_within_the_grace_period():
+    calls = []
+    compute = lambda: calls.append(1) or len(calls)
+
+    assert [SingleFlight(grace_seconds=0).do("key", compute) for _ in range(2)] == [1, 2]
+    grace = SingleFlight(grace_seconds=60)
+    assert [grace.do("key", compute) for _ in range(2)] == [3, 3]
+
+
+def _request(query: str) -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/dashboard", "query_string": query.encode(), "headers": []})
+
+
+def test_keys_normalize_params_and_separate_scopes():
+    assert request_key(_request("b=2&a=1"), "1:admin") == request_key(_request("a=1&b=2"), "1:admin")
+    assert request_key(_request("a=1"), "1:admin") != request_key(_request("a=1"), "2:admin")
+    assert request_key(_request("a=1"), "1:admin") != request_key(_request("a=2"), "1:admin")
+
+
+@pytest.fixture
+def blocked_conversations(monkeypatch):
+    """/conversations builds block until released; returns (release event, build counter)."""
+    release, builds = Event(), []
+    build = conversations._build_conversations
+
+    def blocked(*args):
+        builds.append(1)
+        release.wait(5)
+        return build(*args)
+
+    monkeypatch.setattr(conversations, "_build_conversations", blocked)
+    return release, builds
+
+
+def test_identical_concurrent_requests_query_once(client, admin, blocked_conversations):
+    release, builds = blocked_conversations
+    before = single_flight.stats()["coalesced"]
+
+    with ThreadPoolExecutor(3) as pool:
+        futures = [pool.submit(client.get, "/conversations", headers=admin.headers) for _ in range(3)]
+        _wait_for(lambda: single_flight.stats()["coalesced"] == before + 2)
+        release.set()
+        responses = [future.result() for future in futures]
+
+    assert len(builds) == 1
+    assert {response.status_code for response in responses} == {200}
+    assert len({response.content for response in responses}) == 1
+
+
+def test_other_workspaces_do_not_share_results(client, admin, other_admin, blocked_conversations):
+    release, builds = blocked_conversations
+    release.set()
+
+    with ThreadPoolExecutor(2) as pool:
+        list(pool.map(lambda account: client.get("/conversations", headers=account.headers), (admin, other_admin)))
+
+    assert len(builds) == 2
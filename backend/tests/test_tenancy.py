@@ -0,0 +1,100 @@
+"""Workspace isolation of requests and of the unscoped booking status job."""
+import pytest
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services.automation_service import AutomationService
+from app.services.booking_service import BookingService
+from conftest import add_user, unique
+
+
+def test_sign_up_creates_its_own_workspace_and_ignores_role(client):
+    response = client.post("/auth/register", json={
+        "name": "Mallory", "email": f"{unique()}@example.com", "password": "pw", "role": "staff",
+    })
+
+    assert response.status_code == 201
+    user = response.json()["user"]
+    assert user["role"] == "admin"
+    assert user["workspace_id"] != settings.DEFAULT_WORKSPACE_ID
+    workspace = client.get("/workspace", headers={"Authorization": f"Bearer {response.json()['access_token']}"})
+    assert workspace.json()["name"] == "Mallory"
+
+
+def test_only_admins_add_colleagues(client, admin):
+    staff = add_user(client, admin)
+    assert staff.workspace_id == admin.workspace_id
+
+    response = client.post("/workspace/users", json={
+        "name": "Eve", "email": f"{unique()}@example.com", "password": "pw", "role": "admin",
+    }, headers=staff.headers)
+    assert response.status_code == 403
+
+
+def test_rows_of_other_workspaces_are_invisible(client, admin, other_admin, make_contact):
+    contact = make_contact(admin)
+
+    assert client.get(f"/contacts/{contact['id']}", headers=other_admin.headers).status_code == 404
+    listed = client.get("/contacts", params={"limit": 100}, headers=other_admin.headers).json()
+    assert contact["id"] not in {row["id"] for row in listed}
+    # Writes can't reach them either
+    response = client.patch(f"/contacts/{contact['id']}", json={"name": "Taken over"}, headers=other_admin.headers)
+    assert response.status_code == 404
+
+
+def test_references_to_other_workspaces_are_rejected(client, admin, other_admin, make_contact):
+    contact = make_contact(admin)
+
+    foreign_contact = client.post("/bookings", json={
+        "contact_id": contact["id"], "start_time": "2031-07-01T09:00:00", "end_time": "2031-07-01T10:00:00",
+    }, headers=other_admin.headers)
+    foreign_staff = client.post("/bookings", json={
+        "contact_id": contact["id"], "staff_id": other_admin.user_id,
+        "start_time": "2031-07-01T09:00:00", "end_time": "2031-07-01T10:00:00",
+    }, headers=admin.headers)
+
+    assert foreign_contact.status_code == 404
+    assert foreign_staff.status_code == 404
+
+
+def test_dashboard_counts_only_the_callers_workspace(client, admin, other_admin, make_contact):
+    make_contact(admin)
+    make_contact(admin)
+
+    assert client.get("/dashboard", headers=other_admin.headers).json()["contacts"]["total"] == 0
+    assert client.get("/dashboard", headers=admin.headers).json()["contacts"]["total"] == 2
+
+
+@pytest.fixture
+def status_events(monkeypatch):
+    """handle_bookings_status_changed calls of the booking status job."""
+    events = []
+
+    def record(self, workspace_id, status, bookings):
+        events.append((workspace_id, status, sorted(booking["id"] for booking in bookings)))
+
+    monkeypatch.setattr(AutomationService, "handle_bookings_status_changed", record)
+    return events
+
+
+def test_status_job_closes_each_workspace_separately(client, admin, other_admin, make_contact, status_events):
+    past = {}
+    for account in (admin, other_admin):
+        contact = make_contact(account)
+        response = client.post("/bookings", json={
+            "contact_id": contact["id"], "start_time": "2020-02-01T09:00:00", "end_time": "2020-02-01T10:00:00",
+        }, headers=account.headers)
+        past[account.workspace_id] = response.json()["id"]
+
+    db = SessionLocal()  # Unscoped, as in the job
+    try:
+        BookingService(db).close_past_bookings()
+    finally:
+        db.close()
+
+    # One event per workspace, carrying only that workspace's bookings
+    for workspace_id, booking_id in past.items():
+        events = [event for event in status_events if event[0] == workspace_id]
+        assert events == [(workspace_id, "no_show", [booking_id])]
+    for account in (admin, other_admin):
+        booking = client.get(f"/bookings/{past[account.workspace_id]}", headers=account.headers).json()
+        assert booking["status"] == "no_show"
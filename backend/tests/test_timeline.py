@@ -0,0 +1,116 @@
+"""Contact timeline: k-way merge of bookings, messages and alerts, one keyset cursor."""
+from datetime import datetime
+import pytest
+from sqlalchemy import update
+from app.core.database import SessionLocal
+from app.core.pagination import encode_cursor
+from app.models.alert import Alert, AlertSeverity, AlertType
+from app.models.message import Message
+from app.services.archive_service import ArchiveService
+
+
+@pytest.fixture
+def history(client, admin, make_contact, db):
+    """A contact with bookings (two at the same instant), messages and alerts."""
+    contact = make_contact(admin)
+    bookings = []
+    for start in ("2030-01-01T09:00:00", "2030-01-01T09:00:00", "2030-02-01T09:00:00", "2031-01-01T09:00:00"):
+        response = client.post("/bookings", json={
+            "contact_id": contact["id"], "start_time": start, "end_time": start.replace("T09", "T10"),
+        }, headers=admin.headers)
+        assert response.status_code == 201, response.text
+        bookings.append(response.json()["id"])
+    for content in ("First", "Second"):
+        client.post("/messages", json={
+            "contact_id": contact["id"], "channel": "sms", "direction": "incoming", "content": content,
+        }, headers=admin.headers)
+    db.add_all([
+        Alert(type=AlertType.SYSTEM, severity=AlertSeverity.INFO, message="About the contact",
+              reference_type="contact", reference_id=contact["id"]),
+        Alert(type=AlertType.BOOKING, severity=AlertSeverity.WARNING, message="About a booking",
+              reference_type="booking", reference_id=bookings[0]),
+    ])
+    db.commit()
+    return contact
+
+
+def _timeline(client, account, contact_id, **params):
+    response = client.get(f"/contacts/{contact_id}/timeline", params=params, headers=account.headers)
+    assert response.status_code == 200, response.text
+    return response
+
+
+def _order(event):
+    return event["occurred_at"], event["type"], event["id"]
+
+
+def test_sources_are_merged_newest_first(client, admin, history):
+    events = _timeline(client, admin, history["id"]).json()
+
+    types = [event["type"] for event in events]
+    assert (types.count("booking"), types.count("alert")) == (4, 2)
+    assert types.count("message") >= 2  # Plus welcome and confirmation messages
+    assert events == sorted(events, key=_order, reverse=True)
+
+
+@pytest.mark.parametrize("limit", [1, 2, 4])
+def test_cursor_pages_match_the_full_timeline(client, admin, history, limit):
+    full = _timeline(client, admin, history["id"], limit=200).json()
+
+    paged, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = _timeline(client, admin, history["id"], **params)
+        paged.extend(response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+
+    # Pages split the same-instant bookings without losing or repeating either
+    assert [_order(event) for event in paged] == [_order(event) for event in full]
+
+
+def test_archived_messages_and_alerts_need_include_archived(client, admin, history, db):
+    before = _timeline(client, admin, history["id"], limit=200).json()
+    # Old enough for the archive job, which only moves rows from 2000
+    long_ago = datetime(2000, 1, 1)
+    db.execute(update(Message).where(Message.contact_id == history["id"]).values(created_at=long_ago))
+    db.execute(update(Alert).values(is_dismissed=True, dismissed_at=long_ago))
+    db.commit()
+    job = SessionLocal()
+    try:
+        ArchiveService(job).archive_old_messages(older_than_days=365 * 20)
+        ArchiveService(job).archive_dismissed_alerts(older_than_days=365 * 20)
+    finally:
+        job.close()
+
+    live = _timeline(client, admin, history["id"], limit=200).json()
+    everything = _timeline(client, admin, history["id"], limit=200, include_archived=True).json()
+
+    assert {event["type"] for event in live} == {"booking"}
+    assert sorted((event["type"], event["id"]) for event in everything) == \
+        sorted((event["type"], event["id"]) for event in before)
+
+
+def test_types_filter(client, admin, history):
+    events = _timeline(client, admin, history["id"], types="booking,alert").json()
+    assert {event["type"] for event in events} == {"booking", "alert"}
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor",
+    encode_cursor([datetime(2030, 1, 1), "booking"]),  # Too short
+    encode_cursor(["2030-01-01T09:00:00", "booking", 1]),  # Time as a plain string
+    encode_cursor([datetime(2030, 1, 1), "booking", "1"]),  # Id as a string
+    encode_cursor([datetime(2030, 1, 1), "invoice", 1]),  # Unknown source
+])
+def test_invalid_cursor_is_400(client, admin, history, cursor):
+    response = client.get(
+        f"/contacts/{history['id']}/timeline", params={"cursor": cursor}, headers=admin.headers
+    )
+    assert response.status_code == 400
+
+
+def test_timeline_of_another_workspaces_contact_is_404(client, other_admin, history):
+    response = client.get(f"/contacts/{history['id']}/timeline", headers=other_admin.headers)
+    assert response.status_code == 404
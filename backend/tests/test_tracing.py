@@ -0,0 +1,72 @@
+"""Request phase timings: the Server-Timing header and sampled trace records."""
+import logging
+import orjson
+import pytest
+from app.core.config import settings
+from app.core.tracing import trace_logger
+
+
+def _phases(response) -> dict:
+    """Server-Timing entries as {name: parameters}."""
+    phases = {}
+    for entry in response.headers["server-timing"].split(", "):
+        name, _, params = entry.partition(";")
+        phases[name] = params
+    return phases
+
+
+def test_server_timing_breaks_down_a_list_request(client, admin, make_contact):
+    make_contact(admin)
+
+    phases = _phases(client.get("/contacts", headers=admin.headers))
+
+    assert {"auth", "serialize", "db", "total"} <= set(phases)
+    assert phases["db"].endswith('queries"')
+    assert all(params.startswith("dur=") for params in phases.values())
+
+
+def test_response_model_validation_is_its_own_phase(client, admin, make_contact):
+    contact = make_contact(admin)
+
+    phases = _phases(client.get(f"/contacts/{contact['id']}", headers=admin.headers))
+
+    assert "validate" in phases and "serialize" not in phases
+
+
+class _Records(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(orjson.loads(record.getMessage()))
+
+
+@pytest.fixture
+def traces(monkeypatch):
+    handler = _Records()
+    trace_logger.addHandler(handler)
+    level = trace_logger.level
+    trace_logger.setLevel(logging.INFO)
+    yield handler.records
+    trace_logger.setLevel(level)
+    trace_logger.removeHandler(handler)
+
+
+def test_sampled_requests_write_a_full_trace(client, admin, make_contact, traces, monkeypatch):
+    contact = make_contact(admin)
+    monkeypatch.setattr(settings, "TRACE_SAMPLE_RATE", 1.0)
+
+    response = client.get(f"/contacts/{contact['id']}", headers=admin.headers)
+
+    [trace] = traces
+    assert trace["route"] == "/contacts/{contact_id}" and trace["status"] == 200
+    assert trace["request_id"] == response.headers["x-request-id"]
+    assert trace["queries"] == sum(1 for span in trace["spans"] if span["name"] == "db")
+    assert any(span["name"] == "auth" and span["detail"] == "jwt" for span in trace["spans"])
+
+
+def test_unsampled_requests_write_nothing(client, admin, traces):
+    client.get("/contacts", headers=admin.headers)
+
+    assert traces == []
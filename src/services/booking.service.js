@@ -13,6 +13,39 @@ const bookingService = {
         return response.data;
     },
 
+    /**
+     * Get bookings starting in [from, to) ordered by start time (calendar views)
+     */
+    async getBookingsInRange(from, to, { staffId = null, status = null, skip = 0, limit = 500 } = {}) {
+        const params = { from, to, skip, limit };
+        if (staffId) {
+            params.staff_id = staffId;
+        }
+        if (status) {
+            params.status = status;
+        }
+        const response = await api.get('/bookings', { params });
+        return response.data;
+    },
+
+    /**
+     * Get free slots for a staff member or service type (public)
+     */
+    async getAvailability(dateFrom, dateTo, { staffId = null, serviceType = null, durationMinutes = null } = {}) {
+        const params = { date_from: dateFrom, date_to: dateTo };
+        if (staffId) {
+            params.staff_id = staffId;
+        }
+        if (serviceType) {
+            params.service_type = serviceType;
+        }
+        if (durationMinutes) {
+            params.duration_minutes = durationMinutes;
+        }
+        const response = await api.get('/bookings/availability', { params });
+        return response.data;
+    },
+
     /**
      * Get single booking by ID
      */